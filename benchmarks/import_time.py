@@ -0,0 +1,113 @@
+"""
+Import-time benchmark for tracking startup regressions
+
+Each target is imported in a fresh interpreter with -X importtime, several times, and the
+median total import time is reported along with any heavy modules it pulled in that it
+shouldn't have (the model SDK and dotenv are only needed once a model-backed game starts).
+
+Usage:
+    python benchmarks/import_time.py                          # print a report
+    python benchmarks/import_time.py --save baseline.json     # record a baseline
+    python benchmarks/import_time.py --baseline baseline.json # fail on a >20% regression
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Statement run in a fresh interpreter -> modules it must not import
+TARGETS: Dict[str, Tuple[str, List[str]]] = {
+    "setup": ("import setup", ["openai", "dotenv"]),
+    "play": ("import play", ["openai", "dotenv"]),
+    "simulation.game_runner": ("import simulation.game_runner", ["openai", "dotenv"]),
+    "game_server.sessions": ("import game_server.sessions", ["openai", "dotenv"]),
+    "scripted agent": (
+        "from game_context.roles import Role; Role.SEER.get_agent_class('scripted')",
+        ["openai", "dotenv", "game_agents.human"]
+    ),
+}
+
+
+def measure(statement: str) -> Tuple[float, List[str]]:
+    """
+    Import time of one statement in a fresh interpreter
+
+    Returns:
+        Tuple of (total import time in milliseconds, names of every module imported)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    total_us = 0
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules.append(name.strip())
+        # Only top-level imports (no indentation) so nested imports aren't counted twice
+        if not name.startswith("  "):
+            total_us += int(cumulative)
+    return total_us / 1000, modules
+
+
+def run(repeat: int) -> Dict[str, dict]:
+    report = {}
+    for label, (statement, forbidden) in TARGETS.items():
+        timings = []
+        for _ in range(repeat):
+            milliseconds, modules = measure(statement)
+            timings.append(milliseconds)
+        report[label] = {
+            "median_ms": statistics.median(timings),
+            "min_ms": min(timings),
+            "modules": len(modules),
+            "unexpected_imports": [name for name in forbidden if name in modules],
+        }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure cold import time of the game's entry points")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per target")
+    parser.add_argument("--save", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", help="Compare against a JSON file written by --save")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown over the baseline (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    report = run(args.repeat)
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+
+    failed = False
+    print(f"{'target':<24} {'median':>9} {'min':>9} {'modules':>8}")
+    for label, result in report.items():
+        line = f"{label:<24} {result['median_ms']:>7.1f}ms {result['min_ms']:>7.1f}ms {result['modules']:>8}"
+        if result["unexpected_imports"]:
+            line += f"  ❌ imports {', '.join(result['unexpected_imports'])}"
+            failed = True
+        if label in baseline:
+            limit = baseline[label]["median_ms"] * (1 + args.tolerance)
+            change = result["median_ms"] / baseline[label]["median_ms"] - 1
+            line += f"  ({change:+.0%} vs baseline)"
+            if result["median_ms"] > limit:
+                line += " ❌ regression"
+                failed = True
+        print(line)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Games per second and peak RSS of a scripted batch with and without object pooling
+
+Each mode runs in its own fresh interpreter so peak RSS isn't shared between them. Both modes
+play the same seeds, and the benchmark checks that their stored results are identical, since
+reusing agents and contexts must not change any game.
+
+Scripted agents are cheap to build, so most of what pooling saves shows up in model-backed
+games, where every fresh agent creates its own OpenAI client. Playing those would call the API,
+so for them only game setup (deal, seat agents, create clients) is timed.
+
+Usage:
+    python benchmarks/pooling.py --games 2000
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COMPARED_COLUMNS = ("seed", "initial_roles", "final_roles", "night_actions", "votes", "eliminated")
+
+
+def run_batch(num_games: int, pooled: bool, max_rounds: int) -> dict:
+    """Play one batch in this process and report its throughput, peak RSS and a results digest"""
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    from setup import load_game_config
+    from simulation import BatchRunner, ResultsStore
+
+    game_config = load_game_config()
+    game_config["default_agent_type"] = "scripted"
+    game_config["seat_agent_types"] = []
+    game_config["max_rounds"] = max_rounds
+
+    with tempfile.TemporaryDirectory() as store_path:
+        runner = BatchRunner(game_config, store_path, pool_objects=pooled)
+        start = time.perf_counter()
+        written = runner.run(num_games)
+        elapsed = time.perf_counter() - start
+
+        store = ResultsStore(store_path)
+        digest = hashlib.sha256()
+        for name in COMPARED_COLUMNS:
+            digest.update(store[name].tobytes())
+
+    return {
+        "games": written,
+        "games_per_sec": written / elapsed,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "agents_created": runner.agent_pool.created if runner.agent_pool else None,
+        "agents_reused": runner.agent_pool.reused if runner.agent_pool else None,
+        "results_digest": digest.hexdigest(),
+    }
+
+
+def time_model_game_setup(num_games: int, pooled: bool) -> float:
+    """Milliseconds per model-backed game setup, including creating each agent's client"""
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    os.environ.setdefault("OPENAI_API_KEY", "benchmark-only")
+    from game_agents.agent_pool import AgentPool
+    from setup import load_game_config, setup_game_context
+
+    game_config = load_game_config()
+    game_config["default_agent_type"] = "llm"
+    game_config["seat_agent_types"] = []
+    agent_pool = AgentPool() if pooled else None
+    spare_context = None
+
+    start = time.perf_counter()
+    for seed in range(num_games):
+        game_context = setup_game_context(game_config, random.Random(seed), agent_pool=agent_pool, game_context=spare_context)
+        for agent in game_context.players.values():
+            agent.client
+        if pooled:
+            agent_pool.release(game_context.players.values())
+            spare_context = game_context
+    return (time.perf_counter() - start) / num_games * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark batch games with and without object pooling")
+    parser.add_argument("--games", type=int, default=1000, help="Games per batch")
+    parser.add_argument("--rounds", type=int, default=2, help="Discussion rounds per game")
+    parser.add_argument("--worker", choices=["pooled", "fresh"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        result = run_batch(args.games, args.worker == "pooled", args.rounds)
+        result["model_setup_ms"] = time_model_game_setup(min(args.games, 200), args.worker == "pooled")
+        print(json.dumps(result))
+        return
+
+    results = {}
+    for mode in ("fresh", "pooled"):
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--worker", mode, "--games", str(args.games), "--rounds", str(args.rounds)],
+            capture_output=True, text=True, check=True
+        ).stdout
+        results[mode] = json.loads(output.strip().splitlines()[-1])
+
+    for mode, result in results.items():
+        reuse = f", {result['agents_created']} agents created / {result['agents_reused']} reused" if result["agents_created"] is not None else ""
+        print(f"{mode:<7} {result['games_per_sec']:>8.1f} games/s   peak RSS {result['peak_rss_mb']:>6.1f} MB{reuse}")
+    speedup = results["pooled"]["games_per_sec"] / results["fresh"]["games_per_sec"]
+    print(f"Pooling: {speedup:.2f}x games/s, {results['pooled']['peak_rss_mb'] - results['fresh']['peak_rss_mb']:+.1f} MB peak RSS")
+    print(f"Model-backed game setup: {results['fresh']['model_setup_ms']:.1f}ms fresh, {results['pooled']['model_setup_ms']:.1f}ms pooled")
+    if results["pooled"]["results_digest"] != results["fresh"]["results_digest"]:
+        print("❌ Pooled and fresh batches stored different results")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Discussion wall time, hit rate and latency saved by speculative turns, per relevance check
+
+Plays the day phase of model-backed games against the load test's fake model client, so
+every model call takes a realistic, seeded latency without calling the API. "never" drops
+every speculation and is the baseline: its turns wait for their own calls, as without
+speculation, while still paying for the speculative ones.
+
+Usage:
+    python benchmarks/speculation.py --games 20 --latency 0.2
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_days(num_games: int, relevance: str, latency: float, max_rounds: int) -> dict:
+    """Play num_games days with one relevance check; report mean discussion time and speculation totals"""
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    os.environ.setdefault("OPENAI_API_KEY", "benchmark-only")
+    from game_agents.speculation import Speculator
+    from game_server.load_test import FakeModelClient
+    from play import DayPhaseManager, NightPhaseManager
+    from setup import load_game_config, setup_game_context
+
+    game_config = load_game_config()
+    game_config["default_agent_type"] = "llm"
+    game_config["seat_agent_types"] = []
+
+    elapsed, started, hits, misses, saved = 0.0, 0, 0, 0, 0.0
+    for seed in range(num_games):
+        game_context = setup_game_context(game_config, random.Random(seed), client_factory=lambda: FakeModelClient(latency, seed=seed))
+        NightPhaseManager(game_context, verbose=False).execute_night_phase()
+        game_context.set_nighttime(False)
+
+        speculator = Speculator(relevance)
+        day_manager = DayPhaseManager(game_context, max_rounds=max_rounds, verbose=False, speculator=speculator)
+        start = time.perf_counter()
+        day_manager.run_discussion()
+        elapsed += time.perf_counter() - start
+        day_manager.shutdown()
+
+        report = speculator.report()
+        started += report["started"]
+        hits += report["hits"]
+        misses += report["misses"]
+        saved += report["seconds_saved"]
+
+    return {
+        "seconds_per_day": elapsed / num_games,
+        "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+        "seconds_saved_per_game": saved / num_games,
+        "extra_calls_per_game": (started - hits) / num_games,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark speculative discussion turns")
+    parser.add_argument("--games", type=int, default=20, help="Games per relevance check")
+    parser.add_argument("--latency", type=float, default=0.2, help="Median fake model latency in seconds")
+    parser.add_argument("--rounds", type=int, default=3, help="Discussion rounds per game")
+    args = parser.parse_args()
+
+    results = {relevance: run_days(args.games, relevance, args.latency, args.rounds) for relevance in ("never", "mentions", "claims", "always")}
+    baseline = results["never"]["seconds_per_day"]
+    for relevance, result in results.items():
+        print(
+            f"{relevance:<9} {result['seconds_per_day']:>6.2f}s per discussion ({baseline / result['seconds_per_day']:.2f}x)   "
+            f"hit rate {result['hit_rate']:>5.1%}   {result['seconds_saved_per_game']:>5.2f}s saved / game   "
+            f"{result['extra_calls_per_game']:>4.1f} wasted calls / game"
+        )
+
+
+if __name__ == "__main__":
+    main()
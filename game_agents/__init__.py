@@ -5,8 +5,20 @@ This package contains all the AI agents for different roles in One Night Werewol
 Each agent is configured with role-specific instructions and strategies.
 The agents use the OpenAI Agents SDK to participate in the game.
 
+Role modules are not imported here. agent_registry.py maps each role to its module and imports
+it the first time Role.get_agent_class looks the role up, and the OpenAI SDK is only imported
+when a model-backed agent creates its client, so scripted games and workers start quickly.
+
 Common Tools:
 - common_tools.py: Shared functionality including NightActionResult class and validation utilities
+- tool_registry.py: Declarative registry mapping each tool schema to its handler, with argument
+  validators compiled at import and structured ToolError results for rejected calls
+- prompting.py: Role prompt templates compiled once per role and assembled from the most stable
+  content (rules, role strategy) to the most volatile (conversation history, current ask)
+- streaming.py: Incremental extraction of public_response text from streamed structured responses
+- knowledge.py: Each agent's private knowledge as typed, deduplicated facts indexed by subject
+- speculation.py: Starts the next speaker's first model call early and keeps it if nothing relevant
+  was said in the meantime
 
 Night Action Tools:
 Each agent file that has night actions also contains the corresponding tool functions:
@@ -20,14 +32,27 @@ Each agent file that has night actions also contains the corresponding tool func
 - insomniac.py: check_final_role()
 
 Roles without night actions: villager, hunter, tanner
+
+Scripted Agents:
+- scripted.py: Rule-based counterparts of every role agent that never call a model,
+  registered in SCRIPTED_AGENT_REGISTRY and selected per seat from the game config
+
+Human Players:
+- human.py: Human counterparts of every role agent (built into HUMAN_AGENT_REGISTRY on first
+  use), with per-request timeouts that fall back to the same defaults as a missed model deadline
+- human_io.py: Background asyncio loop and terminal / local WebSocket channels for human input
 """
 
 from .base_agent import BaseAgent, ONWAgentResponse
-from .agent_registry import AGENT_REGISTRY
-from . import villager, werewolf, seer, robber, troublemaker, drunk, hunter, insomniac, mason, minion, tanner
+from .agent_registry import AGENT_REGISTRY, HUMAN_AGENT_REGISTRY, SCRIPTED_AGENT_REGISTRY
+from .tool_registry import TOOL_REGISTRY, ToolError
 
 __all__ = [
     'BaseAgent',
     'ONWAgentResponse',
     'AGENT_REGISTRY',
+    'SCRIPTED_AGENT_REGISTRY',
+    'HUMAN_AGENT_REGISTRY',
+    'TOOL_REGISTRY',
+    'ToolError',
 ] 
\ No newline at end of file
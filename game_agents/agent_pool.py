@@ -0,0 +1,37 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Type
+from game_agents.base_agent import BaseAgent
+
+
+class AgentPool:
+    """
+    Agents from finished games, kept by class and reseated in later games
+
+    Reusing an agent keeps its model client and avoids rebuilding its state, which matters
+    when a batch plays thousands of short games. Only AI agents are pooled; a human seat's
+    channel belongs to its player.
+    """
+    def __init__(self):
+        self._free: Dict[Type[BaseAgent], List[BaseAgent]] = defaultdict(list)
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, agent_cls: Type[BaseAgent], player_id: int, player_name: str, initial_role: str, is_ai: bool = True) -> BaseAgent:
+        """A reset agent of agent_cls from the pool, or a new one if none is free"""
+        free = self._free.get(agent_cls)
+        if free and is_ai:
+            agent = free.pop()
+            agent.reset(player_id, player_name, initial_role, is_ai)
+            self.reused += 1
+            return agent
+        self.created += 1
+        return agent_cls(player_id=player_id, player_name=player_name, initial_role=initial_role, is_ai=is_ai)
+
+    def release(self, agents: Iterable[BaseAgent]) -> None:
+        """Return a finished game's agents; they must not be used by that game afterwards"""
+        for agent in agents:
+            if agent.is_ai:
+                self._free[type(agent)].append(agent)
+
+    def __len__(self) -> int:
+        return sum(len(free) for free in self._free.values())
@@ -1,10 +1,73 @@
-from typing import Dict, Type
+from importlib import import_module
+from typing import Callable, Dict, Type
 from game_agents.base_agent import BaseAgent
 
-AGENT_REGISTRY: Dict[str, Type[BaseAgent]] = {}
+# Module that registers each role's agent; imported the first time the role is looked up
+ROLE_MODULES: Dict[str, str] = {
+    "villager": "game_agents.villager",
+    "werewolf": "game_agents.werewolf",
+    "seer": "game_agents.seer",
+    "robber": "game_agents.robber",
+    "troublemaker": "game_agents.troublemaker",
+    "drunk": "game_agents.drunk",
+    "hunter": "game_agents.hunter",
+    "insomniac": "game_agents.insomniac",
+    "mason": "game_agents.mason",
+    "minion": "game_agents.minion",
+    "tanner": "game_agents.tanner",
+}
+
+
+class LazyAgentRegistry(dict):
+    """
+    Role name -> agent class, loading a role's agents on first lookup
+
+    Indexing a role that isn't registered yet calls the loader, which imports (or builds) and
+    registers it, so a game only ever imports the roles it deals.
+    """
+    def __init__(self, loader: Callable[[str], None]):
+        super().__init__()
+        self._loader = loader
+
+    def __missing__(self, role_name: str) -> Type[BaseAgent]:
+        if role_name not in ROLE_MODULES:
+            raise KeyError(role_name)
+        self._loader(role_name)
+        return dict.__getitem__(self, role_name)
+
+    def load_all(self) -> "LazyAgentRegistry":
+        """Register every role (for callers that need the whole registry)"""
+        for role_name in ROLE_MODULES:
+            self[role_name]
+        return self
+
+
+def _load_role_module(role_name: str) -> None:
+    import_module(ROLE_MODULES[role_name])
+
+
+def _load_scripted_agents(role_name: str) -> None:
+    import_module("game_agents.scripted")
+
+
+def _load_human_agent(role_name: str) -> None:
+    from game_agents.human import HumanAgentMixin
+    agent_cls = AGENT_REGISTRY[role_name]
+    HUMAN_AGENT_REGISTRY[role_name] = type(f"Human{agent_cls.__name__}", (HumanAgentMixin, agent_cls), {"__module__": HumanAgentMixin.__module__})
+
+
+AGENT_REGISTRY: Dict[str, Type[BaseAgent]] = LazyAgentRegistry(_load_role_module)
+SCRIPTED_AGENT_REGISTRY: Dict[str, Type[BaseAgent]] = LazyAgentRegistry(_load_scripted_agents)
+HUMAN_AGENT_REGISTRY: Dict[str, Type[BaseAgent]] = LazyAgentRegistry(_load_human_agent)
 
 def register_agent(role_name: str):
     def decorator(cls):
         AGENT_REGISTRY[role_name.lower()] = cls
         return cls
-    return decorator
\ No newline at end of file
+    return decorator
+
+def register_scripted_agent(role_name: str):
+    def decorator(cls):
+        SCRIPTED_AGENT_REGISTRY[role_name.lower()] = cls
+        return cls
+    return decorator
@@ -1,11 +1,21 @@
-from openai import OpenAI
 import os
+import sys
 import json
-import textwrap
-from typing import Optional
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
+from typing import Any, Callable, Optional
 from pydantic import BaseModel
 from game_context.game_context import GameContext
 from game_context.messages import ConversationHistory
+from game_agents.common_tools import resolve_player_name_to_id
+from game_agents.model_router import ModelRoute, ModelRouter
+from game_agents.hedging import DeadlineExceeded, HedgedCaller
+from game_agents.knowledge import KnowledgeStore
+from game_agents.speculation import SpeculativeTurn
+from game_agents.streaming import PublicResponseExtractor
+from game_agents.prompting import PromptLayers, RolePrompt, question_ask, shared_prefix_length, turn_ask, vote_ask
+from game_agents.tool_registry import ToolError, dispatch_tool, get_tool, register_tool
 
 class ONWAgentResponse(BaseModel):
     """Response from the agent"""
@@ -14,7 +24,12 @@ class ONWAgentResponse(BaseModel):
     tool_calls: list[dict] = []
     raw_response: str = ""
 
-def inquire_about_another_player(player_name: str, question: str, game_context: GameContext, questioning_player_name: str):
+class ONWVoteResponse(BaseModel):
+    """Vote cast by the agent at the end of the day"""
+    private_thoughts: str
+    vote_target_name: str
+
+def inquire_about_another_player(player_name: str, question: str, game_context: GameContext, questioning_player_name: str, message_id: Optional[int] = None):
     """
     Send a question to another player and get their response
     
@@ -23,6 +38,7 @@ def inquire_about_another_player(player_name: str, question: str, game_context:
         question: The question to ask
         game_context: Current game context containing all players
         questioning_player_name: Name of the player asking the question
+        message_id: Transcript id reserved for the answer (a new one is taken when omitted)
         
     Returns:
         The response from the questioned player
@@ -37,7 +53,8 @@ def inquire_about_another_player(player_name: str, question: str, game_context:
             prompt=question,
             prompt_is_another_player_question=True,
             questioning_player_name=questioning_player_name,
-            game_state=game_context
+            game_state=game_context,
+            message_id=message_id
         )
         return f"{player_name} responds: {response.public_response}"
     except Exception as e:
@@ -68,99 +85,271 @@ common_tools = [
     }
 ]
 
+class _NeverRaised(Exception):
+    pass
+
+
+def _api_timeout_error() -> type:
+    """openai.APITimeoutError, without importing the SDK for agents that never load it"""
+    openai = sys.modules.get("openai")
+    return openai.APITimeoutError if openai is not None else _NeverRaised
+
+
 class BaseAgent:
+    prompt_template: Optional[RolePrompt] = None
+    # False for seats that never call a model (scripted and human), so nothing waits on model latency for them
+    calls_model = True
+
     def __init__(self, player_id: int, player_name: str, initial_role: str, is_ai: bool, model: str = "gpt-4o-mini", nighttime_tools: list[dict] = []):
         self.model = model
         self.player_id = player_id
         self.player_name = player_name
         self.current_role = initial_role
         self.initial_role = initial_role
-        self.personal_knowledge = []
+        self.personal_knowledge = KnowledgeStore()
         self.is_ai = is_ai
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client_factory: Optional[Callable[[], Any]] = None
+        self._client = None
+        self._client_created = False
         self.nighttime_tools = nighttime_tools
         self.daytime_tools = common_tools
         self.nighttime_tool = nighttime_tools[0].get("function", {}).get("name") if nighttime_tools else None
+        self.token_usage = {"prompt_tokens": 0, "completion_tokens": 0}
+        self.router: Optional[ModelRouter] = None
+        self.hedger: Optional[HedgedCaller] = None
+        self.max_tool_steps = 4
+        self.max_turn_seconds = 60.0
+        self.max_tool_repairs = 1
+        self._last_prompts = {}
+        self.stream_responses = False
+        # "full" transcript, "relevant" messages, or the "claims" table and this round (see prompting.py)
+        self.history_mode = "full"
+        self.history_token_budget = 1500
+        # Model-free night choice that overrides the route, e.g. replaying a cached night (see simulation.night_cache)
+        self.night_policy: Optional[Callable[[Any, GameContext], Optional[tuple]]] = None
     
+    def reset(self, player_id: int, player_name: str, initial_role: str, is_ai: bool = True) -> None:
+        """
+        Reseat this agent for a new game (see AgentPool)
+        
+        Knowledge, roles and usage from the previous game are cleared; the model client and the
+        settings applied by setup_game_context are kept.
+        """
+        self.player_id = player_id
+        self.player_name = player_name
+        self.current_role = initial_role
+        self.initial_role = initial_role
+        self.is_ai = is_ai
+        self.personal_knowledge.clear()
+        self.token_usage = {"prompt_tokens": 0, "completion_tokens": 0}
+        self._last_prompts.clear()
+        self.night_policy = None
+    
+    @property
+    def client(self):
+        """Model client, created on first use so a game can set client_factory after seating the agent"""
+        if not self._client_created:
+            self._client = self._create_client()
+            self._client_created = True
+        return self._client
+    
+    @client.setter
+    def client(self, client) -> None:
+        self._client = client
+        self._client_created = True
+    
+    def _create_client(self):
+        """Create the model client used by this agent"""
+        if self.client_factory is not None:
+            return self.client_factory()
+        # Imported here so scripted and human seats (and fake clients) never pay for the SDK
+        from openai import OpenAI
+        return OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
     def act(
             self,
             prompt: str,
             prompt_is_another_player_question: bool = False,
             questioning_player_name: str = "",
-            game_state: GameContext = None
+            game_state: GameContext = None,
+            speculation: Optional[SpeculativeTurn] = None,
+            message_id: Optional[int] = None
     ) -> ONWAgentResponse:
         """
         Act on the given prompt.
+        
+        A speculation started earlier for this turn (see Speculator) stands in for its first model call.
+        The response is added to the transcript under message_id when one was reserved for it (see
+        ConversationHistory.reserve_message_id); the caller releases the id if acting fails.
         """
         conversation_history = game_state.conversation
-        return self._invoke_model(conversation_history, prompt, prompt_is_another_player_question, questioning_player_name, game_state)
+        return self._invoke_model(conversation_history, prompt, prompt_is_another_player_question, questioning_player_name, game_state, speculation, message_id)
 
-    def _get_system_prompt(self):
-        raise NotImplementedError("Subclasses must implement this method")
+    def _resolve_route(self, call_type: str, game_context: GameContext) -> ModelRoute:
+        """Pick the model settings for a call, falling back to this agent's model when no router is set"""
+        if self.router is None:
+            return ModelRoute(model=self.model)
+        phase = "night" if game_context.is_nighttime else "day"
+        return self.router.resolve(self.initial_role, phase, call_type)
 
-    def _get_prompt(self, conversation_history: ConversationHistory, prompt: str, prompt_is_another_player_question: bool = False, questioning_player_name: str = ""):
-        if conversation_history.messages:
-            conversation_history_text = f"Here is the conversation history you've been participating in:\n\n{conversation_history.get_public_conversation_history()}"
-        else:
-            conversation_history_text = ""
+    def _call_timeout(self, route: ModelRoute, deadline: Optional[float]) -> Optional[float]:
+        """
+        Seconds a call on route may take: the route's timeout, cut to what is left before deadline
+        
+        Raises:
+            DeadlineExceeded: If deadline (a time.monotonic() value) has already passed
+        """
+        if deadline is None:
+            return route.timeout
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceeded(f"No time left in the turn for a call on route '{route.name}'")
+        return remaining if route.timeout is None else min(route.timeout, remaining)
 
-        if prompt_is_another_player_question:
-            return textwrap.dedent(
-                f"""{questioning_player_name} has a question for you!
-
-                The question is: {prompt}
-
-                The conversation history as of current has been:
-                {conversation_history_text}    
-
-                Please respond to {questioning_player_name}'s question. You can choose to be truthful, 
-                misleading, or evasive depending on what benefits your role.
-                
-                Format your response exactly like this:
-                
-                PRIVATE_THOUGHTS: [Your internal reasoning and strategy - what you're actually thinking]
-                
-                PUBLIC_RESPONSE: [What you want to say out loud to {questioning_player_name} and the group in response to their question]"""
-            )
-        else:
-            return textwrap.dedent(
-                f"""It's your turn to act!
-
-                Current situation: {prompt}
-
-                The conversation history as of current has been:
-                {conversation_history_text}
-
-                What would you like to say to the group or do? You can share information, ask questions, make accusations, 
-                or use any available tools.
-                
-                Format your response exactly like this:
-                
-                PRIVATE_THOUGHTS: [Your internal reasoning and strategy - what you're actually thinking]
-                
-                PUBLIC_RESPONSE: [What you want to say out loud to the group]"""
-            )
+    def _create_completion(self, route: ModelRoute, structured: bool, on_content_delta=None, deadline: Optional[float] = None, **api_params):
+        """
+        Call the model with the route's settings, recording latency and token usage
+        
+        With a hedger the call gets a hard deadline (the route's timeout) and a hedged duplicate
+        request, and raises DeadlineExceeded when nothing answers in time. Passing on_content_delta
+        streams the response instead; streamed calls are never hedged, since their tokens are
+        already visible. A deadline (a time.monotonic() value, e.g. the end of the turn) shortens
+        the call's timeout to the time left before it.
+        """
+        api_params.update(route.completion_params())
+        timeout = self._call_timeout(route, deadline)
+        if on_content_delta is not None:
+            return self._stream_completion(route, on_content_delta, {**api_params, "timeout": timeout})
+        create = self.client.chat.completions.parse if structured else self.client.chat.completions.create
+        
+        def attempt(timeout: Optional[float]):
+            params = dict(api_params)
+            if timeout is not None:
+                params["timeout"] = timeout
+            start = time.perf_counter()
+            try:
+                response = create(**params)
+            except Exception:
+                if self.router:
+                    self.router.record(route, time.perf_counter() - start, error=True)
+                raise
+            return response, time.perf_counter() - start
         
-    def _invoke_model(self, conversation_history: ConversationHistory, prompt: str, prompt_is_another_player_question: bool = False, questioning_player_name: str = "", game_context: GameContext = None) -> ONWAgentResponse:
         try:
-            system_prompt = self._get_system_prompt(game_context)
-        except TypeError:
-            system_prompt = self._get_system_prompt()
-        user_prompt = self._get_prompt(conversation_history, prompt, prompt_is_another_player_question, questioning_player_name)
+            if self.hedger:
+                (response, latency), _ = self.hedger.call(route, attempt, timeout=timeout)
+            else:
+                response, latency = attempt(timeout)
+        except _api_timeout_error() as e:
+            if self.router:
+                self.router.record_timeout(route)
+            raise DeadlineExceeded(f"Route '{route.name}' call timed out: {str(e)}") from e
         
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt}
-        ]
+        self._record_usage(response, route, latency)
+        return response
+
+    def _stream_completion(self, route: ModelRoute, on_content_delta, api_params: dict):
+        """
+        Stream a structured completion, passing content deltas on and recording time to first token
+        
+        The request timeout only bounds the wait for each chunk, so the whole stream is held to
+        the call's timeout here: a stream still running at the deadline is closed and the call
+        raises DeadlineExceeded, as a blocking call would.
+        """
+        params = {key: value for key, value in api_params.items() if value is not None}
+        timeout = params.get("timeout")
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        start = time.perf_counter()
+        first_token = None
+        try:
+            with self.client.chat.completions.stream(stream_options={"include_usage": True}, **params) as stream:
+                for event in stream:
+                    if deadline is not None and time.monotonic() >= deadline:
+                        # Leaving the with block closes the stream
+                        raise DeadlineExceeded(f"Route '{route.name}' stream missed its {timeout}s deadline")
+                    if event.type != "content.delta":
+                        continue
+                    if first_token is None:
+                        first_token = time.perf_counter() - start
+                        if self.router:
+                            self.router.record_first_token(route, first_token)
+                    on_content_delta(event.delta)
+                response = stream.get_final_completion()
+        except DeadlineExceeded:
+            if self.router:
+                self.router.record(route, time.perf_counter() - start, error=True)
+                self.router.record_timeout(route)
+            raise
+        except _api_timeout_error() as e:
+            if self.router:
+                self.router.record(route, time.perf_counter() - start, error=True)
+                self.router.record_timeout(route)
+            raise DeadlineExceeded(f"Route '{route.name}' call timed out: {str(e)}") from e
+        except Exception:
+            if self.router:
+                self.router.record(route, time.perf_counter() - start, error=True)
+            raise
+        
+        self._record_usage(response, route, time.perf_counter() - start)
+        return response
+
+    def _prompt_layers(self, game_context: GameContext, ask: str) -> PromptLayers:
+        """Assemble this agent's prompt for one call from its role's precompiled template"""
+        if self.prompt_template is None:
+            raise NotImplementedError("Subclasses must set prompt_template")
+        return self.prompt_template.layers(self, game_context, ask)
+
+    def _track_prompt(self, route: ModelRoute, layers: PromptLayers) -> None:
+        """
+        Report how much of a prompt a provider-side prompt cache can reuse
+        
+        The cacheable prefix is the longer of the layers that are fixed for the game and the
+        prefix shared with this agent's previous prompt on the same route.
+        """
+        text = "".join(message["content"] for message in layers.messages())
+        previous = self._last_prompts.get(route.name, "")
+        self._last_prompts[route.name] = text
+        prefix_chars = max(min(layers.stable_prefix_chars, len(text)), shared_prefix_length(previous, text))
+        if self.router:
+            self.router.record_prompt(route, len(text), prefix_chars)
+
+    def speculate_turn(self, prompt: str, game_context: GameContext, executor) -> Optional[SpeculativeTurn]:
+        """
+        Start the first model call of this agent's next daytime turn on the conversation as it is now
         
-        # Determine which tools are available based on game phase
+        The call has no side effects: nothing is added to the conversation and no tool runs until
+        the turn takes the result. Returns None for routes that don't call a model.
+        """
+        route = self._resolve_route("turn", game_context)
+        if route.is_scripted or self.client is None:
+            return None
+        messages, _, api_params = self._build_request(prompt, False, "", route, game_context)
+        if self.max_tool_steps <= 1 and api_params["tools"]:
+            api_params["tool_choice"] = "none"
+        turn = SpeculativeTurn(self.player_id, prompt, route, messages, api_params, game_context)
+        turn.run(executor, partial(self._create_completion, route, structured=True, **api_params))
+        return turn
+
+    def _build_request(self, prompt: str, prompt_is_another_player_question: bool, questioning_player_name: str, route: ModelRoute, game_context: GameContext) -> tuple[list, list, dict]:
+        """The messages, tools and request parameters of the first model call of a turn, question or night action"""
+        if prompt_is_another_player_question:
+            ask = question_ask(questioning_player_name, prompt)
+        else:
+            ask = turn_ask(prompt)
+        layers = self._prompt_layers(game_context, ask)
+        self._track_prompt(route, layers)
+        messages = layers.messages()
+        
+        # Determine which tools are available based on game phase; answering a question gets no tools
+        # so inquiries can't recurse into further inquiries
         if game_context.is_nighttime:
             available_tools = self.nighttime_tools
+        elif prompt_is_another_player_question:
+            available_tools = []
         else:
             available_tools = self.daytime_tools
         
         api_params = {
-            "model": self.model,
             "messages": messages,
             "tools": available_tools if available_tools else None
         }
@@ -173,33 +362,100 @@ class BaseAgent:
             forced_tool = self.get_forced_nighttime_tool()
             if forced_tool:
                 api_params["tool_choice"] = {"type": "function", "function": {"name": forced_tool}}
-        
+        return messages, available_tools, api_params
+
+    def _invoke_model(self, conversation_history: ConversationHistory, prompt: str, prompt_is_another_player_question: bool = False, questioning_player_name: str = "", game_context: GameContext = None, speculation: Optional[SpeculativeTurn] = None, message_id: Optional[int] = None) -> ONWAgentResponse:
         if game_context.is_nighttime:
-            # For nighttime, use regular completion (no structured output)
-            response = self.client.chat.completions.create(**api_params)
+            call_type = "night_action"
+        elif prompt_is_another_player_question:
+            call_type = "question"
         else:
-            # For daytime, use structured output
-            response = self.client.chat.completions.parse(**api_params)
-
-        raw_response = response.choices[0].message.content
+            call_type = "turn"
+        route = self._resolve_route(call_type, game_context)
+        
+        if call_type == "night_action" and self.night_policy is not None:
+            return self._apply_night_policy(self.night_policy, "a replayed night", route, conversation_history, game_context)
+        if route.is_scripted:
+            from game_agents.scripted import choose_night_action
+            return self._apply_night_policy(choose_night_action, f"scripted route '{route.name}'", route, conversation_history, game_context)
+        
+        if speculation is not None and (call_type != "turn" or speculation.route != route or (self.max_tool_steps <= 1) != ("tool_choice" in speculation.api_params)):
+            # Settings changed since the speculation started (e.g. the day budget cut the tool steps)
+            speculation.cancel()
+            speculation = None
+        if speculation is not None:
+            messages, api_params = speculation.messages, speculation.api_params
+            available_tools = api_params["tools"] or []
+        else:
+            messages, available_tools, api_params = self._build_request(prompt, prompt_is_another_player_question, questioning_player_name, route, game_context)
+        
+        raw_response = None
         tool_calls_made = []
-
-        if response.choices[0].message.tool_calls:
-            for tool_call in response.choices[0].message.tool_calls:
-                name = tool_call.function.name
-                args = json.loads(tool_call.function.arguments)
-                
-                result = self.call_tool(name, args, game_context)
-                tool_calls_made.append(ToolCall(
-                    name=name,
-                    arguments=ToolCallArguments(args=args, result=result)
-                ))
-                
+        loop_start = time.monotonic()
+        # Every model call and inquiry of the turn has to finish by then, not just start before it
+        turn_deadline = loop_start + self.max_turn_seconds
+        
+        for step in range(self.max_tool_steps):
+            out_of_budget = step == self.max_tool_steps - 1 or time.monotonic() - loop_start >= self.max_turn_seconds
+            if out_of_budget and available_tools and not game_context.is_nighttime:
+                # Last chance: make the model answer with what it has instead of asking for more tools
+                api_params["tool_choice"] = "none"
+            
+            extractor, on_content_delta = None, None
+            if self.stream_responses and not game_context.is_nighttime:
+                extractor = PublicResponseExtractor()
+                on_content_delta = partial(self._publish_public_delta, extractor, game_context=game_context)
+            
+            # For nighttime, use regular completion (no structured output); for daytime, use structured output
+            try:
+                if step == 0 and speculation is not None:
+                    response = speculation.result(timeout=self._call_timeout(route, turn_deadline))
+                else:
+                    response = self._create_completion(route, structured=not game_context.is_nighttime, on_content_delta=on_content_delta, deadline=turn_deadline, **api_params)
+            except DeadlineExceeded:
+                if game_context.is_nighttime and not tool_calls_made:
+                    from game_agents.scripted import default_night_action
+                    return self._apply_night_policy(default_night_action, "the default action after a missed deadline", route, conversation_history, game_context)
+                return self._pass_turn(conversation_history, tool_calls_made, message_id=message_id)
+            
+            message = response.choices[0].message
+            raw_response = message.content
+            if not message.tool_calls:
+                break
+            if extractor and extractor.text:
+                # The model spoke and then asked for tools; its final answer replaces what was streamed
+                game_context.events.publish("public_response_retracted", player_id=self.player_id)
+            
+            messages.append({
+                "role": "assistant",
+                "content": message.content,
+                "tool_calls": [
+                    {
+                        "id": tool_call.id,
+                        "type": "function",
+                        "function": {"name": tool_call.function.name, "arguments": tool_call.function.arguments}
+                    }
+                    for tool_call in message.tool_calls
+                ]
+            })
+            
+            for tool_call, (name, args, result) in zip(message.tool_calls, self._execute_tool_calls(message.tool_calls, game_context, deadline=turn_deadline)):
+                tool_calls_made.append(self._tool_call_record(name, args, result))
                 messages.append({
                     "role": "tool",
                     "tool_call_id": tool_call.id,
                     "content": str(result)
                 })
+            
+            if game_context.is_nighttime:
+                # The forced night action is a single tool call; there is nothing left to ask the model
+                break
+        
+        if game_context.is_nighttime and tool_calls_made and all("error" in call for call in tool_calls_made):
+            # Don't lose the night action to a tool call that stayed invalid (or named an action that
+            # can't be taken, like robbing yourself) after the repair attempts
+            from game_agents.scripted import default_night_action
+            return self._apply_night_policy(default_night_action, "the default action after an invalid tool call", route, conversation_history, game_context)
         
         if game_context.is_nighttime:
             # For nighttime, create simple response
@@ -207,35 +463,246 @@ class BaseAgent:
             public_response = raw_response or "Action completed"
         else:
             # For daytime, parse structured response
-            private_thoughts, public_response = self._parse_structured_response(raw_response)
+            private_thoughts, public_response = self._parse_structured_response(raw_response or "")
         
         agent_response = ONWAgentResponse(  
             public_response=public_response,
             private_thoughts=private_thoughts,
             tool_calls=tool_calls_made,
-            raw_response=raw_response
+            raw_response=raw_response or ""
         )
 
-        # Convert ToolCall objects back to dict format for conversation history
-        tool_calls_for_history = []
-        for tool_call in tool_calls_made:
-            tool_calls_for_history.append({
-                "name": tool_call.name,
-                "args": tool_call.arguments.args,
-                "result": tool_call.arguments.result
-            })
-        
         conversation_history.add_agent_response(
             player_id=self.player_id,
             player_name=self.player_name,
             public_response=public_response,
             private_thoughts=private_thoughts,
-            tool_calls=tool_calls_for_history,
-            raw_response=raw_response
+            tool_calls=tool_calls_made,
+            raw_response=raw_response or "",
+            message_id=message_id
         )
         
         return agent_response
 
+    def _execute_tool_calls(self, tool_calls: list, game_context: GameContext, deadline: Optional[float] = None) -> list[tuple[str, dict, str]]:
+        """
+        Run the tool calls from one model response, concurrently where they are independent
+        
+        Calls aimed at the same player (or the same tool, when there is no target player) run in
+        order on one worker; everything else runs in parallel. Results come back in call order.
+        Calls that add a message to the transcript (questions to other players) have their ids
+        reserved up front, in call order, so the answers land in the order they were asked rather
+        than the order they finish. During the day, calls still running at deadline (a
+        time.monotonic() value) are given up with a "timed_out" error and their ids released; a
+        questioned player's answer that lands later is left out of the transcript. Night actions
+        change the game state, so they are always waited for.
+        
+        Returns:
+            List of (tool name, arguments actually used, result) in the order the calls were made
+        """
+        parsed_calls = []
+        for tool_call in tool_calls:
+            name, raw_arguments = tool_call.function.name, tool_call.function.arguments
+            try:
+                parsed_calls.append((name, json.loads(raw_arguments), raw_arguments))
+            except json.JSONDecodeError:
+                parsed_calls.append((name, None, raw_arguments))
+        
+        groups = {}
+        for index, (name, args, _) in enumerate(parsed_calls):
+            key = args.get("player_name", name) if isinstance(args, dict) else name
+            groups.setdefault(key, []).append(index)
+        
+        results = [None] * len(parsed_calls)
+        conversation = game_context.conversation
+        message_ids = [
+            conversation.reserve_message_id() if isinstance(args, dict) and getattr(get_tool(name), "posts_message", False) else None
+            for name, args, _ in parsed_calls
+        ]
+        
+        def run_group(indices):
+            for index in indices:
+                try:
+                    results[index] = self._call_tool_with_repair(*parsed_calls[index], game_context, message_id=message_ids[index])
+                finally:
+                    if message_ids[index] is not None:
+                        conversation.release_message_id(message_ids[index])
+        
+        bounded = deadline is not None and not game_context.is_nighttime
+        if len(groups) == 1 and not bounded:
+            run_group(next(iter(groups.values())))
+        else:
+            executor = ThreadPoolExecutor(max_workers=len(groups))
+            try:
+                futures = [executor.submit(run_group, indices) for indices in groups.values()]
+                done, _ = wait(futures, timeout=max(deadline - time.monotonic(), 0.0) if bounded else None)
+                for future in done:
+                    future.result()
+            finally:
+                # Don't wait for calls that missed the deadline; they finish in the background
+                executor.shutdown(wait=False)
+        
+        for index, (name, args, _) in enumerate(parsed_calls):
+            if results[index] is None:
+                if message_ids[index] is not None:
+                    conversation.release_message_id(message_ids[index])
+                results[index] = (name, args, ToolError(tool=name, kind="timed_out", message=f"{name} did not finish before the end of the turn"))
+        return [(name, args if isinstance(args, dict) else {}, result) for name, args, result in results]
+
+    def _call_tool_with_repair(self, name: str, args, raw_arguments: str, game_context: GameContext, message_id: Optional[int] = None) -> tuple:
+        """
+        Call a tool, re-prompting for just that call when its arguments fail validation or
+        describe an action that can't be taken
+        
+        The re-prompt shows the model only the rejected call and the validation problems, forces
+        the same tool, and is retried at most max_tool_repairs times.
+        
+        Returns:
+            Tuple of (tool name, arguments used, result)
+        """
+        if args is None:
+            result = ToolError(tool=name, kind="invalid_arguments", message=f"Arguments for {name} are not valid JSON")
+        else:
+            result = self.call_tool(name, args, game_context, message_id=message_id)
+        
+        for _ in range(self.max_tool_repairs):
+            if not (isinstance(result, ToolError) and result.kind in ("invalid_arguments", "invalid_action")):
+                break
+            repaired = self._repair_tool_arguments(name, raw_arguments, result, game_context)
+            if repaired is None:
+                break
+            args, raw_arguments = repaired, json.dumps(repaired)
+            result = self.call_tool(name, args, game_context, message_id=message_id)
+        
+        return name, args, result
+
+    def _repair_tool_arguments(self, name: str, raw_arguments: str, error: ToolError, game_context: GameContext) -> Optional[dict]:
+        """Ask the model (on the tool_repair route) to resend one rejected tool call, returning the new arguments"""
+        spec = get_tool(name)
+        if spec is None or self.client is None:
+            return None
+        
+        problems = "\n".join(f"- {problem}" for problem in error.problems) or f"- {error.message}"
+        messages = [
+            {"role": "system", "content": f"You are {self.player_name}. Your last call to the {name} tool was rejected. Call it again with corrected arguments and keep your original intent."},
+            {"role": "user", "content": f"Arguments you sent:\n{raw_arguments}\n\nProblems:\n{problems}"}
+        ]
+        try:
+            response = self._create_completion(
+                self._resolve_route("tool_repair", game_context),
+                structured=False,
+                messages=messages,
+                tools=[spec.schema],
+                tool_choice={"type": "function", "function": {"name": name}}
+            )
+        except DeadlineExceeded:
+            return None
+        
+        tool_calls = response.choices[0].message.tool_calls
+        if not tool_calls:
+            return None
+        try:
+            return json.loads(tool_calls[0].function.arguments)
+        except json.JSONDecodeError:
+            return None
+
+    def cast_vote(self, game_context: GameContext) -> Optional[int]:
+        """
+        Ask the model who to eliminate at the end of the day
+        
+        Args:
+            game_context: Current game state
+            
+        Returns:
+            The player ID voted for, or None if the model named nobody valid
+        """
+        route = self._resolve_route("vote", game_context)
+        layers = self._prompt_layers(game_context, vote_ask(game_context, self.player_id))
+        self._track_prompt(route, layers)
+        
+        try:
+            response = self._create_completion(
+                route,
+                structured=True,
+                messages=layers.messages(),
+                response_format=ONWVoteResponse
+            )
+        except DeadlineExceeded:
+            return None
+        
+        vote = response.choices[0].message.parsed
+        if not vote:
+            return None
+        
+        success, _, target_player_id = resolve_player_name_to_id(game_context, vote.vote_target_name, self.player_id)
+        return target_player_id if success else None
+
+    def _record_usage(self, response, route: ModelRoute, latency: float) -> None:
+        """Accumulate token counts reported by the model provider and report them to the router"""
+        usage = getattr(response, "usage", None)
+        prompt_tokens = (usage.prompt_tokens or 0) if usage else 0
+        completion_tokens = (usage.completion_tokens or 0) if usage else 0
+        prompt_details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = (getattr(prompt_details, "cached_tokens", 0) or 0) if prompt_details else 0
+        self.token_usage["prompt_tokens"] += prompt_tokens
+        self.token_usage["completion_tokens"] += completion_tokens
+        
+        if self.router:
+            self.router.record(route, latency, prompt_tokens, completion_tokens, cached_tokens=cached_tokens)
+
+    def _apply_night_policy(self, policy, chosen_by: str, route: ModelRoute, conversation_history: ConversationHistory, game_context: GameContext) -> ONWAgentResponse:
+        """Take the night action picked by a model-free policy (see game_agents.scripted)"""
+        start = time.perf_counter()
+        tool_calls_made = []
+        choice = policy(self, game_context)
+        if choice:
+            name, args = choice
+            tool_calls_made.append(self._tool_call_record(name, args, self.call_tool(name, args, game_context)))
+        if self.router and route.is_scripted:
+            self.router.record(route, time.perf_counter() - start)
+        
+        public_response = "Action completed"
+        private_thoughts = f"Nighttime action chosen by {chosen_by}"
+        conversation_history.add_agent_response(
+            player_id=self.player_id,
+            player_name=self.player_name,
+            public_response=public_response,
+            private_thoughts=private_thoughts,
+            tool_calls=tool_calls_made
+        )
+        
+        return ONWAgentResponse(
+            public_response=public_response,
+            private_thoughts=private_thoughts,
+            tool_calls=tool_calls_made
+        )
+
+    def _publish_public_delta(self, extractor: PublicResponseExtractor, delta: str, game_context: GameContext) -> None:
+        """Publish the part of a streamed response that is new public_response text"""
+        text = extractor.feed(delta)
+        if text:
+            game_context.events.publish("public_response_delta", player_id=self.player_id, player_name=self.player_name, text=text)
+
+    def _tool_call_record(self, name: str, args: dict, result) -> dict:
+        """Conversation record of one tool call; rejected calls keep their structured error"""
+        record = {"name": name, "args": args, "result": str(result)}
+        if isinstance(result, ToolError):
+            record["error"] = result.model_dump()
+        return record
+
+    def _pass_turn(self, conversation_history: ConversationHistory, tool_calls_made: Optional[list] = None, private_thoughts: str = "Turn skipped after the model call missed its deadline", message_id: Optional[int] = None) -> ONWAgentResponse:
+        """Give up a daytime turn that ran out of time, keeping any tool calls already made"""
+        public_response = "(stays quiet)"
+        conversation_history.add_agent_response(
+            player_id=self.player_id,
+            player_name=self.player_name,
+            public_response=public_response,
+            private_thoughts=private_thoughts,
+            tool_calls=tool_calls_made or [],
+            message_id=message_id
+        )
+        return ONWAgentResponse(public_response=public_response, private_thoughts=private_thoughts, tool_calls=tool_calls_made or [])
+
     def _parse_structured_response(self, raw_response: str) -> tuple[str, str]:
         try:
             parsed = json.loads(raw_response)
@@ -251,10 +718,34 @@ class BaseAgent:
             return f"Error parsing response: {str(e)}", raw_response.strip()
 
 
+    def prepare_turn(self, game_context: GameContext) -> None:
+        """
+        Get ready for an upcoming daytime turn while another player is still speaking
+        
+        Sends a one-token request with the same model, tools and system prompt as the real turn,
+        so the provider has the prompt prefix cached by the time this agent speaks. It goes
+        through the usual completion path, and its latency and tokens are recorded under a
+        "warm_up" copy of the turn's route, so they show in cost reports without skewing the
+        turn latencies the day budget plans with.
+        """
+        if self.client is None:
+            return
+        turn_route = self._resolve_route("turn", game_context)
+        if turn_route.is_scripted:
+            return
+        route = turn_route.model_copy(update={"name": f"{turn_route.name}-warm-up", "call_type": "warm_up", "max_tokens": 1})
+        system_message = self._prompt_layers(game_context, "").messages()[0]
+        try:
+            self._create_completion(route, structured=False, messages=[system_message], tools=self.daytime_tools)
+        except Exception:
+            # Only an optimisation; the turn itself doesn't depend on it
+            pass
+
     def is_tool_available(self, tool_name: str, game_context: GameContext = None) -> bool:
         """Check if a tool is available based on current game phase"""
-        if tool_name == self.nighttime_tool:
-            return game_context and game_context.is_nighttime
+        spec = get_tool(tool_name)
+        if tool_name == self.nighttime_tool or (spec and spec.phase == "night"):
+            return bool(game_context and game_context.is_nighttime)
         return True  # Daytime tools always available
     
     def execute_night_action(self, game_context: GameContext):
@@ -265,29 +756,22 @@ class BaseAgent:
         """Return the forced nighttime tool if one is set."""
         return self.nighttime_tool
     
-    def call_tool(self, name: str, args: dict, game_context: GameContext = None):
+    def call_tool(self, name: str, args: dict, game_context: GameContext = None, message_id: Optional[int] = None):
         """
-        Call a tool. Must be implemented by subclasses to define their specific tools.
+        Call a tool through the tool registry (see game_agents.tool_registry)
+        
+        Returns:
+            The tool's result string, or a ToolError if the call was rejected before running
         """
-        raise NotImplementedError("Subclasses must implement call_tool to define their available tools")
-    
-    def _call_common_tool(self, name: str, args: dict, game_context: GameContext = None):
-        """Helper method for common tools available to all agents"""
-        if not self.is_tool_available(name, game_context):
-            return f"The tool '{name}' is not available during the current game phase."
-        
-        if name == "inquire_about_another_player":
-            result = inquire_about_another_player(
-                player_name=args['player_name'],
-                question=args['question'],
-                game_context=game_context,
-                questioning_player_name=self.player_name
-            )
-            
-            if result and isinstance(result, str) and not result.startswith("Error:"):
-                self.personal_knowledge.append(result)
-            
-            return result
-        else:
-            return f"Unknown common tool: {name}"
-    
\ No newline at end of file
+        return dispatch_tool(self, name, args, game_context, message_id=message_id)
+
+
+@register_tool(common_tools[0], posts_message=True)
+def _handle_inquire_about_another_player(agent: BaseAgent, args: dict, game_context: GameContext, message_id: Optional[int] = None) -> str:
+    return inquire_about_another_player(
+        player_name=args["player_name"],
+        question=args["question"],
+        game_context=game_context,
+        questioning_player_name=agent.player_name,
+        message_id=message_id
+    )
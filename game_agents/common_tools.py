@@ -1,6 +1,7 @@
 from typing import Dict
 from game_context.game_context import GameContext
 from game_context.roles import Role
+from game_agents.tool_registry import ToolError
 
 
 class NightActionResult:
@@ -11,6 +12,11 @@ class NightActionResult:
         self.data = data or {}
 
 
+def invalid_action(tool: str, message: str) -> ToolError:
+    """Result of a night tool call whose action could not be taken (e.g. a target that isn't in the game)"""
+    return ToolError(tool=tool, kind="invalid_action", message=message)
+
+
 def validate_player_exists(game_context: GameContext, player_id: int, error_message: str = None) -> tuple[bool, str]:
     """
     Validate that a player exists in the game context
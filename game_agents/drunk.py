@@ -1,9 +1,11 @@
+from typing import Union
 from game_context.game_context import GameContext
 from game_context.roles import Role
-from .common_tools import NightActionResult, validate_center_position, resolve_player_name_to_id
+from .common_tools import NightActionResult, invalid_action, validate_center_position, resolve_player_name_to_id
 from game_agents.agent_registry import register_agent
 from game_agents.base_agent import BaseAgent
-import textwrap
+from game_agents.prompting import RolePrompt
+from game_agents.tool_registry import ToolError, register_tool
 
 # Drunk tool definition
 DRUNK_SWAP_TOOL = {
@@ -28,8 +30,28 @@ DRUNK_SWAP_TOOL = {
     }
 }
 
+DRUNK_PROMPT = RolePrompt(
+    "Drunk",
+    day_strategy="""During the night, you swapped your card with a center card, but you didn't look at your new role. You have no idea what role you now have!
+
+    Your strategy should be to:
+    1. Be honest about being the original Drunk
+    2. Explain that you don't know your current role
+    3. Try to figure out what role you might have based on game flow
+    4. Help the village as best you can with limited information
+
+    But be careful, because you could be a werewolf now if you grabbed a werewolf card from the center during the night!""",
+    night_instructions="""It is now nighttime and you must use the "drunk_swap" tool to swap your card with a center card.
+
+    Usage: drunk_swap with {"center_position": <0, 1, or 2>}
+
+    Choose wisely - you won't see either card, so you'll have no idea what your new role is!"""
+)
+
 @register_agent(Role.DRUNK)
 class DrunkAgent(BaseAgent):
+    prompt_template = DRUNK_PROMPT
+
     def __init__(self, player_id: int, player_name: str, initial_role: str, is_ai: bool):
         super().__init__(player_id, player_name, initial_role, is_ai, nighttime_tools=[DRUNK_SWAP_TOOL])
         self.nighttime_tool = DRUNK_SWAP_TOOL.get("function", {}).get("name")
@@ -37,71 +59,7 @@ class DrunkAgent(BaseAgent):
     def execute_night_action(self, game_context: GameContext):
         """Drunk has no automatic night action - they must use the drunk_swap tool"""
         return "As the Drunk, you must choose which center card to swap with using the drunk_swap tool."
-    
-    def call_tool(self, name: str, args: dict, game_context: GameContext = None):
-        """Handle Drunk-specific tools and common tools"""
-        if not self.is_tool_available(name, game_context):
-            return f"The tool '{name}' is not available during the current game phase."
-        
-        if name == "drunk_swap":
-            result = drunk_swap(
-                game_context=game_context,
-                drunk_player_id=self.player_id,
-                center_position=args.get('center_position')
-            )
-            
-            if result and isinstance(result, str) and not result.startswith("Error:"):
-                self.personal_knowledge.append(result)
-            
-            return result
-        else:
-            return self._call_common_tool(name, args, game_context)
-
-    def _get_system_prompt(self, game_context: GameContext = None):
-        if game_context and game_context.is_nighttime:
-            return self._get_nighttime_prompt(game_context)
-        else:
-            return self._get_daytime_prompt(game_context)
-    
-    def _get_nighttime_prompt(self, game_context: GameContext):
-        player_list = game_context.get_other_player_names_in_text(self.player_id)
-        
-        return textwrap.dedent(
-            f"""You are playing One Night Werewolf with the initial role of {self.initial_role}! Your name is {self.player_name}.
-
-            {player_list}
-
-            It is now nighttime and you must use the "drunk_swap" tool to swap your card with a center card.
-            
-            Usage: drunk_swap with {{"center_position": <0, 1, or 2>}}
-            
-            Choose wisely - you won't see either card, so you'll have no idea what your new role is!"""
-        )
-    
-    def _get_daytime_prompt(self, game_context: GameContext = None):
-        night_knowledge = ""
-        if self.personal_knowledge:
-            night_knowledge = f"\n\nWhat you learned during the night phase:\n" + "\n".join(f"- {knowledge}" for knowledge in self.personal_knowledge)
-        
-        player_list = ""
-        if game_context:
-            player_list = game_context.get_other_player_names_in_text(self.player_id)
-        
-        return textwrap.dedent(
-            f"""You are playing One Night Werewolf with the initial role of {self.initial_role}! Your name is {self.player_name}.
-
-            {player_list}{night_knowledge}
-
-            During the night, you swapped your card with a center card, but you didn't look at your new role. You have no idea what role you now have!
-
-            Your strategy should be to:
-            1. Be honest about being the original Drunk
-            2. Explain that you don't know your current role
-            3. Try to figure out what role you might have based on game flow
-            4. Help the village as best you can with limited information
-
-            But be careful, because you could be a werewolf now if you grabbed a werewolf card from the center during the night!"""
-        )
+
 
 def drunk_swap_center(game_context: GameContext, drunk_player_id: int, center_position: int) -> NightActionResult:
     """
@@ -119,17 +77,20 @@ def drunk_swap_center(game_context: GameContext, drunk_player_id: int, center_po
     if not is_valid:
         return NightActionResult(False, error_msg)
 
-    drunk_original_role = game_context.get_player_current_role(drunk_player_id)
-    center_original_role = game_context.get_center_card_role(center_position)
+    # Hold the cards still from the read through the swap and the log entry
+    with game_context.transaction():
+        drunk_original_role = game_context.get_player_current_role(drunk_player_id)
+        center_original_role = game_context.get_center_card_role(center_position)
     
-    if not drunk_original_role or not center_original_role:
-        return NightActionResult(False, "Could not determine roles for swap!")
+        if not drunk_original_role or not center_original_role:
+            return NightActionResult(False, "Could not determine roles for swap!")
 
-    success = game_context.swap_player_with_center(drunk_player_id, center_position)
-    if not success:
-        return NightActionResult(False, "Failed to swap with center card!")
+        success = game_context.swap_player_with_center(drunk_player_id, center_position)
+        if not success:
+            return NightActionResult(False, "Failed to swap with center card!")
     
-    new_role = game_context.get_player_current_role(drunk_player_id)
+        new_role = game_context.get_player_current_role(drunk_player_id)
+        game_context.record_night_action(drunk_player_id, "drunk", [center_position])
     
     return NightActionResult(
         True,
@@ -144,7 +105,7 @@ def drunk_swap_center(game_context: GameContext, drunk_player_id: int, center_po
     )
 
 
-def drunk_swap(game_context: GameContext, drunk_player_id: int, center_position: int) -> str:
+def drunk_swap(game_context: GameContext, drunk_player_id: int, center_position: int) -> Union[str, ToolError]:
     """
     Drunk swap tool - allows the drunk to swap with a center card
     
@@ -154,8 +115,18 @@ def drunk_swap(game_context: GameContext, drunk_player_id: int, center_position:
         center_position: Center card position to swap with (0, 1, or 2)
     
     Returns:
-        String result of the swap
+        String result of the swap, or a ToolError if no swap was made
     """
     result = drunk_swap_center(game_context, drunk_player_id, center_position)
+    if not result.success:
+        return invalid_action("drunk_swap", result.message)
     return result.message
 
+
+@register_tool(DRUNK_SWAP_TOOL, phase="night")
+def _handle_drunk_swap(agent, args: dict, game_context: GameContext) -> Union[str, ToolError]:
+    return drunk_swap(
+        game_context=game_context,
+        drunk_player_id=agent.player_id,
+        center_position=args["center_position"]
+    )
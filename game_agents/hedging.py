@@ -0,0 +1,130 @@
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, List, Optional, Tuple, TypeVar
+from game_agents.model_router import ModelRoute, ModelRouter
+
+T = TypeVar("T")
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when no attempt of a model call finished before the route's deadline"""
+
+
+class HedgedCaller:
+    """
+    Runs model calls with a hard per-call deadline and a hedged duplicate request
+
+    The route's timeout is the deadline for the whole call. Once the first attempt has been
+    running for longer than the route's observed latency percentile (p95 by default), a
+    duplicate attempt is sent and whichever answers first wins. If the first attempt fails
+    before the hedge goes out, the hedge is sent immediately.
+
+    A losing attempt whose request is already in flight can't be cancelled: it runs until it
+    answers or its own request timeout ends it. Each attempt gets the time left until the
+    deadline as that timeout, so on a route with a timeout nothing outlives the deadline; on a
+    route without one, losing attempts run to completion.
+
+    The worker threads are started on the first call and belong to whoever built the caller
+    (a batch, a session or a single game), which calls shutdown() once its games are over.
+    """
+    def __init__(self, router: ModelRouter, percentile: float = 95.0, min_samples: int = 20, max_workers: int = 32):
+        self.router = router
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, router: ModelRouter, hedging_config: Optional[dict]) -> Optional["HedgedCaller"]:
+        """Build a caller from the "hedging" section of the game config, or None if hedging is disabled"""
+        hedging_config = hedging_config or {}
+        if not hedging_config.get("enabled", False):
+            return None
+        return cls(
+            router,
+            percentile=hedging_config.get("percentile", 95.0),
+            min_samples=hedging_config.get("min_samples", 20),
+            max_workers=hedging_config.get("max_workers", 32)
+        )
+
+    def call(self, route: ModelRoute, attempt: Callable[[Optional[float]], T], timeout: Optional[float] = None) -> Tuple[T, bool]:
+        """
+        Run attempt(timeout) until one copy succeeds or the deadline passes
+
+        Args:
+            route: Route of the call, providing the deadline and latency history
+            attempt: Makes one request, given the seconds left until the deadline (None for no deadline)
+            timeout: Seconds the whole call may take, when shorter than the route's (e.g. what is left of a turn)
+
+        Returns:
+            Tuple of (result of the first successful attempt, whether that attempt was the hedge)
+
+        Raises:
+            DeadlineExceeded: If no attempt finished in time
+            Exception: The error of the last attempt if every attempt failed
+        """
+        start = time.monotonic()
+        timeout = timeout if timeout is not None else route.timeout
+        deadline = start + timeout if timeout is not None else None
+        hedge_delay = self.router.latency_percentile(route, self.percentile, min_samples=self.min_samples)
+
+        primary = self._submit(attempt, deadline)
+        hedge: Optional[Future] = None
+        pending: List[Future] = [primary]
+        last_error: Optional[BaseException] = None
+
+        while pending:
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                break
+
+            wait_for = None if deadline is None else deadline - now
+            if hedge is None and hedge_delay is not None:
+                until_hedge = max(start + hedge_delay - now, 0.0)
+                wait_for = until_hedge if wait_for is None else min(wait_for, until_hedge)
+
+            done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.remove(future)
+                if future.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    won_by_hedge = future is hedge
+                    self.router.record_hedge(route, hedged=hedge is not None, hedge_won=won_by_hedge)
+                    return future.result(), won_by_hedge
+                last_error = future.exception()
+                if hedge is None and hedge_delay is not None:
+                    # The primary failed outright, so send the hedge now rather than waiting for the delay
+                    hedge = self._submit(attempt, deadline)
+                    pending.append(hedge)
+
+            if not done and hedge is None and hedge_delay is not None and time.monotonic() - start >= hedge_delay:
+                hedge = self._submit(attempt, deadline)
+                pending.append(hedge)
+
+        for future in pending:
+            future.cancel()
+
+        if not pending and last_error is not None:
+            raise last_error
+
+        self.router.record_timeout(route)
+        raise DeadlineExceeded(f"Route '{route.name}' call missed its {timeout}s deadline")
+
+    def shutdown(self) -> None:
+        """Stop the worker threads; attempts already in flight finish in the background"""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, attempt: Callable[[Optional[float]], T], deadline: Optional[float]) -> Future:
+        def run():
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0.001)
+            return attempt(remaining)
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="hedged-call")
+            return self._executor.submit(run)
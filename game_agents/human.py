@@ -0,0 +1,149 @@
+import json
+import re
+import time
+from types import SimpleNamespace
+from typing import Callable, Dict, Optional, Tuple
+from game_context.events import GameEvent
+from game_context.game_context import GameContext
+from game_agents.base_agent import ONWAgentResponse
+from game_agents.common_tools import resolve_player_name_to_id
+from game_agents.human_io import HumanChannel
+from game_agents.scripted import default_night_action
+
+ASK_COMMAND = re.compile(r"^/ask\s+(?P<player_name>[^:]+):\s*(?P<question>.+)$")
+
+
+def _parse_seer(text: str, game_context: GameContext) -> Optional[dict]:
+    positions = re.findall(r"\d", text)
+    if len(positions) == 2:
+        return {"investigation_type": "center", "target_player_name": "", "card_positions": [int(position) for position in positions]}
+    return {"investigation_type": "player", "target_player_name": text, "card_positions": []}
+
+
+def _parse_troublemaker(text: str, game_context: GameContext) -> Optional[dict]:
+    names = [name.strip() for name in text.split(",") if name.strip()]
+    return {"player1_name": names[0], "player2_name": names[1]} if len(names) == 2 else None
+
+
+def _parse_drunk(text: str, game_context: GameContext) -> Optional[dict]:
+    return {"center_position": int(text)} if text.isdigit() else None
+
+
+# Night tool -> (what to ask the player, parser from their answer to tool arguments)
+NIGHT_CHOICES: Dict[str, Tuple[str, Callable[[str, GameContext], Optional[dict]]]] = {
+    "seer_investigate": ("Type a player's name to look at their card, or two center positions (e.g. '0 2') to look at those center cards.", _parse_seer),
+    "robber_swap": ("Type the name of the player whose card you want to steal.", lambda text, _: {"target_player_name": text}),
+    "troublemaker_swap": ("Type the names of the two players whose cards you want to swap, separated by a comma.", _parse_troublemaker),
+    "drunk_swap": ("Type the center position (0, 1 or 2) to swap your card with.", _parse_drunk),
+}
+
+
+class HumanAgentMixin:
+    """
+    Routes a seat's decisions to a human player through a HumanChannel instead of a model
+
+    Every request has a timeout; when it passes, the seat takes the same default as a model call
+    that missed its deadline (default night action, a skipped turn, no vote). A discussion turn,
+    including any /ask and the question it leads to, ends turn_timeout after it starts. Mix in ahead of the
+    role's agent class so the role's night action functions and knowledge handling are reused.
+    """
+    calls_model = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.channel: Optional[HumanChannel] = None
+        self.night_timeout = 60.0
+        self.turn_timeout = 120.0
+        self.vote_timeout = 60.0
+
+    def _create_client(self):
+        return None
+
+    def attach_channel(self, channel: HumanChannel, game_context: GameContext, human_io_config: Optional[dict] = None) -> None:
+        """Connect this seat to a player and forward everything said at the table to them"""
+        human_io_config = human_io_config or {}
+        self.channel = channel
+        self.night_timeout = human_io_config.get("night_timeout", self.night_timeout)
+        self.turn_timeout = human_io_config.get("turn_timeout", self.turn_timeout)
+        self.vote_timeout = human_io_config.get("vote_timeout", self.vote_timeout)
+        game_context.events.subscribe(self._forward_event)
+        channel.notify(f"You are {self.player_name}. You were dealt the {self.initial_role.title()} card.")
+
+    def _forward_event(self, event: GameEvent) -> None:
+        if event.type == "message" and event.player_id != self.player_id:
+            self.channel.notify(f"{event.data['player_name']}: {event.data['public_response']}")
+
+    def get_forced_nighttime_tool(self) -> Optional[str]:
+        # The player makes their choice inside execute_night_action instead of via a model tool call
+        return None
+
+    def execute_night_action(self, game_context: GameContext):
+        if self.nighttime_tool not in NIGHT_CHOICES:
+            result = super().execute_night_action(game_context)
+        else:
+            question, parse = NIGHT_CHOICES[self.nighttime_tool]
+            answer = self.channel.request(f"🌙 Night: {question}", self.night_timeout)
+            args = parse(answer, game_context) if answer else None
+            actions_before = len(game_context.night_action_log)
+            result = self.call_tool(self.nighttime_tool, args, game_context) if args else None
+            if len(game_context.night_action_log) == actions_before:
+                # No answer, or one the action rejected (e.g. an unknown name): take the default action
+                if result is not None:
+                    self.channel.notify(str(result))
+                tool_name, default_args = default_night_action(self, game_context)
+                result = self.call_tool(tool_name, default_args, game_context)
+            result = str(result)
+        self.channel.notify(result)
+        return result
+
+    def act(
+            self,
+            prompt: str,
+            prompt_is_another_player_question: bool = False,
+            questioning_player_name: str = "",
+            game_state: GameContext = None,
+            speculation=None,
+            message_id: Optional[int] = None
+    ) -> ONWAgentResponse:
+        tool_calls_made = []
+        deadline = time.monotonic() + self.turn_timeout
+        if prompt_is_another_player_question:
+            answer = self.channel.request(f"❓ {questioning_player_name} asks you: {prompt}", self.turn_timeout)
+        else:
+            answer = self.channel.request(f"💬 Your turn. {prompt} Say something, or '/ask <name>: <question>' to question a player.", self.turn_timeout)
+            command = ASK_COMMAND.match(answer or "")
+            if command:
+                args = {"player_name": command["player_name"].strip(), "question": command["question"].strip()}
+                # Through the agent loop's tool runner, so an answer still coming at the deadline is given up
+                tool_call = SimpleNamespace(function=SimpleNamespace(name="inquire_about_another_player", arguments=json.dumps(args)))
+                _, _, result = self._execute_tool_calls([tool_call], game_state, deadline=deadline)[0]
+                tool_calls_made.append(self._tool_call_record("inquire_about_another_player", args, result))
+                self.channel.notify(str(result))
+                remaining = deadline - time.monotonic()
+                answer = self.channel.request("💬 What do you want to say to the group?", remaining) if remaining > 0 else None
+
+        if answer is None:
+            return self._pass_turn(game_state.conversation, tool_calls_made, private_thoughts="Turn skipped: timed out waiting for input", message_id=message_id)
+
+        game_state.conversation.add_agent_response(
+            player_id=self.player_id,
+            player_name=self.player_name,
+            public_response=answer,
+            tool_calls=tool_calls_made,
+            message_id=message_id
+        )
+        return ONWAgentResponse(public_response=answer, private_thoughts="", tool_calls=tool_calls_made)
+
+    def cast_vote(self, game_context: GameContext) -> Optional[int]:
+        answer = self.channel.request(f"🗳️ Vote: type the name of the player to eliminate. {game_context.get_other_player_names_in_text(self.player_id)}", self.vote_timeout)
+        if not answer:
+            return None
+        success, message, target_player_id = resolve_player_name_to_id(game_context, answer, self.player_id)
+        if not success:
+            self.channel.notify(f"{message} Your vote was not counted.")
+            return None
+        return target_player_id
+
+    def prepare_turn(self, game_context: GameContext) -> None:
+        # Humans prepare on their own
+        return None
@@ -0,0 +1,180 @@
+import asyncio
+import sys
+import threading
+from typing import Callable, Dict, List, Optional
+from game_server.websocket import WebSocket, WebSocketClosed, accept
+
+
+async def _settle(tasks) -> None:
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class HumanIOLoop:
+    """
+    Background asyncio loop that owns every human player's input and output
+
+    The game runs on ordinary threads; they hand prompts to this loop and wait only for the
+    answer they need, with a timeout, so one slow human never stalls anything else. The loop
+    lives as long as its game; shutdown() closes the channels and servers registered with
+    on_shutdown() and stops the thread.
+    """
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._on_shutdown: List[Callable[[], None]] = []
+        self._stopped = False
+        self._thread = threading.Thread(target=self.loop.run_forever, name="human-io", daemon=True)
+        self._thread.start()
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped
+
+    def run(self, coroutine, timeout: Optional[float] = None):
+        """Run a coroutine on the loop and wait for its result from a game thread"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(timeout)
+
+    def on_shutdown(self, callback: Callable[[], None]) -> None:
+        """Have shutdown() call callback, before the loop stops"""
+        self._on_shutdown.append(callback)
+
+    def shutdown(self) -> None:
+        if self._stopped:
+            return
+        self._stopped = True
+        for callback in self._on_shutdown:
+            callback()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=1.0)
+        if self._thread.is_alive():
+            return
+        # Messages still queued and questions still open are dropped with the game
+        pending = asyncio.all_tasks(self.loop)
+        for task in pending:
+            task.cancel()
+        self.loop.run_until_complete(_settle(pending))
+        self.loop.close()
+
+
+class HumanChannel:
+    """Input and output for one human seat; lines typed by the player land in an inbox queue"""
+    def __init__(self, io_loop: HumanIOLoop):
+        self.io_loop = io_loop
+        self.inbox: asyncio.Queue = asyncio.Queue()
+
+    async def send(self, text: str) -> None:
+        raise NotImplementedError("Subclasses must implement send")
+
+    async def ask(self, prompt: str, timeout: float) -> Optional[str]:
+        """Show a prompt and wait for the player's next line; None if they don't answer in time"""
+        # Anything typed before the prompt appeared answers an older question
+        while not self.inbox.empty():
+            self.inbox.get_nowait()
+        await self.send(prompt)
+        try:
+            return (await asyncio.wait_for(self.inbox.get(), timeout)).strip()
+        except asyncio.TimeoutError:
+            await self.send("⏰ Time's up - a default action was taken for you.")
+            return None
+
+    def request(self, prompt: str, timeout: float) -> Optional[str]:
+        """Blocking version of ask for game threads; None once the game's I/O is shut down"""
+        if self.io_loop.stopped:
+            return None
+        return self.io_loop.run(self.ask(prompt, timeout))
+
+    def notify(self, text: str) -> None:
+        """Send a message without waiting for it to be delivered"""
+        if not self.io_loop.stopped:
+            asyncio.run_coroutine_threadsafe(self.send(text), self.io_loop.loop)
+
+
+class TerminalChannel(HumanChannel):
+    """
+    Human player at this process's terminal (only one per process, since they share stdin)
+
+    Stdin is only read once the player is first asked something, so a game whose seat never
+    prompts (or whose channel is replaced) doesn't touch it.
+    """
+    def __init__(self, io_loop: HumanIOLoop, player_name: str):
+        super().__init__(io_loop)
+        self.player_name = player_name
+        self._reader: Optional[threading.Thread] = None
+        self._closed = False
+        io_loop.on_shutdown(self.close)
+
+    async def send(self, text: str) -> None:
+        print(f"[{self.player_name}] {text}", flush=True)
+
+    async def ask(self, prompt: str, timeout: float) -> Optional[str]:
+        if self._reader is None:
+            # A daemon thread rather than the loop's executor, so a pending readline never blocks exit
+            self._reader = threading.Thread(target=self._read_stdin, name="human-stdin", daemon=True)
+            self._reader.start()
+        return await super().ask(prompt, timeout)
+
+    def close(self) -> None:
+        """Stop reading; a readline already waiting ends with the next line typed, which is discarded"""
+        self._closed = True
+
+    def _read_stdin(self) -> None:
+        for line in sys.stdin:
+            if self._closed:
+                return
+            self.io_loop.loop.call_soon_threadsafe(self.inbox.put_nowait, line)
+
+
+class WebSocketChannel(HumanChannel):
+    """Human player connected over a local WebSocket; messages sent before they connect are queued"""
+    def __init__(self, io_loop: HumanIOLoop):
+        super().__init__(io_loop)
+        self.websocket: Optional[WebSocket] = None
+        self._outbox = []
+
+    async def send(self, text: str) -> None:
+        if self.websocket is None or self.websocket.closed:
+            self._outbox.append(text)
+            return
+        try:
+            await self.websocket.send(text)
+        except (WebSocketClosed, ConnectionError):
+            self._outbox.append(text)
+
+    async def attach(self, websocket: WebSocket) -> None:
+        """Take over a newly connected socket (reconnects replace the old one) and read from it"""
+        self.websocket = websocket
+        pending, self._outbox = self._outbox, []
+        for text in pending:
+            await self.send(text)
+        while (text := await websocket.recv()) is not None:
+            await self.inbox.put(text)
+
+
+class WebSocketHumanServer:
+    """Local WebSocket server where each human seat connects at /seat/<player_id>"""
+    def __init__(self, io_loop: HumanIOLoop, host: str = "127.0.0.1", port: int = 8765):
+        self.io_loop = io_loop
+        self.host = host
+        self.port = port
+        self.channels: Dict[int, WebSocketChannel] = {}
+        self._server = io_loop.run(asyncio.start_server(self._handle_connection, host, port))
+        io_loop.on_shutdown(self.close)
+
+    def channel_for(self, player_id: int) -> WebSocketChannel:
+        if player_id not in self.channels:
+            self.channels[player_id] = WebSocketChannel(self.io_loop)
+        return self.channels[player_id]
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        websocket = await accept(reader, writer)
+        if websocket is None:
+            return
+        _, _, seat = websocket.path.rstrip("/").rpartition("/seat/")
+        if not seat.isdigit() or int(seat) not in self.channels:
+            await websocket.send("Unknown seat. Connect to /seat/<player_id>.")
+            await websocket.close()
+            return
+        await self.channels[int(seat)].attach(websocket)
+
+    def close(self) -> None:
+        """Stop listening, freeing the port"""
+        self.io_loop.loop.call_soon_threadsafe(self._server.close)
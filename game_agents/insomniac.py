@@ -2,12 +2,27 @@ from game_context.game_context import GameContext
 from game_context.roles import Role
 from game_agents.agent_registry import register_agent
 from game_agents.base_agent import BaseAgent
-import textwrap
+from game_agents.prompting import RolePrompt
 from game_agents.common_tools import NightActionResult
 
 
+INSOMNIAC_PROMPT = RolePrompt(
+    "Insomniac",
+    day_strategy="""As the Insomniac, you woke up at the end of the night to check your final role.
+
+    Your strategy should be to:
+    1. Share information about whether your role changed
+    2. If it changed, figure out who might have caused the change
+    3. Help identify players who performed night actions
+    4. Use your information to help the village
+
+    You are on the villager team and want to eliminate werewolves (unless your role changed to werewolf)."""
+)
+
 @register_agent(Role.INSOMNIAC)
 class InsomniacAgent(BaseAgent):
+    prompt_template = INSOMNIAC_PROMPT
+
     def __init__(self, player_id: int, player_name: str, initial_role: str, is_ai: bool):
         super().__init__(player_id, player_name, initial_role, is_ai)
 
@@ -20,35 +35,6 @@ class InsomniacAgent(BaseAgent):
         
         return result.message
 
-    def call_tool(self, name: str, args: dict, game_context: GameContext = None):
-        """Handle common tools (Insomniac has no specific tools)"""
-        return self._call_common_tool(name, args, game_context)
-
-    def _get_system_prompt(self, game_context: GameContext = None):
-        night_knowledge = ""
-        if self.personal_knowledge:
-            night_knowledge = f"\n\nWhat you learned during the night phase:\n" + "\n".join(f"- {knowledge}" for knowledge in self.personal_knowledge)
-        
-        player_list = ""
-        if game_context:
-            player_list = game_context.get_other_player_names_in_text(self.player_id)
-        
-        return textwrap.dedent(
-            f"""You are playing One Night Werewolf with the initial role of {self.initial_role}! Your name is {self.player_name}.
-
-            {player_list}{night_knowledge}
-
-            As the Insomniac, you woke up at the end of the night to check your final role.
-
-            Your strategy should be to:
-            1. Share information about whether your role changed
-            2. If it changed, figure out who might have caused the change
-            3. Help identify players who performed night actions
-            4. Use your information to help the village
-
-            You are on the villager team and want to eliminate werewolves (unless your role changed to werewolf)."""
-        )
-
 
 def check_final_role(game_context: GameContext, insomniac_player_id: int, initial_role: str) -> NightActionResult:
     """
@@ -0,0 +1,192 @@
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+from pydantic import BaseModel
+from game_context.claims import claimed_roles
+
+# Subject used for the agent's own card
+SELF = "you"
+
+# Facts kept in the prompt first when there are more than the cap; lower is more important
+KIND_PRIORITY = {"saw_role": 0, "swapped": 0, "note": 1, "claimed": 2, "answer": 3}
+
+MAX_RENDERED_FACTS = 20
+MAX_ANSWER_CHARS = 200
+
+
+class Fact(BaseModel):
+    """
+    One thing an agent knows, with the player or center card it is about
+
+    Args:
+        kind: saw_role, swapped, claimed, answer or note
+        subject: Player name, "center <n>", or "you" for the agent's own card
+        role: Role seen or claimed
+        other: Second party of a swap
+        detail: A note's own wording, when it is only part of the source
+        source: The text the fact was read from
+    """
+    kind: str
+    subject: str = ""
+    role: Optional[str] = None
+    other: Optional[str] = None
+    detail: Optional[str] = None
+    source: str
+
+    class Config:
+        frozen = True
+
+    @property
+    def key(self) -> Tuple:
+        """Facts with the same key say the same thing; an answer is keyed by who gave it"""
+        if self.kind == "answer":
+            return (self.kind, self.subject)
+        if self.kind == "note":
+            return (self.kind, self.detail or self.source)
+        return (self.kind, self.subject, self.role, self.other)
+
+    def render(self) -> str:
+        if self.kind == "saw_role":
+            if self.subject == SELF:
+                return f"Your card is now the {self.role.title()}"
+            owner = f"The {self.subject} card" if self.subject.startswith("center") else f"{self.subject}'s card"
+            return f"{owner} was the {self.role.title()}"
+        if self.kind == "swapped":
+            if self.subject != SELF:
+                return f"You swapped {self.subject}'s and {self.other}'s cards"
+            second = f"the {self.other} card" if self.other.startswith("center") else f"{self.other}'s card"
+            return f"You swapped your card with {second}"
+        if self.kind == "claimed":
+            return f"{self.subject} claimed to be the {self.role.title()}"
+        if self.kind == "answer":
+            answer = self.source.split(" responds: ", 1)[-1]
+            if len(answer) > MAX_ANSWER_CHARS:
+                answer = answer[:MAX_ANSWER_CHARS].rstrip() + "…"
+            return f"{self.subject} told you: {answer}"
+        return self.detail or self.source
+
+
+def _names(text: str) -> List[str]:
+    return [name.strip() for name in text.split(",") if name.strip()]
+
+
+# Night result and tool messages written by the role modules -> the facts they state
+_PATTERNS = [
+    (re.compile(r"You looked at (?P<name>.+?)'s card and saw they are the (?P<role>\w+)"),
+     lambda m, text: [Fact(kind="saw_role", subject=m["name"], role=m["role"].lower(), source=text)]),
+    (re.compile(r"You looked at center cards \[(?P<positions>[\d, ]+)\] and saw: (?P<roles>[\w, ]+)"),
+     lambda m, text: [
+         Fact(kind="saw_role", subject=f"center {position}", role=role.lower(), source=text)
+         for position, role in zip(_names(m["positions"]), _names(m["roles"]))
+     ]),
+    (re.compile(r"looked at center position (?P<position>\d) and saw the (?P<role>\w+) card"),
+     lambda m, text: [Fact(kind="saw_role", subject=f"center {m['position']}", role=m["role"].lower(), source=text)]),
+    (re.compile(r"You are the lone werewolf!"),
+     lambda m, text: [Fact(kind="note", detail="You are the lone werewolf", source=text)]),
+    (re.compile(r"You looked for other werewolves and found: (?P<names>.+)"),
+     lambda m, text: [Fact(kind="saw_role", subject=name, role="werewolf", source=text) for name in _names(m["names"])]),
+    (re.compile(r"You identified the werewolves: (?P<names>.+)"),
+     lambda m, text: [Fact(kind="saw_role", subject=name, role="werewolf", source=text) for name in _names(m["names"])]),
+    (re.compile(r"You looked for other masons and found: (?P<names>.+)"),
+     lambda m, text: [Fact(kind="saw_role", subject=name, role="mason", source=text) for name in _names(m["names"])]),
+    (re.compile(r"You checked your card and you are (?:now|still): (?P<role>\w+)"),
+     lambda m, text: [Fact(kind="saw_role", subject=SELF, role=m["role"].lower(), source=text)]),
+    (re.compile(r"You swapped cards with (?P<name>.+?) and your new role is (?P<role>\w+)"),
+     lambda m, text: [
+         Fact(kind="swapped", subject=SELF, other=m["name"], source=text),
+         Fact(kind="saw_role", subject=SELF, role=m["role"].lower(), source=text),
+         Fact(kind="saw_role", subject=m["name"], role="robber", source=text),
+     ]),
+    (re.compile(r"You swapped (?P<first>.+?)'s and (?P<second>.+?)'s cards"),
+     lambda m, text: [Fact(kind="swapped", subject=m["first"], other=m["second"], source=text)]),
+    (re.compile(r"You swapped your card with center position (?P<position>\d)"),
+     lambda m, text: [Fact(kind="swapped", subject=SELF, other=f"center {m['position']}", source=text)]),
+]
+_ANSWER = re.compile(r"^(?P<name>[^\n]+?) responds: ", re.DOTALL)
+
+
+def facts_from_text(text: str) -> List[Fact]:
+    """
+    Read the typed facts out of a night result or tool result
+
+    A player's answer to a question is kept as an answer, plus a claimed fact for each role
+    they say they are in it. Text that matches none of the known messages is kept whole as a note.
+    """
+    answer = _ANSWER.match(text)
+    if answer:
+        name = answer["name"]
+        return [Fact(kind="answer", subject=name, source=text)] + [
+            Fact(kind="claimed", subject=name, role=role, source=text) for role in claimed_roles(text[answer.end():])
+        ]
+    facts = []
+    for pattern, build in _PATTERNS:
+        for match in pattern.finditer(text):
+            facts.extend(build(match, text))
+    return facts or [Fact(kind="note", source=text)]
+
+
+class KnowledgeStore:
+    """
+    An agent's private knowledge as deduplicated facts, indexed by who or what they're about
+
+    Supports the list operations the agents used on the plain list it replaces: append() takes
+    a result string, and iterating yields each distinct text that was added, in order. Facts
+    keep the position they were first learned at; a player's newer answer replaces their
+    older one in place, so the rendered block only ever changes where something new was learned.
+    """
+    def __init__(self, max_rendered: int = MAX_RENDERED_FACTS):
+        self.max_rendered = max_rendered
+        self._facts: Dict[Tuple, Fact] = {}
+        self._by_subject: Dict[str, List[Tuple]] = {}
+
+    def add(self, fact: Fact) -> bool:
+        """Add a fact; returns False if an identical fact was already known"""
+        key = fact.key
+        existing = self._facts.get(key)
+        if existing == fact:
+            return False
+        self._facts[key] = fact
+        if existing is None and fact.subject:
+            self._by_subject.setdefault(fact.subject, []).append(key)
+        return True
+
+    def append(self, text: str) -> None:
+        for fact in facts_from_text(text):
+            self.add(fact)
+
+    def facts(self) -> List[Fact]:
+        return list(self._facts.values())
+
+    def about(self, subject: str) -> List[Fact]:
+        """Every fact about one player, center card ("center <n>"), or the agent's own card ("you")"""
+        return [self._facts[key] for key in self._by_subject.get(subject, [])]
+
+    def render(self, limit: Optional[int] = None) -> List[str]:
+        """
+        Facts as short prompt lines, in the order they were learned
+
+        Past the cap, the least important kinds go first (answers, then claims, then notes),
+        oldest first within answers and claims.
+        """
+        limit = self.max_rendered if limit is None else limit
+
+        def importance(item):
+            index, fact = item
+            priority = KIND_PRIORITY.get(fact.kind, 1)
+            return (priority, -index if priority >= KIND_PRIORITY["claimed"] else index)
+
+        ranked = sorted(enumerate(self._facts.values()), key=importance)
+        kept = sorted(ranked[:limit], key=lambda item: item[0])
+        return [fact.render() for _, fact in kept]
+
+    def clear(self) -> None:
+        self._facts.clear()
+        self._by_subject.clear()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(dict.fromkeys(fact.source for fact in self._facts.values()))
+
+    def __len__(self) -> int:
+        return len(self._facts)
+
+    def __bool__(self) -> bool:
+        return bool(self._facts)
@@ -3,11 +3,30 @@ from game_context.roles import Role
 from game_agents.common_tools import NightActionResult
 from game_agents.agent_registry import register_agent
 from game_agents.base_agent import BaseAgent
-import textwrap
+from game_agents.prompting import RolePrompt
 
 
+MINION_PROMPT = RolePrompt(
+    "Minion",
+    day_strategy="""You are on the werewolf team! During the night, you learned who the werewolves are, but they don't know who you are.
+
+    Your win condition: You win if no werewolves are eliminated, even if you are eliminated.
+
+    Your strategy should be to:
+    1. Protect the werewolves without revealing your connection
+    2. Cast suspicion on villagers
+    3. Be willing to sacrifice yourself to save werewolves
+    4. Don't claim to be a werewolf (you're not one)
+
+    But be careful, as your role may have been changed during the night by other players' actions.
+
+    It is now morning -- time to help the werewolves win!"""
+)
+
 @register_agent(Role.MINION)    
 class MinionAgent(BaseAgent):
+    prompt_template = MINION_PROMPT
+
     def __init__(self, player_id: int, player_name: str, initial_role: str, is_ai: bool):
         super().__init__(player_id, player_name, initial_role, is_ai)
 
@@ -18,34 +37,6 @@ class MinionAgent(BaseAgent):
         
         return minion_result.message
 
-    def call_tool(self, name: str, args: dict, game_context: GameContext = None):
-        """Handle common tools (Minion has no specific tools)"""
-        return self._call_common_tool(name, args, game_context)
-
-    def _get_system_prompt(self):
-        night_knowledge = ""
-        if self.personal_knowledge:
-            night_knowledge = f"\n\nWhat you learned during the night phase:\n" + "\n".join(f"- {knowledge}" for knowledge in self.personal_knowledge)
-        
-        return textwrap.dedent(
-            f"""You are playing a game of One Night Werewolf and have been assigned the role of the Minion! Your name is {self.player_name}.
-
-            You are on the werewolf team! During the night, you learned who the werewolves are, but they don't know who you are.
-
-            {night_knowledge}
-
-            Your win condition: You win if no werewolves are eliminated, even if you are eliminated.
-
-            Your strategy should be to:
-            1. Protect the werewolves without revealing your connection
-            2. Cast suspicion on villagers
-            3. Be willing to sacrifice yourself to save werewolves
-            4. Don't claim to be a werewolf (you're not one)
-
-            But be careful, as your role may have been changed during the night by other players' actions.
-
-            It is now morning -- time to help the werewolves win!"""
-        )
 
 def see_all_werewolves(game_context: GameContext, minion_player_id: int) -> NightActionResult:
     """
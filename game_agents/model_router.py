@@ -0,0 +1,184 @@
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field
+
+WILDCARD = "*"
+PHASES = ("night", "day")
+CALL_TYPES = ("night_action", "turn", "question", "vote", "tool_repair", "warm_up")
+# Call types a model-free route can stand in for (the decision has a scripted policy)
+SCRIPTED_CALL_TYPES = ("night_action",)
+
+# USD per million (prompt, completion) tokens
+DEFAULT_MODEL_PRICES: Dict[str, tuple] = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1-nano": (0.10, 0.40),
+}
+
+
+class ModelRoute(BaseModel):
+    """Model settings for the calls matching a (role, phase, call type) pattern"""
+    name: str = "default"
+    role: str = WILDCARD
+    phase: str = WILDCARD
+    call_type: str = WILDCARD
+    model: Optional[str] = "gpt-4o-mini"  # None routes the call to the scripted policy
+    temperature: Optional[float] = None
+    max_tokens: Optional[int] = None
+    timeout: Optional[float] = None
+
+    @property
+    def is_scripted(self) -> bool:
+        return self.model is None
+
+    def matches(self, role: str, phase: str, call_type: str) -> bool:
+        return all(pattern in (WILDCARD, value) for pattern, value in ((self.role, role), (self.phase, phase), (self.call_type, call_type)))
+
+    def specificity(self) -> int:
+        return sum(pattern != WILDCARD for pattern in (self.role, self.phase, self.call_type))
+
+    def completion_params(self) -> Dict[str, Any]:
+        """Keyword arguments for chat.completions.create/parse, leaving unset options to the provider defaults"""
+        params = {"model": self.model, "temperature": self.temperature, "max_tokens": self.max_tokens, "timeout": self.timeout}
+        return {key: value for key, value in params.items() if value is not None}
+
+
+class RouteStats(BaseModel):
+    """Latency, token and cost totals for one route"""
+    calls: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    prompt_chars: int = 0
+    prefix_chars: int = 0
+    cost_usd: float = 0.0
+    total_latency: float = 0.0
+    recent_latencies: deque = Field(default_factory=lambda: deque(maxlen=1000))
+    recent_first_tokens: deque = Field(default_factory=lambda: deque(maxlen=1000))
+
+    def latency_percentile(self, percentile: float, samples: Optional[deque] = None) -> Optional[float]:
+        samples = self.recent_latencies if samples is None else samples
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        index = min(int(round(percentile / 100 * (len(ordered) - 1))), len(ordered) - 1)
+        return ordered[index]
+
+
+class ModelRouter:
+    """
+    Picks the model settings for each agent call and tracks per-route latency and cost
+
+    Routes are matched on (role, phase, call type); the most specific matching route wins and
+    ties go to the route declared first. Unmatched calls use the default route.
+    """
+    def __init__(self, routes: Optional[List[ModelRoute]] = None, default: Optional[ModelRoute] = None, prices: Optional[Dict[str, tuple]] = None):
+        self.routes = routes or []
+        self.default = default or ModelRoute()
+        self.prices = {**DEFAULT_MODEL_PRICES, **(prices or {})}
+        self.stats: Dict[str, RouteStats] = {}
+        self._lock = threading.Lock()
+
+        for route in self.routes + [self.default]:
+            if route.phase not in PHASES + (WILDCARD,):
+                raise ValueError(f"Route '{route.name}' has unknown phase: {route.phase}")
+            if route.call_type not in CALL_TYPES + (WILDCARD,):
+                raise ValueError(f"Route '{route.name}' has unknown call type: {route.call_type}")
+            if route.is_scripted and route.call_type not in SCRIPTED_CALL_TYPES:
+                raise ValueError(f"Route '{route.name}' has no model, which is only supported for call types: {', '.join(SCRIPTED_CALL_TYPES)}")
+
+    @classmethod
+    def from_config(cls, routing_config: Optional[dict]) -> "ModelRouter":
+        """Build a router from the "model_routing" section of the game config"""
+        routing_config = routing_config or {}
+        default = ModelRoute(**routing_config["default"]) if "default" in routing_config else None
+        routes = [ModelRoute(**route) for route in routing_config.get("routes", [])]
+        prices = {model: tuple(price) for model, price in routing_config.get("prices", {}).items()}
+        return cls(routes=routes, default=default, prices=prices)
+
+    def resolve(self, role: str, phase: str, call_type: str) -> ModelRoute:
+        """Find the route for a call"""
+        best = None
+        for route in self.routes:
+            if route.matches(role.lower(), phase, call_type) and (best is None or route.specificity() > best.specificity()):
+                best = route
+        return best or self.default
+
+    def record(self, route: ModelRoute, latency: float, prompt_tokens: int = 0, completion_tokens: int = 0, error: bool = False, cached_tokens: int = 0) -> None:
+        """Record the latency and token usage of a finished call"""
+        prompt_price, completion_price = self.prices.get(route.model, (0.0, 0.0))
+        with self._lock:
+            stats = self.stats.setdefault(route.name, RouteStats())
+            stats.calls += 1
+            stats.errors += int(error)
+            stats.prompt_tokens += prompt_tokens
+            stats.completion_tokens += completion_tokens
+            stats.cached_tokens += cached_tokens
+            stats.cost_usd += (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1_000_000
+            stats.total_latency += latency
+            # Failed calls often end at a timeout, which would drag the percentiles towards the deadline
+            if not error:
+                stats.recent_latencies.append(latency)
+
+    def record_prompt(self, route: ModelRoute, prompt_chars: int, prefix_chars: int) -> None:
+        """Record the size of a prompt and of its cacheable prefix"""
+        with self._lock:
+            stats = self.stats.setdefault(route.name, RouteStats())
+            stats.prompt_chars += prompt_chars
+            stats.prefix_chars += prefix_chars
+
+    def record_first_token(self, route: ModelRoute, seconds: float) -> None:
+        """Record the time to first token of a streamed call"""
+        with self._lock:
+            self.stats.setdefault(route.name, RouteStats()).recent_first_tokens.append(seconds)
+
+    def record_timeout(self, route: ModelRoute) -> None:
+        """Record a call that missed its deadline"""
+        with self._lock:
+            self.stats.setdefault(route.name, RouteStats()).timeouts += 1
+
+    def record_hedge(self, route: ModelRoute, hedged: bool, hedge_won: bool) -> None:
+        """Record whether a call sent a hedged duplicate and whether the duplicate answered first"""
+        with self._lock:
+            stats = self.stats.setdefault(route.name, RouteStats())
+            stats.hedges += int(hedged)
+            stats.hedge_wins += int(hedge_won)
+
+    def latency_percentile(self, route: ModelRoute, percentile: float, min_samples: int = 1) -> Optional[float]:
+        """Observed latency percentile for a route, or None until it has min_samples calls"""
+        with self._lock:
+            stats = self.stats.get(route.name)
+            if not stats or len(stats.recent_latencies) < min_samples:
+                return None
+            return stats.latency_percentile(percentile)
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """Per-route call counts, latency percentiles, tokens and cost"""
+        with self._lock:
+            return {
+                name: {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "timeouts": stats.timeouts,
+                    "hedges": stats.hedges,
+                    "hedge_wins": stats.hedge_wins,
+                    "mean_latency": stats.total_latency / stats.calls if stats.calls else None,
+                    "p50_latency": stats.latency_percentile(50),
+                    "p95_latency": stats.latency_percentile(95),
+                    "p50_first_token": stats.latency_percentile(50, stats.recent_first_tokens),
+                    "p95_first_token": stats.latency_percentile(95, stats.recent_first_tokens),
+                    "prompt_tokens": stats.prompt_tokens,
+                    "completion_tokens": stats.completion_tokens,
+                    "cached_tokens": stats.cached_tokens,
+                    "cacheable_prefix_share": stats.prefix_chars / stats.prompt_chars if stats.prompt_chars else None,
+                    "cost_usd": stats.cost_usd,
+                }
+                for name, stats in self.stats.items()
+            }
@@ -0,0 +1,191 @@
+import inspect
+from typing import List, NamedTuple, Optional
+
+# Shared by every role, so it is the longest prefix any two calls can have in common
+GAME_RULES = inspect.cleandoc(
+    """You are playing One Night Werewolf, a social deduction game.
+
+    Every player is dealt one role card and three more cards are placed face down in the center.
+    During the night some roles wake up and act: Werewolves see each other (a lone Werewolf looks at
+    a center card), the Minion sees the Werewolves, Masons see each other, the Seer looks at another
+    player's card or two center cards, the Robber swaps cards with another player and looks at their
+    new card, the Troublemaker swaps two other players' cards, the Drunk swaps their card with a
+    center card without looking, and the Insomniac checks their own card at the end of the night.
+
+    Cards can move during the night, so a player may now hold a different card than the one they were
+    dealt. The card a player holds at the end of the night decides their team.
+
+    During the day everyone talks, then all players vote at the same time. The player with the most
+    votes is eliminated; nobody is eliminated if no player gets more than one vote. If the Hunter is
+    eliminated, the player the Hunter voted for is eliminated too. The village wins if a Werewolf is
+    eliminated. The werewolf team wins if no Werewolf is eliminated. The Tanner wins only by being
+    eliminated.
+
+    Players may claim anything about their role and what they saw. Some of them will be lying.
+
+    Whenever you respond, keep your private reasoning (private_thoughts) separate from what you
+    say out loud to the table (public_response). Only your public response is heard by others."""
+)
+
+
+# Rough size of a token in English text, for keeping retrieved history within a budget
+CHARS_PER_TOKEN = 4
+
+
+class PromptLayers(NamedTuple):
+    """
+    The parts of one model prompt, ordered from most to least stable
+
+    static: rules and role strategy, identical for every call by the role
+    game: identity and roster, fixed for the whole game
+    agent: this agent's private knowledge, which changes a few times per game
+    volatile: conversation history followed by the current ask
+    """
+    static: str
+    game: str
+    agent: str
+    volatile: str
+
+    @property
+    def stable_prefix_chars(self) -> int:
+        """Length of the prefix that cannot change during a game (static and game layers)"""
+        return len(self.static) + len(self.game) + 2
+
+    def messages(self) -> List[dict]:
+        return [
+            {"role": "system", "content": f"{self.static}\n\n{self.game}\n\n{self.agent}"},
+            {"role": "user", "content": self.volatile}
+        ]
+
+
+class RolePrompt:
+    """
+    Precompiled prompt template for one role
+
+    The role text is dedented and joined to the shared rules once, when the role module is
+    imported, so every call made by the role starts with byte-identical text.
+    """
+    def __init__(self, role_name: str, day_strategy: str, night_instructions: Optional[str] = None):
+        header = f"{GAME_RULES}\n\nYOUR ROLE: {role_name}\n\n"
+        self.role_name = role_name
+        self.day_static = header + inspect.cleandoc(day_strategy)
+        self.night_static = header + inspect.cleandoc(night_instructions) if night_instructions else self.day_static
+
+    def layers(self, agent, game_context, ask: str) -> PromptLayers:
+        """
+        Assemble the prompt for one call
+
+        Args:
+            agent: The agent being prompted
+            game_context: Current game state
+            ask: What the agent has to do now; placed after the conversation history
+        """
+        return PromptLayers(
+            static=self.night_static if game_context.is_nighttime else self.day_static,
+            game=game_section(agent, game_context),
+            agent=knowledge_section(agent),
+            volatile=f"{history_section(game_context, agent)}\n\n{ask}"
+        )
+
+
+def game_section(agent, game_context) -> str:
+    other_names = ", ".join(game_context.get_other_player_names(agent.player_id))
+    return f"Your name is {agent.player_name} and you were dealt the {agent.initial_role.title()} card.\nThe other players at the table are: {other_names}"
+
+
+def knowledge_section(agent) -> str:
+    if not agent.personal_knowledge:
+        return "You have no private information."
+    return "What you know privately:\n" + "\n".join(f"- {knowledge}" for knowledge in agent.personal_knowledge.render())
+
+
+def history_section(game_context, agent=None) -> str:
+    if not game_context.conversation.messages:
+        return "Nobody has spoken yet."
+    if agent is not None and agent.history_mode == "relevant":
+        return relevant_history_section(agent, game_context, agent.history_token_budget)
+    if agent is not None and agent.history_mode == "claims":
+        return claims_history_section(game_context, agent.history_token_budget)
+    # The history only ever grows at the end, so earlier turns stay part of the cached prefix
+    return f"The conversation so far:\n\n{game_context.conversation.get_public_conversation_history()}"
+
+
+def _fit_to_budget(messages, token_budget: int) -> List[str]:
+    """The newest messages whose lines fit in the token budget, in transcript order"""
+    lines: List[str] = []
+    tokens = 0
+    for message in reversed(messages):
+        if not message.public_response.strip():
+            continue
+        line = f"{message.player_name}: {message.public_response}"
+        tokens += len(line) // CHARS_PER_TOKEN + 1
+        if tokens > token_budget and lines:
+            break
+        lines.append(line)
+    lines.reverse()
+    return lines
+
+
+def relevant_history_section(agent, game_context, token_budget: int) -> str:
+    """
+    The messages that matter most to one agent, newest first until the token budget is spent
+
+    Relevant messages are those said by or naming the agent or a player its private knowledge is
+    about, those naming its dealt role or a role it has seen, and everything said this round.
+    They are shown in transcript order. Unlike the full transcript this selection changes from
+    turn to turn, so it gives up prompt-cache reuse of the history for a much shorter prompt.
+    """
+    conversation = game_context.conversation
+    facts = agent.personal_knowledge.facts()
+    focus = [agent.player_id]
+    for fact in facts:
+        for name in (fact.subject, fact.other):
+            player = game_context.get_player_by_name(name) if name else None
+            if player is not None and player.player_id not in focus:
+                focus.append(player.player_id)
+    roles = [agent.initial_role] + [fact.role for fact in facts if fact.role]
+
+    relevant = conversation.query(speakers=focus, mentions=focus, roles=roles, rounds=[conversation.current_round])
+    lines = _fit_to_budget(relevant, token_budget)
+
+    total = sum(1 for message in conversation.snapshot() if message.public_response.strip())
+    if len(lines) == total:
+        return "The conversation so far:\n\n" + "\n".join(lines)
+    return f"The parts of the conversation most relevant to you ({len(lines)} of {total} messages):\n\n" + "\n".join(lines)
+
+
+def claims_history_section(game_context, token_budget: int) -> str:
+    """
+    The claims table in place of the transcript, plus what has been said this round
+
+    The table (see game_context.claims) already holds who claimed which role and night action
+    and where the claims contradict each other, which is most of what earlier rounds are for.
+    """
+    conversation = game_context.conversation
+    lines = _fit_to_budget(conversation.query(rounds=[conversation.current_round]), token_budget)
+    said = "\n".join(lines) if lines else "Nothing yet."
+    return f"What each player has claimed so far:\n{conversation.render_claims()}\n\nSaid this round:\n{said}"
+
+
+def turn_ask(prompt: str) -> str:
+    return f"It's your turn to act!\n\nCurrent situation: {prompt}\n\nWhat would you like to say to the group or do? You can share information, ask questions, make accusations, or use any available tools."
+
+
+def question_ask(questioning_player_name: str, question: str) -> str:
+    return f"{questioning_player_name} has a question for you: {question}\n\nRespond to {questioning_player_name}. You can be truthful, misleading, or evasive depending on what benefits your role."
+
+
+def vote_ask(game_context, player_id: int) -> str:
+    return f"The discussion is over and it's time to vote!\n\n{game_context.get_other_player_names_in_text(player_id)}\n\nVote for exactly one other player to eliminate. Use their exact name as vote_target_name."
+
+
+def shared_prefix_length(previous: str, current: str) -> int:
+    """Number of leading characters two prompts have in common"""
+    limit = min(len(previous), len(current))
+    index = 0
+    # Compare in blocks first; prompts usually share thousands of characters
+    while index + 256 <= limit and previous[index:index + 256] == current[index:index + 256]:
+        index += 256
+    while index < limit and previous[index] == current[index]:
+        index += 1
+    return index
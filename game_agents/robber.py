@@ -1,9 +1,11 @@
+from typing import Union
 from game_context.game_context import GameContext
 from game_context.roles import Role
 from game_agents.agent_registry import register_agent
 from game_agents.base_agent import BaseAgent
-from game_agents.common_tools import NightActionResult, validate_player_exists, resolve_player_name_to_id
-import textwrap
+from game_agents.prompting import RolePrompt
+from game_agents.tool_registry import ToolError, register_tool
+from game_agents.common_tools import NightActionResult, invalid_action, validate_player_exists, resolve_player_name_to_id
 
 # Robber tool definition
 ROBBER_SWAP_TOOL = {
@@ -26,8 +28,27 @@ ROBBER_SWAP_TOOL = {
     }
 }
 
+ROBBER_PROMPT = RolePrompt(
+    "Robber",
+    day_strategy="""At night, you used your special abilities to swap your card with another player and learn your new role (see what you know privately).
+
+    Your strategy depends on your new role:
+    - If you're now a villager role: Help find the werewolves
+    - If you're now a werewolf: Try to blend in and avoid detection (while also protecting those werewolfs from discovery)
+    - Share information about the swap strategically
+
+    But be careful, as your role may have been changed during the night by other players' actions!""",
+    night_instructions="""It is now nighttime and you must use the "robber_swap" tool to swap your card with another player and learn your new role.
+
+    Usage: robber_swap with {"target_player_name": "<player_name>"}
+
+    Choose wisely!"""
+)
+
 @register_agent(Role.ROBBER)
 class RobberAgent(BaseAgent):
+    prompt_template = ROBBER_PROMPT
+
     def __init__(self, player_id: int, player_name: str, initial_role: str, is_ai: bool):
         super().__init__(player_id, player_name, initial_role, is_ai, nighttime_tools=[ROBBER_SWAP_TOOL])
         self.nighttime_tool = ROBBER_SWAP_TOOL.get("function", {}).get("name")
@@ -35,71 +56,7 @@ class RobberAgent(BaseAgent):
     def execute_night_action(self, game_context: GameContext):
         """Robber has no automatic night action - they must use the robber_swap tool"""
         return "As the Robber, you must choose which player to swap cards with using the robber_swap tool."
-    
-    def call_tool(self, name: str, args: dict, game_context: GameContext = None):
-        """Handle Robber-specific tools and common tools"""
-        if not self.is_tool_available(name, game_context):
-            return f"The tool '{name}' is not available during the current game phase."
-        
-        if name == "robber_swap":
-            result = robber_swap(
-                game_context=game_context,
-                robber_player_id=self.player_id,
-                target_player_name=args.get('target_player_name')
-            )
-            
-            if result and isinstance(result, str) and not result.startswith("Error:"):
-                self.personal_knowledge.append(result)
-            
-            return result
-        else:
-            return self._call_common_tool(name, args, game_context)
-
-    def _get_system_prompt(self, game_context: GameContext = None):
-        if game_context and game_context.is_nighttime:
-            return self._get_nighttime_prompt(game_context)
-        else:
-            return self._get_daytime_prompt(game_context)
-    
-    def _get_nighttime_prompt(self, game_context: GameContext):
-        player_list = game_context.get_other_player_names_in_text(self.player_id)
-        
-        return textwrap.dedent(
-            f"""You are playing One Night Werewolf with the initial role of {self.initial_role}! Your name is {self.player_name}.
 
-            Other players in the game are:
-            {player_list}
-
-            It is now nighttime and you must use the "robber_swap" tool to swap your card with another player and learn your new role.
-            
-            Usage: robber_swap with {{"target_player_name": "<player_name>"}}
-
-            Choose wisely!"""
-        )
-    
-    def _get_daytime_prompt(self, game_context: GameContext = None):
-        night_knowledge = ""
-        if self.personal_knowledge:
-            night_knowledge = f"\n\nWhat you learned during the night phase:\n" + "\n".join(f"- {knowledge}" for knowledge in self.personal_knowledge)
-        
-        player_list = game_context.get_other_player_names_in_text(self.player_id)
-        
-        return textwrap.dedent(
-            f"""You are playing One Night Werewolf with the initial role of {self.initial_role}! Your name is {self.player_name}.
-
-            Other players in the game are:
-            {player_list}
-
-            At night, you used your special abilities to swap your card with another player and learn your new role:
-            {night_knowledge}
-
-            Your strategy depends on your new role:
-            - If you're now a villager role: Help find the werewolves
-            - If you're now a werewolf: Try to blend in and avoid detection (while also protecting those werewolfs from discovery)
-            - Share information about the swap strategically
-
-            But be careful, as your role may have been changed during the night by other players' actions!"""
-        )
 
 def rob_player_card(game_context: GameContext, robber_player_id: int, target_player_id: int) -> NightActionResult:
     """
@@ -122,17 +79,20 @@ def rob_player_card(game_context: GameContext, robber_player_id: int, target_pla
     
     target_player = game_context.get_player(target_player_id)
     
-    robber_original_role = game_context.get_player_current_role(robber_player_id)
-    target_original_role = game_context.get_player_current_role(target_player_id)
+    # The robber must see the card they actually took, even with other turns running
+    with game_context.transaction():
+        robber_original_role = game_context.get_player_current_role(robber_player_id)
+        target_original_role = game_context.get_player_current_role(target_player_id)
     
-    if not robber_original_role or not target_original_role:
-        return NightActionResult(False, "Could not determine player roles for swap!")
+        if not robber_original_role or not target_original_role:
+            return NightActionResult(False, "Could not determine player roles for swap!")
     
-    success = game_context.swap_player_roles(robber_player_id, target_player_id)
-    if not success:
-        return NightActionResult(False, "Failed to swap cards!")
+        success = game_context.swap_player_roles(robber_player_id, target_player_id)
+        if not success:
+            return NightActionResult(False, "Failed to swap cards!")
     
-    new_role = game_context.get_player_current_role(robber_player_id)
+        new_role = game_context.get_player_current_role(robber_player_id)
+        game_context.record_night_action(robber_player_id, "robber", [target_player_id])
     
     return NightActionResult(
         True,
@@ -146,7 +106,7 @@ def rob_player_card(game_context: GameContext, robber_player_id: int, target_pla
     )
 
 
-def robber_swap(game_context: GameContext, robber_player_id: int, target_player_name: str) -> str:
+def robber_swap(game_context: GameContext, robber_player_id: int, target_player_name: str) -> Union[str, ToolError]:
     """
     Robber swap tool - allows the robber to swap cards with another player
     
@@ -156,19 +116,30 @@ def robber_swap(game_context: GameContext, robber_player_id: int, target_player_
         target_player_name: Name of the player to swap cards with
     
     Returns:
-        String result of the swap
+        String result of the swap, or a ToolError if no swap was made
     """
     success, resolution_message, target_player_id = resolve_player_name_to_id(
         game_context, target_player_name, robber_player_id
     )
     
     if not success:
-        return resolution_message
+        return invalid_action("robber_swap", resolution_message)
     
     result = rob_player_card(game_context, robber_player_id, target_player_id)
+    if not result.success:
+        return invalid_action("robber_swap", result.message)
 
     final_message = result.message
     if resolution_message:
         final_message = resolution_message + " " + result.message
     
     return final_message
+
+
+@register_tool(ROBBER_SWAP_TOOL, phase="night")
+def _handle_robber_swap(agent, args: dict, game_context: GameContext) -> Union[str, ToolError]:
+    return robber_swap(
+        game_context=game_context,
+        robber_player_id=agent.player_id,
+        target_player_name=args["target_player_name"]
+    )
@@ -0,0 +1,264 @@
+import re
+from typing import Dict, Optional, Tuple
+from game_context.game_context import GameContext
+from game_context.roles import Role
+from game_agents.agent_registry import register_scripted_agent
+from game_agents.base_agent import ONWAgentResponse
+from game_agents.villager import VillagerAgent
+from game_agents.werewolf import WerewolfAgent
+from game_agents.seer import SeerAgent
+from game_agents.robber import RobberAgent
+from game_agents.troublemaker import TroublemakerAgent
+from game_agents.drunk import DrunkAgent
+from game_agents.hunter import HunterAgent
+from game_agents.insomniac import InsomniacAgent
+from game_agents.mason import MasonAgent
+from game_agents.minion import MinionAgent
+from game_agents.tanner import TannerAgent
+
+WEREWOLF_TEAM_ROLES = (Role.WEREWOLF.value, Role.MINION.value)
+
+
+def choose_night_action(agent, game_context: GameContext) -> Optional[Tuple[str, dict]]:
+    """
+    Pick a random night tool call for roles that have to choose a night action
+
+    Args:
+        agent: The acting agent
+        game_context: Current game state (its rng drives every choice)
+
+    Returns:
+        Tuple of (tool name, tool arguments), or None if the role has no choice to make
+    """
+    rng = game_context.rng
+    role = agent.initial_role.lower()
+    other_names = game_context.get_other_player_names(agent.player_id)
+
+    if role == Role.SEER.value:
+        if other_names and rng.random() < 0.5:
+            return "seer_investigate", {"investigation_type": "player", "target_player_name": rng.choice(other_names), "card_positions": []}
+        return "seer_investigate", {"investigation_type": "center", "target_player_name": "", "card_positions": sorted(rng.sample(range(3), 2))}
+    if role == Role.ROBBER.value:
+        return "robber_swap", {"target_player_name": rng.choice(other_names)}
+    if role == Role.TROUBLEMAKER.value:
+        player1_name, player2_name = rng.sample(other_names, 2)
+        return "troublemaker_swap", {"player1_name": player1_name, "player2_name": player2_name}
+    if role == Role.DRUNK.value:
+        return "drunk_swap", {"center_position": rng.randrange(3)}
+    return None
+
+
+def default_night_action(agent, game_context: GameContext) -> Optional[Tuple[str, dict]]:
+    """
+    Deterministic night tool call used when a model-backed night action misses its deadline
+
+    The acting player always targets the next players clockwise (by player ID) and the first
+    center cards, so the fallback never depends on randomness.
+
+    Args:
+        agent: The acting agent
+        game_context: Current game state
+
+    Returns:
+        Tuple of (tool name, tool arguments), or None if the role has no choice to make
+    """
+    role = agent.initial_role.lower()
+    seat_order = sorted(game_context.players)
+    next_index = seat_order.index(agent.player_id) + 1
+    clockwise = [game_context.get_player(player_id).player_name for player_id in seat_order[next_index:] + seat_order[:next_index - 1]]
+
+    if role == Role.SEER.value:
+        return "seer_investigate", {"investigation_type": "center", "target_player_name": "", "card_positions": [0, 1]}
+    if role == Role.ROBBER.value:
+        return "robber_swap", {"target_player_name": clockwise[0]}
+    if role == Role.TROUBLEMAKER.value:
+        return "troublemaker_swap", {"player1_name": clockwise[0], "player2_name": clockwise[1]}
+    if role == Role.DRUNK.value:
+        return "drunk_swap", {"center_position": 0}
+    return None
+
+
+def _first_person(text: str) -> str:
+    """Rewrite a second-person night result ("You looked at...") as a first-person claim"""
+    text = re.sub(r"\b[Yy]ou are\b", "I am", text)
+    text = re.sub(r"\bYou\b", "I", text)
+    text = re.sub(r"\byou\b", "me", text)
+    return re.sub(r"\byour\b", "my", text)
+
+
+class ScriptedAgentMixin:
+    """
+    Rule-based behaviour layered over a role agent so no model is ever called
+
+    Night choices are random (from the game's seeded rng), daytime turns restate the agent's
+    claim, and votes go to known werewolves when the agent has seen one. Mix in ahead of the
+    role's agent class so the role's night action functions and knowledge handling are reused.
+    """
+    calls_model = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.known_roles: Dict[int, str] = {}
+
+    def _create_client(self):
+        return None
+
+    def reset(self, *args, **kwargs) -> None:
+        super().reset(*args, **kwargs)
+        self.known_roles.clear()
+
+    def get_forced_nighttime_tool(self) -> Optional[str]:
+        # Scripted agents make their choice inside execute_night_action instead of via a model tool call
+        return None
+
+    def execute_night_action(self, game_context: GameContext):
+        choice = (self.night_policy or choose_night_action)(self, game_context)
+        if choice is None:
+            result = super().execute_night_action(game_context)
+        else:
+            tool_name, args = choice
+            result = str(self.call_tool(tool_name, args, game_context))
+        self._remember_night_roles(game_context)
+        return result
+
+    def _remember_night_roles(self, game_context: GameContext) -> None:
+        """Record the cards this agent legitimately saw during its own night action"""
+        role = self.initial_role.lower()
+        if role in WEREWOLF_TEAM_ROLES:
+            for player_id in game_context.get_players_with_role(Role.WEREWOLF):
+                self.known_roles[player_id] = Role.WEREWOLF.value
+        elif role == Role.MASON.value:
+            for player_id in game_context.get_players_with_role(Role.MASON):
+                self.known_roles[player_id] = Role.MASON.value
+        elif role == Role.INSOMNIAC.value:
+            self.known_roles[self.player_id] = self.current_role
+
+        own_actions = [action for action in game_context.night_action_log if action["player_id"] == self.player_id]
+        if not own_actions:
+            return
+        action = own_actions[-1]
+        if action["action"] == "seer_player":
+            target_id = action["targets"][0]
+            self.known_roles[target_id] = game_context.get_player_current_role(target_id).value
+        elif action["action"] == "robber":
+            self.known_roles[action["targets"][0]] = Role.ROBBER.value
+            self.known_roles[self.player_id] = self.current_role
+
+    def _believed_role(self) -> str:
+        return self.known_roles.get(self.player_id, self.initial_role.lower())
+
+    def _is_on_werewolf_team(self) -> bool:
+        return self._believed_role() in WEREWOLF_TEAM_ROLES
+
+    def _claim(self) -> str:
+        """What the agent says about itself; village roles tell the truth by default"""
+        claim = f"I'm the {self.initial_role.title()}."
+        if self.personal_knowledge:
+            claim += " " + " ".join(_first_person(knowledge) for knowledge in self.personal_knowledge)
+        return claim
+
+    def act(
+            self,
+            prompt: str,
+            prompt_is_another_player_question: bool = False,
+            questioning_player_name: str = "",
+            game_state: GameContext = None,
+            speculation=None,
+            message_id: Optional[int] = None
+    ) -> ONWAgentResponse:
+        public_response = self._claim()
+        if prompt_is_another_player_question:
+            public_response = f"{questioning_player_name}, {public_response}"
+        private_thoughts = f"Scripted {self._believed_role()} policy"
+
+        game_state.conversation.add_agent_response(
+            player_id=self.player_id,
+            player_name=self.player_name,
+            public_response=public_response,
+            private_thoughts=private_thoughts,
+            message_id=message_id
+        )
+        return ONWAgentResponse(public_response=public_response, private_thoughts=private_thoughts)
+
+    def cast_vote(self, game_context: GameContext) -> Optional[int]:
+        candidates = game_context.get_valid_vote_targets(self.player_id)
+        if not candidates:
+            return None
+
+        if self._is_on_werewolf_team():
+            safe_targets = [player_id for player_id in candidates if self.known_roles.get(player_id) != Role.WEREWOLF.value]
+            return game_context.rng.choice(safe_targets or candidates)
+
+        known_werewolves = [player_id for player_id in candidates if self.known_roles.get(player_id) == Role.WEREWOLF.value]
+        if known_werewolves:
+            return known_werewolves[0]
+
+        unknown_targets = [player_id for player_id in candidates if player_id not in self.known_roles]
+        return game_context.rng.choice(unknown_targets or candidates)
+
+
+@register_scripted_agent(Role.VILLAGER)
+class ScriptedVillagerAgent(ScriptedAgentMixin, VillagerAgent):
+    def _claim(self) -> str:
+        return "I'm a Villager, so I have no night information."
+
+
+@register_scripted_agent(Role.WEREWOLF)
+class ScriptedWerewolfAgent(ScriptedAgentMixin, WerewolfAgent):
+    def _claim(self) -> str:
+        return "I'm a Villager, so I have no night information."
+
+
+@register_scripted_agent(Role.MINION)
+class ScriptedMinionAgent(ScriptedAgentMixin, MinionAgent):
+    def _claim(self) -> str:
+        return "I'm a Villager, so I have no night information."
+
+
+@register_scripted_agent(Role.TANNER)
+class ScriptedTannerAgent(ScriptedAgentMixin, TannerAgent):
+    def _claim(self) -> str:
+        return "I'd rather not say what my role is yet."
+
+    def cast_vote(self, game_context: GameContext) -> Optional[int]:
+        candidates = game_context.get_valid_vote_targets(self.player_id)
+        return game_context.rng.choice(candidates) if candidates else None
+
+
+@register_scripted_agent(Role.SEER)
+class ScriptedSeerAgent(ScriptedAgentMixin, SeerAgent):
+    pass
+
+
+@register_scripted_agent(Role.ROBBER)
+class ScriptedRobberAgent(ScriptedAgentMixin, RobberAgent):
+    def _claim(self) -> str:
+        # A robber who stole a werewolf card now plays for the werewolves and keeps quiet about it
+        if self._is_on_werewolf_team():
+            return "I'm a Villager, so I have no night information."
+        return super()._claim()
+
+
+@register_scripted_agent(Role.TROUBLEMAKER)
+class ScriptedTroublemakerAgent(ScriptedAgentMixin, TroublemakerAgent):
+    pass
+
+
+@register_scripted_agent(Role.DRUNK)
+class ScriptedDrunkAgent(ScriptedAgentMixin, DrunkAgent):
+    pass
+
+
+@register_scripted_agent(Role.HUNTER)
+class ScriptedHunterAgent(ScriptedAgentMixin, HunterAgent):
+    pass
+
+
+@register_scripted_agent(Role.INSOMNIAC)
+class ScriptedInsomniacAgent(ScriptedAgentMixin, InsomniacAgent):
+    pass
+
+
+@register_scripted_agent(Role.MASON)
+class ScriptedMasonAgent(ScriptedAgentMixin, MasonAgent):
+    pass
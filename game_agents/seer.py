@@ -1,10 +1,11 @@
-from typing import List
+from typing import List, Union
 from game_context.game_context import GameContext
 from game_context.roles import Role
 from game_agents.agent_registry import register_agent
 from game_agents.base_agent import BaseAgent
-from game_agents.common_tools import NightActionResult, validate_player_exists, resolve_player_name_to_id
-import textwrap
+from game_agents.prompting import RolePrompt
+from game_agents.tool_registry import ToolError, register_tool
+from game_agents.common_tools import NightActionResult, invalid_action, validate_player_exists, resolve_player_name_to_id
 
 # Seer tool definition
 SEER_INVESTIGATE_TOOL = {
@@ -39,8 +40,31 @@ SEER_INVESTIGATE_TOOL = {
     }
 }
 
+SEER_PROMPT = RolePrompt(
+    "Seer",
+    day_strategy="""At night, you used your special investigative abilities to gain information (see what you know privately).
+
+    You started on the villager team and want to eliminate werewolves.
+
+    Your role is to determine the identity of the werewolf (or werewolves!) and help eliminate them. To do this, you will collaborate with all the players, while the werewolf players will try to deceive you.
+
+    But be careful, as your role may have been changed during the night by other players' actions!""",
+    night_instructions="""It is now nighttime and you must use the "seer_investigate" tool to gain information. You have two options:
+
+    1. Look at another player's card:
+       investigation_type: "player", target_player_name: "<player_name>"
+       
+    2. Look at two center cards:
+       investigation_type: "center", card_positions: [<pos1>, <pos2>]
+       (positions are 0, 1, or 2)
+
+    Choose wisely!"""
+)
+
 @register_agent(Role.SEER)
 class SeerAgent(BaseAgent):
+    prompt_template = SEER_PROMPT
+
     def __init__(self, player_id: int, player_name: str, initial_role: str, is_ai: bool):
         super().__init__(player_id, player_name, initial_role, is_ai, nighttime_tools=[SEER_INVESTIGATE_TOOL])
         self.nighttime_tool = SEER_INVESTIGATE_TOOL.get("function", {}).get("name")
@@ -48,79 +72,7 @@ class SeerAgent(BaseAgent):
     def execute_night_action(self, game_context: GameContext):
         """Seer has no automatic night action - they must use the seer_investigate tool"""
         return "As the Seer, you must choose what to investigate using the seer_investigate tool."
-    
-    def call_tool(self, name: str, args: dict, game_context: GameContext = None):
-        """Handle Seer-specific tools and common tools"""
-        if not self.is_tool_available(name, game_context):
-            return f"The tool '{name}' is not available during the current game phase."
-        
-        if name == "seer_investigate":
-            result = seer_investigate(
-                game_context=game_context,
-                seer_player_id=self.player_id,
-                investigation_type=args.get('investigation_type'),
-                target_player_name=args.get('target_player_name'),
-                card_positions=args.get('card_positions')
-            )
-            
-            if result and isinstance(result, str) and not result.startswith("Error:"):
-                self.personal_knowledge.append(result)
-            
-            return result
-        else:
-            return self._call_common_tool(name, args, game_context)
-
-    def _get_system_prompt(self, game_context: GameContext = None):
-        if game_context and game_context.is_nighttime:
-            return self._get_nighttime_prompt(game_context)
-        else:
-            return self._get_daytime_prompt(game_context)
-    
-    def _get_nighttime_prompt(self, game_context: GameContext):
-        player_list = game_context.get_other_player_names_in_text(self.player_id)
-        
-        return textwrap.dedent(
-            f"""You are playing One Night Werewolf with the initial role of {self.initial_role}! Your name is {self.player_name}.
-
-            Other players at the table are:
-            {player_list}
-
-            It is now nighttime and you must use the "seer_investigate" tool to gain information. You have two options:
 
-            1. Look at another player's card:
-               investigation_type: "player", target_player_name: "<player_name>"
-               
-            2. Look at two center cards:
-               investigation_type: "center", card_positions: [<pos1>, <pos2>]
-               (positions are 0, 1, or 2)
-
-            Choose wisely!"""
-        )
-    
-    def _get_daytime_prompt(self, game_context: GameContext = None):
-        night_knowledge = ""
-        if self.personal_knowledge:
-            night_knowledge = f"\n\nWhat you learned during the night phase:\n" + "\n".join(f"- {knowledge}" for knowledge in self.personal_knowledge)
-        
-        player_list = ""
-        if game_context:
-            player_list = game_context.get_other_player_names_in_text(self.player_id)
-        
-        return textwrap.dedent(
-            f"""You are playing One Night Werewolf with the initial role of {self.initial_role}! Your name is {self.player_name}.
-
-            Other players in the game are:
-            {player_list}
-
-            At night, you used your special investigative abilities to gain information:
-            {night_knowledge}
-
-            You started on the villager team and want to eliminate werewolves.
-
-            Your role is to determine the identity of the werewolf (or werewolves!) and help eliminate them. To do this, you will collaborate with all the players, while the werewolf players will try to deceive you.
-
-            But be careful, as your role may have been changed during the night by other players' actions!"""
-        )
 
 def see_player_card(game_context: GameContext, seer_player_id: int, target_player_id: int) -> NightActionResult:
     """
@@ -147,6 +99,8 @@ def see_player_card(game_context: GameContext, seer_player_id: int, target_playe
     if not target_role:
         return NightActionResult(False, f"Could not determine {target_player.player_name}'s role!")
     
+    game_context.record_night_action(seer_player_id, "seer_player", [target_player_id])
+    
     return NightActionResult(
         True, 
         f"You looked at {target_player.player_name}'s card and saw they are the {target_role.value.title()}",
@@ -180,6 +134,8 @@ def see_center_cards(game_context: GameContext, seer_player_id: int, card_positi
         else:
             return NightActionResult(False, f"Could not determine center card at position {pos}!")
     
+    game_context.record_night_action(seer_player_id, "seer_center", card_positions)
+    
     return NightActionResult(
         True,
         f"You looked at center cards {card_positions} and saw: {', '.join(roles_seen)}",
@@ -187,7 +143,7 @@ def see_center_cards(game_context: GameContext, seer_player_id: int, card_positi
     )
 
 
-def seer_investigate(game_context: GameContext, seer_player_id: int, investigation_type: str, target_player_name: str = None, card_positions: list = None) -> str:
+def seer_investigate(game_context: GameContext, seer_player_id: int, investigation_type: str, target_player_name: str = None, card_positions: list = None) -> Union[str, ToolError]:
     """
     Seer investigate tool - allows the seer to investigate either a player or center cards
     
@@ -199,11 +155,11 @@ def seer_investigate(game_context: GameContext, seer_player_id: int, investigati
         card_positions: List of 2 center card positions (required for 'center' type)
     
     Returns:
-        String result of the investigation
+        String result of the investigation, or a ToolError if nothing was seen
     """
     if investigation_type == 'player':
         if not target_player_name or target_player_name.strip() == "":
-            return "Error: target_player_name required for player investigation"
+            return invalid_action("seer_investigate", "target_player_name required for player investigation")
         
         # Resolve player name to ID
         success, resolution_message, target_player_id = resolve_player_name_to_id(
@@ -211,9 +167,11 @@ def seer_investigate(game_context: GameContext, seer_player_id: int, investigati
         )
         
         if not success:
-            return resolution_message
+            return invalid_action("seer_investigate", resolution_message)
         
         result = see_player_card(game_context, seer_player_id, target_player_id)
+        if not result.success:
+            return invalid_action("seer_investigate", result.message)
         
         # Add duplicate name warning if needed
         final_message = result.message
@@ -222,12 +180,25 @@ def seer_investigate(game_context: GameContext, seer_player_id: int, investigati
         
     elif investigation_type == 'center':
         if not card_positions or len(card_positions) != 2:
-            return "Error: exactly 2 card_positions required for center card investigation"
+            return invalid_action("seer_investigate", "exactly 2 card_positions required for center card investigation")
         
         result = see_center_cards(game_context, seer_player_id, card_positions)
+        if not result.success:
+            return invalid_action("seer_investigate", result.message)
         final_message = result.message
         
     else:
-        return "Error: investigation type must be 'player' or 'center'"
+        return invalid_action("seer_investigate", "investigation type must be 'player' or 'center'")
     
     return final_message
+
+
+@register_tool(SEER_INVESTIGATE_TOOL, phase="night")
+def _handle_seer_investigate(agent, args: dict, game_context: GameContext) -> Union[str, ToolError]:
+    return seer_investigate(
+        game_context=game_context,
+        seer_player_id=agent.player_id,
+        investigation_type=args["investigation_type"],
+        target_player_name=args.get("target_player_name"),
+        card_positions=args.get("card_positions")
+    )
@@ -0,0 +1,168 @@
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional
+from game_agents.hedging import DeadlineExceeded
+
+
+class SpeculativeTurn:
+    """
+    The first model call of a player's next turn, started early on the conversation as it stood
+
+    Holds everything the turn needs to carry on from that call (route, messages, request
+    parameters), plus what the conversation looked like when the request was built so a
+    relevance check can decide whether the result is still good once the turn comes round.
+    """
+    def __init__(self, player_id: int, prompt: str, route: Any, messages: list, api_params: dict, game_context: Any):
+        conversation = game_context.conversation
+        self.player_id = player_id
+        self.prompt = prompt
+        self.route = route
+        self.messages = messages
+        self.api_params = api_params
+        self.seen_message_id = conversation.next_message_id
+        self.seen_claims_version = conversation.claims.version
+        self.future: Optional[Future] = None
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+        self.taken: Optional[float] = None
+        self.used = False
+
+    def run(self, executor, call: Callable[[], Any]) -> None:
+        self.future = executor.submit(call)
+        self.future.add_done_callback(self._on_done)
+
+    def _on_done(self, future: Future) -> None:
+        self.finished = time.perf_counter()
+
+    def result(self, timeout: Optional[float] = None):
+        """
+        The speculative response, waiting for it if it's still in flight; marks the speculation used
+        
+        Raises:
+            DeadlineExceeded: If the call is still running after timeout seconds
+        """
+        self.taken = time.perf_counter()
+        self.used = True
+        try:
+            return self.future.result(timeout=timeout)
+        except FutureTimeoutError as e:
+            raise DeadlineExceeded(f"Speculative call on route '{self.route.name}' did not finish within the turn") from e
+
+    def cancel(self) -> None:
+        """Drop the speculation; a request that already went out still runs to completion, unused"""
+        if self.future is not None:
+            self.future.cancel()
+
+    @property
+    def seconds_saved(self) -> float:
+        """How long the call had already been running, or had been finished for, when the turn took it"""
+        if not self.used or self.taken is None:
+            return 0.0
+        end = self.taken if self.finished is None else min(self.taken, self.finished)
+        return max(end - self.started, 0.0)
+
+
+def _new_messages_mention(turn: SpeculativeTurn, game_context: Any) -> bool:
+    conversation = game_context.conversation
+    with conversation.order.lock:
+        conversation.index.catch_up(conversation.messages)
+        mentions = conversation.index.by_mention.get(turn.player_id, [])
+        return bool(mentions) and mentions[-1].message_id >= turn.seen_message_id
+
+
+def _unchanged_table(turn: SpeculativeTurn, game_context: Any) -> bool:
+    """Nothing new was claimed since the speculation started, and nobody named the speaker"""
+    if game_context.conversation.claims.version != turn.seen_claims_version:
+        return False
+    return not _new_messages_mention(turn, game_context)
+
+
+# Relevance check name -> whether a finished speculation still fits the conversation
+RELEVANCE_CHECKS: Dict[str, Callable[[SpeculativeTurn, Any], bool]] = {
+    "claims": _unchanged_table,
+    "mentions": lambda turn, game_context: not _new_messages_mention(turn, game_context),
+    "always": lambda turn, game_context: True,
+    "never": lambda turn, game_context: False,
+}
+
+
+class Speculator:
+    """
+    Starts the next speaker's first model call while the current speaker is still talking
+
+    In a round-robin discussion the next speaker's prompt is known except for the message being
+    generated now. When their turn comes, the relevance check decides whether what was said in
+    the meantime changes the situation: if not, the turn carries on from the speculative result;
+    if so, it is dropped and the turn makes the call again. Only model-backed seats speculate,
+    and the speculative call is never streamed. Tracks hits and the latency saved per game.
+
+    Args:
+        relevance: Name of the check in RELEVANCE_CHECKS ("claims" by default)
+    """
+    def __init__(self, relevance: str = "claims"):
+        if relevance not in RELEVANCE_CHECKS:
+            raise ValueError(f"Unknown speculation relevance check '{relevance}'; expected one of {', '.join(RELEVANCE_CHECKS)}")
+        self.relevance = relevance
+        self._check = RELEVANCE_CHECKS[relevance]
+        self._pending: Dict[int, SpeculativeTurn] = {}
+        self.started = 0
+        self.hits = 0
+        self.misses = 0
+        self.discarded = 0
+        self.seconds_saved = 0.0
+
+    @classmethod
+    def from_config(cls, game_config: Dict[str, Any]) -> Optional["Speculator"]:
+        """A speculator for one game from the config's "speculation" section, or None if it's disabled"""
+        options = game_config.get("speculation", {})
+        if not options.get("enabled", False):
+            return None
+        return cls(relevance=options.get("relevance", "claims"))
+
+    def start(self, player: Any, prompt: str, game_context: Any, executor) -> None:
+        """Start the player's next turn early, unless it is already running or they call no model"""
+        if player.player_id in self._pending or not player.calls_model:
+            return
+        turn = player.speculate_turn(prompt, game_context, executor)
+        if turn is not None:
+            self._pending[player.player_id] = turn
+            self.started += 1
+
+    def take(self, player: Any, prompt: str, game_context: Any) -> Optional[SpeculativeTurn]:
+        """The player's speculation if it is still relevant to this turn, else None (after dropping it)"""
+        turn = self._pending.pop(player.player_id, None)
+        if turn is None:
+            return None
+        if turn.prompt != prompt or not self._check(turn, game_context):
+            turn.cancel()
+            self.misses += 1
+            return None
+        return turn
+
+    def settle(self, turn: SpeculativeTurn) -> None:
+        """Count a taken speculation once its turn is over; the agent may still have refused it"""
+        if turn.used:
+            self.hits += 1
+            self.seconds_saved += turn.seconds_saved
+        else:
+            self.misses += 1
+
+    def cancel_all(self) -> None:
+        """Drop every speculation still waiting for its turn, e.g. when the discussion ends early"""
+        for turn in self._pending.values():
+            turn.cancel()
+        self.discarded += len(self._pending)
+        self._pending.clear()
+
+    def report(self) -> Dict[str, Any]:
+        """Speculations started, kept and dropped this game, with the hit rate and seconds saved"""
+        decided = self.hits + self.misses
+        return {
+            "started": self.started,
+            "hits": self.hits,
+            "misses": self.misses,
+            "discarded": self.discarded,
+            "hit_rate": self.hits / decided if decided else None,
+            "seconds_saved": self.seconds_saved,
+        }
@@ -0,0 +1,73 @@
+import re
+
+_FIELD_START = re.compile(r'"public_response"\s*:\s*"')
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+class PublicResponseExtractor:
+    """
+    Pulls the public_response string out of a structured response while its JSON is still streaming
+
+    Feed it content deltas as they arrive; each call returns the newly decoded public_response
+    text (possibly empty). Nothing outside that one string value is ever returned, so private
+    thoughts stay private even when the model writes them first.
+    """
+    def __init__(self, field_pattern: re.Pattern = _FIELD_START):
+        self._field_pattern = field_pattern
+        self._buffer = ""
+        self._position = 0
+        self._in_value = False
+        self._pending_high_surrogate = ""
+        self.done = False
+        self.text = ""
+
+    def feed(self, delta: str) -> str:
+        if self.done or not delta:
+            return ""
+        self._buffer += delta
+
+        if not self._in_value:
+            match = self._field_pattern.search(self._buffer)
+            if not match:
+                return ""
+            self._in_value = True
+            self._position = match.end()
+
+        decoded = []
+        buffer, position = self._buffer, self._position
+        while position < len(buffer):
+            char = buffer[position]
+            if char == '"':
+                self.done = True
+                position += 1
+                break
+            if char != "\\":
+                decoded.append(char)
+                position += 1
+                continue
+
+            # Escape sequences may be split across deltas; wait for the rest
+            if position + 1 >= len(buffer):
+                break
+            code = buffer[position + 1]
+            if code != "u":
+                decoded.append(_ESCAPES.get(code, code))
+                position += 2
+                continue
+            if position + 6 > len(buffer):
+                break
+            codepoint = int(buffer[position + 2:position + 6], 16)
+            position += 6
+            if 0xD800 <= codepoint <= 0xDBFF:
+                self._pending_high_surrogate = chr(codepoint)
+            elif 0xDC00 <= codepoint <= 0xDFFF and self._pending_high_surrogate:
+                pair = self._pending_high_surrogate + chr(codepoint)
+                decoded.append(pair.encode("utf-16", "surrogatepass").decode("utf-16"))
+                self._pending_high_surrogate = ""
+            else:
+                decoded.append(chr(codepoint))
+
+        self._position = position
+        new_text = "".join(decoded)
+        self.text += new_text
+        return new_text
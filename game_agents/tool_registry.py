@@ -0,0 +1,183 @@
+from typing import Any, Callable, Dict, List, Optional, Union
+from pydantic import BaseModel, Field
+
+Validator = Callable[[Any], List[str]]
+
+JSON_TYPES: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "integer": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+}
+
+
+class ToolError(BaseModel):
+    """Structured result of a tool call that could not be executed"""
+    tool: str
+    kind: str  # "unknown_tool", "unavailable", "invalid_arguments", "invalid_action" or "timed_out"
+    message: str
+    problems: List[str] = Field(default_factory=list)
+
+    def __str__(self) -> str:
+        details = f" ({'; '.join(self.problems)})" if self.problems else ""
+        return f"Error: {self.message}{details}"
+
+
+class ToolSpec:
+    """A tool declared once: its OpenAI schema, compiled argument validator and handler"""
+    def __init__(self, schema: dict, handler: Callable, phase: str, records_knowledge: bool = True, posts_message: bool = False):
+        self.schema = schema
+        self.name = schema["function"]["name"]
+        self.handler = handler
+        self.phase = phase
+        self.records_knowledge = records_knowledge
+        self.posts_message = posts_message
+        self.validate: Validator = compile_validator(schema["function"].get("parameters", {"type": "object"}))
+
+
+# Night tools are registered by their role's module, so they appear once that role is loaded
+TOOL_REGISTRY: Dict[str, ToolSpec] = {}
+
+
+def register_tool(schema: dict, phase: str = "day", records_knowledge: bool = True, posts_message: bool = False):
+    """
+    Register a handler for a tool schema (one of the *_TOOL dicts)
+
+    The handler is called as handler(agent, args, game_context) with already validated
+    arguments and returns the result string shown to the model, or a ToolError of kind
+    "invalid_action" when the arguments are well-formed but the action can't be taken
+    (e.g. a night tool aimed at the caller or at a player who isn't in the game).
+
+    Args:
+        schema: OpenAI function tool definition
+        phase: "night" for tools only usable at night, "day" for tools usable at any time
+        records_knowledge: Append successful results to the calling agent's personal knowledge
+        posts_message: The tool adds a message to the transcript (e.g. another player's answer);
+            its handler also takes the message_id reserved for that message
+    """
+    def decorator(handler):
+        spec = ToolSpec(schema, handler, phase, records_knowledge, posts_message)
+        TOOL_REGISTRY[spec.name] = spec
+        return handler
+    return decorator
+
+
+def get_tool(name: str) -> Optional[ToolSpec]:
+    return TOOL_REGISTRY.get(name)
+
+
+def dispatch_tool(agent, name: str, args: Any, game_context, message_id: Optional[int] = None) -> Union[str, ToolError]:
+    """
+    Validate and run a tool call on behalf of an agent
+
+    Args:
+        agent: The calling agent
+        name: Tool name from the model's tool call
+        args: Parsed tool call arguments
+        game_context: Current game state
+        message_id: Transcript id reserved for the message a posts_message tool adds
+
+    Returns:
+        The tool's result string, or a ToolError describing why the call was rejected
+    """
+    spec = TOOL_REGISTRY.get(name)
+    if spec is None:
+        return ToolError(tool=name, kind="unknown_tool", message=f"Unknown tool: {name}")
+
+    agent_tool_names = {tool["function"]["name"] for tool in agent.nighttime_tools + agent.daytime_tools}
+    if name not in agent_tool_names or not agent.is_tool_available(name, game_context):
+        return ToolError(tool=name, kind="unavailable", message=f"The tool '{name}' is not available during the current game phase.")
+
+    problems = spec.validate(args)
+    if problems:
+        return ToolError(tool=name, kind="invalid_arguments", message=f"Invalid arguments for {name}", problems=problems)
+
+    if spec.posts_message:
+        result = spec.handler(agent, args, game_context, message_id=message_id)
+    else:
+        result = spec.handler(agent, args, game_context)
+    if spec.records_knowledge and result and isinstance(result, str) and not result.startswith("Error:"):
+        agent.personal_knowledge.append(result)
+    return result
+
+
+def compile_validator(schema: dict, path: str = "$") -> Validator:
+    """
+    Compile the JSON schema subset used by the tool definitions into a validation function
+
+    Supports type, enum, minimum/maximum, minItems/maxItems, items, properties, required
+    and additionalProperties: false. The returned function lists every problem found.
+    """
+    checks: List[Callable[[Any], List[str]]] = []
+
+    expected_type = schema.get("type")
+    if expected_type:
+        type_check = JSON_TYPES[expected_type]
+
+        def check_type(value):
+            return [] if type_check(value) else [f"{path} must be of type {expected_type}"]
+        checks.append(check_type)
+
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+
+        def check_enum(value):
+            return [] if value in allowed else [f"{path} must be one of {allowed}"]
+        checks.append(check_enum)
+
+    if "minimum" in schema or "maximum" in schema:
+        minimum, maximum = schema.get("minimum"), schema.get("maximum")
+
+        def check_range(value):
+            if not JSON_TYPES["number"](value):
+                return []
+            if (minimum is not None and value < minimum) or (maximum is not None and value > maximum):
+                return [f"{path} must be between {minimum} and {maximum}"]
+            return []
+        checks.append(check_range)
+
+    if "minItems" in schema or "maxItems" in schema or "items" in schema:
+        min_items, max_items = schema.get("minItems"), schema.get("maxItems")
+        item_validator = compile_validator(schema["items"], f"{path}[]") if "items" in schema else None
+
+        def check_items(value):
+            if not isinstance(value, list):
+                return []
+            problems = []
+            if (min_items is not None and len(value) < min_items) or (max_items is not None and len(value) > max_items):
+                problems.append(f"{path} must have between {min_items or 0} and {max_items} items")
+            if item_validator:
+                for item in value:
+                    problems.extend(item_validator(item))
+            return problems
+        checks.append(check_items)
+
+    if "properties" in schema or "required" in schema:
+        property_validators = {key: compile_validator(subschema, f"{path}.{key}") for key, subschema in schema.get("properties", {}).items()}
+        required = list(schema.get("required", []))
+        closed = schema.get("additionalProperties") is False
+
+        def check_properties(value):
+            if not isinstance(value, dict):
+                return []
+            problems = [f"{path}.{key} is required" for key in required if key not in value]
+            for key, item in value.items():
+                if key in property_validators:
+                    problems.extend(property_validators[key](item))
+                elif closed:
+                    problems.append(f"{path}.{key} is not an allowed argument")
+            return problems
+        checks.append(check_properties)
+
+    def validate(value) -> List[str]:
+        problems = []
+        for check in checks:
+            problems.extend(check(value))
+            # A wrong type makes the remaining checks meaningless
+            if problems and check is checks[0] and expected_type:
+                return problems
+        return problems
+
+    return validate
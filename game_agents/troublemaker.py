@@ -1,9 +1,11 @@
+from typing import Union
 from game_context.game_context import GameContext
 from game_context.roles import Role
 from game_agents.agent_registry import register_agent
 from game_agents.base_agent import BaseAgent
-from game_agents.common_tools import NightActionResult, validate_player_exists, validate_different_players, resolve_player_name_to_id
-import textwrap
+from game_agents.prompting import RolePrompt
+from game_agents.tool_registry import ToolError, register_tool
+from game_agents.common_tools import NightActionResult, invalid_action, validate_player_exists, validate_different_players, resolve_player_name_to_id
 
 # Troublemaker tool definition
 TROUBLEMAKER_SWAP_TOOL = {
@@ -30,8 +32,30 @@ TROUBLEMAKER_SWAP_TOOL = {
     }
 }
 
+TROUBLEMAKER_PROMPT = RolePrompt(
+    "Troublemaker",
+    day_strategy="""During the night, you swapped the cards of two other players (without looking at them). Those players now have each other's original roles, but they don't know about the swap.
+
+    Your strategy should be to:
+    1. Reveal your swap information strategically
+    2. Help create confusion that benefits the village
+    3. Watch for reactions when you reveal the swap
+    4. Help identify werewolves based on how players react
+
+    You are on the villager team and want to eliminate werewolves.
+
+    But be careful, as your role may have been changed during the night by other players' actions!""",
+    night_instructions="""It is now nighttime and you must use the "troublemaker_swap" tool to swap the cards of two other players.
+
+    Usage: troublemaker_swap with {"player1_name": "<player_name>", "player2_name": "<player_name>"}
+
+    Choose strategically - you won't see their cards, but the swap will create chaos that can help the village!"""
+)
+
 @register_agent(Role.TROUBLEMAKER)
 class TroublemakerAgent(BaseAgent):
+    prompt_template = TROUBLEMAKER_PROMPT
+
     def __init__(self, player_id: int, player_name: str, initial_role: str, is_ai: bool):
         super().__init__(player_id, player_name, initial_role, is_ai, nighttime_tools=[TROUBLEMAKER_SWAP_TOOL])
         self.nighttime_tool = TROUBLEMAKER_SWAP_TOOL.get("function", {}).get("name")
@@ -39,74 +63,7 @@ class TroublemakerAgent(BaseAgent):
     def execute_night_action(self, game_context: GameContext):
         """Troublemaker has no automatic night action - they must use the troublemaker_swap tool"""
         return "As the Troublemaker, you must choose which two players to swap using the troublemaker_swap tool."
-    
-    def call_tool(self, name: str, args: dict, game_context: GameContext = None):
-        """Handle Troublemaker-specific tools and common tools"""
-        if not self.is_tool_available(name, game_context):
-            return f"The tool '{name}' is not available during the current game phase."
-        
-        if name == "troublemaker_swap":
-            result = troublemaker_swap(
-                game_context=game_context,
-                troublemaker_player_id=self.player_id,
-                player1_name=args.get('player1_name'),
-                player2_name=args.get('player2_name')
-            )
-
-            if result and isinstance(result, str) and not result.startswith("Error:"):
-                self.personal_knowledge.append(result)
-            
-            return result
-        else:
-            return self._call_common_tool(name, args, game_context)
-
-    def _get_system_prompt(self, game_context: GameContext = None):
-        if game_context and game_context.is_nighttime:
-            return self._get_nighttime_prompt(game_context)
-        else:
-            return self._get_daytime_prompt(game_context)
-    
-    def _get_nighttime_prompt(self, game_context: GameContext):
-        player_list = game_context.get_other_player_names_in_text(self.player_id)
-        
-        return textwrap.dedent(
-            f"""You are playing One Night Werewolf with the initial role of {self.initial_role}! Your name is {self.player_name}.
-
-            {player_list}
-
-            It is now nighttime and you must use the "troublemaker_swap" tool to swap the cards of two other players.
-            
-            Usage: troublemaker_swap with {{"player1_name": "<player_name>", "player2_name": "<player_name>"}}
-            
-            Choose strategically - you won't see their cards, but the swap will create chaos that can help the village!"""
-        )
-    
-    def _get_daytime_prompt(self, game_context: GameContext = None):
-        night_knowledge = ""
-        if self.personal_knowledge:
-            night_knowledge = f"\n\nWhat you learned during the night phase:\n" + "\n".join(f"- {knowledge}" for knowledge in self.personal_knowledge)
-        
-        player_list = ""
-        if game_context:
-            player_list = game_context.get_other_player_names_in_text(self.player_id)
-        
-        return textwrap.dedent(
-            f"""You are playing One Night Werewolf with the initial role of {self.initial_role}! Your name is {self.player_name}.
-
-            {player_list}{night_knowledge}
-
-            During the night, you swapped the cards of two other players (without looking at them). Those players now have each other's original roles, but they don't know about the swap.
-
-            Your strategy should be to:
-            1. Reveal your swap information strategically
-            2. Help create confusion that benefits the village
-            3. Watch for reactions when you reveal the swap
-            4. Help identify werewolves based on how players react
-
-            You are on the villager team and want to eliminate werewolves.
-
-            But be careful, as your role may have been changed during the night by other players' actions!"""
-        )
+
 
 def swap_two_players(game_context: GameContext, troublemaker_player_id: int, player1_id: int, player2_id: int) -> NightActionResult:
     """
@@ -136,12 +93,16 @@ def swap_two_players(game_context: GameContext, troublemaker_player_id: int, pla
     player1 = game_context.get_player(player1_id)
     player2 = game_context.get_player(player2_id)
     
-    player1_original_role = game_context.get_player_current_role(player1_id)
-    player2_original_role = game_context.get_player_current_role(player2_id)
+    # Report the cards that were actually swapped, even with other turns running
+    with game_context.transaction():
+        player1_original_role = game_context.get_player_current_role(player1_id)
+        player2_original_role = game_context.get_player_current_role(player2_id)
+    
+        success = game_context.swap_player_roles(player1_id, player2_id)
+        if not success:
+            return NightActionResult(False, "Failed to swap cards!")
     
-    success = game_context.swap_player_roles(player1_id, player2_id)
-    if not success:
-        return NightActionResult(False, "Failed to swap cards!")
+        game_context.record_night_action(troublemaker_player_id, "troublemaker", [player1_id, player2_id])
     
     return NightActionResult(
         True,
@@ -156,7 +117,7 @@ def swap_two_players(game_context: GameContext, troublemaker_player_id: int, pla
     )
 
 
-def troublemaker_swap(game_context: GameContext, troublemaker_player_id: int, player1_name: str, player2_name: str) -> str:
+def troublemaker_swap(game_context: GameContext, troublemaker_player_id: int, player1_name: str, player2_name: str) -> Union[str, ToolError]:
     """
     Troublemaker swap tool - allows the troublemaker to swap two other players' cards
     
@@ -167,7 +128,7 @@ def troublemaker_swap(game_context: GameContext, troublemaker_player_id: int, pl
         player2_name: Name of the second player to swap
     
     Returns:
-        String result of the swap
+        String result of the swap, or a ToolError if no swap was made
     """
     # Resolve player names to IDs
     success1, resolution_message1, player1_id = resolve_player_name_to_id(
@@ -175,17 +136,19 @@ def troublemaker_swap(game_context: GameContext, troublemaker_player_id: int, pl
     )
     
     if not success1:
-        return resolution_message1
+        return invalid_action("troublemaker_swap", resolution_message1)
     
     success2, resolution_message2, player2_id = resolve_player_name_to_id(
         game_context, player2_name, troublemaker_player_id
     )
     
     if not success2:
-        return resolution_message2
+        return invalid_action("troublemaker_swap", resolution_message2)
     
     # Perform the swap
     result = swap_two_players(game_context, troublemaker_player_id, player1_id, player2_id)
+    if not result.success:
+        return invalid_action("troublemaker_swap", result.message)
     
     # Combine any duplicate name warnings
     warnings = []
@@ -199,3 +162,13 @@ def troublemaker_swap(game_context: GameContext, troublemaker_player_id: int, pl
         final_message = " ".join(warnings) + " " + result.message
     
     return final_message
+
+
+@register_tool(TROUBLEMAKER_SWAP_TOOL, phase="night")
+def _handle_troublemaker_swap(agent, args: dict, game_context: GameContext) -> Union[str, ToolError]:
+    return troublemaker_swap(
+        game_context=game_context,
+        troublemaker_player_id=agent.player_id,
+        player1_name=args["player1_name"],
+        player2_name=args["player2_name"]
+    )
@@ -1,10 +1,9 @@
-import textwrap
 from game_context.game_context import GameContext
 from game_context.roles import Role
 from game_agents.common_tools import NightActionResult
 from game_agents.base_agent import BaseAgent
+from game_agents.prompting import RolePrompt
 from .agent_registry import register_agent
-import random
 
 
 def see_werewolf_allies(game_context: GameContext, werewolf_player_id: int) -> NightActionResult:
@@ -48,8 +47,26 @@ def see_werewolf_allies(game_context: GameContext, werewolf_player_id: int) -> N
         }
     )
 
+WEREWOLF_PROMPT = RolePrompt(
+    "Werewolf",
+    day_strategy="""Your role is to deceive the villagers and avoid being voted out. 
+    You are on the werewolf team and win if no werewolves are eliminated during the day phase.
+
+    Your strategy should be to:
+    1. Blend in with the villagers
+    2. Cast suspicion on innocent players
+    3. Defend other werewolves without being obvious
+    4. Claim to be a villager role
+
+    But be careful, as your role may have been changed during the night by other players' actions.
+
+    It is now morning -- time to deceive!"""
+)
+
 @register_agent(Role.WEREWOLF)
 class WerewolfAgent(BaseAgent):
+    prompt_template = WEREWOLF_PROMPT
+
     def __init__(self, player_id: int, player_name: str, initial_role: str, is_ai: bool):
         super().__init__(player_id, player_name, initial_role, is_ai)
     
@@ -63,8 +80,9 @@ class WerewolfAgent(BaseAgent):
             if not eligible_center_cards:
                 raise ValueError("Game setup bug: Lone werewolf found but all center cards are werewolves")
             
-            chosen_card = random.choice(eligible_center_cards)
+            chosen_card = game_context.rng.choice(eligible_center_cards)
             center_position = game_context.center_cards.index(chosen_card)
+            game_context.record_night_action(self.player_id, "werewolf_center", [center_position])
             center_info = f"As the lone werewolf, you automatically looked at center position {center_position} and saw the {chosen_card.value} card."
             
             final_message = werewolf_result.message + " " + center_info
@@ -74,33 +92,3 @@ class WerewolfAgent(BaseAgent):
         self.personal_knowledge.append(final_message)
         
         return final_message
-    
-    def call_tool(self, name: str, args: dict, game_context: GameContext = None):
-        """Handle common tools (Werewolf has no specific tools)"""
-        return self._call_common_tool(name, args, game_context)
-    
-    def _get_system_prompt(self):
-        night_knowledge = ""
-        if self.personal_knowledge:
-            night_knowledge = f"\n\nWhat you learned during the night phase:\n" + "\n".join(f"- {knowledge}" for knowledge in self.personal_knowledge)
-        
-        return textwrap.dedent(
-            f"""You are playing a game of One Night Werewolf!
-
-                You are playing as {self.player_name} and your initial role is Werewolf.
-
-                {night_knowledge}
-
-                Your role is to deceive the villagers and avoid being voted out. 
-                You are on the werewolf team and win if no werewolves are eliminated during the day phase.
-
-                Your strategy should be to:
-                1. Blend in with the villagers
-                2. Cast suspicion on innocent players
-                3. Defend other werewolves without being obvious
-                4. Claim to be a villager role
-
-                But be careful, as your role may have been changed during the night by other players' actions.
-
-                It is now morning -- time to deceive!"""
-        )
@@ -7,16 +7,42 @@ Modules:
 - roles: Role definitions and assignment tracking
 - game_state: Game and player state management  
 - game_context: Main context that ties everything together
+- outcome: Vote tallying and win condition resolution
+- events: Ordered stream of public game events for spectators and streaming clients
+- night_plan: Night action schedule fixed at dusk from the dealt roles
+- claims: Role and night-action claims read from public messages, with contradictions
+- straw_poll: Vote prediction from the public claims, used to end a settled discussion early
+- day_budget: Wall-time budget for the day phase, sizing each turn to the time left
 - session: OpenAI SDK session implementation
 """
 
 from .messages import Message, ConversationHistory
 from .roles import Role
-from .game_context import GameContext
+from .game_context import GameContext, GameSnapshot
+from .outcome import Team, GameOutcome, resolve_game_outcome
+from .events import GameEvent, EventStream
+from .night_plan import NightTurn, NightPlan
+from .claims import Claim, Contradiction, ClaimsTable
+from .straw_poll import StrawPoll
+from .day_budget import DayBudget, TurnAllowance
 
 __all__ = [
     'Message', 
     'ConversationHistory',
     'Role',
-    'GameContext'
+    'GameContext',
+    'GameSnapshot',
+    'Team',
+    'GameOutcome',
+    'resolve_game_outcome',
+    'GameEvent',
+    'EventStream',
+    'NightTurn',
+    'NightPlan',
+    'Claim',
+    'Contradiction',
+    'ClaimsTable',
+    'StrawPoll',
+    'DayBudget',
+    'TurnAllowance'
 ]
\ No newline at end of file
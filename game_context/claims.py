@@ -0,0 +1,293 @@
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from .roles import Role
+
+# Roles whose night action a claim can describe -> the action claim kinds it explains
+ROLE_ACTIONS: Dict[str, Tuple[str, ...]] = {
+    Role.SEER.value: ("saw_player", "saw_center"),
+    Role.ROBBER.value: ("robbed",),
+    Role.TROUBLEMAKER.value: ("swapped",),
+    Role.DRUNK.value: ("took_center",),
+    Role.INSOMNIAC.value: ("checked",),
+}
+
+_ROLE_WORD = r"(villager|seer|robber|troublemaker|drunk|insomniac|mason|hunter|werewol(?:f|ves)|minion|tanner)s?"
+_ROLE = re.compile(r"\b" + _ROLE_WORD + r"\b", re.IGNORECASE)
+_ROLE_CLAIM = re.compile(
+    r"\b(?:I'm|I am|I was dealt|I was|my (?:role|card) (?:is|was)|I started as)\s+(?:(?:actually|really|definitely|honestly|truly|just)\s+)?"
+    r"(not\s+)?(?:(?:actually|really|the|a|an)\s+)*" + _ROLE_WORD + r"\b",
+    re.IGNORECASE
+)
+_FIRST_PERSON = re.compile(r"\b(?:I|I'm|I've|[Mm]y|[Mm]e)\b")
+_DIGIT = re.compile(r"\b([0-2])\b")
+_SENTENCE_END = re.compile(r"(?<=[.!?;])\s+")
+
+# Words that say which night action a sentence describes, found in one pass; earlier
+# alternatives win where they overlap ("swapped cards with" is a robbery, not a swap)
+_ACTION_CUES = re.compile(
+    r"\b(?:(?P<checked_own>(?:checked|looked at) my (?:own )?card)"
+    r"|(?P<center>center|middle)"
+    r"|(?P<robbed>robbed|stole|swapped cards with|took (?:AI|Human) \d+'s card)"
+    r"|(?P<swapped>swapped|switched|exchanged)"
+    r"|(?P<took>took)"
+    r"|(?P<looked>looked at|saw|peeked at|checked))\b",
+    re.IGNORECASE
+)
+
+
+def _role(word: str) -> str:
+    word = word.lower()
+    return Role.WEREWOLF.value if word.startswith("werewol") else word.rstrip("s")
+
+
+def claimed_roles(text: str) -> List[str]:
+    """Roles a speaker says they hold in text (first-person claims, denials left out), in the order claimed"""
+    roles = []
+    for sentence in _SENTENCE_END.split(text):
+        if _FIRST_PERSON.search(sentence):
+            roles.extend(_role(role) for negated, role in _ROLE_CLAIM.findall(sentence) if not negated)
+    return list(dict.fromkeys(roles))
+
+
+class Claim(NamedTuple):
+    """
+    One thing a player said about their own card or night action
+
+    A NamedTuple rather than a model: a claim is made for nearly every message, so it has to be
+    cheap to build.
+
+    Args:
+        kind: role, not_role, saw_player, saw_center, robbed, swapped, took_center or checked
+        role: Role claimed, denied, seen or taken
+        targets: Player ids, or center positions for saw_center and took_center
+        seen_roles: Roles the player says they saw, in target order
+    """
+    message_id: int
+    player_id: int
+    kind: str
+    role: Optional[str] = None
+    targets: Tuple[int, ...] = ()
+    seen_roles: Tuple[str, ...] = ()
+
+
+class Contradiction(NamedTuple):
+    """Two claims that can't both be true, or a player who changed their story"""
+    kind: str  # changed_story, same_role, action_role, seen_vs_claimed
+    player_ids: Tuple[int, ...]
+    message_ids: Tuple[int, ...]
+    reason: str
+
+
+class ClaimExtractor:
+    """
+    Rule-based reader of first-person role and night-action claims in public messages
+
+    It reads one sentence at a time and only sentences in the first person, so "AI 2 is the
+    Seer" is not a claim by the speaker but "I'm the Seer" and "I robbed AI 2" are.
+    """
+    def __init__(self, player_names: Optional[Dict[int, str]] = None):
+        self.track_players(player_names or {})
+
+    def track_players(self, player_names: Dict[int, str]) -> None:
+        # Players often repeat themselves word for word, so each (speaker, sentence) is read once
+        self._cache: Dict[Tuple[int, str], List[Claim]] = {}
+        self._player_ids = {name.lower(): player_id for player_id, name in player_names.items()}
+        names = sorted(player_names.values(), key=len, reverse=True)
+        self._names = re.compile(r"\b(" + "|".join(re.escape(name) for name in names) + r")\b", re.IGNORECASE) if names else None
+
+    def extract(self, message_id: int, player_id: int, text: str) -> List[Claim]:
+        claims = []
+        for sentence in _SENTENCE_END.split(text):
+            found = self._cache.get((player_id, sentence))
+            if found is None:
+                found = self._read_sentence(player_id, sentence)
+                self._cache[(player_id, sentence)] = found
+            claims.extend(claim._replace(message_id=message_id) for claim in found)
+        return claims
+
+    def _read_sentence(self, player_id: int, sentence: str) -> List[Claim]:
+        if not _FIRST_PERSON.search(sentence):
+            return []
+        claims = self._role_claims(0, player_id, sentence)
+        action = self._action_claim(0, player_id, sentence)
+        if action is not None:
+            claims.append(action)
+        return claims
+
+    def _role_claims(self, message_id: int, player_id: int, sentence: str) -> List[Claim]:
+        return [
+            Claim(message_id=message_id, player_id=player_id, kind="not_role" if negated else "role", role=_role(role))
+            for negated, role in _ROLE_CLAIM.findall(sentence)
+        ]
+
+    def _action_claim(self, message_id: int, player_id: int, sentence: str) -> Optional[Claim]:
+        cues = {match.lastgroup for match in _ACTION_CUES.finditer(sentence)}
+        if not cues:
+            return None
+        names = [self._player_ids[name.lower()] for name in self._names.findall(sentence)] if self._names else []
+        others = [other for other in dict.fromkeys(names) if other != player_id]
+        # Roles named after the action verb are what the player says they saw or got
+        roles = [_role(role) for role in _ROLE.findall(_ROLE_CLAIM.sub("", sentence))]
+        claim = dict(message_id=message_id, player_id=player_id)
+
+        if "checked_own" in cues and roles:
+            return Claim(**claim, kind="checked", role=roles[0])
+        if "center" in cues:
+            positions = tuple(int(digit) for digit in _DIGIT.findall(sentence))
+            if cues & {"swapped", "took", "robbed"}:
+                return Claim(**claim, kind="took_center", targets=positions[:1])
+            if "looked" in cues:
+                return Claim(**claim, kind="saw_center", targets=positions[:2], seen_roles=tuple(roles[:2]))
+            return None
+        if "robbed" in cues and len(others) == 1:
+            return Claim(**claim, kind="robbed", targets=(others[0],), role=roles[-1] if roles else None)
+        if "swapped" in cues and len(others) == 2:
+            return Claim(**claim, kind="swapped", targets=tuple(others))
+        if "looked" in cues and len(others) == 1 and roles:
+            return Claim(**claim, kind="saw_player", targets=(others[0],), role=roles[-1], seen_roles=(roles[-1],))
+        return None
+
+
+class ClaimsTable:
+    """
+    Every claim made so far, the latest role each player claims, and the contradictions found
+
+    Messages are added as they land in the transcript; each new claim is checked against the
+    claims already in the table, so finding contradictions never rereads the conversation.
+    """
+    def __init__(self):
+        self.extractor = ClaimExtractor()
+        self.claims: List[Claim] = []
+        self.role_claims: Dict[int, Claim] = {}
+        self.action_claims: Dict[int, List[Claim]] = {}
+        self.contradictions: List[Contradiction] = []
+        self.role_counts: Counter = Counter()
+        self._names: Dict[int, str] = {}
+        # Bumped whenever a claim adds something new, so readers can tell if the table changed
+        self.version = 0
+        # Repeating a claim every round would otherwise flag the same contradiction each time
+        self._flagged: set = set()
+        self._seen_actions: set = set()
+
+    def track_players(self, player_names: Dict[int, str]) -> None:
+        self._names = dict(player_names)
+        self.extractor.track_players(player_names)
+
+    def set_deck(self, roles: Iterable[str]) -> None:
+        """Roles in play (player and center cards), so two claims of a doubled role aren't flagged"""
+        self.role_counts = Counter(role.lower() for role in roles)
+
+    def add_message(self, message_id: int, player_id: int, text: str) -> List[Claim]:
+        """Extract a message's claims, check them against the table and add them"""
+        claims = self.extractor.extract(message_id, player_id, text)
+        for claim in claims:
+            self.claims.append(claim)
+            # A repeat of a player's current role or of an action they already described can't
+            # contradict anything that wasn't checked the first time
+            if claim.kind == "role":
+                current = self.role_claims.get(player_id)
+                if current is None or current.role != claim.role:
+                    self.version += 1
+                    self._check(claim)
+                self.role_claims[player_id] = claim
+            elif claim.kind == "not_role":
+                self.version += 1
+                self._check(claim)
+            elif claim[1:] not in self._seen_actions:
+                self.version += 1
+                self._seen_actions.add(claim[1:])
+                self._check(claim)
+                self.action_claims.setdefault(player_id, []).append(claim)
+        return claims
+
+    def _flag(self, kind: str, claims: List[Claim], reason: str) -> None:
+        if reason in self._flagged:
+            return
+        self._flagged.add(reason)
+        self.contradictions.append(Contradiction(
+            kind=kind,
+            player_ids=tuple(dict.fromkeys(claim.player_id for claim in claims)),
+            message_ids=tuple(claim.message_id for claim in claims),
+            reason=reason
+        ))
+
+    def _name(self, player_id: int) -> str:
+        return self._names.get(player_id, f"Player {player_id}")
+
+    def _check(self, claim: Claim) -> None:
+        speaker = self._name(claim.player_id)
+        earlier = self.role_claims.get(claim.player_id)
+
+        if claim.kind == "role":
+            if earlier is not None and earlier.role != claim.role:
+                self._flag("changed_story", [earlier, claim], f"{speaker} claimed {earlier.role.title()}, then {claim.role.title()}")
+            rivals = [other for player_id, other in self.role_claims.items() if player_id != claim.player_id and other.role == claim.role]
+            if rivals and len(rivals) + 1 > self.role_counts.get(claim.role, 1):
+                self._flag("same_role", rivals + [claim], f"{speaker} and {', '.join(self._name(rival.player_id) for rival in rivals)} {'both' if len(rivals) == 1 else 'all'} claim {claim.role.title()}")
+            for action in self.action_claims.get(claim.player_id, []):
+                self._check_action_role(action, claim)
+            for player_id, actions in self.action_claims.items():
+                for action in actions:
+                    if action.kind == "saw_player" and action.targets[0] == claim.player_id and action.role != claim.role:
+                        self._flag("seen_vs_claimed", [action, claim], f"{self._name(player_id)} says {speaker} is the {action.role.title()}, but {speaker} claims {claim.role.title()}")
+        elif claim.kind == "not_role":
+            if earlier is not None and earlier.role == claim.role:
+                self._flag("changed_story", [earlier, claim], f"{speaker} claimed {claim.role.title()}, then denied it")
+        else:
+            if earlier is not None:
+                self._check_action_role(claim, earlier)
+            if claim.kind == "saw_player":
+                target_claim = self.role_claims.get(claim.targets[0])
+                if target_claim is not None and target_claim.role != claim.role:
+                    target = self._name(claim.targets[0])
+                    self._flag("seen_vs_claimed", [target_claim, claim], f"{speaker} says {target} is the {claim.role.title()}, but {target} claims {target_claim.role.title()}")
+
+    def _check_action_role(self, action: Claim, role_claim: Claim) -> None:
+        if action.kind not in ROLE_ACTIONS.get(role_claim.role, ()):
+            speaker = self._name(action.player_id)
+            self._flag("action_role", [role_claim, action], f"{speaker} claims {role_claim.role.title()} but describes a {action.kind.replace('_', ' ')} action")
+
+    def describe(self, claim: Claim) -> str:
+        """A claim as a short phrase, e.g. "saw AI 2 = Werewolf" """
+        names = [self._name(target) for target in claim.targets]
+        if claim.kind == "role":
+            return f"claims {claim.role.title()}"
+        if claim.kind == "not_role":
+            return f"denies {claim.role.title()}"
+        if claim.kind == "saw_player":
+            return f"saw {names[0]} = {claim.role.title()}"
+        if claim.kind == "saw_center":
+            seen = ", ".join(f"center {position} = {role.title()}" for position, role in zip(claim.targets, claim.seen_roles))
+            return f"saw {seen or 'center cards'}"
+        if claim.kind == "robbed":
+            return f"robbed {names[0]}" + (f", now {claim.role.title()}" if claim.role else "")
+        if claim.kind == "swapped":
+            return f"swapped {names[0]} and {names[1]}"
+        if claim.kind == "took_center":
+            return f"took center {claim.targets[0]}" if claim.targets else "took a center card"
+        return f"checked own card = {claim.role.title()}"
+
+    def render(self) -> str:
+        """The table as a few prompt lines: one per player who claimed something, then contradictions"""
+        lines = []
+        for player_id in sorted(set(self.role_claims) | set(self.action_claims)):
+            phrases = [self.describe(self.role_claims[player_id])] if player_id in self.role_claims else []
+            phrases += [self.describe(claim) for claim in self.action_claims.get(player_id, [])]
+            lines.append(f"{self._name(player_id)}: {'; '.join(phrases)}")
+        if not lines:
+            return "Nobody has claimed a role yet."
+        if self.contradictions:
+            lines.append("Contradictions:")
+            lines.extend(f"- {contradiction.reason}" for contradiction in self.contradictions)
+        return "\n".join(lines)
+
+    def clear(self) -> None:
+        self.claims.clear()
+        self.role_claims.clear()
+        self.action_claims.clear()
+        self.contradictions.clear()
+        self._flagged.clear()
+        self._seen_actions.clear()
+        self.role_counts = Counter()
+        self.track_players({})
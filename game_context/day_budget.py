@@ -0,0 +1,172 @@
+import time
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Union
+
+
+class TurnAllowance(NamedTuple):
+    """The agent loop settings one discussion turn runs with under the day's deadline"""
+    max_turn_seconds: float
+    max_tool_steps: int
+    history_mode: str
+    history_token_budget: int
+
+
+class HumanTurnAllowance(NamedTuple):
+    """The time a human's discussion turn may take under the day's deadline"""
+    turn_timeout: float
+
+
+class DayBudget:
+    """
+    A hard wall-time budget for the day phase, spent turn by turn
+
+    Before each turn the budget checks that one model call for the speaker still fits in what
+    is left once the vote is paid for; when it doesn't, the discussion ends and the vote starts.
+    Seats that never call a model (scripted and human) are planned at no cost, but a human may
+    take up to their turn timeout, so theirs is capped at the time that is left.
+    Call latencies are the router's observed p95 for the speaker's route, or the defaults below
+    until a route has min_samples calls. The vote is reserved at each vote route's timeout
+    instead, since the day has to hold even when every vote call runs to its deadline, and at
+    the longest human vote timeout when that is longer (humans vote alongside the AIs). A turn's
+    allowance bounds every call the turn makes while it is in flight, not just when it starts.
+    A turn that fits gets as many tool steps (each one an inquiry and its answer) as the
+    remaining time covers, and once less than shrink_below of the day is left its conversation
+    history shrinks with the time, so late prompts are faster.
+
+    Args:
+        wall_time: Seconds from the first discussion turn to the end of the vote
+        default_turn_seconds: Assumed latency of one turn call before any are observed
+        default_question_seconds: Assumed latency of answering an inquiry
+        default_vote_seconds: Assumed latency of one vote call
+        min_samples: Calls a route needs before its observed latency is used
+        shrink_below: Fraction of the day left below which history budgets shrink
+        min_context_fraction: Smallest fraction of an agent's history budget a turn is given
+    """
+    def __init__(
+            self,
+            wall_time: float = 90.0,
+            default_turn_seconds: float = 8.0,
+            default_question_seconds: float = 6.0,
+            default_vote_seconds: float = 4.0,
+            min_samples: int = 5,
+            shrink_below: float = 0.5,
+            min_context_fraction: float = 0.25
+    ):
+        self.wall_time = wall_time
+        self.default_turn_seconds = default_turn_seconds
+        self.default_question_seconds = default_question_seconds
+        self.default_vote_seconds = default_vote_seconds
+        self.min_samples = min_samples
+        self.shrink_below = shrink_below
+        self.min_context_fraction = min_context_fraction
+        self.deadline: Optional[float] = None
+        # (role, call type) -> route; routing is fixed for the game, and resolving it scans every route
+        self._routes: Dict[Tuple[str, str], Any] = {}
+        self._defaults = {"turn": default_turn_seconds, "question": default_question_seconds, "vote": default_vote_seconds}
+        self._vote_reserve: Optional[float] = None
+
+    @classmethod
+    def from_config(cls, game_config: Dict[str, Any]) -> Optional["DayBudget"]:
+        """A budget for one day from the config's "day_budget" section, or None if it's disabled"""
+        options = dict(game_config.get("day_budget", {}))
+        if not options.pop("enabled", False):
+            return None
+        return cls(**options)
+
+    def start(self) -> None:
+        """Start the clock; called when the first discussion turn is about to be taken"""
+        if self.deadline is None:
+            self.deadline = time.monotonic() + self.wall_time
+
+    def remaining(self) -> float:
+        if self.deadline is None:
+            return self.wall_time
+        return max(self.deadline - time.monotonic(), 0.0)
+
+    def _route(self, player: Any, call_type: str, game_context: Any) -> Any:
+        key = (player.initial_role, call_type)
+        route = self._routes.get(key)
+        if route is None:
+            route = self._routes[key] = game_context.model_router.resolve(player.initial_role, "day", call_type)
+        return route
+
+    def call_seconds(self, player: Any, call_type: str, game_context: Any) -> float:
+        """Expected latency of one of a player's calls; seats and routes that call no model cost nothing"""
+        if not player.calls_model:
+            return 0.0
+        router = game_context.model_router
+        if router is None:
+            return self._defaults[call_type]
+        route = self._route(player, call_type, game_context)
+        if route.is_scripted:
+            return 0.0
+        observed = router.latency_percentile(route, 95, min_samples=self.min_samples)
+        return observed if observed is not None else self._defaults[call_type]
+
+    def call_deadline_seconds(self, player: Any, call_type: str, game_context: Any) -> float:
+        """Longest one of a player's calls can take: its route's timeout, or the expected latency without one"""
+        if not player.calls_model or game_context.model_router is None:
+            return self.call_seconds(player, call_type, game_context)
+        route = self._route(player, call_type, game_context)
+        if route.is_scripted or route.timeout is None:
+            return self.call_seconds(player, call_type, game_context)
+        return route.timeout
+
+    def vote_reserve(self, game_context: Any) -> float:
+        """
+        Seconds kept back for the vote: every AI vote at its route's timeout, since they are
+        collected one after another, or the longest human vote timeout if that is longer
+        """
+        players = game_context.players.values()
+        ai_votes = sum(self.call_deadline_seconds(player, "vote", game_context) for player in players if player.is_ai)
+        human_votes = max((player.vote_timeout for player in players if not player.is_ai), default=0.0)
+        return max(ai_votes, human_votes)
+
+    def available(self, game_context: Any) -> float:
+        """Seconds left for discussion once the vote is paid for (as estimated at the start of the round)"""
+        if self._vote_reserve is None:
+            self._vote_reserve = self.vote_reserve(game_context)
+        return self.remaining() - self._vote_reserve
+
+    def speakers_that_fit(self, speakers: list, game_context: Any) -> int:
+        """How many of the speakers, in order, can still take a one-call turn; called at the start of each round"""
+        self._vote_reserve = self.vote_reserve(game_context)
+        available = self.available(game_context)
+        fitting = 0
+        for player in speakers:
+            available -= self.call_seconds(player, "turn", game_context)
+            if available < 0:
+                break
+            fitting += 1
+        return fitting
+
+    def fits(self, player: Any, game_context: Any) -> bool:
+        """Whether the player's next turn can still take one call before the vote is due"""
+        available = self.available(game_context)
+        return available > 0 and available >= self.call_seconds(player, "turn", game_context)
+
+    def allowance(self, player: Any, game_context: Any) -> Optional[Union[TurnAllowance, HumanTurnAllowance]]:
+        """The settings the player's next turn (which must fit) may use, or None for a scripted seat"""
+        available = self.available(game_context)
+        if not player.is_ai:
+            return HumanTurnAllowance(turn_timeout=min(player.turn_timeout, max(available, 0.0)))
+        if not player.calls_model:
+            return None
+        turn = self.call_seconds(player, "turn", game_context)
+        question = self.call_seconds(player, "question", game_context)
+        extra_steps = int((available - turn) // (turn + question)) if turn + question > 0 else player.max_tool_steps
+        max_tool_steps = max(1, min(player.max_tool_steps, 1 + extra_steps))
+
+        history_mode, history_token_budget = player.history_mode, player.history_token_budget
+        left = self.remaining() / self.wall_time if self.wall_time > 0 else 0.0
+        if left < self.shrink_below:
+            # The full transcript can't shrink, so a pressed turn reads the messages relevant to it instead
+            history_mode = "relevant" if history_mode == "full" else history_mode
+            fraction = max(left / self.shrink_below, self.min_context_fraction)
+            history_token_budget = max(int(history_token_budget * fraction), 1)
+
+        return TurnAllowance(
+            max_turn_seconds=min(player.max_turn_seconds, available),
+            max_tool_steps=max_tool_steps,
+            history_mode=history_mode,
+            history_token_budget=history_token_budget
+        )
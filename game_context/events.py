@@ -0,0 +1,53 @@
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+from pydantic import BaseModel, Field
+
+
+class GameEvent(BaseModel):
+    """Something observable that happened in a game, in publication order"""
+    seq: int
+    type: str
+    player_id: Optional[int] = None
+    data: Dict[str, Any] = Field(default_factory=dict)
+    timestamp: float = Field(default_factory=time.time)
+
+
+class EventStream:
+    """
+    Ordered, thread-safe stream of public game events
+
+    Subscribers are called synchronously, in publication order, on the publishing thread, so
+    they should hand slow work off elsewhere. Only public information belongs on the stream.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: List[Callable[[GameEvent], None]] = []
+        self._next_seq = 1
+
+    def subscribe(self, callback: Callable[[GameEvent], None]) -> Callable[[], None]:
+        """Register a callback for every future event; returns a function that unsubscribes it"""
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe():
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+        return unsubscribe
+
+    def reset(self) -> None:
+        """Drop every subscriber and restart numbering, for a context reused in a new game"""
+        with self._lock:
+            self._subscribers.clear()
+            self._next_seq = 1
+
+    def publish(self, event_type: str, player_id: Optional[int] = None, **data) -> GameEvent:
+        """Publish an event to every subscriber"""
+        # Holding the lock while delivering keeps every subscriber's view in sequence order
+        with self._lock:
+            event = GameEvent(seq=self._next_seq, type=event_type, player_id=player_id, data=data)
+            self._next_seq += 1
+            for callback in list(self._subscribers):
+                callback(event)
+        return event
@@ -1,6 +1,10 @@
+import random
+import threading
+from contextlib import contextmanager
 from pydantic import BaseModel, Field
-from typing import List, Dict, Optional, Any
-from .messages import ConversationHistory
+from typing import List, Dict, Iterator, Optional, Any, Tuple
+from .events import EventStream
+from .messages import ConversationHistory, Message
 from .roles import Role
 
 # Define the order in which roles act during the night phase
@@ -16,18 +20,90 @@ NIGHT_PHASE_ORDER = [
 ]
 
 
+class GameSnapshot(BaseModel):
+    """Consistent, read-only copy of the game state at one moment, for building prompts"""
+    player_roles: Dict[int, str]
+    center_cards: Tuple[Role, ...]
+    messages: Tuple[Message, ...]
+    night_action_log: Tuple[Dict[str, Any], ...]
+    is_nighttime: bool
+    
+    class Config:
+        frozen = True
+
+
 class GameContext(BaseModel):
-    """Complete game context including all players and conversation"""
+    """
+    Complete game context including all players and conversation
+    
+    Card state is guarded by one re-entrant lock so turns can run on several threads: each
+    method that reads or writes cards holds it, and transaction() holds it across several
+    calls that must see no other player's changes in between (a read, swap and read-back).
+    """
     players: Dict[int, Any] = Field(default_factory=dict)
     conversation: ConversationHistory = Field(default_factory=ConversationHistory)
     center_cards: List[Role] = Field(default_factory=list)
+    initial_center_cards: List[Role] = Field(default_factory=list)
     is_nighttime: bool = True
     night_phase_order: List[str] = Field(default_factory=lambda: NIGHT_PHASE_ORDER.copy())
     night_actions_completed: Dict[str, bool] = Field(default_factory=dict)
+    night_action_log: List[Dict[str, Any]] = Field(default_factory=list)
+    rng: random.Random = Field(default_factory=random.Random, exclude=True)
+    model_router: Optional[Any] = Field(default=None, exclude=True)
+    events: EventStream = Field(default_factory=EventStream, exclude=True)
+    state_lock: Any = Field(default_factory=threading.RLock, exclude=True, repr=False)
+    # The human players' I/O loop (see game_agents.human_io), owned by this game
+    human_io: Optional[Any] = Field(default=None, exclude=True, repr=False)
     
     class Config:
         arbitrary_types_allowed = True
     
+    def model_post_init(self, __context: Any) -> None:
+        self.conversation.events = self.events
+    
+    
+    def reset(self, rng: Optional[random.Random] = None, model_router: Optional[Any] = None) -> None:
+        """
+        Clear this context for a new game so it can be reused instead of rebuilt
+        
+        Players, conversation, cards, night progress and event subscribers are all dropped;
+        the containers themselves are kept and refilled by the next game's setup.
+        """
+        self.players.clear()
+        self.conversation.reset()
+        self.center_cards.clear()
+        self.initial_center_cards.clear()
+        self.is_nighttime = True
+        self.night_phase_order[:] = NIGHT_PHASE_ORDER
+        self.night_actions_completed.clear()
+        self.night_action_log.clear()
+        self.rng = rng or random.Random()
+        self.model_router = model_router
+        self.events.reset()
+        self.close()
+    
+    def close(self) -> None:
+        """Shut down what the game holds outside itself: the human players' I/O thread and server"""
+        if self.human_io is not None:
+            self.human_io.shutdown()
+            self.human_io = None
+    
+    @contextmanager
+    def transaction(self) -> Iterator["GameContext"]:
+        """Hold the state lock so a sequence of reads and swaps applies as one atomic step"""
+        with self.state_lock:
+            yield self
+    
+    def snapshot(self) -> GameSnapshot:
+        """Copy the cards, transcript and night log as they stand, taken under the state lock"""
+        with self.state_lock:
+            return GameSnapshot(
+                player_roles={player_id: player.current_role for player_id, player in self.players.items()},
+                center_cards=tuple(self.center_cards),
+                messages=self.conversation.snapshot(),
+                night_action_log=tuple(dict(action) for action in self.night_action_log),
+                is_nighttime=self.is_nighttime
+            )
     
     def get_player(self, player_id: int) -> Optional[Any]:
         """Get a player by ID"""
@@ -50,6 +126,7 @@ class GameContext(BaseModel):
         if not target or target.player_id == player_id:
             return False
             
+        self.events.publish("vote", player_id=player_id, target_id=vote_target)
         return True
     
     def get_valid_vote_targets(self, player_id: int) -> List[int]:
@@ -63,6 +140,7 @@ class GameContext(BaseModel):
     def initialize_center_cards(self, center_role_enums: List[Role]) -> None:
         """Initialize center cards"""
         self.center_cards = center_role_enums.copy()
+        self.initial_center_cards = center_role_enums.copy()
         if len(self.center_cards) != 3:
             raise ValueError("Must have exactly 3 center cards")
     
@@ -70,25 +148,29 @@ class GameContext(BaseModel):
         """Get the current role of a player from the agent"""
         player = self.get_player(player_id)
         if player:
-            return Role(player.current_role.lower())
+            with self.state_lock:
+                return Role(player.current_role.lower())
         return None
     
     def set_player_role(self, player_id: int, role: Role) -> None:
         """Set/update a player's role (used for swapping)"""
         player = self.get_player(player_id)
         if player:
-            player.current_role = role.value
+            with self.state_lock:
+                player.current_role = role.value
     
     def get_center_card_role(self, position: int) -> Optional[Role]:
         """Get the role of a center card at given position (0, 1, or 2)"""
-        if 0 <= position < len(self.center_cards):
-            return self.center_cards[position]
+        with self.state_lock:
+            if 0 <= position < len(self.center_cards):
+                return self.center_cards[position]
         return None
     
     def set_center_card_role(self, position: int, role: Role) -> None:
         """Set/update a center card role (used for swapping)"""
-        if 0 <= position < len(self.center_cards):
-            self.center_cards[position] = role
+        with self.state_lock:
+            if 0 <= position < len(self.center_cards):
+                self.center_cards[position] = role
     
     def swap_player_roles(self, player1_id: int, player2_id: int) -> bool:
         """Swap the current roles of two players"""
@@ -98,38 +180,47 @@ class GameContext(BaseModel):
         if not player1 or not player2:
             return False
             
-        # Perform the swap
-        player1.current_role, player2.current_role = player2.current_role, player1.current_role
+        with self.state_lock:
+            player1.current_role, player2.current_role = player2.current_role, player1.current_role
         return True
 
     def swap_player_with_center(self, player_id: int, center_position: int) -> bool:
         """Swap a player's role with a center card"""
         player = self.get_player(player_id)
         
-        if not player or not (0 <= center_position < len(self.center_cards)):
-            return False
+        with self.state_lock:
+            if not player or not (0 <= center_position < len(self.center_cards)):
+                return False
             
-        # Perform the swap
-        center_role = self.center_cards[center_position]
-        self.center_cards[center_position] = Role(player.current_role.lower())
-        player.current_role = center_role.value
+            # Work out both new cards before writing either, so a bad card changes nothing
+            center_role = self.center_cards[center_position]
+            player_role = Role(player.current_role.lower())
+            self.center_cards[center_position] = player_role
+            player.current_role = center_role.value
         return True
     
     def get_role_assignments_summary(self) -> Dict[str, Any]:
         """Get a summary of all role assignments"""
-        player_roles = {pid: player.current_role for pid, player in self.players.items()}
-        center_cards = [role.value for role in self.center_cards]
+        with self.state_lock:
+            player_roles = {pid: player.current_role for pid, player in self.players.items()}
+            center_cards = [role.value for role in self.center_cards]
         return {
             "player_roles": player_roles,
             "center_cards": center_cards
         }
     
+    def reveal_roles(self) -> None:
+        """Publish every player's final card and the center cards once the game is over"""
+        summary = self.get_role_assignments_summary()
+        self.events.publish("roles_revealed", player_roles=summary["player_roles"], center_cards=summary["center_cards"])
+    
     def get_players_with_role(self, role: Role) -> List[int]:
         """Get list of player IDs who have the specified role"""
-        return [
-            player_id for player_id, player in self.players.items()
-            if player.current_role.lower() == role.value.lower()
-        ]
+        with self.state_lock:
+            return [
+                player_id for player_id, player in self.players.items()
+                if player.current_role.lower() == role.value.lower()
+            ]
     
     # Phase management methods
     def set_nighttime(self, is_night: bool) -> None:
@@ -138,10 +229,21 @@ class GameContext(BaseModel):
         if is_night:
             # Reset night actions when entering night phase
             self.night_actions_completed.clear()
+        self.events.publish("phase", phase="night" if is_night else "day")
+    
+    def record_night_action(self, player_id: int, action: str, targets: List[int]) -> None:
+        """Record a successful night action (targets are player IDs or center positions depending on the action)"""
+        with self.state_lock:
+            self.night_action_log.append({
+                "player_id": player_id,
+                "action": action,
+                "targets": list(targets)
+            })
     
     def mark_night_action_completed(self, role: str) -> None:
         """Mark a role's nighttime action as completed"""
-        self.night_actions_completed[role] = True
+        with self.state_lock:
+            self.night_actions_completed[role] = True
     
     def is_night_action_completed(self, role: str) -> bool:
         """Check if a role's nighttime action has been completed"""
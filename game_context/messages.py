@@ -1,8 +1,12 @@
+import re
+import threading
 from pydantic import BaseModel, Field
-from typing import List, Dict, Set, Optional, Any
+from typing import List, Dict, Set, Optional, Any, Tuple
 from datetime import datetime
 from enum import Enum
 from collections import deque
+from .roles import Role
+from .claims import ClaimsTable
 
 
 class Message(BaseModel):
@@ -14,13 +18,124 @@ class Message(BaseModel):
     private_thoughts: str = ""
     tool_calls: List[Dict] = Field(default_factory=list)
     raw_response: str = ""
+    round_number: int = 0
     timestamp: datetime = Field(default_factory=datetime.now)
 
 
+class TranscriptOrder:
+    """Locks and bookkeeping that keep a ConversationHistory in message_id order"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        # Publishing happens outside lock (subscribers may read the history) but in id order
+        self.publish_lock = threading.Lock()
+        self.next_to_append = 1
+        self.held: Dict[int, Optional[Message]] = {}
+        # Released ids still waiting on an earlier one; a late message for them is dropped
+        self.released: Set[int] = set()
+
+
+# Role names as players write them, singular or plural -> the role
+ROLE_MENTION = re.compile(
+    r"\b(" + "|".join("werewol(?:f|ves)" if role is Role.WEREWOLF else f"{role.value}s?" for role in Role) + r")\b",
+    re.IGNORECASE
+)
+
+
+def _mentioned_role(word: str) -> str:
+    word = word.lower()
+    return Role.WEREWOLF.value if word.startswith("werewol") else word.rstrip("s")
+
+
+class ConversationIndex:
+    """
+    Inverted index over the public text of a conversation
+
+    Messages are posted under their speaker, the players they name, the roles they name and
+    the discussion round they were said in. Postings are in transcript order. The index is
+    brought up to date incrementally, with only the messages added since, when it is queried,
+    so games that never query it don't pay for it.
+    """
+    def __init__(self):
+        self.indexed = 0
+        self.by_speaker: Dict[int, List[Message]] = {}
+        self.by_mention: Dict[int, List[Message]] = {}
+        self.by_role: Dict[str, List[Message]] = {}
+        self.by_round: Dict[int, List[Message]] = {}
+        self._player_ids: Dict[str, int] = {}
+        self._name_pattern: Optional[re.Pattern] = None
+
+    def track_players(self, player_names: Dict[int, str]) -> None:
+        """Set the names to look for in messages that haven't been indexed yet"""
+        self._player_ids = {name.lower(): player_id for player_id, name in player_names.items()}
+        # Longest names first so "AI 10" isn't read as "AI 1"
+        names = sorted(player_names.values(), key=len, reverse=True)
+        self._name_pattern = re.compile(r"\b(" + "|".join(re.escape(name) for name in names) + r")\b", re.IGNORECASE) if names else None
+
+    def add(self, message: Message) -> None:
+        self.by_speaker.setdefault(message.player_id, []).append(message)
+        self.by_round.setdefault(message.round_number, []).append(message)
+        text = message.public_response
+        if self._name_pattern is not None:
+            for player_id in dict.fromkeys(self._player_ids[name.lower()] for name in self._name_pattern.findall(text)):
+                self.by_mention.setdefault(player_id, []).append(message)
+        for role in dict.fromkeys(_mentioned_role(word) for word in ROLE_MENTION.findall(text)):
+            self.by_role.setdefault(role, []).append(message)
+
+    def catch_up(self, messages: deque) -> None:
+        """Index the messages added since the last call"""
+        for position in range(self.indexed, len(messages)):
+            self.add(messages[position])
+        self.indexed = len(messages)
+
+    def clear(self) -> None:
+        self.indexed = 0
+        self.by_speaker.clear()
+        self.by_mention.clear()
+        self.by_role.clear()
+        self.by_round.clear()
+        self._player_ids = {}
+        self._name_pattern = None
+
+
 class ConversationHistory(BaseModel):
-    """Manages the complete conversation history"""
+    """
+    Manages the complete conversation history
+    
+    The transcript is append-only and always in message_id order. A turn that runs alongside
+    others reserves its id up front, in turn order; its message is held back until every
+    earlier id has been added or released, so the transcript doesn't depend on which turn
+    finishes first. Readers take snapshot() rather than iterating messages directly.
+    
+    query() searches an inverted index of the messages (see ConversationIndex), so a prompt
+    can include only the messages relevant to one agent, and claims holds the role and action
+    claims read from each message as it lands (see claims.ClaimsTable).
+    """
     messages: deque = Field(default_factory=deque)
     next_message_id: int = 1
+    events: Optional[Any] = Field(default=None, exclude=True)
+    current_round: int = 0
+    order: TranscriptOrder = Field(default_factory=TranscriptOrder, exclude=True, repr=False)
+    index: ConversationIndex = Field(default_factory=ConversationIndex, exclude=True, repr=False)
+    claims: ClaimsTable = Field(default_factory=ClaimsTable, exclude=True, repr=False)
+    
+    class Config:
+        arbitrary_types_allowed = True
+    
+    def reserve_message_id(self) -> int:
+        """Claim the next message id, fixing this message's place in the transcript"""
+        with self.order.lock:
+            message_id = self.next_message_id
+            self.next_message_id += 1
+            return message_id
+    
+    def release_message_id(self, message_id: int) -> None:
+        """
+        Give up a reserved id whose turn produced no message, so later messages can land
+        
+        Safe to call for an id whose message was already added; it is then left alone. A
+        message added after its id was released is dropped.
+        """
+        self._commit(message_id, None, release=True)
     
     def add_agent_response(
         self,
@@ -29,24 +144,133 @@ class ConversationHistory(BaseModel):
         public_response: str,
         private_thoughts: str = "",
         tool_calls: List[Dict] = None,
-        raw_response: str = ""
+        raw_response: str = "",
+        message_id: Optional[int] = None
     ) -> Message:
-        """Add a full agent response to the conversation"""
+        """
+        Add a full agent response to the conversation
+        
+        Args:
+            message_id: Id from reserve_message_id(); a new one is taken when omitted
+        """
+        if message_id is None:
+            message_id = self.reserve_message_id()
         
         new_message = Message(
-            message_id=self.next_message_id,
+            message_id=message_id,
             player_id=player_id,
             player_name=player_name,
             public_response=public_response,
             private_thoughts=private_thoughts,
             tool_calls=tool_calls or [],
-            raw_response=raw_response
+            raw_response=raw_response,
+            round_number=self.current_round
         )
-        
-        self.messages.append(new_message)
-        self.next_message_id += 1
+        self._commit(message_id, new_message)
         return new_message
     
+    def _commit(self, message_id: int, message: Optional[Message], release: bool = False) -> None:
+        order = self.order
+        with order.publish_lock:
+            with order.lock:
+                if message_id < order.next_to_append or message_id in order.released:
+                    # Already added, or released and so closed to the message that comes late
+                    return
+                if release:
+                    if message_id in order.held:
+                        return
+                    order.released.add(message_id)
+                order.held[message_id] = message
+                ready = []
+                while order.next_to_append in order.held:
+                    held = order.held.pop(order.next_to_append)
+                    order.released.discard(order.next_to_append)
+                    order.next_to_append += 1
+                    if held is not None:
+                        self.messages.append(held)
+                        self.claims.add_message(held.message_id, held.player_id, held.public_response)
+                        ready.append(held)
+            if self.events is not None:
+                for message in ready:
+                    self.events.publish(
+                        "message",
+                        player_id=message.player_id,
+                        message_id=message.message_id,
+                        player_name=message.player_name,
+                        public_response=message.public_response
+                    )
+    
+    def snapshot(self) -> Tuple[Message, ...]:
+        """The messages added so far, in transcript order"""
+        with self.order.lock:
+            return tuple(self.messages)
+    
+    def get_message(self, message_id: int) -> Optional[Message]:
+        """Look up a message that is already in the transcript"""
+        with self.order.lock:
+            for message in reversed(self.messages):
+                if message.message_id == message_id:
+                    return message
+        return None
+    
+    def track_players(self, player_names: Dict[int, str]) -> None:
+        """Tell the index and the claims table which player names to look for (player_id -> name)"""
+        with self.order.lock:
+            self.index.track_players(player_names)
+            self.claims.track_players(player_names)
+    
+    def render_claims(self) -> str:
+        """The claims table as prompt lines, read under the history lock"""
+        with self.order.lock:
+            return self.claims.render()
+    
+    def start_round(self, round_number: int) -> None:
+        """Tag messages added from now on with this discussion round"""
+        self.current_round = round_number
+    
+    def query(
+        self,
+        speakers: Optional[List[int]] = None,
+        mentions: Optional[List[int]] = None,
+        roles: Optional[List[str]] = None,
+        rounds: Optional[List[int]] = None
+    ) -> List[Message]:
+        """
+        Messages matching any of the given filters, in transcript order
+        
+        Args:
+            speakers: Player ids whose messages to include
+            mentions: Player ids; include messages that name any of them
+            roles: Role names; include messages that name any of them (e.g. role claims)
+            rounds: Discussion rounds to include (0 is anything said before the first round)
+        """
+        index = self.index
+        with self.order.lock:
+            index.catch_up(self.messages)
+            found: Dict[int, Message] = {}
+            for postings, keys in (
+                (index.by_speaker, speakers),
+                (index.by_mention, mentions),
+                (index.by_role, [role.lower() for role in roles or []]),
+                (index.by_round, rounds),
+            ):
+                for key in keys or []:
+                    for message in postings.get(key, []):
+                        found[message.message_id] = message
+        return [found[message_id] for message_id in sorted(found)]
+    
+    def reset(self) -> None:
+        """Forget every message so the history can be reused for a new game"""
+        with self.order.lock:
+            self.messages.clear()
+            self.index.clear()
+            self.claims.clear()
+            self.next_message_id = 1
+            self.current_round = 0
+            self.order.next_to_append = 1
+            self.order.held.clear()
+            self.order.released.clear()
+    
     def get_public_conversation_history(self) -> str:
         """Get only the public conversation history (what players actually said)"""
         return self._get_plain_text_conversation_history(include_private_thoughts=False, include_tool_calls=False)
@@ -59,17 +283,18 @@ class ConversationHistory(BaseModel):
         """Get all private thoughts for a specific player"""
         return [
             message.private_thoughts 
-            for message in self.messages 
+            for message in self.snapshot() 
             if message.player_id == player_id and message.private_thoughts.strip()
         ]
     
     def _get_plain_text_conversation_history(self, include_private_thoughts: bool = False, include_tool_calls: bool = False) -> str:
         """Get conversation history as plain text, with optional private thoughts and tool calls"""
-        if not self.messages:
+        messages = self.snapshot()
+        if not messages:
             return "No conversation history yet."
             
         formatted = []
-        for message in self.messages:
+        for message in messages:
             if message.public_response.strip():
                 formatted.append(f"{message.player_name}: {message.public_response}")
             
@@ -0,0 +1,47 @@
+from typing import Any, Dict, List, Tuple
+from pydantic import BaseModel
+
+
+class NightTurn(BaseModel):
+    """One player's night action: the role they were dealt and the seat that acts"""
+    role: str
+    player_id: int
+
+    class Config:
+        frozen = True
+
+
+class NightPlan(BaseModel):
+    """
+    Who acts at night and in what order, fixed at dusk from the dealt roles
+
+    A player acts for the card they were dealt, even if an earlier action swapped it away, so
+    the plan is built once before any action runs and never changes during the night.
+    """
+    role_order: Tuple[str, ...]
+    turns: Tuple[NightTurn, ...]
+
+    class Config:
+        frozen = True
+
+    @classmethod
+    def from_game_context(cls, game_context: Any) -> "NightPlan":
+        """Build the plan from each player's initial role and the context's night order"""
+        seats_by_role: Dict[str, List[int]] = {}
+        for player_id, player in game_context.players.items():
+            seats_by_role.setdefault(player.initial_role.lower(), []).append(player_id)
+
+        turns = tuple(
+            NightTurn(role=role, player_id=player_id)
+            for role in game_context.night_phase_order
+            for player_id in seats_by_role.get(role, ())
+        )
+        return cls(role_order=tuple(game_context.night_phase_order), turns=turns)
+
+    def turns_for(self, role: str) -> Tuple[NightTurn, ...]:
+        """The turns taken for one role, in seat order"""
+        return tuple(turn for turn in self.turns if turn.role == role)
+
+    def to_log(self) -> List[Dict[str, Any]]:
+        """The plan as plain dicts, for logs and game records"""
+        return [{"role": turn.role, "player_id": turn.player_id} for turn in self.turns]
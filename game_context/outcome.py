@@ -0,0 +1,116 @@
+from collections import Counter
+from enum import Enum
+from typing import Dict, List
+from pydantic import BaseModel, Field
+from .roles import Role
+
+
+class Team(str, Enum):
+    """Teams that can win a game of One Night Werewolf"""
+    VILLAGE = "village"
+    WEREWOLF = "werewolf"
+    TANNER = "tanner"
+
+
+ROLE_TEAMS: Dict[Role, Team] = {
+    Role.VILLAGER: Team.VILLAGE,
+    Role.SEER: Team.VILLAGE,
+    Role.ROBBER: Team.VILLAGE,
+    Role.TROUBLEMAKER: Team.VILLAGE,
+    Role.DRUNK: Team.VILLAGE,
+    Role.INSOMNIAC: Team.VILLAGE,
+    Role.MASON: Team.VILLAGE,
+    Role.HUNTER: Team.VILLAGE,
+    Role.WEREWOLF: Team.WEREWOLF,
+    Role.MINION: Team.WEREWOLF,
+    Role.TANNER: Team.TANNER,
+}
+
+
+class GameOutcome(BaseModel):
+    """Result of the day phase vote"""
+    votes: Dict[int, int] = Field(default_factory=dict)
+    eliminated: List[int] = Field(default_factory=list)
+    winning_teams: List[Team] = Field(default_factory=list)
+    winners: List[int] = Field(default_factory=list)
+
+
+def tally_votes(votes: Dict[int, int]) -> List[int]:
+    """
+    Determine who is eliminated by the vote
+
+    The player(s) with the most votes die, unless nobody received more than one vote.
+
+    Args:
+        votes: Mapping of voter player ID to target player ID
+
+    Returns:
+        Sorted list of eliminated player IDs
+    """
+    counts = Counter(votes.values())
+    if not counts:
+        return []
+
+    top_count = max(counts.values())
+    if top_count <= 1:
+        return []
+
+    return sorted(player_id for player_id, count in counts.items() if count == top_count)
+
+
+def resolve_game_outcome(game_context, votes: Dict[int, int]) -> GameOutcome:
+    """
+    Resolve eliminations and winners from the final votes and final (post-night) roles
+
+    Args:
+        game_context: Current game state
+        votes: Mapping of voter player ID to target player ID
+
+    Returns:
+        GameOutcome with eliminations, winning teams and winning player IDs
+    """
+    eliminated = tally_votes(votes)
+
+    # The Hunter takes whoever they voted for down with them
+    for player_id in list(eliminated):
+        if game_context.get_player_current_role(player_id) == Role.HUNTER:
+            hunter_target = votes.get(player_id)
+            if hunter_target is not None and hunter_target not in eliminated:
+                eliminated.append(hunter_target)
+
+    final_roles = {player_id: game_context.get_player_current_role(player_id) for player_id in game_context.players}
+    eliminated_roles = {final_roles[player_id] for player_id in eliminated}
+    werewolves_in_play = Role.WEREWOLF in final_roles.values()
+    minion_in_play = Role.MINION in final_roles.values()
+
+    winning_teams = []
+    if Role.WEREWOLF in eliminated_roles:
+        winning_teams.append(Team.VILLAGE)
+    elif Role.TANNER not in eliminated_roles:
+        if werewolves_in_play:
+            winning_teams.append(Team.WEREWOLF)
+        elif not eliminated:
+            winning_teams.append(Team.VILLAGE)
+        elif minion_in_play and Role.MINION not in eliminated_roles:
+            winning_teams.append(Team.WEREWOLF)
+        elif Role.MINION in eliminated_roles:
+            winning_teams.append(Team.VILLAGE)
+
+    if Role.TANNER in eliminated_roles:
+        winning_teams.append(Team.TANNER)
+
+    winners = []
+    for player_id, role in final_roles.items():
+        team = ROLE_TEAMS[role]
+        if team not in winning_teams:
+            continue
+        if team == Team.TANNER and player_id not in eliminated:
+            continue
+        winners.append(player_id)
+
+    return GameOutcome(
+        votes=dict(votes),
+        eliminated=eliminated,
+        winning_teams=winning_teams,
+        winners=sorted(winners)
+    )
@@ -25,11 +25,14 @@ class Role(str, Enum):
     # Solo team
     TANNER = "tanner"
 
-    def get_agent_class(self) -> Type['BaseAgent']:
-        from game_agents.agent_registry import AGENT_REGISTRY
+    def get_agent_class(self, agent_type: str = "llm") -> Type['BaseAgent']:
+        from game_agents.agent_registry import AGENT_REGISTRY, HUMAN_AGENT_REGISTRY, SCRIPTED_AGENT_REGISTRY
+        registries = {"llm": AGENT_REGISTRY, "scripted": SCRIPTED_AGENT_REGISTRY, "human": HUMAN_AGENT_REGISTRY}
+        if agent_type not in registries:
+            raise ValueError(f"Unknown agent type: {agent_type}. Expected one of: {', '.join(registries)}")
         try:
-            return AGENT_REGISTRY[self.value]
+            return registries[agent_type][self.value]
         except KeyError:
-            raise ValueError(f"No agent class registered for role: {self.value}")
+            raise ValueError(f"No {agent_type} agent class registered for role: {self.value}")
 
 
@@ -0,0 +1,100 @@
+import re
+from typing import Any, Dict, List, Optional
+from .outcome import tally_votes
+from .roles import Role
+
+# Words that turn a message naming a player into an accusation of that player
+_ACCUSATION = re.compile(r"\b(?:werewol(?:f|ves)|minion|lying|liar|lie|suspicious|sus|vote (?:for|out)|eliminate)\b", re.IGNORECASE)
+
+# Suspicion added to a player for each kind of public evidence against them
+SEEN_AS_WEREWOLF = 3
+CONTRADICTION = 2
+ACCUSED = 1
+
+
+class StrawPoll:
+    """
+    Predicts the day vote from the public claims and accusations, without asking any model
+
+    After each discussion round every player is scored for suspicion: being seen as a werewolf
+    by someone else, taking part in a contradiction, and being accused by name. Each voter is
+    predicted to vote for the most suspicious other player, with their own accusations counting
+    double for them. Once the predicted eliminations haven't changed for stable_rounds rounds
+    in a row, the table has settled and more discussion is unlikely to change the vote. A round
+    in which nobody suspects anyone predicts nothing, so it never counts towards settling.
+
+    Args:
+        stable_rounds: Rounds the prediction must hold before the discussion is cut short
+        min_rounds: Rounds always played, however settled the table looks
+    """
+    def __init__(self, stable_rounds: int = 2, min_rounds: int = 2):
+        self.stable_rounds = stable_rounds
+        self.min_rounds = min_rounds
+        # Predicted eliminations after each round, None for a round with no predicted votes
+        self.predictions: List[Optional[List[int]]] = []
+        # Message id -> whether it accuses the players it names; messages are read once per game
+        self._accusing: Dict[int, bool] = {}
+
+    @classmethod
+    def from_config(cls, game_config: Dict[str, Any]) -> Optional["StrawPoll"]:
+        """A poll for one game from the config's "early_stop" section, or None if it's disabled"""
+        options = game_config.get("early_stop", {})
+        if not options.get("enabled", False):
+            return None
+        return cls(stable_rounds=options.get("stable_rounds", 2), min_rounds=options.get("min_rounds", 2))
+
+    def suspicion(self, game_context: Any) -> Dict[int, Dict[int, int]]:
+        """Each voter's suspicion of every other player, from what has been said so far"""
+        conversation = game_context.conversation
+        players = list(game_context.players)
+        public = {player_id: 0 for player_id in players}
+        personal = {voter: {player_id: 0 for player_id in players} for voter in players}
+
+        with conversation.order.lock:
+            index = conversation.index
+            index.catch_up(conversation.messages)
+            for player_id, messages in index.by_mention.items():
+                for message in messages:
+                    accusing = self._accusing.get(message.message_id)
+                    if accusing is None:
+                        accusing = self._accusing[message.message_id] = bool(_ACCUSATION.search(message.public_response))
+                    if accusing and message.player_id != player_id and message.player_id in personal and player_id in public:
+                        public[player_id] += ACCUSED
+                        personal[message.player_id][player_id] += ACCUSED
+
+            claims = conversation.claims
+            for actions in claims.action_claims.values():
+                for action in actions:
+                    if action.kind == "saw_player" and action.role == Role.WEREWOLF.value and action.targets[0] in public:
+                        public[action.targets[0]] += SEEN_AS_WEREWOLF
+                        personal[action.player_id][action.targets[0]] += SEEN_AS_WEREWOLF
+            for contradiction in claims.contradictions:
+                for player_id in contradiction.player_ids:
+                    if player_id in public:
+                        public[player_id] += CONTRADICTION
+
+        return {
+            voter: {player_id: public[player_id] + personal[voter][player_id] for player_id in players if player_id != voter}
+            for voter in players
+        }
+
+    def predict_votes(self, game_context: Any) -> Dict[int, int]:
+        """Each voter's most likely target; voters with no suspicion of anyone are left out"""
+        votes = {}
+        for voter, scores in self.suspicion(game_context).items():
+            if not scores:
+                continue
+            # Ties go to the lowest seat so the prediction is the same every time it's made
+            target = max(scores, key=lambda player_id: (scores[player_id], -player_id))
+            if scores[target] > 0:
+                votes[voter] = target
+        return votes
+
+    def record_round(self, game_context: Any) -> bool:
+        """Poll the table after a round; True once the discussion has settled and voting can start"""
+        votes = self.predict_votes(game_context)
+        self.predictions.append(tally_votes(votes) if votes else None)
+        if len(self.predictions) < max(self.min_rounds, self.stable_rounds):
+            return False
+        recent = self.predictions[-self.stable_rounds:]
+        return recent[0] is not None and all(prediction == recent[0] for prediction in recent)
@@ -0,0 +1,23 @@
+# One Night Werewolf Game Server
+"""
+This package serves games to remote clients.
+
+Modules:
+- websocket: Minimal asyncio WebSocket protocol (handshake, text frames, ping/pong, close)
+- sessions: Many concurrent game sessions on one event loop, with memory limits and idle eviction
+- spectators: Compact, sequence-numbered spectator deltas with snapshots and burst coalescing
+- server: HTTP API for creating and inspecting sessions, and WebSocket spectator feeds
+- load_test: Load test harness backed by a fake model client
+
+The sessions and server modules import the game itself, so they are not re-exported here;
+game_agents imports this package for its WebSocket support.
+"""
+
+from .websocket import WebSocket, WebSocketClosed, accept, connect
+
+__all__ = [
+    'WebSocket',
+    'WebSocketClosed',
+    'accept',
+    'connect'
+]
@@ -0,0 +1,238 @@
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+from types import SimpleNamespace
+from typing import List, Optional
+from game_server.server import GameServer
+from game_server.sessions import SessionManager, percentile
+from game_server.websocket import connect
+
+_OTHER_PLAYERS = re.compile(r"The other players at the table are: (.*)")
+
+
+class FakeModelClient:
+    """
+    Stand-in for the OpenAI client that answers every call validly after a simulated latency
+
+    Latencies are log-normal around median_latency seconds. Night tool calls target players named
+    in the prompt, daytime turns speak without calling tools, and votes name another player.
+    Only the parts of the chat completions API the agents use are implemented.
+    """
+    def __init__(self, median_latency: float = 0.05, seed: Optional[int] = None):
+        self.median_latency = median_latency
+        self.rng = random.Random(seed)
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._complete, parse=self._complete, stream=self._stream))
+
+    def _latency(self) -> float:
+        return self.median_latency * self.rng.lognormvariate(0, 0.5)
+
+    def _complete(self, **params):
+        time.sleep(self._latency())
+        return self._response(params)
+
+    def _stream(self, stream_options=None, **params):
+        return _FakeStream(self._response(params), self._latency())
+
+    def _response(self, params: dict):
+        messages = params.get("messages", [])
+        match = _OTHER_PLAYERS.search(messages[0]["content"]) if messages else None
+        other_names = match.group(1).split(", ") if match else []
+        content, parsed, tool_calls = None, None, None
+
+        tool_choice = params.get("tool_choice")
+        if isinstance(tool_choice, dict):
+            name = tool_choice["function"]["name"]
+            arguments = json.dumps(self._tool_arguments(name, other_names))
+            tool_calls = [SimpleNamespace(id="call_0", type="function", function=SimpleNamespace(name=name, arguments=arguments))]
+
+        response_format = params.get("response_format")
+        if response_format is not None and tool_calls is None:
+            if "vote_target_name" in response_format.model_fields:
+                target = self.rng.choice(other_names) if other_names else ""
+                parsed = response_format(private_thoughts="Voting on gut feeling.", vote_target_name=target)
+            else:
+                parsed = response_format(public_response="I'm a Villager, so I have no night information.", private_thoughts="Keeping it simple.")
+            content = parsed.model_dump_json()
+
+        message = SimpleNamespace(content=content, parsed=parsed, tool_calls=tool_calls)
+        usage = SimpleNamespace(prompt_tokens=sum(len(prompt_message["content"] or "") for prompt_message in messages) // 4, completion_tokens=len(content or "") // 4)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+
+    def _tool_arguments(self, name: str, other_names: List[str]) -> dict:
+        if name == "seer_investigate":
+            return {"investigation_type": "center", "target_player_name": "", "card_positions": [0, 1]}
+        if name == "robber_swap":
+            return {"target_player_name": self.rng.choice(other_names)}
+        if name == "troublemaker_swap":
+            player1_name, player2_name = self.rng.sample(other_names, 2)
+            return {"player1_name": player1_name, "player2_name": player2_name}
+        if name == "drunk_swap":
+            return {"center_position": self.rng.randrange(3)}
+        return {}
+
+
+class _FakeStream:
+    """Streams a fake response's content in small chunks, spreading its latency across them"""
+    def __init__(self, response, latency: float):
+        self.response = response
+        self.latency = latency
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def __iter__(self):
+        content = self.response.choices[0].message.content or ""
+        chunks = [content[index:index + 8] for index in range(0, len(content), 8)] or [""]
+        # Roughly a third of the latency passes before the first token
+        time.sleep(self.latency / 3)
+        for chunk in chunks:
+            time.sleep(self.latency * 2 / 3 / len(chunks))
+            if chunk:
+                yield SimpleNamespace(type="content.delta", delta=chunk)
+
+    def get_final_completion(self):
+        return self.response
+
+
+async def _http(host: str, port: int, method: str, path: str, payload=None):
+    """One JSON request to the game server; returns (status code, decoded body)"""
+    reader, writer = await asyncio.open_connection(host, port)
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: {host}:{port}\r\nContent-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, response_body = response.partition(b"\r\n\r\n")
+    return int(head.split(b" ", 2)[1]), json.loads(response_body or b"null")
+
+
+async def _watch_session(host: str, port: int, session_id: str, delivery_lags: List[float]) -> dict:
+    """Follow one session's spectator feed to the end, resyncing on gaps; returns what it received"""
+    websocket = await connect(host, port, f"/sessions/{session_id}/events")
+    received = {"frames": 0, "bytes": 0, "resyncs": 0, "summary": None}
+    last_seq = None
+    while (payload := await websocket.recv()) is not None:
+        received["frames"] += 1
+        received["bytes"] += len(payload)
+        frame = json.loads(payload)
+        if "end" in frame:
+            received["summary"] = frame["end"]
+            break
+        if "snapshot" in frame:
+            last_seq = frame["seq"]
+            continue
+        if last_seq is not None and frame["from"] != last_seq + 1:
+            received["resyncs"] += 1
+            await websocket.send("resync")
+        last_seq = frame["to"]
+        delivery_lags.append(time.time() - frame["t"])
+    await websocket.close()
+    return received
+
+
+async def _play_session(host: str, port: int, game_config: dict, seed: int, watchers: int, delivery_lags: List[float]) -> dict:
+    """Create one session, watch it with several spectators to the end and return its final summary"""
+    start = time.perf_counter()
+    status, session = await _http(host, port, "POST", f"/sessions?seed={seed}", game_config)
+    if status != 201:
+        raise RuntimeError(f"Creating a session failed with {status}: {session}")
+
+    watched = await asyncio.gather(*(_watch_session(host, port, session["session_id"], delivery_lags) for _ in range(watchers)))
+    summary = watched[0]["summary"] or session
+    summary["lifetime"] = time.perf_counter() - start
+    summary["watcher_bytes"] = sum(received["bytes"] for received in watched)
+    summary["watcher_frames"] = sum(received["frames"] for received in watched)
+    summary["resyncs"] = sum(received["resyncs"] for received in watched)
+    return summary
+
+
+async def run_load_test(
+    game_config: dict,
+    num_sessions: int = 100,
+    median_latency: float = 0.05,
+    max_workers: int = 64,
+    watchers: int = 1,
+    base_seed: int = 0
+) -> dict:
+    """
+    Play num_sessions concurrent sessions against an in-process server backed by the fake model,
+    each followed by the given number of spectators
+
+    Returns:
+        Report with sessions per core (concurrent sessions one fully busy core sustains, i.e.
+        total session lifetime over CPU time used), action latency percentiles from the
+        server, spectator bandwidth, and delivery lag percentiles seen by the spectators
+    """
+    manager = SessionManager(
+        max_sessions=num_sessions,
+        idle_timeout=3600,
+        max_workers=max_workers,
+        client_factory=lambda: FakeModelClient(median_latency)
+    )
+    server = GameServer(manager, host="127.0.0.1", port=0)
+    await server.start()
+
+    delivery_lags: List[float] = []
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    try:
+        summaries = await asyncio.gather(*(
+            _play_session(server.host, server.port, game_config, base_seed + index, watchers, delivery_lags)
+            for index in range(num_sessions)
+        ))
+        cpu_seconds, wall_seconds = time.process_time() - cpu_start, time.perf_counter() - wall_start
+        _, stats = await _http(server.host, server.port, "GET", "/stats")
+    finally:
+        await server.close()
+
+    delivery_lags.sort()
+    session_seconds = sum(summary["lifetime"] for summary in summaries)
+    return {
+        "sessions": num_sessions,
+        "finished": sum(summary["status"] == "finished" for summary in summaries),
+        "wall_seconds": wall_seconds,
+        "cpu_seconds": cpu_seconds,
+        "mean_concurrent_sessions": session_seconds / wall_seconds,
+        "sessions_per_core": session_seconds / cpu_seconds if cpu_seconds else None,
+        "actions": stats["actions"],
+        "p50_action_latency": stats["p50_action_latency"],
+        "p99_action_latency": stats["p99_action_latency"],
+        "bytes_per_watcher": sum(summary["watcher_bytes"] for summary in summaries) / (num_sessions * watchers),
+        "frames_per_watcher": sum(summary["watcher_frames"] for summary in summaries) / (num_sessions * watchers),
+        "resyncs": sum(summary["resyncs"] for summary in summaries),
+        "p99_event_delivery_lag": percentile(delivery_lags, 99),
+    }
+
+
+def main() -> None:
+    from setup import load_game_config
+
+    parser = argparse.ArgumentParser(description="Load test the game server with a fake model")
+    parser.add_argument("--sessions", type=int, default=100, help="Concurrent sessions to play")
+    parser.add_argument("--latency", type=float, default=0.05, help="Median fake model latency in seconds")
+    parser.add_argument("--watchers", type=int, default=1, help="Spectators following each session")
+    parser.add_argument("--workers", type=int, default=64, help="Worker threads running game actions")
+    parser.add_argument("--rounds", type=int, default=None, help="Discussion rounds per game (default: from the config)")
+    args = parser.parse_args()
+
+    game_config = load_game_config()
+    game_config["default_agent_type"] = "llm"
+    if args.rounds is not None:
+        game_config["max_rounds"] = args.rounds
+
+    report = asyncio.run(run_load_test(game_config, args.sessions, args.latency, args.workers, args.watchers))
+    print(f"🐺 {report['finished']}/{report['sessions']} sessions finished in {report['wall_seconds']:.1f}s "
+          f"({report['cpu_seconds']:.1f}s CPU, {report['mean_concurrent_sessions']:.1f} concurrent on average)")
+    print(f"   Sessions per core: {report['sessions_per_core']:.1f}")
+    print(f"   Action latency: p50 {report['p50_action_latency'] * 1000:.0f}ms, p99 {report['p99_action_latency'] * 1000:.0f}ms over {report['actions']} actions")
+    print(f"   Spectators: {report['bytes_per_watcher'] / 1024:.1f} KiB in {report['frames_per_watcher']:.0f} frames per watcher per game, "
+          f"{report['resyncs']} resyncs, p99 delivery lag {report['p99_event_delivery_lag'] * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
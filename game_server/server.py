@@ -0,0 +1,175 @@
+import asyncio
+import json
+from typing import Any, Callable, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from game_server.sessions import SessionManager
+from game_server.websocket import HTTPRequest, read_request, upgrade
+
+MAX_BODY_BYTES = 1 << 20
+REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large"}
+
+
+class GameServer:
+    """
+    Local HTTP and WebSocket front end for a SessionManager
+
+    Routes:
+        POST   /sessions?seed=N          create a session from a game_config-shaped JSON body
+        GET    /sessions                 summaries of every hosted session
+        GET    /sessions/<id>            one session's summary (with its outcome once finished)
+        DELETE /sessions/<id>            stop and remove a session
+        GET    /sessions/<id>/events     WebSocket spectator feed (see SpectatorFeed); ?since=N resumes
+                                         after sequence number N instead of starting from a snapshot
+        GET    /stats                    session counts and action latency percentiles
+    """
+    def __init__(self, manager: SessionManager, host: str = "127.0.0.1", port: int = 8080, eviction_interval: float = 10.0):
+        self.manager = manager
+        self.host = host
+        self.port = port
+        self.eviction_interval = eviction_interval
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._evictor: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        # Port 0 asks the OS for a free port; report the real one
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._evictor = asyncio.get_running_loop().create_task(self._evict_periodically())
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._evictor:
+            self._evictor.cancel()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.manager.shutdown()
+
+    async def _evict_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.eviction_interval)
+            self.manager.evict_idle()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        request = await read_request(reader)
+        if request is None:
+            writer.close()
+            return
+
+        url = urlsplit(request.path)
+        parts = [part for part in url.path.split("/") if part]
+        if request.is_websocket_upgrade:
+            if len(parts) == 3 and parts[0] == "sessions" and parts[2] == "events":
+                since = parse_qs(url.query).get("since", [None])[0]
+                await self._stream_events(reader, writer, request, parts[1], int(since) if since and since.isdigit() else None)
+            else:
+                await self._respond(writer, 404, {"error": f"No event stream at {url.path}"})
+            return
+
+        length = int(request.headers.get("content-length", 0) or 0)
+        if length > MAX_BODY_BYTES:
+            await self._respond(writer, 413, {"error": f"Request body is larger than {MAX_BODY_BYTES} bytes"})
+            return
+        try:
+            body = await reader.readexactly(length) if length else b""
+        except asyncio.IncompleteReadError:
+            writer.close()
+            return
+
+        status, payload = self._route(request.method, parts, parse_qs(url.query), body)
+        await self._respond(writer, status, payload)
+
+    def _route(self, method: str, parts: list, query: dict, body: bytes) -> Tuple[int, Any]:
+        """Handle one plain HTTP request; returns (status code, JSON payload)"""
+        if parts == ["stats"]:
+            return (200, self.manager.stats()) if method == "GET" else (405, {"error": "Use GET"})
+
+        if parts == ["sessions"]:
+            if method == "GET":
+                return 200, [session.summary() for session in self.manager.sessions.values()]
+            if method != "POST":
+                return 405, {"error": "Use GET or POST"}
+            try:
+                game_config = json.loads(body or b"null")
+                seed = int(query["seed"][0]) if "seed" in query else None
+                session = self.manager.create_session(game_config, seed=seed)
+            except (ValueError, TypeError) as e:
+                return 400, {"error": str(e)}
+            return 201, session.summary()
+
+        if len(parts) == 2 and parts[0] == "sessions":
+            session = self.manager.get_session(parts[1])
+            if session is None:
+                return 404, {"error": f"No session {parts[1]}"}
+            if method == "GET":
+                return 200, session.summary()
+            if method == "DELETE":
+                self.manager.remove_session(session.session_id)
+                return 200, session.summary()
+            return 405, {"error": "Use GET or DELETE"}
+
+        return 404, {"error": "Not found"}
+
+    async def _stream_events(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, request: HTTPRequest, session_id: str, since: Optional[int]) -> None:
+        session = self.manager.get_session(session_id)
+        if session is None:
+            await self._respond(writer, 404, {"error": f"No session {session_id}"})
+            return
+        websocket = await upgrade(reader, writer, request)
+        if websocket is None:
+            return
+
+        session.feed.attach(websocket, since)
+        try:
+            # Watchers only ever ask for a fresh snapshot; anything else they send is ignored
+            while session.feed.ended is None and (text := await websocket.recv()) is not None:
+                if text.strip() == "resync":
+                    session.feed.resync(websocket)
+        finally:
+            session.feed.detach(websocket)
+            session.touch()
+            await websocket.close()
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, payload: Any) -> None:
+        body = json.dumps(payload).encode()
+        writer.write((
+            f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n"
+        ).encode() + body)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        writer.close()
+
+
+async def serve(server_config: Optional[dict] = None, client_factory: Optional[Callable[[], Any]] = None) -> None:
+    """Run a game server from the "game_server" section of game_config.json until cancelled"""
+    server_config = server_config or {}
+    server = GameServer(
+        SessionManager.from_config(server_config, client_factory=client_factory),
+        host=server_config.get("host", "127.0.0.1"),
+        port=server_config.get("port", 8080),
+        eviction_interval=server_config.get("eviction_interval", 10.0)
+    )
+    await server.start()
+    print(f"🐺 Game server listening on http://{server.host}:{server.port}")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+    from setup import load_game_config
+
+    load_dotenv()
+    asyncio.run(serve(load_game_config().get("game_server")))
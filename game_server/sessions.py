@@ -0,0 +1,283 @@
+import asyncio
+import random
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+from game_agents.hedging import HedgedCaller
+from game_agents.model_router import ModelRouter
+from game_agents.speculation import Speculator
+from game_context.day_budget import DayBudget
+from game_context.events import GameEvent
+from game_context.game_context import GameContext
+from game_context.outcome import GameOutcome, resolve_game_outcome
+from game_context.roles import Role
+from game_context.straw_poll import StrawPoll
+from game_server.spectators import SpectatorFeed
+from play import NightPhaseManager, DayPhaseManager, MAX_ROUNDS_PRIOR_TO_VOTING
+from setup import deal_roles, setup_game_context
+
+class SessionStopped(Exception):
+    """Raised inside a session's game when it has been asked to stop between actions"""
+
+
+class GameSession:
+    """
+    One hosted game: its context and the spectator feed streaming it
+
+    The game itself runs one action (a night action, a discussion turn, the vote) at a time on
+    the manager's worker threads; everything else about the session lives on the event loop.
+    Memory is accounted as the bytes of the game's public events plus conversation text, and
+    the game is stopped before its next action once that passes max_bytes.
+    """
+    def __init__(self, session_id: str, game_config: dict, seed: Optional[int], max_bytes: int, coalesce_interval: float = 0.05):
+        self.session_id = session_id
+        self.game_config = game_config
+        self.seed = seed
+        self.max_bytes = max_bytes
+        self.status = "pending"
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.last_activity = time.monotonic()
+        self.game_context: Optional[GameContext] = None
+        self.outcome: Optional[GameOutcome] = None
+        self.feed = SpectatorFeed(coalesce_interval=coalesce_interval)
+        self.memory_bytes = 0
+        self.actions_run = 0
+        self._stop_reason: Optional[str] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in ("pending", "running")
+
+    def touch(self) -> None:
+        self.last_activity = time.monotonic()
+
+    def stop(self, reason: str) -> None:
+        """Stop the game before its next action (the action in progress, if any, finishes)"""
+        if self._stop_reason is None:
+            self._stop_reason = reason
+
+    def summary(self) -> dict:
+        summary = {
+            "session_id": self.session_id,
+            "status": self.status,
+            "seed": self.seed,
+            "created_at": self.created_at,
+            "actions_run": self.actions_run,
+            "memory_bytes": self.memory_bytes,
+            "viewers": len(self.feed.watchers),
+        }
+        if self.error:
+            summary["error"] = self.error
+        if self.outcome is not None:
+            summary["outcome"] = self.outcome.model_dump(mode="json")
+        return summary
+
+    async def run(self, executor: ThreadPoolExecutor, client_factory: Optional[Callable[[], Any]], record_latency: Callable[[float], None]) -> None:
+        """Play the game to the end (or until stopped), one action at a time on the executor"""
+        self._loop = asyncio.get_running_loop()
+        self.status = "running"
+        # Each session's config brings its own routing; its hedger is shut down when the game ends
+        router = ModelRouter.from_config(self.game_config.get("model_routing"))
+        hedger = HedgedCaller.from_config(router, self.game_config.get("hedging"))
+        try:
+            self.game_context = await self._loop.run_in_executor(
+                executor,
+                lambda: setup_game_context(self.game_config, rng=random.Random(self.seed), router=router, hedger=hedger, client_factory=client_factory)
+            )
+            self.feed.state.players = {player_id: player.player_name for player_id, player in self.game_context.players.items()}
+            self.game_context.events.subscribe(self._on_event)
+
+            night_manager = NightPhaseManager(self.game_context, verbose=False)
+            for step in night_manager.night_steps():
+                await self._run_action(executor, step, record_latency)
+            self.game_context.set_nighttime(False)
+
+            day_manager = DayPhaseManager(
+                self.game_context,
+                max_rounds=self.game_config.get("max_rounds", MAX_ROUNDS_PRIOR_TO_VOTING),
+                verbose=False,
+                straw_poll=StrawPoll.from_config(self.game_config),
+                day_budget=DayBudget.from_config(self.game_config),
+                speculator=Speculator.from_config(self.game_config)
+            )
+            try:
+                for step in day_manager.discussion_steps():
+                    await self._run_action(executor, step, record_latency)
+                votes = await self._run_action(executor, day_manager.run_vote, record_latency)
+            finally:
+                day_manager.shutdown()
+
+            self.outcome = resolve_game_outcome(self.game_context, votes)
+            self.game_context.reveal_roles()
+            self.game_context.events.publish("game_over", **self.outcome.model_dump(mode="json"))
+            status = "finished"
+        except SessionStopped:
+            status, self.error = "stopped", self._stop_reason
+        except Exception as e:
+            status, self.error = "failed", str(e)
+        finally:
+            if self.game_context is not None:
+                self.game_context.close()
+            if hedger is not None:
+                hedger.shutdown()
+
+        # Let events the workers already handed to the loop land before the feed ends
+        await asyncio.sleep(0)
+        self.status = status
+        self.feed.close(self.summary())
+
+    async def _run_action(self, executor: ThreadPoolExecutor, action: Callable[[], Any], record_latency: Callable[[float], None]):
+        if self._stop_reason is not None:
+            raise SessionStopped(self._stop_reason)
+        # Latency includes the wait for a free worker, which is what a player would notice
+        start = time.perf_counter()
+        result = await self._loop.run_in_executor(executor, action)
+        record_latency(time.perf_counter() - start)
+        self.actions_run += 1
+        return result
+
+    def _on_event(self, event: GameEvent) -> None:
+        # Called on the game's worker thread, in sequence order
+        size = len(event.type) + len(str(event.data))
+        message = self.game_context.conversation.get_message(event.data["message_id"]) if event.type == "message" else None
+        if message is not None:
+            size += len(message.private_thoughts) + len(message.raw_response) + len(str(message.tool_calls))
+        self.memory_bytes += size
+        if self.memory_bytes > self.max_bytes:
+            self.stop(f"Session exceeded its memory limit of {self.max_bytes} bytes")
+        self._loop.call_soon_threadsafe(self.feed.publish, event)
+
+
+class SessionManager:
+    """
+    Hosts many concurrent game sessions on one event loop
+
+    Blocking game actions run on a shared pool of worker threads, so the number of sessions is
+    bounded by memory rather than threads. Sessions with no viewers and no requests for
+    idle_timeout seconds are evicted (stopping them first if their game is still running).
+    """
+    def __init__(
+        self,
+        max_sessions: int = 1000,
+        max_session_bytes: int = 8 << 20,
+        idle_timeout: float = 300.0,
+        max_workers: int = 64,
+        coalesce_interval: float = 0.05,
+        client_factory: Optional[Callable[[], Any]] = None
+    ):
+        self.max_sessions = max_sessions
+        self.max_session_bytes = max_session_bytes
+        self.idle_timeout = idle_timeout
+        self.coalesce_interval = coalesce_interval
+        self.client_factory = client_factory
+        self.sessions: Dict[str, GameSession] = {}
+        self.action_latencies: deque = deque(maxlen=100_000)
+        self.evicted = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="game-session")
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    @classmethod
+    def from_config(cls, server_config: Optional[dict], client_factory: Optional[Callable[[], Any]] = None) -> "SessionManager":
+        """Build a manager from the "game_server" section of game_config.json"""
+        server_config = server_config or {}
+        return cls(
+            max_sessions=server_config.get("max_sessions", 1000),
+            max_session_bytes=server_config.get("max_session_bytes", 8 << 20),
+            idle_timeout=server_config.get("idle_timeout", 300.0),
+            max_workers=server_config.get("max_workers", 64),
+            coalesce_interval=server_config.get("spectator_coalesce_interval", 0.05),
+            client_factory=client_factory
+        )
+
+    def create_session(self, game_config: dict, seed: Optional[int] = None) -> GameSession:
+        """
+        Validate a game_config-shaped payload and start its game
+
+        Raises:
+            ValueError: If the payload is not a playable config or the server is full
+        """
+        game_config = validate_session_config(game_config)
+        if len(self.sessions) >= self.max_sessions:
+            raise ValueError(f"Server is hosting its maximum of {self.max_sessions} sessions")
+
+        session = GameSession(uuid.uuid4().hex[:12], game_config, seed, self.max_session_bytes, self.coalesce_interval)
+        self.sessions[session.session_id] = session
+        self._tasks[session.session_id] = asyncio.get_running_loop().create_task(
+            session.run(self._executor, self.client_factory, self.action_latencies.append)
+        )
+        return session
+
+    def get_session(self, session_id: str) -> Optional[GameSession]:
+        session = self.sessions.get(session_id)
+        if session is not None:
+            session.touch()
+        return session
+
+    def remove_session(self, session_id: str, reason: str = "Session was deleted") -> bool:
+        session = self.sessions.pop(session_id, None)
+        if session is None:
+            return False
+        session.stop(reason)
+        self._tasks.pop(session_id, None)
+        return True
+
+    def evict_idle(self) -> List[str]:
+        """Remove every session nobody has watched or requested for idle_timeout seconds"""
+        cutoff = time.monotonic() - self.idle_timeout
+        idle = [
+            session_id for session_id, session in self.sessions.items()
+            if not session.feed.watchers and session.last_activity < cutoff
+        ]
+        for session_id in idle:
+            self.remove_session(session_id, "Session was evicted after being idle")
+        self.evicted += len(idle)
+        return idle
+
+    def stats(self) -> dict:
+        """Session counts by status and action latency percentiles across every session"""
+        by_status: Dict[str, int] = {}
+        for session in self.sessions.values():
+            by_status[session.status] = by_status.get(session.status, 0) + 1
+        latencies = sorted(self.action_latencies)
+        return {
+            "sessions": len(self.sessions),
+            "by_status": by_status,
+            "evicted": self.evicted,
+            "memory_bytes": sum(session.memory_bytes for session in self.sessions.values()),
+            "actions": len(latencies),
+            "p50_action_latency": percentile(latencies, 50),
+            "p99_action_latency": percentile(latencies, 99),
+        }
+
+    async def shutdown(self) -> None:
+        for session_id in list(self.sessions):
+            self.remove_session(session_id, "Server is shutting down")
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def validate_session_config(game_config: Any) -> dict:
+    """
+    Check a session payload is a playable, AI-only game config
+
+    Raises:
+        ValueError: Describing the first problem found
+    """
+    if not isinstance(game_config, dict) or not isinstance(game_config.get("available_roles"), list):
+        raise ValueError("Session payload must be a game config object with an available_roles list")
+    game_config = {"number_human_players": 0, **game_config}
+    if game_config["number_human_players"]:
+        raise ValueError("Hosted sessions are AI-only; number_human_players must be 0")
+    for role in game_config["available_roles"]:
+        Role(str(role).lower())
+    deal_roles(game_config, random.Random(0))
+    return game_config
+
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * pct / 100))]
@@ -0,0 +1,230 @@
+import asyncio
+import json
+import time
+from collections import deque
+from typing import Dict, List, Optional
+from game_context.events import GameEvent
+from game_server.websocket import OP_TEXT, WebSocket, WebSocketClosed, encode_frame
+
+# Bytes a watcher may have waiting to be sent before it stops getting deltas and is resynced
+MAX_WATCHER_BACKLOG = 256 << 10
+# Batches kept so a reconnecting watcher can catch up without a full snapshot
+HISTORY_BATCHES = 256
+
+
+class SpectatorState:
+    """
+    What a spectator can see of a game, built only from public events
+
+    Cards stay hidden until the game publishes roles_revealed. Each applied event returns the
+    compact delta to send to spectators, or None when nothing they can see changed.
+    """
+    def __init__(self, players: Optional[Dict[int, str]] = None):
+        self.players = dict(players or {})
+        self.phase = "night"
+        self.messages: List[list] = []
+        self.speaking: Dict[int, str] = {}
+        self.votes: Dict[int, int] = {}
+        self.roles: Optional[dict] = None
+        self.outcome: Optional[dict] = None
+
+    def apply(self, event: GameEvent) -> Optional[dict]:
+        data = event.data
+        if event.type == "message":
+            self.speaking.pop(event.player_id, None)
+            message = [data["message_id"], event.player_id, data["public_response"]]
+            self.messages.append(message)
+            return {"msg": message}
+        if event.type == "public_response_delta":
+            self.speaking[event.player_id] = self.speaking.get(event.player_id, "") + data["text"]
+            return {"say": [event.player_id, data["text"]]}
+        if event.type == "public_response_retracted":
+            if self.speaking.pop(event.player_id, None) is None:
+                return None
+            return {"unsay": event.player_id}
+        if event.type == "phase":
+            if data["phase"] == self.phase:
+                return None
+            self.phase = data["phase"]
+            return {"phase": self.phase}
+        if event.type == "vote":
+            if self.votes.get(event.player_id) == data["target_id"]:
+                return None
+            self.votes[event.player_id] = data["target_id"]
+            return {"vote": [event.player_id, data["target_id"]]}
+        if event.type == "roles_revealed":
+            self.roles = {"players": data["player_roles"], "center": data["center_cards"]}
+            return {"roles": self.roles}
+        if event.type == "game_over":
+            self.outcome = {key: data[key] for key in ("eliminated", "winning_teams", "winners")}
+            return {"over": self.outcome}
+        return None
+
+    def snapshot(self) -> dict:
+        return {
+            "players": self.players,
+            "phase": self.phase,
+            "messages": self.messages,
+            "speaking": self.speaking,
+            "votes": self.votes,
+            "roles": self.roles,
+            "over": self.outcome,
+        }
+
+
+def coalesce(deltas: List[dict]) -> List[dict]:
+    """
+    Merge a burst of deltas into the fewest that leave spectators in the same state
+
+    Streamed text chunks from one player become one chunk, chunks superseded in the same burst
+    by that player's finished message or a retraction are dropped, and only each voter's last
+    vote is kept.
+    """
+    merged: List[Optional[dict]] = []
+    open_say: Dict[int, int] = {}
+    open_vote: Dict[int, int] = {}
+    for delta in deltas:
+        if "say" in delta:
+            player_id, text = delta["say"]
+            if player_id in open_say:
+                index = open_say[player_id]
+                merged[index] = {"say": [player_id, merged[index]["say"][1] + text]}
+                continue
+            open_say[player_id] = len(merged)
+        elif "msg" in delta or "unsay" in delta:
+            player_id = delta["msg"][1] if "msg" in delta else delta["unsay"]
+            index = open_say.pop(player_id, None)
+            if index is not None:
+                # The message (or retraction) replaces whatever text the player was streaming
+                merged[index] = None
+        elif "vote" in delta:
+            voter = delta["vote"][0]
+            if voter in open_vote:
+                merged[open_vote[voter]] = None
+            open_vote[voter] = len(merged)
+        merged.append(delta)
+    return [delta for delta in merged if delta is not None]
+
+
+class SpectatorFeed:
+    """
+    Sequence-numbered delta stream of one game for any number of watchers
+
+    Deltas are buffered for coalesce_interval seconds, coalesced, and sent as one batch frame
+    {"from": first_seq, "to": last_seq, "t": time, "d": [deltas]} that is JSON-encoded and
+    framed once and written to every watcher. A watcher that sees a gap in the sequence (or
+    sends "resync") gets a snapshot frame {"seq": n, "snapshot": {...}}; so does one that falls
+    too far behind. The stream ends with {"end": {...}}.
+    """
+    def __init__(self, players: Optional[Dict[int, str]] = None, coalesce_interval: float = 0.05):
+        self.state = SpectatorState(players)
+        self.coalesce_interval = coalesce_interval
+        self.seq = 0
+        self.watchers: Dict[WebSocket, bool] = {}
+        self.ended: Optional[bytes] = None
+        self._pending: List[dict] = []
+        self._pending_since: Optional[float] = None
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._history: deque = deque(maxlen=HISTORY_BATCHES)
+        self._snapshot_frame: Optional[bytes] = None
+
+    def publish(self, event: GameEvent) -> None:
+        """Apply a game event (on the event loop) and queue its delta, if spectators can see it"""
+        delta = self.state.apply(event)
+        if delta is None:
+            return
+        self.seq += 1
+        self._snapshot_frame = None
+        if not self._pending:
+            self._pending_since = event.timestamp
+            self._flush_handle = asyncio.get_running_loop().call_later(self.coalesce_interval, self.flush)
+        self._pending.append(delta)
+
+    def flush(self) -> None:
+        """Send every pending delta to the watchers as one batch"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+        first_seq = self.seq - len(self._pending) + 1
+        batch = {"from": first_seq, "to": self.seq, "t": self._pending_since, "d": coalesce(self._pending)}
+        self._pending = []
+        frame = _encode(batch)
+        self._history.append((first_seq, frame))
+        for websocket in list(self.watchers):
+            if self.watchers[websocket]:
+                self._write(websocket, frame)
+            else:
+                self._catch_up(websocket)
+
+    def attach(self, websocket: WebSocket, since: Optional[int] = None) -> None:
+        """
+        Start sending deltas to a watcher
+
+        Args:
+            websocket: The watcher's connection
+            since: Last sequence number the watcher already has (e.g. before a reconnect);
+                it is caught up from recent batches when possible, otherwise from a snapshot
+        """
+        self.flush()
+        self.watchers[websocket] = True
+        replay = self._history_after(since) if since is not None else None
+        if replay is None:
+            self._write(websocket, self._snapshot())
+        else:
+            for frame in replay:
+                self._write(websocket, frame)
+        if self.ended is not None:
+            self._write(websocket, self.ended)
+
+    def detach(self, websocket: WebSocket) -> None:
+        self.watchers.pop(websocket, None)
+
+    def resync(self, websocket: WebSocket) -> None:
+        """Send a watcher a fresh snapshot (it asked for one, e.g. after seeing a gap)"""
+        self.flush()
+        if websocket in self.watchers:
+            self.watchers[websocket] = True
+            self._write(websocket, self._snapshot())
+
+    def close(self, summary: dict) -> None:
+        """End the stream for every watcher, after any pending deltas"""
+        self.flush()
+        self.ended = _encode({"end": summary})
+        for websocket in list(self.watchers):
+            self._write(websocket, self.ended)
+            asyncio.ensure_future(websocket.close())
+
+    def _history_after(self, since: int) -> Optional[List[bytes]]:
+        if since == self.seq:
+            return []
+        frames = [(first_seq, frame) for first_seq, frame in self._history if first_seq > since]
+        if not frames or frames[0][0] != since + 1:
+            return None
+        return [frame for _, frame in frames]
+
+    def _snapshot(self) -> bytes:
+        # Shared by every watcher that needs one until the state changes again
+        if self._snapshot_frame is None:
+            self._snapshot_frame = _encode({"seq": self.seq, "t": time.time(), "snapshot": self.state.snapshot()})
+        return self._snapshot_frame
+
+    def _write(self, websocket: WebSocket, frame: bytes) -> None:
+        try:
+            backlog = websocket.write_encoded(frame)
+        except (WebSocketClosed, ConnectionError):
+            self.detach(websocket)
+            return
+        if backlog > MAX_WATCHER_BACKLOG:
+            # Stop sending deltas until the backlog drains, then resync with a snapshot
+            self.watchers[websocket] = False
+
+    def _catch_up(self, websocket: WebSocket) -> None:
+        if websocket.writer.transport.get_write_buffer_size() <= MAX_WATCHER_BACKLOG // 4:
+            self.watchers[websocket] = True
+            self._write(websocket, self._snapshot())
+
+
+def _encode(message: dict) -> bytes:
+    return encode_frame(OP_TEXT, json.dumps(message, separators=(",", ":")).encode())
@@ -0,0 +1,206 @@
+import asyncio
+import base64
+import hashlib
+import os
+import struct
+from typing import Dict, NamedTuple, Optional, Tuple
+
+# Minimal RFC 6455 WebSocket support (text messages, ping/pong, close) on top of asyncio streams,
+# enough for local human players and spectators without an extra dependency.
+
+_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+OP_CONTINUATION, OP_TEXT, OP_BINARY, OP_CLOSE, OP_PING, OP_PONG = 0x0, 0x1, 0x2, 0x8, 0x9, 0xA
+MAX_MESSAGE_BYTES = 1 << 20
+
+
+class WebSocketClosed(ConnectionError):
+    """Raised when sending on a connection that has been closed"""
+
+
+class WebSocket:
+    """One WebSocket connection; the client side masks its frames, the server side does not"""
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, is_client: bool = False, path: str = "/"):
+        self.reader = reader
+        self.writer = writer
+        self.is_client = is_client
+        self.path = path
+        self.closed = False
+        self._last_frame_final = True
+        self._send_lock = asyncio.Lock()
+
+    async def send(self, text: str) -> None:
+        await self._send_frame(OP_TEXT, text.encode("utf-8"))
+
+    async def recv(self) -> Optional[str]:
+        """Next text message, or None once the connection is closed"""
+        fragments = []
+        while not self.closed:
+            try:
+                opcode, payload = await self._read_frame()
+            except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+                await self.close()
+                return None
+
+            if opcode == OP_PING:
+                await self._send_frame(OP_PONG, payload)
+            elif opcode == OP_CLOSE:
+                await self.close()
+                return None
+            elif opcode in (OP_TEXT, OP_BINARY, OP_CONTINUATION):
+                fragments.append(payload)
+                if self._last_frame_final:
+                    return b"".join(fragments).decode("utf-8", errors="replace")
+        return None
+
+    async def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            await self._send_frame(OP_CLOSE, b"")
+        except (WebSocketClosed, ConnectionError):
+            pass
+        self.closed = True
+        self.writer.close()
+
+    def write_encoded(self, frame: bytes) -> int:
+        """
+        Queue a frame built by encode_frame without waiting for it to drain
+
+        Lets one encoded frame be fanned out to many server-side connections. Returns the number
+        of bytes still waiting to be sent, so callers can spot a peer that isn't keeping up.
+        """
+        if self.closed:
+            raise WebSocketClosed("WebSocket is closed")
+        self.writer.write(frame)
+        return self.writer.transport.get_write_buffer_size()
+
+    async def _send_frame(self, opcode: int, payload: bytes) -> None:
+        if self.closed:
+            raise WebSocketClosed("WebSocket is closed")
+        frame = encode_frame(opcode, payload, masked=self.is_client)
+        async with self._send_lock:
+            self.writer.write(frame)
+            await self.writer.drain()
+
+    async def _read_frame(self) -> Tuple[int, bytes]:
+        first, second = await self.reader.readexactly(2)
+        self._last_frame_final = bool(first & 0x80)
+        opcode = first & 0x0F
+        length = second & 0x7F
+        if length == 126:
+            (length,) = struct.unpack("!H", await self.reader.readexactly(2))
+        elif length == 127:
+            (length,) = struct.unpack("!Q", await self.reader.readexactly(8))
+        if length > MAX_MESSAGE_BYTES:
+            raise ValueError(f"WebSocket frame of {length} bytes exceeds the {MAX_MESSAGE_BYTES} byte limit")
+        mask = await self.reader.readexactly(4) if second & 0x80 else None
+        payload = await self.reader.readexactly(length)
+        return opcode, _apply_mask(payload, mask) if mask else payload
+
+
+def encode_frame(opcode: int, payload: bytes, masked: bool = False) -> bytes:
+    """Build one complete frame; clients must mask their frames, servers must not"""
+    header = bytearray([0x80 | opcode])
+    mask_bit = 0x80 if masked else 0
+    length = len(payload)
+    if length < 126:
+        header.append(mask_bit | length)
+    elif length < 1 << 16:
+        header.append(mask_bit | 126)
+        header += struct.pack("!H", length)
+    else:
+        header.append(mask_bit | 127)
+        header += struct.pack("!Q", length)
+    if masked:
+        mask = os.urandom(4)
+        header += mask
+        payload = _apply_mask(payload, mask)
+    return bytes(header) + payload
+
+
+def _apply_mask(payload: bytes, mask: bytes) -> bytes:
+    # XOR against the repeated 4-byte mask, done as one big integer operation instead of per byte
+    repeated = (mask * (len(payload) // 4 + 1))[:len(payload)]
+    return (int.from_bytes(payload, "big") ^ int.from_bytes(repeated, "big")).to_bytes(len(payload), "big")
+
+
+def _accept_key(key: str) -> str:
+    return base64.b64encode(hashlib.sha1((key + _GUID).encode()).digest()).decode()
+
+
+class HTTPRequest(NamedTuple):
+    """Request line and headers (lower-cased names) of an incoming HTTP request"""
+    method: str
+    path: str
+    headers: Dict[str, str]
+
+    @property
+    def is_websocket_upgrade(self) -> bool:
+        return self.method == "GET" and "websocket" in self.headers.get("upgrade", "").lower() and "sec-websocket-key" in self.headers
+
+
+async def read_request(reader: asyncio.StreamReader) -> Optional[HTTPRequest]:
+    """Read the head of an HTTP request; None if the peer sent something that isn't one"""
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+        return None
+
+    request_line, *header_lines = head.decode("latin-1").split("\r\n")
+    headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    parts = request_line.split(" ")
+    if len(parts) < 2:
+        return None
+    return HTTPRequest(parts[0], parts[1], headers)
+
+
+async def upgrade(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, request: HTTPRequest) -> Optional[WebSocket]:
+    """Answer an already-read upgrade request; returns None (and closes) if it isn't one"""
+    if not request.is_websocket_upgrade:
+        writer.write(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+        await writer.drain()
+        writer.close()
+        return None
+
+    writer.write((
+        "HTTP/1.1 101 Switching Protocols\r\n"
+        "Upgrade: websocket\r\n"
+        "Connection: Upgrade\r\n"
+        f"Sec-WebSocket-Accept: {_accept_key(request.headers['sec-websocket-key'])}\r\n\r\n"
+    ).encode())
+    await writer.drain()
+    return WebSocket(reader, writer, is_client=False, path=request.path)
+
+
+async def accept(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> Optional[WebSocket]:
+    """Perform the server side of the opening handshake; returns None (and closes) for bad requests"""
+    request = await read_request(reader)
+    if request is None:
+        writer.close()
+        return None
+    return await upgrade(reader, writer, request)
+
+
+async def connect(host: str, port: int, path: str = "/") -> WebSocket:
+    """Open a client connection (used by test clients and load generators)"""
+    reader, writer = await asyncio.open_connection(host, port)
+    key = base64.b64encode(os.urandom(16)).decode()
+    writer.write((
+        f"GET {path} HTTP/1.1\r\n"
+        f"Host: {host}:{port}\r\n"
+        "Upgrade: websocket\r\n"
+        "Connection: Upgrade\r\n"
+        f"Sec-WebSocket-Key: {key}\r\n"
+        "Sec-WebSocket-Version: 13\r\n\r\n"
+    ).encode())
+    await writer.drain()
+
+    response = await reader.readuntil(b"\r\n\r\n")
+    if b" 101 " not in response.split(b"\r\n", 1)[0] or _accept_key(key).encode() not in response:
+        writer.close()
+        raise ConnectionError(f"WebSocket handshake with {host}:{port}{path} failed")
+    return WebSocket(reader, writer, is_client=True, path=path)
@@ -1,16 +1,22 @@
 import json
 import random
-from typing import List, Optional
-from dotenv import load_dotenv
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import partial
+from typing import Callable, Dict, Iterator, List, Optional, Union
 from game_agents.base_agent import BaseAgent
 from game_agents.agent_registry import AGENT_REGISTRY
-from game_context.game_context import GameContext, NIGHT_PHASE_ORDER
+from game_agents.hedging import HedgedCaller
+from game_agents.model_router import ModelRouter
+from game_agents.speculation import Speculator
+from game_context.game_context import GameContext
+from game_context.day_budget import DayBudget, HumanTurnAllowance, TurnAllowance
+from game_context.night_plan import NightPlan
+from game_context.outcome import GameOutcome, resolve_game_outcome
+from game_context.straw_poll import StrawPoll
 from game_context.roles import Role
 from setup import load_game_config, setup_game_context
 
-# Load environment variables
-load_dotenv()
-
 # Game constants
 NUM_PLAYERS = 5
 QUORUM_FOR_VOTING = (NUM_PLAYERS >> 1) + 1
@@ -20,45 +26,61 @@ MAX_ROUNDS_PRIOR_TO_VOTING = 10
 class NightPhaseManager:
     """Manages the sequential execution of nighttime actions"""
     
-    def __init__(self, game_context: GameContext):
+    def __init__(self, game_context: GameContext, verbose: bool = True):
         self.game_context = game_context
+        self.verbose = verbose
+        self._plan: Optional[NightPlan] = None
+    
+    def _log(self, message: str) -> None:
+        if self.verbose:
+            print(message)
+    
+    @property
+    def plan(self) -> NightPlan:
+        """The night's schedule, built from the dealt roles the first time it's needed"""
+        if self._plan is None:
+            self._plan = NightPlan.from_game_context(self.game_context)
+        return self._plan
     
     def execute_night_phase(self) -> None:
         """Execute all nighttime actions in the proper order"""
-        print("🌙 Night falls... The supernatural beings begin their work.")
-        print("=" * 60)
+        self._log("🌙 Night falls... The supernatural beings begin their work.")
+        self._log("=" * 60)
+        schedule = ", ".join(f"{self.game_context.players[turn.player_id].player_name} ({turn.role})" for turn in self.plan.turns)
+        self._log(f"📋 Tonight's order: {schedule or 'nobody wakes'}")
+        
+        for step in self.night_steps():
+            step()
+        
+        self._log("\n🌅 The night phase is complete. Dawn breaks...")
+        self._log("=" * 60)
+    
+    def night_steps(self) -> Iterator[Callable[[], None]]:
+        """
+        Yield each player's night action, in night order, as a call to make
         
-        for role in NIGHT_PHASE_ORDER:
+        The plan is fixed before the first step runs, so a card swapped earlier in the night
+        doesn't change who acts later. Callers that interleave several games (see game_server)
+        run one step at a time; a role is marked completed once all of its players' steps
+        have been run.
+        """
+        plan = self.plan
+        for role in plan.role_order:
             if self.game_context.is_night_action_completed(role):
                 continue
-                
-            # Find all players with this role
-            players_with_role = []
-            for player_id, player in self.game_context.players.items():
-                if player.current_role.lower() == role:
-                    players_with_role.append((player_id, player))
-            
-            if not players_with_role:
-                # No players have this role, mark as completed
-                self.game_context.mark_night_action_completed(role)
-                continue
-            
-            print(f"\n🔮 {role.capitalize()} phase begins...")
             
-            # Execute night action for each player with this role
-            for player_id, player in players_with_role:
-                self._execute_player_night_action(player, role)
+            turns = plan.turns_for(role)
+            if turns:
+                self._log(f"\n🔮 {role.capitalize()} phase begins...")
+                for turn in turns:
+                    yield partial(self._execute_player_night_action, self.game_context.players[turn.player_id], role)
+                self._log(f"✅ {role.capitalize()} phase completed.")
             
-            # Mark this role's night actions as completed
             self.game_context.mark_night_action_completed(role)
-            print(f"✅ {role.capitalize()} phase completed.")
-        
-        print("\n🌅 The night phase is complete. Dawn breaks...")
-        print("=" * 60)
     
     def _execute_player_night_action(self, player: BaseAgent, role: str) -> None:
         """Execute a single player's night action"""
-        print(f"  → {player.player_name} ({role}) is taking their night action...")
+        self._log(f"  → {player.player_name} ({role}) is taking their night action...")
         
         try:
             # Check if this role needs to use a tool interactively
@@ -71,21 +93,18 @@ class NightPhaseManager:
                 # Automatic night action (Werewolf, Minion, Mason, Insomniac, etc.)
                 result = player.execute_night_action(self.game_context)
                 if result and not result.startswith("As a"):  # Filter out role descriptions
-                    print(f"    {result}")
+                    self._log(f"    {result}")
         
         except Exception as e:
-            print(f"    ❌ Error during {player.player_name}'s night action: {str(e)}")
+            self._log(f"    ❌ Error during {player.player_name}'s night action: {str(e)}")
     
     def _execute_interactive_night_action(self, player: BaseAgent, tool_name: str, role: str) -> None:
         """Execute an interactive night action using the player's AI to make decisions"""
-        print(f"    🤖 {player.player_name} is deciding what to do...")
+        self._log(f"    🤖 {player.player_name} is deciding what to do...")
         
         try:
-            # Get the nighttime-specific system prompt
-            if hasattr(player, '_get_nighttime_prompt'):
-                nighttime_prompt = player._get_nighttime_prompt(self.game_context)
-            else:
-                nighttime_prompt = f"You are the {role}. Use your {tool_name} tool to take your night action."
+            # The role's night instructions are already part of its system prompt
+            nighttime_prompt = f"It is night. Use your {tool_name} tool to take your night action."
             
             # Have the AI agent decide what action to take
             response = player.act(
@@ -95,18 +114,210 @@ class NightPhaseManager:
                 game_state=self.game_context
             )
             
-            if response.tool_calls_made:
-                print(f"    ✨ {player.player_name} completed their night action")
+            if response.tool_calls:
+                self._log(f"    ✨ {player.player_name} completed their night action")
                 # The tool calls have already been processed and knowledge updated
             else:
-                print(f"    ⚠️  {player.player_name} did not use any tools during their night phase")
+                self._log(f"    ⚠️  {player.player_name} did not use any tools during their night phase")
                 
         except Exception as e:
-            print(f"    ❌ Error during {player.player_name}'s interactive night action: {str(e)}")
+            self._log(f"    ❌ Error during {player.player_name}'s interactive night action: {str(e)}")
+
+
+class DayPhaseManager:
+    """Manages the daytime discussion rounds and the final vote"""
+    
+    def __init__(
+            self,
+            game_context: GameContext,
+            max_rounds: int = MAX_ROUNDS_PRIOR_TO_VOTING,
+            verbose: bool = True,
+            prepare_while_humans_speak: bool = True,
+            straw_poll: Optional[StrawPoll] = None,
+            day_budget: Optional[DayBudget] = None,
+            speculator: Optional[Speculator] = None
+    ):
+        self.game_context = game_context
+        self.max_rounds = max_rounds
+        self.verbose = verbose
+        self.prepare_while_humans_speak = prepare_while_humans_speak
+        # Ends the discussion early once the predicted vote stops changing; None always plays every round
+        self.straw_poll = straw_poll
+        # Hard wall-time limit for the day; None lets every round run however long it takes
+        self.day_budget = day_budget
+        # Starts each next speaker's model call while the current one is speaking; None waits for every turn
+        self.speculator = speculator
+        self.rounds_played = 0
+        self._background = ThreadPoolExecutor(max_workers=4, thread_name_prefix="day-prep")
+        self._preparing: List[Future] = []
+    
+    def _log(self, message: str) -> None:
+        if self.verbose:
+            print(message)
+    
+    def execute_day_phase(self) -> GameOutcome:
+        """Run the discussion, collect votes and resolve the game"""
+        try:
+            self.run_discussion()
+            votes = self.run_vote()
+        finally:
+            self.shutdown()
+        return resolve_game_outcome(self.game_context, votes)
+    
+    def shutdown(self) -> None:
+        """Stop the background threads once the day is over (execute_day_phase does this itself)"""
+        self._background.shutdown(wait=False, cancel_futures=True)
+    
+    def run_discussion(self) -> None:
+        """Give every player a turn to speak in each discussion round"""
+        for step in self.discussion_steps():
+            step()
+    
+    def discussion_steps(self) -> Iterator[Callable[[], None]]:
+        """
+        Yield each discussion turn, round by round in seat order, as a call to make
+        
+        With a straw poll, the table is polled after every round and the discussion stops as
+        soon as it has settled. Warm-ups that haven't started yet are dropped; one already sent is
+        a single one-token request and is left to finish.
+        With a day budget, each turn is sized to the time left and the discussion stops as soon
+        as the next speaker no longer fits before the vote. With a speculator, each turn also
+        starts the next speaker's turn early.
+        """
+        if self.day_budget is not None:
+            self.day_budget.start()
+        
+        for round_number in range(1, self.max_rounds + 1):
+            speakers = list(self.game_context.players.values())
+            if self.day_budget is not None:
+                fitting = self.day_budget.speakers_that_fit(speakers, self.game_context)
+                if fitting == 0:
+                    self._out_of_time()
+                    return
+                if fitting < len(speakers):
+                    self._log(f"\n⏱️  {fitting} of {len(speakers)} speakers fit in the {self.day_budget.remaining():.0f}s left")
+            
+            self._log(f"\n💬 Discussion round {round_number} of {self.max_rounds}")
+            self.game_context.conversation.start_round(round_number)
+            
+            for index, player in enumerate(speakers):
+                allowance = None
+                if self.day_budget is not None:
+                    if not self.day_budget.fits(player, self.game_context):
+                        self._out_of_time()
+                        return
+                    allowance = self.day_budget.allowance(player, self.game_context)
+                if not player.is_ai and self.prepare_while_humans_speak:
+                    self._prepare_next_ai_speaker(speakers[index + 1:])
+                next_speaker = speakers[index + 1] if index + 1 < len(speakers) else None
+                yield partial(self._take_turn, player, round_number, allowance, next_speaker)
+            self.rounds_played = round_number
+            
+            if round_number < self.max_rounds and self.straw_poll is not None and self.straw_poll.record_round(self.game_context):
+                self._finish_discussion()
+                self._log(f"\n⏹️  Discussion settled after round {round_number}; moving to the vote")
+                return
+        self._finish_discussion()
+    
+    def _out_of_time(self) -> None:
+        self._finish_discussion()
+        self._log(f"\n⏰ Day time budget nearly spent ({self.day_budget.remaining():.0f}s left); moving to the vote")
+    
+    def _finish_discussion(self) -> None:
+        """Drop background work for turns that will no longer be taken, where it hasn't started yet"""
+        for future in self._preparing:
+            future.cancel()
+        self._preparing.clear()
+        if self.speculator is not None:
+            self.speculator.cancel_all()
+            report = self.speculator.report()
+            if report["started"]:
+                self._log(f"\n⚡ Speculative turns: {report['hits']} of {report['started']} kept, {report['seconds_saved']:.1f}s saved")
+    
+    def _prepare_next_ai_speaker(self, upcoming: List[BaseAgent]) -> None:
+        """Let the next AI speaker warm up in the background while a human is typing"""
+        next_ai = next((player for player in upcoming if player.is_ai), None)
+        if next_ai is not None:
+            self._preparing = [future for future in self._preparing if not future.done()]
+            self._preparing.append(self._background.submit(next_ai.prepare_turn, self.game_context))
+    
+    def _turn_prompt(self, round_number: int) -> str:
+        voting = "Voting happens after the final round, or sooner if the table settles." if self.straw_poll else "Voting happens after the final round."
+        return f"Discussion round {round_number} of {self.max_rounds}. {voting}"
+    
+    def _take_turn(self, player: BaseAgent, round_number: int, allowance: Optional[Union[TurnAllowance, HumanTurnAllowance]] = None, next_speaker: Optional[BaseAgent] = None) -> None:
+        """Let a single player speak during the discussion, within the allowance the day budget gave them"""
+        prompt = self._turn_prompt(round_number)
+        speculation = None
+        if self.speculator is not None:
+            speculation = self.speculator.take(player, prompt, self.game_context)
+            if next_speaker is not None:
+                self.speculator.start(next_speaker, prompt, self.game_context, self._background)
+        saved = None
+        if allowance is not None:
+            saved = type(allowance)(*(getattr(player, setting) for setting in allowance._fields))
+            for setting, value in allowance._asdict().items():
+                setattr(player, setting, value)
+        try:
+            response = player.act(prompt=prompt, game_state=self.game_context, speculation=speculation)
+            self._log(f"  {player.player_name}: {response.public_response}")
+        except Exception as e:
+            self._log(f"    ❌ Error during {player.player_name}'s turn: {str(e)}")
+        finally:
+            if speculation is not None:
+                self.speculator.settle(speculation)
+            if saved is not None:
+                for setting, value in saved._asdict().items():
+                    setattr(player, setting, value)
+    
+    def _collect_vote(self, player: BaseAgent, get_vote) -> Optional[int]:
+        try:
+            return get_vote()
+        except Exception as e:
+            self._log(f"    ❌ Error during {player.player_name}'s vote: {str(e)}")
+            return None
+    
+    def _human_vote(self, future: Future) -> Optional[int]:
+        """A human's vote; with a day budget, one that hasn't come in by the end of the day is no vote"""
+        try:
+            return future.result(timeout=self.day_budget.remaining() if self.day_budget is not None else None)
+        except FutureTimeoutError:
+            return None
+    
+    def run_vote(self) -> Dict[int, int]:
+        """Collect each player's vote, skipping invalid or failed votes"""
+        self._log("\n🗳️  Voting begins...")
+        votes = {}
+        
+        # Humans vote in the background so they never hold up the AI votes, which stay on this
+        # thread in seat order to keep seeded games reproducible
+        human_votes = {
+            player_id: self._background.submit(player.cast_vote, self.game_context)
+            for player_id, player in self.game_context.players.items()
+            if not player.is_ai
+        }
+        targets = {}
+        for player_id, player in self.game_context.players.items():
+            if player_id not in human_votes:
+                targets[player_id] = self._collect_vote(player, lambda: player.cast_vote(self.game_context))
+        for player_id, future in human_votes.items():
+            targets[player_id] = self._collect_vote(self.game_context.get_player(player_id), partial(self._human_vote, future))
+        
+        for player_id, player in self.game_context.players.items():
+            target_id = targets[player_id]
+            if target_id is not None and self.game_context.set_player_vote(player_id, target_id):
+                votes[player_id] = target_id
+                self._log(f"  {player.player_name} votes for {self.game_context.get_player(target_id).player_name}")
+        
+        return votes
 
 
 def run_game():
     """Main game execution function"""
+    # Loaded here rather than at import so workers and batch runs that import play.py start faster
+    from dotenv import load_dotenv
+    load_dotenv()
+    
     print("🐺 Welcome to One Night Werewolf AI! 🐺")
     print("=" * 60)
     
@@ -116,7 +327,9 @@ def run_game():
     print(f"   Available roles: {', '.join(game_config['available_roles'])}")
     
     print("🎲 Setting up game context...")
-    game_context = setup_game_context(game_config)
+    router = ModelRouter.from_config(game_config.get("model_routing"))
+    hedger = HedgedCaller.from_config(router, game_config.get("hedging"))
+    game_context = setup_game_context(game_config, router=router, hedger=hedger)
     
     print("👥 Players in the game:")
     for player_id, player in game_context.players.items():
@@ -128,26 +341,30 @@ def run_game():
     
     print("\n" + "=" * 60)
     
-    # Execute night phase
-    night_manager = NightPhaseManager(game_context)
-    night_manager.execute_night_phase()
-    
-    # Transition to day phase
-    game_context.set_nighttime(False)
-    print("☀️  Day phase begins! Time for discussion and voting.")
-    print("=" * 60)
-    
-    # Day phase simulation (basic structure for now)
-    current_round = 0
-    players_ready_to_vote = 0
-    
-    print("💬 Discussion phase begins...")
-    print("   (In a full implementation, this would be the discussion and voting loop)")
-    print(f"   Players will discuss for up to {MAX_ROUNDS_PRIOR_TO_VOTING} rounds")
-    print(f"   Voting begins when {QUORUM_FOR_VOTING} players are ready")
+    try:
+        # Execute night phase
+        night_manager = NightPhaseManager(game_context)
+        night_manager.execute_night_phase()
+        
+        # Transition to day phase
+        game_context.set_nighttime(False)
+        print("☀️  Day phase begins! Time for discussion and voting.")
+        print("=" * 60)
+        
+        day_manager = DayPhaseManager(
+            game_context,
+            max_rounds=game_config.get("max_rounds", MAX_ROUNDS_PRIOR_TO_VOTING),
+            straw_poll=StrawPoll.from_config(game_config),
+            day_budget=DayBudget.from_config(game_config),
+            speculator=Speculator.from_config(game_config)
+        )
+        outcome = day_manager.execute_day_phase()
+    finally:
+        game_context.close()
+        if hedger is not None:
+            hedger.shutdown()
     
-    # For now, we'll just show the final game state
-    print("\n📊 Final game state after night phase:")
+    print("\n📊 Final game state:")
     print("   Player roles (may have changed during night):")
     for player_id, player in game_context.players.items():
         initial_role = player.initial_role.capitalize()
@@ -168,8 +385,16 @@ def run_game():
         else:
             print(f"     {player.player_name}: No special knowledge gained")
     
-    print("\n🎉 Night phase execution complete!")
-    print("   The game is now ready for the discussion and voting phases.")
+    eliminated_names = [game_context.get_player(player_id).player_name for player_id in outcome.eliminated]
+    print(f"\n⚰️  Eliminated: {', '.join(eliminated_names) if eliminated_names else 'Nobody'}")
+    print(f"🏆 Winning teams: {', '.join(team.value.capitalize() for team in outcome.winning_teams) or 'None'}")
+    
+    if game_context.model_router and game_context.model_router.stats:
+        print("\n📈 Model usage by route:")
+        for route_name, stats in game_context.model_router.report().items():
+            p95 = f"{stats['p95_latency']:.2f}s" if stats['p95_latency'] is not None else "n/a"
+            print(f"   {route_name}: {stats['calls']} calls, p95 {p95}, "
+                  f"{stats['prompt_tokens'] + stats['completion_tokens']} tokens, ${stats['cost_usd']:.4f}")
 
 
 if __name__ == "__main__":
@@ -1,9 +1,13 @@
 import json
 import random
-from typing import List
+from typing import Any, Callable, List, Optional, Tuple
 from game_context import GameContext, Role
 from game_agents.agent_registry import AGENT_REGISTRY
+from game_agents.agent_pool import AgentPool
 from game_agents.base_agent import BaseAgent
+from game_agents.model_router import ModelRouter
+from game_agents.hedging import HedgedCaller
+from game_agents.human_io import HumanIOLoop, TerminalChannel, WebSocketHumanServer
 
 
 def load_game_config() -> dict:
@@ -12,7 +16,10 @@ def load_game_config() -> dict:
         return json.load(f)
 
 
-def create_agents_from_config(game_config: dict) -> List[BaseAgent]:
+def deal_roles(game_config: dict, rng: Optional[random.Random] = None) -> Tuple[List[str], List[str]]:
+    """Shuffle the configured roles once and split them into player roles and the 3 center cards"""
+    rng = rng or random
+    
     # Calculate number of players: all available roles minus 3 (for center cards)
     total_roles = len(game_config["available_roles"])
     num_players = total_roles - 3
@@ -27,9 +34,28 @@ def create_agents_from_config(game_config: dict) -> List[BaseAgent]:
         raise ValueError(f"Cannot have more than 10 players, but {num_players} players calculated from {total_roles} total roles")
     
     roles = game_config["available_roles"].copy()
-    random.shuffle(roles)
+    rng.shuffle(roles)
     
-    player_roles = roles[:num_players]
+    return roles[:num_players], roles[num_players:]
+
+
+def get_seat_agent_type(game_config: dict, seat: int) -> str:
+    """Agent type ("llm" or "scripted") for an AI seat, from seat_agent_types or default_agent_type"""
+    seat_agent_types = game_config.get("seat_agent_types", [])
+    if seat < len(seat_agent_types):
+        return seat_agent_types[seat]
+    return game_config.get("default_agent_type", "llm")
+
+
+def create_agents_from_config(
+    game_config: dict,
+    player_roles: Optional[List[str]] = None,
+    rng: Optional[random.Random] = None,
+    agent_pool: Optional[AgentPool] = None
+) -> List[BaseAgent]:
+    if player_roles is None:
+        player_roles, _ = deal_roles(game_config, rng)
+    num_players = len(player_roles)
     
     num_human_players = game_config["number_human_players"]
     if num_human_players > num_players:
@@ -40,32 +66,107 @@ def create_agents_from_config(game_config: dict) -> List[BaseAgent]:
     for i, role in enumerate(player_roles):
         is_human = i < num_human_players
         role_enum = Role(role.lower())
-        agent_cls = role_enum.get_agent_class()
+        agent_cls = role_enum.get_agent_class("human" if is_human else get_seat_agent_type(game_config, i))
         
-        if is_human:
-            agent_instance = agent_cls(player_id=i, player_name=f"Human {i + 1}", initial_role=role.lower(), is_ai=False)
+        player_name = f"Human {i + 1}" if is_human else f"AI {i - num_human_players + 1}"
+        if agent_pool is not None:
+            agent_instance = agent_pool.acquire(agent_cls, i, player_name, role.lower(), is_ai=not is_human)
         else:
-            agent_instance = agent_cls(player_id=i, player_name=f"AI {i - num_human_players + 1}", initial_role=role.lower(), is_ai=True)
+            agent_instance = agent_cls(player_id=i, player_name=player_name, initial_role=role.lower(), is_ai=not is_human)
         
         all_agents.append(agent_instance)
     
     return all_agents
 
 
-def setup_game_context(game_config: dict) -> GameContext:
-    agents = create_agents_from_config(game_config)
-    game_context = GameContext()
+def setup_game_context(
+    game_config: dict,
+    rng: Optional[random.Random] = None,
+    router: Optional[ModelRouter] = None,
+    hedger: Optional[HedgedCaller] = None,
+    client_factory: Optional[Callable[[], Any]] = None,
+    agent_pool: Optional[AgentPool] = None,
+    game_context: Optional[GameContext] = None
+) -> GameContext:
+    """
+    Deal a new game and seat its agents
+    
+    Pass a router (and hedger) to share route latency history and cost totals across games;
+    otherwise fresh ones are built from the config, and the hedger built for the game (each
+    agent's hedger) is the caller's to shut down once the game is over. A client_factory replaces the OpenAI client
+    of every model-backed agent (e.g. with a fake model for load tests). Close the returned
+    context once the game is over, which stops its human players' I/O.
+    
+    To recycle objects across a batch, pass an agent_pool to seat agents from it and a finished
+    game's context to reset and reuse instead of building a new one.
+    """
+    rng = rng or random.Random()
+    player_roles, center_cards = deal_roles(game_config, rng)
+    
+    agents = create_agents_from_config(game_config, player_roles=player_roles, rng=rng, agent_pool=agent_pool)
+    if router is None:
+        router = ModelRouter.from_config(game_config.get("model_routing"))
+        hedger = HedgedCaller.from_config(router, game_config.get("hedging"))
+    if game_context is not None:
+        game_context.reset(rng=rng, model_router=router)
+    else:
+        game_context = GameContext(rng=rng, model_router=router)
 
+    agent_loop = game_config.get("agent_loop", {})
+    prompting = game_config.get("prompting", {})
     for agent in agents:
+        agent.router = router
+        agent.hedger = hedger
+        agent.max_tool_steps = agent_loop.get("max_steps", agent.max_tool_steps)
+        agent.max_turn_seconds = agent_loop.get("max_wall_time", agent.max_turn_seconds)
+        agent.max_tool_repairs = agent_loop.get("max_tool_repairs", agent.max_tool_repairs)
+        agent.stream_responses = agent_loop.get("stream_responses", agent.stream_responses)
+        agent.client_factory = client_factory
+        agent.history_mode = prompting.get("history_mode", agent.history_mode)
+        agent.history_token_budget = prompting.get("history_token_budget", agent.history_token_budget)
         game_context.players[agent.player_id] = agent
+    game_context.conversation.track_players({agent.player_id: agent.player_name for agent in agents})
+    game_context.conversation.claims.set_deck(player_roles + center_cards)
     
-    all_roles = game_config["available_roles"].copy()
-    random.shuffle(all_roles)
+    attach_human_players(game_context, game_config.get("human_io"))
     
-    num_players = len(agents)
-    center_cards = all_roles[num_players:] 
     center_role_enums = [Role(role_str.lower()) for role_str in center_cards]
     
     game_context.initialize_center_cards(center_role_enums)
     
     return game_context
+
+
+def attach_human_players(game_context: GameContext, human_io_config: Optional[dict] = None) -> None:
+    """
+    Connect every human seat to its player through the terminal or a local WebSocket
+    
+    The "human_io" config section picks the mode ("terminal" or "websocket"), the WebSocket
+    host and port, and the night, turn and vote timeouts in seconds. The I/O loop (and server)
+    is kept on game_context.human_io and lives until game_context.close().
+    """
+    humans = [player for player in game_context.players.values() if not player.is_ai]
+    if not humans:
+        return
+    
+    human_io_config = human_io_config or {}
+    mode = human_io_config.get("mode", "terminal")
+    if mode == "terminal" and len(humans) > 1:
+        raise ValueError(f"Terminal mode supports one human player, but the game has {len(humans)}; use the websocket mode")
+    if mode not in ("terminal", "websocket"):
+        raise ValueError(f"Unknown human_io mode: {mode}. Expected 'terminal' or 'websocket'")
+    
+    # The game owns the loop from here on; game_context.close() shuts it down
+    game_context.close()
+    game_context.human_io = io_loop = HumanIOLoop()
+    if mode == "terminal":
+        humans[0].attach_channel(TerminalChannel(io_loop, humans[0].player_name), game_context, human_io_config)
+    else:
+        try:
+            server = WebSocketHumanServer(io_loop, human_io_config.get("host", "127.0.0.1"), human_io_config.get("port", 8765))
+        except OSError:
+            game_context.close()
+            raise
+        for human in humans:
+            human.attach_channel(server.channel_for(human.player_id), game_context, human_io_config)
+            print(f"   {human.player_name} can join at ws://{server.host}:{server.port}/seat/{human.player_id}")
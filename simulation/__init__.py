@@ -0,0 +1,37 @@
+# One Night Werewolf Simulation Package
+"""
+This package runs games in bulk and stores their results for analysis.
+
+Modules:
+- game_runner: Plays a single non-interactive game from a config and seed
+- batch_runner: Plays many seeded games and writes them to a results store
+- results_store: Columnar, memory-mappable storage of finished games
+- tournament: Seats agent variants over seeded deals and rates them per role, stopping once they separate
+- experiment: Paired A/B tests of one variant against another on identical deals and nights
+- night_cache: Records nights and replays them in games that deal the same cards from the same seed
+- sweep: Plays a grid of deck compositions through the batch runner into a (config x metric) cube
+"""
+
+from .results_store import GameRecord, ResultsStore, ResultsStoreWriter
+from .night_cache import NightCache, NightRecording
+from .batch_runner import BatchRunner
+from .tournament import AgentVariant, Tournament, TournamentResult
+from .experiment import PairedExperiment, PairedResult
+from .sweep import CompositionSweep, SweepCube, expand_compositions
+
+__all__ = [
+    'GameRecord',
+    'ResultsStore',
+    'ResultsStoreWriter',
+    'NightCache',
+    'NightRecording',
+    'BatchRunner',
+    'AgentVariant',
+    'Tournament',
+    'TournamentResult',
+    'PairedExperiment',
+    'PairedResult',
+    'CompositionSweep',
+    'SweepCube',
+    'expand_compositions'
+]
@@ -0,0 +1,30 @@
+# One Night Werewolf Simulation Analytics
+"""
+Vectorized metrics over batches of finished games.
+
+Every metric takes a GameArrays, built either from a memory-mapped ResultsStore
+(GameArrays.from_store) or from GameContext.get_role_assignments_summary() snapshots and
+vote outcomes (GameArrays.from_role_summaries), and is computed with numpy over whole
+columns rather than game by game.
+
+Modules:
+- arrays: GameArrays container and role/team code lookups
+- metrics: Win rates, swap-chain statistics, vote accuracy, werewolf deception success and claim truthfulness
+- bootstrap: Poisson bootstrap confidence intervals for ratio metrics
+"""
+
+from .arrays import GameArrays
+from .bootstrap import bootstrap_ratio_ci, bootstrap_mean_ci
+from .metrics import win_rate_by_role, win_rate_by_seat, swap_chain_stats, vote_accuracy, deception_success, claim_truthfulness
+
+__all__ = [
+    'GameArrays',
+    'bootstrap_ratio_ci',
+    'bootstrap_mean_ci',
+    'win_rate_by_role',
+    'win_rate_by_seat',
+    'swap_chain_stats',
+    'vote_accuracy',
+    'deception_success',
+    'claim_truthfulness'
+]
@@ -0,0 +1,143 @@
+from typing import Dict, List, Optional
+import numpy as np
+from game_context.outcome import GameOutcome, ROLE_TEAMS
+from game_context.roles import Role
+from simulation.results_store import MAX_SEATS, NUM_CENTER_CARDS, ROLE_CODES, ROLE_NAMES, TEAM_NAMES
+
+# Team code for every role code, so team membership is a single fancy-index lookup
+ROLE_TEAM_CODES = np.array([TEAM_NAMES.index(ROLE_TEAMS[Role(name)].value) for name in ROLE_NAMES], dtype=np.int8)
+# Role names in sorted order, with the code of each, so a whole list of names is coded with one search
+_SORTED_ROLE_NAMES = np.array(sorted(ROLE_NAMES))
+_SORTED_ROLE_CODES = np.array([ROLE_CODES[name] for name in _SORTED_ROLE_NAMES], dtype=np.int8)
+
+
+def _role_codes(names: List[str]) -> np.ndarray:
+    """Role codes of a list of role names (any case)"""
+    if not names:
+        return np.zeros(0, dtype=np.int8)
+    lowered = np.char.lower(np.asarray(names, dtype=str))
+    positions = np.searchsorted(_SORTED_ROLE_NAMES, lowered)
+    if (positions >= len(_SORTED_ROLE_NAMES)).any() or (_SORTED_ROLE_NAMES[np.minimum(positions, len(_SORTED_ROLE_NAMES) - 1)] != lowered).any():
+        raise KeyError(f"Unknown role name among: {sorted(set(lowered.tolist()) - set(ROLE_NAMES))}")
+    return _SORTED_ROLE_CODES[positions]
+
+
+class GameArrays:
+    """
+    Per-game arrays the analytics functions operate on
+
+    Role arrays hold role codes (see results_store.ROLE_NAMES) with -1 for empty seats,
+    and vote arrays hold the seat voted for with -1 for no vote.
+    """
+    def __init__(
+        self,
+        initial_roles: np.ndarray,
+        final_roles: np.ndarray,
+        votes: np.ndarray,
+        eliminated: np.ndarray,
+        winners: np.ndarray,
+        night_actions: Optional[np.ndarray] = None,
+        final_center: Optional[np.ndarray] = None,
+        claimed_roles: Optional[np.ndarray] = None
+    ):
+        self.initial_roles = np.asarray(initial_roles)
+        self.final_roles = np.asarray(final_roles)
+        self.votes = np.asarray(votes)
+        self.eliminated = np.asarray(eliminated, dtype=bool)
+        self.winners = np.asarray(winners, dtype=bool)
+        self.night_actions = None if night_actions is None else np.asarray(night_actions)
+        self.final_center = None if final_center is None else np.asarray(final_center)
+        self.claimed_roles = None if claimed_roles is None else np.asarray(claimed_roles)
+        self.occupied = self.final_roles >= 0
+
+    def __len__(self) -> int:
+        return self.final_roles.shape[0]
+
+    @classmethod
+    def from_store(cls, store, mask: Optional[np.ndarray] = None) -> "GameArrays":
+        """
+        Build arrays from a ResultsStore, optionally keeping only the games selected by a boolean mask
+
+        Optional columns a store predates (e.g. claimed_roles) are left as None.
+        """
+        def load(name):
+            if not store.has_column(name):
+                return None
+            column = store[name]
+            return column[mask] if mask is not None else column
+
+        return cls(
+            initial_roles=load("initial_roles"),
+            final_roles=load("final_roles"),
+            votes=load("votes"),
+            eliminated=load("eliminated"),
+            winners=load("winners"),
+            night_actions=load("night_actions"),
+            final_center=load("final_center"),
+            claimed_roles=load("claimed_roles")
+        )
+
+    @classmethod
+    def from_role_summaries(
+        cls,
+        final_summaries: List[Dict],
+        outcomes: List[GameOutcome],
+        initial_summaries: Optional[List[Dict]] = None
+    ) -> "GameArrays":
+        """
+        Build arrays from GameContext.get_role_assignments_summary() snapshots and vote outcomes
+
+        Args:
+            final_summaries: Role summaries taken after the night (and vote)
+            outcomes: Resolved outcome (votes, eliminations, winners) of each game
+            initial_summaries: Role summaries taken before the night; defaults to the final roles
+
+        Returns:
+            GameArrays with seats ordered by player ID
+        """
+        num_games = len(final_summaries)
+        initial_summaries = initial_summaries or final_summaries
+        # One entry per (game, player), with each game's players in player ID order
+        player_ids = [sorted(summary["player_roles"]) for summary in final_summaries]
+        players_per_game = np.array([len(ids) for ids in player_ids], dtype=np.int64)
+        game_index = np.repeat(np.arange(num_games), players_per_game)
+        seat = np.arange(len(game_index)) - np.repeat(np.cumsum(players_per_game) - players_per_game, players_per_game)
+        flat_ids = np.fromiter((player_id for ids in player_ids for player_id in ids), dtype=np.int64, count=len(game_index))
+
+        # (game, player ID) keys are strictly increasing, so a player's seat is a binary search away
+        stride = int(flat_ids.max()) + 1 if len(flat_ids) else 1
+        keys = game_index * stride + flat_ids
+
+        def seats_of(games: np.ndarray, ids: np.ndarray) -> np.ndarray:
+            return seat[np.searchsorted(keys, games * stride + ids)]
+
+        def per_player(summaries: List[Dict]) -> np.ndarray:
+            return _role_codes([summary["player_roles"][player_id] for summary, ids in zip(summaries, player_ids) for player_id in ids])
+
+        initial_roles = np.full((num_games, MAX_SEATS), -1, dtype=np.int8)
+        final_roles = np.full((num_games, MAX_SEATS), -1, dtype=np.int8)
+        initial_roles[game_index, seat] = per_player(initial_summaries)
+        final_roles[game_index, seat] = per_player(final_summaries)
+        final_center = _role_codes([role for summary in final_summaries for role in summary["center_cards"]]).reshape(num_games, NUM_CENTER_CARDS)
+
+        votes = np.full((num_games, MAX_SEATS), -1, dtype=np.int8)
+        vote_games = np.repeat(np.arange(num_games), [len(outcome.votes) for outcome in outcomes])
+        voters = np.fromiter((voter for outcome in outcomes for voter in outcome.votes), dtype=np.int64, count=len(vote_games))
+        targets = np.fromiter((target for outcome in outcomes for target in outcome.votes.values()), dtype=np.int64, count=len(vote_games))
+        votes[vote_games, seats_of(vote_games, voters)] = seats_of(vote_games, targets)
+
+        def player_mask(lists: List[List[int]]) -> np.ndarray:
+            mask = np.zeros((num_games, MAX_SEATS), dtype=bool)
+            games = np.repeat(np.arange(num_games), [len(ids) for ids in lists])
+            ids = np.fromiter((player_id for player_ids in lists for player_id in player_ids), dtype=np.int64, count=len(games))
+            mask[games, seats_of(games, ids)] = True
+            return mask
+
+        eliminated = player_mask([outcome.eliminated for outcome in outcomes])
+        winners = player_mask([outcome.winners for outcome in outcomes])
+
+        return cls(initial_roles, final_roles, votes, eliminated, winners, final_center=final_center)
+
+    def team_codes(self, roles: np.ndarray) -> np.ndarray:
+        """Map role codes to team codes, keeping -1 for empty seats"""
+        return np.where(roles >= 0, ROLE_TEAM_CODES[np.clip(roles, 0, None)], -1)
@@ -0,0 +1,60 @@
+from typing import Optional, Tuple
+import numpy as np
+
+
+def bootstrap_ratio_ci(
+    numerators: np.ndarray,
+    denominators: np.ndarray,
+    n_resamples: int = 1000,
+    confidence: float = 0.95,
+    seed: Optional[int] = None,
+    chunk_size: int = 100
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Bootstrap confidence intervals for ratio metrics aggregated over games
+
+    Uses the Poisson bootstrap: each resample weights every game by an independent
+    Poisson(1) draw, so a resample is a single matrix product instead of an index gather,
+    and memory stays at chunk_size x num_games regardless of n_resamples.
+
+    Args:
+        numerators: Per-game numerators, shape (num_games,) or (num_games, k)
+        denominators: Per-game denominators, same shape as numerators
+        n_resamples: Number of bootstrap resamples
+        confidence: Two-sided confidence level
+        seed: Seed for the resampling weights
+        chunk_size: Number of resamples drawn per matrix product
+
+    Returns:
+        Tuple of (point estimate, lower bound, upper bound); NaN where the denominator is zero
+    """
+    numerators = np.asarray(numerators, dtype=np.float64)
+    denominators = np.asarray(denominators, dtype=np.float64)
+    squeeze = numerators.ndim == 1
+    if squeeze:
+        numerators = numerators[:, None]
+        denominators = denominators[:, None]
+
+    rng = np.random.default_rng(seed)
+    num_games = numerators.shape[0]
+    samples = np.empty((n_resamples, numerators.shape[1]))
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        estimate = numerators.sum(axis=0) / denominators.sum(axis=0)
+        for start in range(0, n_resamples, chunk_size):
+            stop = min(start + chunk_size, n_resamples)
+            weights = rng.poisson(1.0, size=(stop - start, num_games)).astype(np.float64)
+            samples[start:stop] = (weights @ numerators) / (weights @ denominators)
+
+    alpha = (1.0 - confidence) / 2.0
+    low, high = np.nanquantile(samples, [alpha, 1.0 - alpha], axis=0)
+
+    if squeeze:
+        return estimate[0], low[0], high[0]
+    return estimate, low, high
+
+
+def bootstrap_mean_ci(values: np.ndarray, n_resamples: int = 1000, confidence: float = 0.95, seed: Optional[int] = None) -> Tuple[float, float, float]:
+    """Bootstrap confidence interval for the mean of per-game values"""
+    values = np.asarray(values, dtype=np.float64)
+    return bootstrap_ratio_ci(values, np.ones_like(values), n_resamples=n_resamples, confidence=confidence, seed=seed)
@@ -0,0 +1,192 @@
+from typing import Dict, Optional
+import numpy as np
+from game_context.outcome import Team
+from simulation.analytics.arrays import GameArrays
+from simulation.analytics.bootstrap import bootstrap_ratio_ci
+from simulation.results_store import MAX_SEATS, NIGHT_ACTION_CODES, ROLE_CODES, ROLE_NAMES, TEAM_NAMES
+
+WEREWOLF_CODE = ROLE_CODES["werewolf"]
+VILLAGE_TEAM_CODE = TEAM_NAMES.index(Team.VILLAGE.value)
+ROBBER_ACTION = NIGHT_ACTION_CODES["robber"]
+TROUBLEMAKER_ACTION = NIGHT_ACTION_CODES["troublemaker"]
+DRUNK_ACTION = NIGHT_ACTION_CODES["drunk"]
+
+
+def _with_ci(numerators: np.ndarray, denominators: np.ndarray, n_resamples: int, seed: Optional[int]) -> Dict[str, np.ndarray]:
+    estimate, low, high = bootstrap_ratio_ci(numerators, denominators, n_resamples=n_resamples, seed=seed)
+    return {
+        "rate": estimate,
+        "ci_low": low,
+        "ci_high": high,
+        "count": np.asarray(denominators).sum(axis=0)
+    }
+
+
+def _role_counts(roles: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """Per-game count of seats holding each role code where mask is set, shape (num_games, num_roles)"""
+    one_hot = roles[..., None] == np.arange(len(ROLE_NAMES), dtype=roles.dtype)
+    return (one_hot & mask[..., None]).sum(axis=1)
+
+
+def win_rate_by_role(arrays: GameArrays, use_initial_role: bool = True, n_resamples: int = 1000, seed: Optional[int] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Win rate of each role with bootstrap confidence intervals
+
+    Args:
+        arrays: Game arrays to analyse
+        use_initial_role: Group players by the role they were dealt instead of the role they ended with
+        n_resamples: Number of bootstrap resamples
+        seed: Seed for the bootstrap
+
+    Returns:
+        Mapping of role name to {"rate", "ci_low", "ci_high", "count"}
+    """
+    roles = arrays.initial_roles if use_initial_role else arrays.final_roles
+    wins = _role_counts(roles, arrays.winners)
+    plays = _role_counts(roles, arrays.occupied)
+    stats = _with_ci(wins, plays, n_resamples, seed)
+    return {
+        name: {key: float(value[code]) for key, value in stats.items()}
+        for code, name in enumerate(ROLE_NAMES)
+        if stats["count"][code] > 0
+    }
+
+
+def win_rate_by_seat(arrays: GameArrays, n_resamples: int = 1000, seed: Optional[int] = None) -> Dict[int, Dict[str, float]]:
+    """Win rate of each seat (in player ID order) with bootstrap confidence intervals"""
+    stats = _with_ci(arrays.winners & arrays.occupied, arrays.occupied, n_resamples, seed)
+    return {
+        seat: {key: float(value[seat]) for key, value in stats.items()}
+        for seat in range(MAX_SEATS)
+        if stats["count"][seat] > 0
+    }
+
+
+def swap_chain_stats(arrays: GameArrays) -> Dict[str, float]:
+    """
+    How often the robber -> troublemaker -> drunk swap chain fires and how it interacts
+
+    Returns:
+        Frequencies of each swap action and chain, how often later swaps touch seats moved by
+        earlier ones, and how many players end the night holding a different card
+    """
+    changed = (arrays.initial_roles != arrays.final_roles) & arrays.occupied
+    stats = {
+        "games": float(len(arrays)),
+        "role_changed_rate": float(changed.sum() / max(arrays.occupied.sum(), 1)),
+        "changed_seats_per_game": float(changed.sum(axis=1).mean()) if len(arrays) else 0.0,
+    }
+    if arrays.night_actions is None:
+        return stats
+
+    action = arrays.night_actions[..., 0]
+    targets = arrays.night_actions[..., 1:]
+    seats = np.arange(MAX_SEATS)
+
+    robber_seat_mask = action == ROBBER_ACTION
+    troublemaker_seat_mask = action == TROUBLEMAKER_ACTION
+    drunk_seat_mask = action == DRUNK_ACTION
+    robbed = robber_seat_mask.any(axis=1)
+    troubled = troublemaker_seat_mask.any(axis=1)
+    drunk = drunk_seat_mask.any(axis=1)
+
+    # Seats moved by the robber (the robber and their target), as a per-seat mask
+    robber_target = np.where(robber_seat_mask, targets[..., 0], -1).max(axis=1)
+    robber_moved = robber_seat_mask | (seats == robber_target[:, None])
+    # Seats moved by the troublemaker (the two players swapped)
+    troublemaker_targets = np.where(troublemaker_seat_mask[..., None], targets, -1).max(axis=1)
+    troublemaker_moved = (seats == troublemaker_targets[:, :1]) | (seats == troublemaker_targets[:, 1:])
+
+    troublemaker_hits_robbed = (troublemaker_moved & robber_moved).any(axis=1) & robbed & troubled
+    drunk_was_moved = (drunk_seat_mask & (robber_moved | troublemaker_moved)).any(axis=1)
+
+    for name, mask in (("robber", robbed), ("troublemaker", troubled), ("drunk", drunk)):
+        stats[f"{name}_rate"] = float(mask.mean()) if len(arrays) else 0.0
+
+    chains = robbed.astype(np.int8) | (troubled.astype(np.int8) << 1) | (drunk.astype(np.int8) << 2)
+    chain_counts = np.bincount(chains, minlength=8)
+    for code, count in enumerate(chain_counts):
+        steps = [name for bit, name in enumerate(("robber", "troublemaker", "drunk")) if code >> bit & 1]
+        if len(steps) > 1:
+            stats[f"chain:{'→'.join(steps)}"] = float(count)
+
+    stats["troublemaker_hits_robbed_rate"] = float(troublemaker_hits_robbed.sum() / max((robbed & troubled).sum(), 1))
+    stats["drunk_was_moved_rate"] = float(drunk_was_moved.sum() / max(drunk.sum(), 1))
+    return stats
+
+
+def vote_accuracy(arrays: GameArrays, n_resamples: int = 1000, seed: Optional[int] = None) -> Dict[str, float]:
+    """
+    Share of village-team votes that landed on a player holding a werewolf card at the end of the night
+
+    Only games with at least one werewolf among the players count.
+    """
+    voted = arrays.votes >= 0
+    target_roles = np.take_along_axis(arrays.final_roles, np.clip(arrays.votes, 0, None).astype(np.intp), axis=1)
+    village_voter = arrays.team_codes(arrays.final_roles) == VILLAGE_TEAM_CODE
+    has_werewolf = (arrays.final_roles == WEREWOLF_CODE).any(axis=1, keepdims=True)
+
+    counted = voted & village_voter & has_werewolf
+    correct = counted & (target_roles == WEREWOLF_CODE)
+    stats = _with_ci(correct.sum(axis=1), counted.sum(axis=1), n_resamples, seed)
+    return {key: float(value) for key, value in stats.items()}
+
+
+def claim_truthfulness(arrays: GameArrays, n_resamples: int = 1000, seed: Optional[int] = None) -> Dict[str, Dict[str, float]]:
+    """
+    How often players of each dealt role publicly claimed the role they were dealt
+
+    Uses the claims read from the transcript without any model calls (see game_context.claims);
+    players who never claimed a role are left out.
+
+    Returns:
+        Mapping of dealt role name to {"rate", "ci_low", "ci_high", "count"}
+    """
+    if arrays.claimed_roles is None:
+        return {}
+    claimed = (arrays.claimed_roles >= 0) & arrays.occupied
+    truthful = claimed & (arrays.claimed_roles == arrays.initial_roles)
+    stats = _with_ci(_role_counts(arrays.initial_roles, truthful), _role_counts(arrays.initial_roles, claimed), n_resamples, seed)
+    return {
+        name: {key: float(value[code]) for key, value in stats.items()}
+        for code, name in enumerate(ROLE_NAMES)
+        if stats["count"][code] > 0
+    }
+
+
+def deception_success(arrays: GameArrays, n_resamples: int = 1000, seed: Optional[int] = None) -> Dict[str, float]:
+    """
+    How well werewolves avoided detection
+
+    Returns:
+        survival_rate: share of games with werewolves in play where no werewolf was eliminated
+        vote_share: share of all votes received by werewolves
+        expected_vote_share: vote share werewolves would get if everyone voted uniformly at random
+        Each rate comes with bootstrap "_ci_low"/"_ci_high" bounds.
+    """
+    werewolf_seats = arrays.final_roles == WEREWOLF_CODE
+    werewolves = werewolf_seats.sum(axis=1)
+    in_play = werewolves > 0
+    survived = in_play & ~(werewolf_seats & arrays.eliminated).any(axis=1)
+
+    voted = arrays.votes >= 0
+    target_is_werewolf = np.take_along_axis(werewolf_seats, np.clip(arrays.votes, 0, None).astype(np.intp), axis=1)
+    votes_on_werewolves = (voted & target_is_werewolf).sum(axis=1) * in_play
+    votes_cast = voted.sum(axis=1) * in_play
+    # Each voter picks one of the other num_players - 1 players; werewolf voters can hit werewolves - 1 of them
+    num_players = arrays.occupied.sum(axis=1)
+    voter_is_werewolf = voted & werewolf_seats
+    expected_hits = ((voted & ~werewolf_seats).sum(axis=1) * werewolves + voter_is_werewolf.sum(axis=1) * (werewolves - 1)) / np.maximum(num_players - 1, 1)
+
+    stats = {}
+    for name, numerator, denominator in (
+        ("survival_rate", survived, in_play),
+        ("vote_share", votes_on_werewolves, votes_cast),
+        ("expected_vote_share", expected_hits * in_play, votes_cast),
+    ):
+        estimate, low, high = bootstrap_ratio_ci(numerator, denominator, n_resamples=n_resamples, seed=seed)
+        stats[name] = float(estimate)
+        stats[f"{name}_ci_low"] = float(low)
+        stats[f"{name}_ci_high"] = float(high)
+    stats["games"] = float(in_play.sum())
+    return stats
@@ -0,0 +1,93 @@
+from typing import List, Optional, Tuple
+from game_agents.agent_pool import AgentPool
+from game_context.game_context import GameContext
+from game_agents.hedging import HedgedCaller
+from game_agents.model_router import ModelRouter
+from simulation.game_runner import play_game
+from simulation.night_cache import NightCache
+from simulation.results_store import GameRecord, ResultsStore, ResultsStoreWriter
+
+
+class BatchRunner:
+    """Plays many seeded games and streams their results into a columnar results store"""
+    
+    def __init__(
+            self,
+            game_config: dict,
+            store_path: str,
+            base_seed: int = 0,
+            flush_every: int = 100,
+            verbose: bool = False,
+            pool_objects: bool = False,
+            night_cache: Optional[NightCache] = None
+    ):
+        self.game_config = game_config
+        self.store_path = store_path
+        self.base_seed = base_seed
+        self.flush_every = flush_every
+        self.verbose = verbose
+        self.failed_games: List[Tuple[int, str]] = []
+        # Shared across games so route latency percentiles (and hedging) warm up over the batch
+        self.router = ModelRouter.from_config(game_config.get("model_routing"))
+        self.hedger = HedgedCaller.from_config(self.router, game_config.get("hedging"))
+        # Opt-in: recycle each recorded game's agents and context into the next game. Only pays off
+        # where building agents is expensive (one OpenAI client each); resetting scripted seats costs
+        # more than building them fresh (see benchmarks/pooling.py)
+        self.agent_pool: Optional[AgentPool] = AgentPool() if pool_objects else None
+        self._spare_context: Optional[GameContext] = None
+        # Nights recorded by this or other batches, replayed by games that deal the same cards from the same seed
+        self.night_cache = night_cache
+    
+    def run(self, num_games: int) -> int:
+        """
+        Play and store num_games games
+        
+        Seeds continue after the highest seed already in the store, so re-running a batch
+        against the same path extends it instead of replaying the same deals.
+        
+        Args:
+            num_games: Number of games to play
+        
+        Returns:
+            Number of games written to the store
+        """
+        written = 0
+        try:
+            with ResultsStoreWriter(self.store_path, flush_every=self.flush_every) as writer:
+                first_seed = self.base_seed
+                if writer.num_games:
+                    first_seed = max(first_seed, int(ResultsStore(self.store_path)["seed"].max()) + 1)
+            
+                for seed in range(first_seed, first_seed + num_games):
+                    on_setup, after_night = self.night_cache.hooks(self.game_config, seed) if self.night_cache is not None else (None, None)
+                    try:
+                        game_context, outcome = play_game(
+                            self.game_config,
+                            seed=seed,
+                            verbose=self.verbose,
+                            router=self.router,
+                            hedger=self.hedger,
+                            agent_pool=self.agent_pool,
+                            game_context=self._spare_context,
+                            on_setup=on_setup,
+                            after_night=after_night
+                        )
+                    except Exception as e:
+                        # A failed game's objects may be half set up; let them go rather than reuse them
+                        self._spare_context = None
+                        self.failed_games.append((seed, str(e)))
+                        if self.verbose:
+                            print(f"❌ Game with seed {seed} failed: {str(e)}")
+                        continue
+                
+                    writer.append(GameRecord.from_game(game_context, outcome, seed=seed))
+                    written += 1
+                    if self.agent_pool is not None:
+                        self.agent_pool.release(game_context.players.values())
+                        self._spare_context = game_context
+        finally:
+            # The batch owns its hedger; its threads start again on the next run
+            if self.hedger is not None:
+                self.hedger.shutdown()
+        
+        return written
@@ -0,0 +1,264 @@
+import math
+import random
+from functools import partial
+from statistics import NormalDist, fmean, variance
+from typing import Dict, List, Optional, Tuple
+from pydantic import BaseModel, Field
+from game_agents.hedging import HedgedCaller
+from game_agents.model_router import ModelRouter
+from game_context.game_context import GameContext
+from setup import deal_roles, get_seat_agent_type
+from simulation.game_runner import play_game
+from simulation.tournament import AgentVariant
+
+# Route that sends every night action to the scripted policy, which draws from the game's seeded rng
+SCRIPTED_NIGHT_ROUTE = {"name": "experiment-scripted-night", "phase": "night", "call_type": "night_action", "model": None}
+
+
+def scripted_night_routing(routing_config: Optional[dict]) -> dict:
+    """A copy of a "model_routing" section whose night actions are all scripted"""
+    routing_config = dict(routing_config or {})
+    routes = [route for route in routing_config.get("routes", []) if route.get("call_type") != "night_action"]
+    # Declared first, so it also wins ties with role-wide night routes
+    routing_config["routes"] = [SCRIPTED_NIGHT_ROUTE] + routes
+    return routing_config
+
+
+class PairedGame(BaseModel):
+    """Both arms of one seeded deal: the tested seats' score and the tokens spent in each"""
+    seed: int
+    tested_seats: List[int]
+    control: float
+    treatment: float
+    control_tokens: int = 0
+    treatment_tokens: int = 0
+
+    @property
+    def difference(self) -> float:
+        return self.treatment - self.control
+
+
+class PairedResult(BaseModel):
+    """Paired comparison of two arms, and how many games an unpaired test would have needed"""
+    control: str
+    treatment: str
+    pairs: int
+    skipped_deals: int
+    control_mean: float
+    treatment_mean: float
+    difference: float
+    standard_error: float
+    ci_low: float
+    ci_high: float
+    p_value: float
+    unpaired_standard_error: float
+    variance_reduction: float
+    treatment_better: int
+    control_better: int
+    tokens_per_pair: float
+    confidence: float
+    failed_seeds: List[Tuple[int, str]] = Field(default_factory=list)
+
+    def games_needed(self, effect: float, power: float = 0.8, paired: bool = True) -> Optional[int]:
+        """
+        Games per arm to detect a difference of effect at this result's confidence with the given power
+
+        Scales the observed standard error: paired uses the spread of the per-deal differences,
+        unpaired the spread of two independent samples. None before there's any spread to scale.
+        """
+        standard_error = self.standard_error if paired else self.unpaired_standard_error
+        if effect <= 0 or self.pairs < 2 or standard_error <= 0:
+            return None
+        z = NormalDist().inv_cdf(0.5 + self.confidence / 2) + NormalDist().inv_cdf(power)
+        deviation = standard_error * math.sqrt(self.pairs)
+        return math.ceil((z * deviation / effect) ** 2)
+
+
+class PairedExperiment:
+    """
+    A/B test of one component on identical games, using common random numbers
+
+    Win rates swing far more with the deal and the night than with any one change to an agent,
+    so comparing two independent samples needs many games. Here both arms replay the same seed:
+    the same deal, the same night (night actions go to the scripted policy, which draws from the
+    seeded game rng, so a role's night prompt is only tested with script_night off), and the same
+    agents everywhere except at the tested seats, the seats dealt one of the tested roles, which
+    play the control variant in one arm and the treatment variant in the other. Every other seat
+    routes its calls by the config's "model_routing" in both arms; a variant's own routing only
+    applies to the tested seats. The per-deal difference cancels the luck the two games share,
+    so its spread is what the test pays for.
+    Deals without a tested role are skipped unplayed.
+
+    Args:
+        game_config: Game configuration in the shape of game_config.json (human seats are ignored)
+        control: Variant the tested seats play in the control arm
+        treatment: Variant the tested seats play in the treatment arm
+        roles: Roles whose seats are tested (None for every seat)
+        base_seed: Seed of the first deal
+        script_night: Replace every night action with the scripted policy, in both arms
+        confidence: Confidence of the difference's interval
+        verbose: Print each game as it is played
+    """
+    def __init__(
+            self,
+            game_config: dict,
+            control: AgentVariant,
+            treatment: AgentVariant,
+            roles: Optional[List[str]] = None,
+            base_seed: int = 0,
+            script_night: bool = True,
+            confidence: float = 0.95,
+            verbose: bool = False
+    ):
+        self.game_config = {**game_config, "number_human_players": 0}
+        self.control = control
+        self.treatment = treatment
+        self.roles = [role.lower() for role in roles] if roles else None
+        self.base_seed = base_seed
+        self.confidence = confidence
+        self.verbose = verbose
+        self.games: List[PairedGame] = []
+        self.skipped_deals = 0
+        self.failed_seeds: List[Tuple[int, str]] = []
+
+        # One router and hedger per arm, shared across its games, so each arm's tokens and latencies
+        # add up separately; a variant with its own routing gets a second pair for the tested seats
+        self._arms: Dict[str, Tuple[AgentVariant, ModelRouter, Optional[HedgedCaller], Optional[ModelRouter], Optional[HedgedCaller]]] = {}
+        for arm, variant in (("control", control), ("treatment", treatment)):
+            router = self._router(game_config.get("model_routing"), script_night)
+            variant_router = self._router(variant.model_routing, script_night) if variant.model_routing is not None else None
+            self._arms[arm] = (
+                variant,
+                router,
+                HedgedCaller.from_config(router, game_config.get("hedging")),
+                variant_router,
+                HedgedCaller.from_config(variant_router, game_config.get("hedging")) if variant_router is not None else None
+            )
+
+    @staticmethod
+    def _router(routing: Optional[dict], script_night: bool) -> ModelRouter:
+        return ModelRouter.from_config(scripted_night_routing(routing) if script_night else routing)
+
+    @property
+    def routers(self) -> Dict[str, ModelRouter]:
+        """Each arm's router for the seats that aren't tested"""
+        return {arm: router for arm, (_, router, _, _, _) in self._arms.items()}
+
+    @property
+    def variant_routers(self) -> Dict[str, Optional[ModelRouter]]:
+        """Each arm's router for the tested seats, None where the variant has no routing of its own"""
+        return {arm: variant_router for arm, (_, _, _, variant_router, _) in self._arms.items()}
+
+    def tested_seats(self, player_roles: List[str]) -> List[int]:
+        return [seat for seat, role in enumerate(player_roles) if self.roles is None or role.lower() in self.roles]
+
+    def _configure(self, arm: str, tested_seats: List[int], game_context: GameContext) -> None:
+        variant, _, _, variant_router, variant_hedger = self._arms[arm]
+        for seat in tested_seats:
+            variant.apply(game_context.players[seat], router=variant_router, hedger=variant_hedger)
+
+    def play_arm(self, arm: str, seed: int, player_roles: List[str], tested_seats: List[int]) -> Tuple[float, int]:
+        """Play the deal from seed with the arm's variant at the tested seats; their win share and the game's tokens"""
+        variant, router, hedger, _, _ = self._arms[arm]
+        seat_agent_types = [
+            variant.agent_type if seat in tested_seats else get_seat_agent_type(self.game_config, seat)
+            for seat in range(len(player_roles))
+        ]
+        game_context, outcome = play_game(
+            {**self.game_config, "seat_agent_types": seat_agent_types},
+            seed=seed,
+            verbose=self.verbose,
+            router=router,
+            hedger=hedger,
+            on_setup=partial(self._configure, arm, tested_seats)
+        )
+        winners = set(outcome.winners)
+        score = sum(seat in winners for seat in tested_seats) / len(tested_seats)
+        tokens = sum(sum(getattr(agent, "token_usage", {}).values()) for agent in game_context.players.values())
+        return score, tokens
+
+    def play_pair(self, seed: int) -> Optional[PairedGame]:
+        """Play both arms of the deal from seed; None if it has no tested seat or either arm failed"""
+        player_roles, _ = deal_roles(self.game_config, random.Random(seed))
+        tested_seats = self.tested_seats(player_roles)
+        if not tested_seats:
+            self.skipped_deals += 1
+            return None
+        try:
+            control, control_tokens = self.play_arm("control", seed, player_roles, tested_seats)
+            treatment, treatment_tokens = self.play_arm("treatment", seed, player_roles, tested_seats)
+        except Exception as e:
+            self.failed_seeds.append((seed, str(e)))
+            if self.verbose:
+                print(f"❌ Pair with seed {seed} failed: {str(e)}")
+            return None
+        game = PairedGame(
+            seed=seed,
+            tested_seats=tested_seats,
+            control=control,
+            treatment=treatment,
+            control_tokens=control_tokens,
+            treatment_tokens=treatment_tokens
+        )
+        self.games.append(game)
+        return game
+
+    def run(self, num_pairs: int, max_deals: Optional[int] = None) -> PairedResult:
+        """Play deals from base_seed until num_pairs are paired (or max_deals are dealt) and compare the arms"""
+        max_deals = max_deals if max_deals is not None else num_pairs * 20
+        seed = self.base_seed
+        try:
+            while len(self.games) < num_pairs and seed < self.base_seed + max_deals:
+                self.play_pair(seed)
+                seed += 1
+        finally:
+            for _, _, hedger, _, variant_hedger in self._arms.values():
+                for owned in (hedger, variant_hedger):
+                    if owned is not None:
+                        owned.shutdown()
+        return self.result()
+
+    def result(self) -> PairedResult:
+        """Paired statistics over the pairs played so far"""
+        pairs = len(self.games)
+        control = [game.control for game in self.games]
+        treatment = [game.treatment for game in self.games]
+        differences = [game.difference for game in self.games]
+
+        control_mean = fmean(control) if control else 0.0
+        treatment_mean = fmean(treatment) if treatment else 0.0
+        difference = treatment_mean - control_mean
+        if pairs >= 2:
+            standard_error = math.sqrt(variance(differences) / pairs)
+            unpaired_standard_error = math.sqrt((variance(control) + variance(treatment)) / pairs)
+        else:
+            standard_error = unpaired_standard_error = 0.0
+
+        z = NormalDist().inv_cdf(0.5 + self.confidence / 2)
+        if standard_error > 0:
+            p_value = 2 * (1 - NormalDist().cdf(abs(difference) / standard_error))
+        else:
+            p_value = 1.0 if difference == 0 else 0.0
+        # Share of the unpaired variance the pairing removes; games needed shrink by the same factor
+        variance_reduction = 1 - (standard_error / unpaired_standard_error) ** 2 if unpaired_standard_error > 0 else 0.0
+
+        return PairedResult(
+            control=self.control.name,
+            treatment=self.treatment.name,
+            pairs=pairs,
+            skipped_deals=self.skipped_deals,
+            control_mean=control_mean,
+            treatment_mean=treatment_mean,
+            difference=difference,
+            standard_error=standard_error,
+            ci_low=difference - z * standard_error,
+            ci_high=difference + z * standard_error,
+            p_value=p_value,
+            unpaired_standard_error=unpaired_standard_error,
+            variance_reduction=variance_reduction,
+            treatment_better=sum(d > 0 for d in differences),
+            control_better=sum(d < 0 for d in differences),
+            tokens_per_pair=sum(game.control_tokens + game.treatment_tokens for game in self.games) / pairs if pairs else 0.0,
+            confidence=self.confidence,
+            failed_seeds=self.failed_seeds
+        )
@@ -0,0 +1,81 @@
+import random
+from typing import Callable, Optional, Tuple
+from game_context.game_context import GameContext
+from game_context.outcome import GameOutcome
+from game_context.day_budget import DayBudget
+from game_context.straw_poll import StrawPoll
+from game_agents.agent_pool import AgentPool
+from game_agents.hedging import HedgedCaller
+from game_agents.model_router import ModelRouter
+from game_agents.speculation import Speculator
+from play import NightPhaseManager, DayPhaseManager, MAX_ROUNDS_PRIOR_TO_VOTING
+from setup import setup_game_context
+
+
+def play_game(
+    game_config: dict,
+    seed: Optional[int] = None,
+    verbose: bool = False,
+    router: Optional[ModelRouter] = None,
+    hedger: Optional[HedgedCaller] = None,
+    agent_pool: Optional[AgentPool] = None,
+    game_context: Optional[GameContext] = None,
+    on_setup: Optional[Callable[[GameContext], None]] = None,
+    after_night: Optional[Callable[[GameContext], None]] = None
+) -> Tuple[GameContext, GameOutcome]:
+    """
+    Play one complete game (deal, night, discussion, vote) without user interaction
+    
+    Args:
+        game_config: Game configuration in the shape of game_config.json
+        seed: Seed for the deal and any in-game randomness (None for a random game)
+        verbose: Print the game as it is played
+        router: Model router shared across games (built from the config if None)
+        hedger: Hedged caller shared across games
+        agent_pool: Pool to seat agents from (release them back once the game is recorded)
+        game_context: A finished game's context to reset and reuse
+        on_setup: Called with the dealt game before the night starts, e.g. to configure its agents
+        after_night: Called with the game once the night is over, before the discussion starts
+    
+    Returns:
+        Tuple of (final game context, resolved outcome)
+    """
+    # A game given no router builds its own, with a hedger that is shut down once the game ends
+    owned_hedger = None
+    if router is None:
+        router = ModelRouter.from_config(game_config.get("model_routing"))
+        hedger = owned_hedger = HedgedCaller.from_config(router, game_config.get("hedging"))
+    
+    try:
+        game_context = setup_game_context(
+            game_config,
+            rng=random.Random(seed),
+            router=router,
+            hedger=hedger,
+            agent_pool=agent_pool,
+            game_context=game_context
+        )
+        if on_setup is not None:
+            on_setup(game_context)
+        
+        NightPhaseManager(game_context, verbose=verbose).execute_night_phase()
+        if after_night is not None:
+            after_night(game_context)
+        game_context.set_nighttime(False)
+        
+        day_manager = DayPhaseManager(
+            game_context,
+            max_rounds=game_config.get("max_rounds", MAX_ROUNDS_PRIOR_TO_VOTING),
+            verbose=verbose,
+            straw_poll=StrawPoll.from_config(game_config),
+            day_budget=DayBudget.from_config(game_config),
+            speculator=Speculator.from_config(game_config)
+        )
+        outcome = day_manager.execute_day_phase()
+    finally:
+        if game_context is not None:
+            game_context.close()
+        if owned_hedger is not None:
+            owned_hedger.shutdown()
+    
+    return game_context, outcome
@@ -0,0 +1,122 @@
+import copy
+import json
+import random
+from array import array
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Tuple
+from game_context.game_context import NIGHT_PHASE_ORDER, GameContext
+from setup import deal_roles
+
+# Config sections only the day reads; configs that differ only in these play the same night
+DAY_ONLY_SECTIONS = ("max_rounds", "early_stop", "day_budget", "speculation", "human_io", "game_server")
+
+
+def _tool_call(action: Dict[str, Any], game_context: GameContext) -> Optional[Tuple[str, dict]]:
+    """The tool call that made a logged night action; None for automatic ones (the lone werewolf's peek)"""
+    kind, targets = action["action"], action["targets"]
+    name_of = lambda player_id: game_context.players[player_id].player_name
+    if kind == "seer_player":
+        return "seer_investigate", {"investigation_type": "player", "target_player_name": name_of(targets[0]), "card_positions": []}
+    if kind == "seer_center":
+        return "seer_investigate", {"investigation_type": "center", "target_player_name": "", "card_positions": list(targets)}
+    if kind == "robber":
+        return "robber_swap", {"target_player_name": name_of(targets[0])}
+    if kind == "troublemaker":
+        return "troublemaker_swap", {"player1_name": name_of(targets[0]), "player2_name": name_of(targets[1])}
+    if kind == "drunk":
+        return "drunk_swap", {"center_position": targets[0]}
+    return None
+
+
+class NightRecording:
+    """
+    The choices a finished night was played with, and the game rng as the night left it
+
+    Replaying a recording on the same deal makes every choosing role take its recorded tool
+    call instead of asking its model or drawing from the rng; automatic actions run as usual
+    (the lone werewolf's draw comes first in the night, so it sees the same rng). Once the night
+    is over the rng is put back where the recorded night left it, so the day draws the same too.
+    """
+    def __init__(self, choices: Dict[int, Tuple[str, dict]], rng_state: tuple):
+        self.choices = choices
+        # The Mersenne Twister state packed as 32-bit words: a tenth of the size of the tuple of ints
+        version, internal_state, gauss_next = rng_state
+        self._rng_state = (version, array("I", internal_state), gauss_next)
+
+    @property
+    def rng_state(self) -> tuple:
+        version, internal_state, gauss_next = self._rng_state
+        return version, tuple(internal_state), gauss_next
+
+    @classmethod
+    def from_game(cls, game_context: GameContext) -> "NightRecording":
+        """Record the night just played; call before the day draws from the rng"""
+        choices = {}
+        for action in game_context.night_action_log:
+            tool_call = _tool_call(action, game_context)
+            if tool_call is not None:
+                choices[action["player_id"]] = tool_call
+        return cls(choices, game_context.rng.getstate())
+
+    def choose(self, agent: Any, game_context: GameContext) -> Optional[Tuple[str, dict]]:
+        """Night policy that gives each agent its recorded choice; None if it made none"""
+        choice = self.choices.get(agent.player_id)
+        return copy.deepcopy(choice) if choice is not None else None
+
+    def replay_on(self, game_context: GameContext) -> None:
+        """Have the dealt game's agents replay this night; called before the night starts"""
+        for agent in game_context.players.values():
+            agent.night_policy = self.choose
+
+    def restore(self, game_context: GameContext) -> None:
+        """Put the rng where the recorded night left it; called once the replayed night is over"""
+        game_context.rng.setstate(self.rng_state)
+        for agent in game_context.players.values():
+            agent.night_policy = None
+
+
+class NightCache:
+    """
+    Recorded nights shared by every game whose deal looks the same to the night
+
+    A game is keyed on what its night can see: the seed, the seats dealt a role that acts at
+    night (and so the number of seats), the center cards and every config section the night
+    reads except the deck. Seats holding a role with no night action can hold any of them, so
+    decks that differ only in those cards (a tanner for a villager, say) share nights whenever
+    the deal puts their night roles in the same seats. Sections only the day reads are left
+    out too. The first game with a key plays its night and records it; later games with the
+    key replay it, skipping the night's model calls and playing out the same night.
+    """
+    def __init__(self):
+        self._nights: Dict[tuple, NightRecording] = {}
+        # Each distinct night config once, so keys hold a small id rather than their own copy of it
+        self._night_configs: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._nights)
+
+    def key(self, game_config: dict, seed: int) -> tuple:
+        night_config = {
+            section: value for section, value in game_config.items()
+            if section not in DAY_ONLY_SECTIONS and section != "available_roles"
+        }
+        config_id = self._night_configs.setdefault(json.dumps(night_config, sort_keys=True, default=str), len(self._night_configs))
+        player_roles, center_cards = deal_roles(game_config, random.Random(seed))
+        player_roles = [role.lower() for role in player_roles]
+        night_seats = tuple((seat, role) for seat, role in enumerate(player_roles) if role in NIGHT_PHASE_ORDER)
+        return seed, len(player_roles), night_seats, tuple(role.lower() for role in center_cards), config_id
+
+    def hooks(self, game_config: dict, seed: int) -> Tuple[Optional[Callable[[GameContext], None]], Callable[[GameContext], None]]:
+        """play_game's (on_setup, after_night) for a game: replay the cached night, or record a new one"""
+        key = self.key(game_config, seed)
+        recording = self._nights.get(key)
+        if recording is None:
+            self.misses += 1
+            return None, partial(self._record, key)
+        self.hits += 1
+        return recording.replay_on, recording.restore
+
+    def _record(self, key: tuple, game_context: GameContext) -> None:
+        self._nights[key] = NightRecording.from_game(game_context)
@@ -0,0 +1,315 @@
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from game_context.game_context import GameContext
+from game_context.outcome import GameOutcome, Team
+from game_context.roles import Role
+
+# Version 2 added claimed_roles, contradictions and discussion_rounds; stores written before
+# a column existed read it as empty (see ResultsStore.has_column)
+STORE_VERSION = 2
+MAX_SEATS = 10
+NUM_CENTER_CARDS = 3
+
+# Integer codes used in the fixed-width columns; -1 always means "empty"
+ROLE_NAMES: List[str] = [role.value for role in Role]
+ROLE_CODES: Dict[str, int] = {name: code for code, name in enumerate(ROLE_NAMES)}
+TEAM_NAMES: List[str] = [team.value for team in Team]
+NIGHT_ACTION_NAMES: List[str] = ["none", "werewolf_center", "seer_player", "seer_center", "robber", "troublemaker", "drunk"]
+NIGHT_ACTION_CODES: Dict[str, int] = {name: code for code, name in enumerate(NIGHT_ACTION_NAMES)}
+
+# Column name -> (dtype, per-game shape)
+COLUMNS: Dict[str, Tuple[str, Tuple[int, ...]]] = {
+    "seed": ("<i8", ()),
+    "num_players": ("<u1", ()),
+    "initial_roles": ("<i1", (MAX_SEATS,)),
+    "final_roles": ("<i1", (MAX_SEATS,)),
+    "initial_center": ("<i1", (NUM_CENTER_CARDS,)),
+    "final_center": ("<i1", (NUM_CENTER_CARDS,)),
+    "night_actions": ("<i1", (MAX_SEATS, 3)),  # [action code, target a, target b] per seat
+    "votes": ("<i1", (MAX_SEATS,)),  # seat voted for, -1 for no vote
+    "eliminated": ("|b1", (MAX_SEATS,)),
+    "winners": ("|b1", (MAX_SEATS,)),
+    "winning_teams": ("<u1", ()),  # bitmask over TEAM_NAMES
+    "prompt_tokens": ("<i4", (MAX_SEATS,)),
+    "completion_tokens": ("<i4", (MAX_SEATS,)),
+    "claimed_roles": ("<i1", (MAX_SEATS,)),  # last role each seat claimed in public, -1 for none
+    "contradictions": ("<u1", (MAX_SEATS,)),  # contradictions each seat was part of (see game_context.claims)
+    "discussion_rounds": ("<u1", ()),  # rounds played before the vote (fewer than max_rounds if the table settled)
+}
+
+META_FILE = "meta.json"
+TRANSCRIPTS_FILE = "transcripts.bin"
+TRANSCRIPT_OFFSETS_FILE = "transcript_offsets.i8"
+
+
+def _column_file(name: str) -> str:
+    return f"{name}.col"
+
+
+def _empty_value(name: str):
+    """What a column holds for "nothing recorded": -1 in signed integer columns, 0 (False) otherwise"""
+    return -1 if np.dtype(COLUMNS[name][0]).kind == "i" else 0
+
+
+def _row_nbytes(name: str) -> int:
+    dtype, shape = COLUMNS[name]
+    return np.dtype(dtype).itemsize * int(np.prod(shape, dtype=np.int64))
+
+
+class GameRecord:
+    """One finished game flattened into fixed-width column rows plus its transcript"""
+    def __init__(self, columns: Dict[str, np.ndarray], transcript: str = ""):
+        self.columns = columns
+        self.transcript = transcript
+
+    @classmethod
+    def from_game(cls, game_context: GameContext, outcome: GameOutcome, seed: int = -1, include_private: bool = True) -> "GameRecord":
+        """
+        Build a record from a finished game
+
+        Args:
+            game_context: Game state after the vote
+            outcome: Resolved outcome of the vote
+            seed: Seed the game was dealt with (-1 if unknown)
+            include_private: Store private thoughts and tool calls in the transcript
+
+        Returns:
+            GameRecord ready to be appended to a results store
+        """
+        columns = {name: np.full(shape, -1 if np.dtype(dtype).kind == "i" else 0, dtype=dtype) for name, (dtype, shape) in COLUMNS.items()}
+        columns["prompt_tokens"][:] = 0
+        columns["completion_tokens"][:] = 0
+        columns["contradictions"][:] = 0
+        seat_of = {player_id: seat for seat, player_id in enumerate(sorted(game_context.players))}
+        columns["night_actions"][:len(seat_of), 0] = NIGHT_ACTION_CODES["none"]
+
+        columns["seed"][...] = seed
+        columns["num_players"][...] = len(game_context.players)
+
+        for player_id, seat in seat_of.items():
+            player = game_context.get_player(player_id)
+            columns["initial_roles"][seat] = ROLE_CODES[player.initial_role.lower()]
+            columns["final_roles"][seat] = ROLE_CODES[player.current_role.lower()]
+            token_usage = getattr(player, "token_usage", {})
+            columns["prompt_tokens"][seat] = token_usage.get("prompt_tokens", 0)
+            columns["completion_tokens"][seat] = token_usage.get("completion_tokens", 0)
+
+        columns["initial_center"][:] = [ROLE_CODES[role.value] for role in game_context.initial_center_cards]
+        columns["final_center"][:] = [ROLE_CODES[role.value] for role in game_context.center_cards]
+
+        for action in game_context.night_action_log:
+            seat = seat_of[action["player_id"]]
+            # Player targets are stored as seats, center targets as center positions
+            targets = [seat_of.get(target, target) if action["action"] in ("seer_player", "robber", "troublemaker") else target for target in action["targets"]]
+            row = columns["night_actions"][seat]
+            row[0] = NIGHT_ACTION_CODES[action["action"]]
+            for i, target in enumerate(targets[:2]):
+                row[i + 1] = target
+
+        for voter_id, target_id in outcome.votes.items():
+            columns["votes"][seat_of[voter_id]] = seat_of[target_id]
+        for player_id in outcome.eliminated:
+            columns["eliminated"][seat_of[player_id]] = True
+        for player_id in outcome.winners:
+            columns["winners"][seat_of[player_id]] = True
+        columns["winning_teams"][...] = sum(1 << TEAM_NAMES.index(team.value) for team in outcome.winning_teams)
+        columns["discussion_rounds"][...] = game_context.conversation.current_round
+
+        claims = game_context.conversation.claims
+        for player_id, claim in claims.role_claims.items():
+            columns["claimed_roles"][seat_of[player_id]] = ROLE_CODES[claim.role]
+        for contradiction in claims.contradictions:
+            for player_id in contradiction.player_ids:
+                seat = seat_of[player_id]
+                columns["contradictions"][seat] = min(int(columns["contradictions"][seat]) + 1, 255)
+
+        if include_private:
+            transcript = game_context.conversation.get_full_conversation_history()
+        else:
+            transcript = game_context.conversation.get_public_conversation_history()
+
+        return cls(columns, transcript)
+
+
+class ResultsStoreWriter:
+    """
+    Appends game records to a columnar results store on disk
+
+    Rows are buffered and written in batches. Each column is a flat binary file of fixed-width
+    rows, and transcripts go into a single blob indexed by an offsets file. The game count in
+    meta.json is only bumped after the data is written, so a reader never sees a partial batch
+    and a crashed writer can be reopened to continue appending.
+    """
+    def __init__(self, path: str, flush_every: int = 1000):
+        self.path = path
+        self.flush_every = flush_every
+        self._buffer: List[GameRecord] = []
+
+        os.makedirs(path, exist_ok=True)
+        meta_path = os.path.join(path, META_FILE)
+        if os.path.exists(meta_path):
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+            if meta["version"] != STORE_VERSION or meta["columns"] != _columns_meta():
+                # Older stores stay readable (see ResultsStore) but new games go in a new store
+                raise ValueError(f"Results store at {path} has an incompatible layout (version {meta['version']}, expected {STORE_VERSION})")
+            self.num_games = meta["num_games"]
+            self._transcript_end = self._truncate_uncommitted()
+        else:
+            self.num_games = 0
+            self._transcript_end = 0
+            for name in COLUMNS:
+                open(os.path.join(path, _column_file(name)), "wb").close()
+            open(os.path.join(path, TRANSCRIPTS_FILE), "wb").close()
+            np.zeros(1, dtype="<i8").tofile(os.path.join(path, TRANSCRIPT_OFFSETS_FILE))
+            self._write_meta()
+
+    def append(self, record: GameRecord) -> None:
+        """Buffer a record, flushing to disk once the batch is full"""
+        self._buffer.append(record)
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered records to disk and commit them in meta.json"""
+        if not self._buffer:
+            return
+
+        for name, (dtype, shape) in COLUMNS.items():
+            rows = np.stack([record.columns[name] for record in self._buffer]).astype(dtype, copy=False)
+            with open(os.path.join(self.path, _column_file(name)), "ab") as f:
+                rows.tofile(f)
+
+        new_offsets = []
+        with open(os.path.join(self.path, TRANSCRIPTS_FILE), "ab") as f:
+            for record in self._buffer:
+                encoded = record.transcript.encode("utf-8")
+                f.write(encoded)
+                self._transcript_end += len(encoded)
+                new_offsets.append(self._transcript_end)
+        with open(os.path.join(self.path, TRANSCRIPT_OFFSETS_FILE), "ab") as f:
+            np.asarray(new_offsets, dtype="<i8").tofile(f)
+
+        self.num_games += len(self._buffer)
+        self._buffer.clear()
+        self._write_meta()
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "ResultsStoreWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _write_meta(self) -> None:
+        meta = {
+            "version": STORE_VERSION,
+            "num_games": self.num_games,
+            "max_seats": MAX_SEATS,
+            "role_names": ROLE_NAMES,
+            "team_names": TEAM_NAMES,
+            "night_action_names": NIGHT_ACTION_NAMES,
+            "columns": _columns_meta(),
+        }
+        tmp_path = os.path.join(self.path, META_FILE + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(meta, f, indent=2)
+        os.replace(tmp_path, os.path.join(self.path, META_FILE))
+
+    def _truncate_uncommitted(self) -> int:
+        """Drop any rows written after the last committed meta.json (e.g. from a crash mid-flush), returning the transcript blob size"""
+        for name in COLUMNS:
+            with open(os.path.join(self.path, _column_file(name)), "r+b") as f:
+                f.truncate(self.num_games * _row_nbytes(name))
+
+        offsets_path = os.path.join(self.path, TRANSCRIPT_OFFSETS_FILE)
+        offsets = np.fromfile(offsets_path, dtype="<i8")
+        with open(offsets_path, "r+b") as f:
+            f.truncate((self.num_games + 1) * 8)
+        transcript_end = int(offsets[self.num_games])
+        with open(os.path.join(self.path, TRANSCRIPTS_FILE), "r+b") as f:
+            f.truncate(transcript_end)
+        return transcript_end
+
+
+class ResultsStore:
+    """
+    Read-only, memory-mapped view over a results store
+
+    Columns are returned as numpy memmaps of shape (num_games, *row_shape), so filtering and
+    aggregating across millions of games only touches the pages that are actually read.
+    Stores written by an older version can still be read; a column they predate reads as empty
+    (see has_column).
+    """
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, META_FILE), "r") as f:
+            self.meta = json.load(f)
+        if self.meta["version"] > STORE_VERSION:
+            raise ValueError(f"Results store at {path} was written by a newer version ({self.meta['version']} > {STORE_VERSION})")
+        self.num_games: int = self.meta["num_games"]
+        self.role_names: List[str] = self.meta["role_names"]
+        self.team_names: List[str] = self.meta["team_names"]
+        self.night_action_names: List[str] = self.meta["night_action_names"]
+        self._columns: Dict[str, np.memmap] = {}
+        self._offsets: Optional[np.memmap] = None
+        self._transcripts: Optional[np.memmap] = None
+
+    def __len__(self) -> int:
+        return self.num_games
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.column(name)
+
+    def has_column(self, name: str) -> bool:
+        """Whether the store recorded this column (stores from older versions lack the newer ones)"""
+        return name in self.meta["columns"]
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Memory-map a column as an array of shape (num_games, *row_shape)
+        
+        A column the store predates reads as a read-only array of its empty value (-1 in signed
+        integer columns, 0 otherwise).
+        """
+        if name not in COLUMNS:
+            raise KeyError(f"Unknown column: {name}")
+        if name not in self._columns:
+            dtype, shape = COLUMNS[name]
+            if not self.has_column(name):
+                self._columns[name] = np.broadcast_to(np.array(_empty_value(name), dtype=dtype), (self.num_games,) + shape)
+            elif self.num_games == 0:
+                self._columns[name] = np.empty((0,) + shape, dtype=dtype)
+            else:
+                self._columns[name] = np.memmap(
+                    os.path.join(self.path, _column_file(name)),
+                    dtype=dtype,
+                    mode="r",
+                    shape=(self.num_games,) + shape
+                )
+        return self._columns[name]
+
+    def transcript(self, game_index: int) -> str:
+        """Decode the transcript of a single game"""
+        if not 0 <= game_index < self.num_games:
+            raise IndexError(f"Game index {game_index} out of range")
+        if self._offsets is None:
+            self._offsets = np.memmap(os.path.join(self.path, TRANSCRIPT_OFFSETS_FILE), dtype="<i8", mode="r", shape=(self.num_games + 1,))
+        start, end = int(self._offsets[game_index]), int(self._offsets[game_index + 1])
+        if start == end:
+            return ""
+        if self._transcripts is None:
+            self._transcripts = np.memmap(os.path.join(self.path, TRANSCRIPTS_FILE), dtype=np.uint8, mode="r")
+        return self._transcripts[start:end].tobytes().decode("utf-8")
+
+    def role_code(self, role: Role) -> int:
+        """Integer code used for a role in the role columns"""
+        return self.role_names.index(role.value)
+
+
+def _columns_meta() -> Dict[str, List]:
+    return {name: [dtype, list(shape)] for name, (dtype, shape) in COLUMNS.items()}
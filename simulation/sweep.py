@@ -0,0 +1,230 @@
+import itertools
+import os
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+from game_context.roles import Role
+from simulation.analytics.arrays import GameArrays
+from simulation.analytics.metrics import deception_success, swap_chain_stats, vote_accuracy
+from simulation.batch_runner import BatchRunner
+from simulation.night_cache import NightCache
+from simulation.results_store import META_FILE, NUM_CENTER_CARDS, TEAM_NAMES, ResultsStore
+
+MIN_PLAYERS = 3
+MAX_PLAYERS = 10
+
+# Metrics computed for every swept config, in cube column order
+SWEEP_METRICS = [
+    "games",
+    *(f"{team}_win_rate" for team in TEAM_NAMES),
+    "balance",
+    "vote_accuracy",
+    "werewolf_survival_rate",
+    "changed_seats_per_game",
+    "discussion_rounds",
+    "contradictions_per_player",
+]
+
+Composition = Tuple[str, ...]
+
+
+def canonical_composition(roles: Iterable[str]) -> Composition:
+    """A deck as a sorted tuple of role names, so the same multiset of cards always reads the same"""
+    composition = tuple(sorted(Role(role.lower()).value for role in roles))
+    num_players = len(composition) - NUM_CENTER_CARDS
+    if not MIN_PLAYERS <= num_players <= MAX_PLAYERS:
+        raise ValueError(f"A deck of {len(composition)} cards seats {num_players} players; expected {MIN_PLAYERS}-{MAX_PLAYERS}")
+    return composition
+
+
+def dedupe_compositions(compositions: Iterable[Iterable[str]]) -> List[Composition]:
+    """Canonical compositions with repeats (the same cards in any order) removed, first occurrence kept"""
+    return list(dict.fromkeys(canonical_composition(roles) for roles in compositions))
+
+
+def expand_compositions(role_counts: Dict[str, Sequence[int]], player_counts: Iterable[int] = range(MIN_PLAYERS, MAX_PLAYERS + 1)) -> List[Composition]:
+    """
+    Every deck allowed by a grid of role counts that seats one of the player counts
+
+    Args:
+        role_counts: Role name -> the numbers of that card to try, e.g. {"werewolf": [1, 2], "villager": [0, 1, 2]}
+        player_counts: Numbers of players to keep decks for (each deck also has 3 center cards)
+
+    Returns:
+        Canonical compositions, by deck size and then in grid order
+    """
+    roles = list(role_counts)
+    deck_sizes = {num_players + NUM_CENTER_CARDS for num_players in player_counts}
+    compositions = []
+    for counts in itertools.product(*(role_counts[role] for role in roles)):
+        if sum(counts) in deck_sizes:
+            compositions.append([role for role, count in zip(roles, counts) for _ in range(count)])
+    return sorted(dedupe_compositions(compositions), key=len)
+
+
+def composition_label(composition: Composition) -> str:
+    """Short, path-safe name for a composition, e.g. "robber-seer-3villager-2werewolf" """
+    counts: Dict[str, int] = {}
+    for role in composition:
+        counts[role] = counts.get(role, 0) + 1
+    return "-".join(f"{count}{role}" if count > 1 else role for role, count in counts.items())
+
+
+def store_metrics(store: ResultsStore) -> Dict[str, float]:
+    """The sweep metrics of one config's finished games"""
+    games = len(store)
+    if games == 0:
+        return {metric: float("nan") for metric in SWEEP_METRICS}
+    arrays = GameArrays.from_store(store)
+    winning_teams = np.asarray(store["winning_teams"])
+    metrics = {"games": float(games)}
+    for bit, team in enumerate(TEAM_NAMES):
+        metrics[f"{team}_win_rate"] = float((winning_teams >> bit & 1).mean())
+    metrics["balance"] = 1.0 - abs(metrics["village_win_rate"] - metrics["werewolf_win_rate"])
+    metrics["vote_accuracy"] = vote_accuracy(arrays)["rate"]
+    metrics["werewolf_survival_rate"] = deception_success(arrays)["survival_rate"]
+    metrics["changed_seats_per_game"] = swap_chain_stats(arrays)["changed_seats_per_game"]
+    # Stores written before these were recorded don't have them
+    metrics["discussion_rounds"] = float(np.asarray(store["discussion_rounds"]).mean()) if store.has_column("discussion_rounds") else float("nan")
+    metrics["contradictions_per_player"] = float((np.asarray(store["contradictions"]).sum(axis=1) / np.asarray(store["num_players"])).mean()) if store.has_column("contradictions") else float("nan")
+    return metrics
+
+
+class SweepCube:
+    """
+    Metrics of every swept config, as a (config x metric) array
+
+    Configs are (composition, variant) pairs; values[i, j] is metric j of config i, NaN for a
+    config with no finished games.
+    """
+    def __init__(self, configs: List[Tuple[Composition, str]], metrics: List[str], values: np.ndarray, night_hits: int = 0, night_misses: int = 0):
+        self.configs = configs
+        self.metrics = metrics
+        self.values = values
+        self.night_hits = night_hits
+        self.night_misses = night_misses
+
+    def value(self, composition: Iterable[str], metric: str, variant: str = "default") -> float:
+        row = self.configs.index((canonical_composition(composition), variant))
+        return float(self.values[row, self.metrics.index(metric)])
+
+    def column(self, metric: str) -> np.ndarray:
+        return self.values[:, self.metrics.index(metric)]
+
+    def rows(self) -> List[Dict]:
+        """One dict per config: its composition, variant, player count and every metric"""
+        return [
+            {
+                "composition": composition_label(composition),
+                "variant": variant,
+                "num_players": len(composition) - NUM_CENTER_CARDS,
+                **{metric: float(value) for metric, value in zip(self.metrics, row)},
+            }
+            for (composition, variant), row in zip(self.configs, self.values)
+        ]
+
+    def save(self, path: str) -> None:
+        """Write the cube as an .npz archive of its values, config labels and metric names"""
+        np.savez(
+            path,
+            values=self.values,
+            compositions=np.array([composition_label(composition) for composition, _ in self.configs]),
+            variants=np.array([variant for _, variant in self.configs]),
+            metrics=np.array(self.metrics)
+        )
+
+
+class CompositionSweep:
+    """
+    Plays every composition (and variant of the day settings) through the batch engine
+
+    Each config is a composition's deck written into the base config, plus a variant's config
+    overrides, and gets its own results store under store_dir. Every config plays the same
+    seeds, so compositions are compared on the same luck where their decks allow it. Nights are
+    shared through a NightCache: games that deal the night roles to the same seats and the same
+    center cards from the same seed, in configs that differ only in what the day reads (the
+    variants, and decks that differ only in roles with no night action), replay the first one's
+    night instead of playing their own. A sweep resumed on the same store_dir tops each store up
+    to games_per_config.
+
+    Args:
+        game_config: Base configuration in the shape of game_config.json (human seats are ignored)
+        compositions: Decks to sweep, in any order and with repeats; see expand_compositions
+        store_dir: Directory holding one results store per config
+        games_per_config: Games each config plays
+        variants: Variant name -> config overrides, e.g. {"short": {"max_rounds": 2}} (one "default" variant if None)
+        base_seed: Seed of every config's first game
+        reuse_nights: Replay nights across configs that share them
+        flush_every: Games between results store flushes
+        verbose: Print each game as it is played
+    """
+    def __init__(
+            self,
+            game_config: dict,
+            compositions: Iterable[Iterable[str]],
+            store_dir: str,
+            games_per_config: int = 200,
+            variants: Optional[Dict[str, dict]] = None,
+            base_seed: int = 0,
+            reuse_nights: bool = True,
+            flush_every: int = 100,
+            verbose: bool = False
+    ):
+        self.game_config = {**game_config, "number_human_players": 0}
+        self.compositions = dedupe_compositions(compositions)
+        self.store_dir = store_dir
+        self.games_per_config = games_per_config
+        self.variants = variants or {"default": {}}
+        self.base_seed = base_seed
+        self.flush_every = flush_every
+        self.verbose = verbose
+        self.night_cache: Optional[NightCache] = NightCache() if reuse_nights else None
+        self.failed_games: Dict[Tuple[Composition, str], List[Tuple[int, str]]] = {}
+
+    def configs(self) -> List[Tuple[Composition, str]]:
+        """Every (composition, variant) the sweep plays, grouped by composition so shared nights stay close"""
+        return [(composition, variant) for composition in self.compositions for variant in self.variants]
+
+    def config_for(self, composition: Composition, variant: str) -> dict:
+        return {**self.game_config, **self.variants[variant], "available_roles": list(composition)}
+
+    def store_path(self, composition: Composition, variant: str) -> str:
+        return os.path.join(self.store_dir, variant, composition_label(composition))
+
+    def run(self) -> SweepCube:
+        """Play every config up to games_per_config games and return the metric cube"""
+        for composition, variant in self.configs():
+            path = self.store_path(composition, variant)
+            played = len(ResultsStore(path)) if os.path.exists(os.path.join(path, META_FILE)) else 0
+            if played >= self.games_per_config:
+                continue
+            if self.verbose:
+                print(f"🃏 {variant}: {composition_label(composition)} ({played}/{self.games_per_config} games played)")
+            runner = BatchRunner(
+                self.config_for(composition, variant),
+                path,
+                base_seed=self.base_seed,
+                flush_every=self.flush_every,
+                verbose=self.verbose,
+                night_cache=self.night_cache
+            )
+            runner.run(self.games_per_config - played)
+            if runner.failed_games:
+                self.failed_games[(composition, variant)] = runner.failed_games
+        return self.cube()
+
+    def cube(self) -> SweepCube:
+        """The metric cube over every config's store as it stands"""
+        configs = self.configs()
+        values = np.full((len(configs), len(SWEEP_METRICS)), np.nan)
+        for row, (composition, variant) in enumerate(configs):
+            path = self.store_path(composition, variant)
+            if os.path.exists(os.path.join(path, META_FILE)):
+                metrics = store_metrics(ResultsStore(path))
+                values[row] = [metrics[metric] for metric in SWEEP_METRICS]
+        return SweepCube(
+            configs,
+            list(SWEEP_METRICS),
+            values,
+            night_hits=self.night_cache.hits if self.night_cache else 0,
+            night_misses=self.night_cache.misses if self.night_cache else 0
+        )
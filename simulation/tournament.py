@@ -0,0 +1,280 @@
+import math
+import random
+from functools import partial
+from statistics import NormalDist
+from typing import Any, Dict, List, Optional, Tuple
+from pydantic import BaseModel, Field
+from game_agents.hedging import HedgedCaller
+from game_agents.model_router import ModelRouter
+from game_context.game_context import GameContext
+from setup import deal_roles
+from simulation.game_runner import play_game
+
+INITIAL_RATING = 1500.0
+
+
+class AgentVariant(BaseModel):
+    """
+    One way of playing a seat that a tournament compares against others
+
+    Args:
+        name: Label the variant is rated under
+        agent_type: "llm" or "scripted"
+        roles: Roles the variant may be dealt (None for every role)
+        settings: Agent attributes set once the game is dealt, e.g. {"history_mode": "claims", "max_tool_steps": 2}
+        model_routing: Routing for this variant's agents, in the shape of the config's "model_routing"
+    """
+    name: str
+    agent_type: str = "llm"
+    roles: Optional[List[str]] = None
+    settings: Dict[str, Any] = Field(default_factory=dict)
+    model_routing: Optional[Dict[str, Any]] = None
+
+    def plays(self, role: str) -> bool:
+        return self.roles is None or role.lower() in (allowed.lower() for allowed in self.roles)
+
+    def apply(self, agent: Any, router: Optional[ModelRouter] = None, hedger: Optional[HedgedCaller] = None) -> None:
+        """Give a dealt agent this variant's settings, and its router if it has its own routing"""
+        for setting, value in self.settings.items():
+            setattr(agent, setting, value)
+        if router is not None:
+            agent.router = router
+            agent.hedger = hedger
+
+
+class RoleVariantRating(BaseModel):
+    """Games, wins and Elo rating of one variant playing one role"""
+    role: str
+    variant: str
+    games: int = 0
+    wins: int = 0
+    elo: float = INITIAL_RATING
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+
+def wilson_interval(wins: int, games: int, confidence: float) -> Tuple[float, float]:
+    """Wilson score interval for a win rate; (0, 1) before any games"""
+    if games == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    rate = wins / games
+    center = (rate + z * z / (2 * games)) / (1 + z * z / games)
+    half_width = z * math.sqrt(rate * (1 - rate) / games + z * z / (4 * games * games)) / (1 + z * z / games)
+    return max(center - half_width, 0.0), min(center + half_width, 1.0)
+
+
+class RatingTable:
+    """
+    Elo ratings and win counts per (role, variant)
+
+    One Night is a team game with hidden teams, so each seat is rated against the field: its
+    expected score comes from its rating and the mean rating of the other seats in the game,
+    and it scores 1 if it was among the winners. Ratings are kept per role because roles differ
+    so much in how often they win; variants are only compared within a role.
+    """
+    def __init__(self, k_factor: float = 24.0):
+        self.k_factor = k_factor
+        self.ratings: Dict[Tuple[str, str], RoleVariantRating] = {}
+
+    def get(self, role: str, variant: str) -> RoleVariantRating:
+        key = (role, variant)
+        if key not in self.ratings:
+            self.ratings[key] = RoleVariantRating(role=role, variant=variant)
+        return self.ratings[key]
+
+    def record_game(self, seats: List[Tuple[str, str, bool]]) -> None:
+        """Update ratings from one game's seats, each (role dealt, variant, won)"""
+        entries = [self.get(role, variant) for role, variant, _ in seats]
+        before = [entry.elo for entry in entries]
+        for index, (entry, (_, _, won)) in enumerate(zip(entries, seats)):
+            others = before[:index] + before[index + 1:]
+            field = sum(others) / len(others) if others else before[index]
+            expected = 1 / (1 + 10 ** ((field - before[index]) / 400))
+            entry.elo += self.k_factor * (float(won) - expected)
+            entry.games += 1
+            entry.wins += int(won)
+
+    def for_role(self, role: str) -> List[RoleVariantRating]:
+        return [rating for (rated_role, _), rating in self.ratings.items() if rated_role == role]
+
+    def leader(self, role: str, confidence: float) -> Optional[str]:
+        """The variant whose win rate interval lies above every other variant's for the role, if any"""
+        ratings = [rating for rating in self.for_role(role) if rating.games > 0]
+        if len(ratings) < 2:
+            return None
+        intervals = {rating.variant: wilson_interval(rating.wins, rating.games, confidence) for rating in ratings}
+        best = max(ratings, key=lambda rating: intervals[rating.variant][0]).variant
+        if all(intervals[best][0] > high for variant, (_, high) in intervals.items() if variant != best):
+            return best
+        return None
+
+    def rows(self, confidence: float) -> List[Dict[str, Any]]:
+        """Every rating with its win rate interval, by role and then best Elo first"""
+        rows = []
+        for rating in sorted(self.ratings.values(), key=lambda rating: (rating.role, -rating.elo)):
+            low, high = wilson_interval(rating.wins, rating.games, confidence)
+            rows.append({**rating.model_dump(), "win_rate": rating.win_rate, "ci_low": low, "ci_high": high})
+        return rows
+
+
+class TournamentResult(BaseModel):
+    """Ratings and stopping decision of a finished tournament"""
+    games_played: int
+    stopped_early: bool
+    confidence: float
+    leaders: Dict[str, Optional[str]]
+    ratings: List[Dict[str, Any]]
+    failed_games: List[Tuple[int, str]] = Field(default_factory=list)
+
+
+class Tournament:
+    """
+    Seats agent variants over many seeded deals and rates each variant per role
+
+    Every game is dealt from its seed; each seat then gets a variant chosen at random (also from
+    the seed) among those allowed to play the role it was dealt, so a replay seats the same
+    variants. Every check_every games, once min_games are played, the tournament looks at the
+    compared roles and stops as soon as each has a variant whose win rate interval sits above
+    all the others. Each look uses a Bonferroni share of 1 - confidence over all the looks the
+    tournament could make, so stopping at the first separation keeps the overall error rate.
+
+    Args:
+        game_config: Game configuration in the shape of game_config.json (human seats are ignored)
+        variants: Variants to compare
+        roles: Roles whose variants must separate before stopping (None for every role with two or more)
+        base_seed: Seed of the first game
+        k_factor: Elo K factor
+        confidence: Overall confidence of the stopping decision
+        min_games: Games played before the first look
+        max_games: Games played at most
+        check_every: Games between looks
+        verbose: Print each game as it is played
+    """
+    def __init__(
+            self,
+            game_config: dict,
+            variants: List[AgentVariant],
+            roles: Optional[List[str]] = None,
+            base_seed: int = 0,
+            k_factor: float = 24.0,
+            confidence: float = 0.95,
+            min_games: int = 50,
+            max_games: int = 2000,
+            check_every: int = 25,
+            verbose: bool = False
+    ):
+        if len({variant.name for variant in variants}) != len(variants):
+            raise ValueError("Tournament variants must have distinct names")
+        self.game_config = game_config
+        self.variants = variants
+        self.roles = [role.lower() for role in roles] if roles else None
+        self.base_seed = base_seed
+        self.confidence = confidence
+        self.min_games = min_games
+        self.max_games = max_games
+        self.check_every = check_every
+        self.verbose = verbose
+        self.ratings = RatingTable(k_factor)
+        self.failed_games: List[Tuple[int, str]] = []
+
+        looks = max(math.ceil((max_games - min_games) / check_every) + 1, 1)
+        self.look_confidence = 1 - (1 - confidence) / looks
+        # Shared across games so route latency percentiles (and hedging) warm up over the tournament
+        self.router = ModelRouter.from_config(game_config.get("model_routing"))
+        self.hedger = HedgedCaller.from_config(self.router, game_config.get("hedging"))
+        self._variant_routers = {
+            variant.name: ModelRouter.from_config(variant.model_routing)
+            for variant in variants if variant.model_routing is not None
+        }
+        self._variant_hedgers = {
+            name: HedgedCaller.from_config(router, game_config.get("hedging"))
+            for name, router in self._variant_routers.items()
+        }
+
+    def seat_variants(self, player_roles: List[str], seed: int) -> List[AgentVariant]:
+        """The variant for each seat of the game dealt from seed"""
+        rng = random.Random(f"tournament-seats-{seed}")
+        seated = []
+        for role in player_roles:
+            eligible = [variant for variant in self.variants if variant.plays(role)]
+            if not eligible:
+                raise ValueError(f"No tournament variant can play the {role} role")
+            seated.append(rng.choice(eligible))
+        return seated
+
+    def _configure(self, seated: List[AgentVariant], game_context: GameContext) -> None:
+        for player_id, agent in game_context.players.items():
+            variant = seated[player_id]
+            variant.apply(agent, self._variant_routers.get(variant.name), self._variant_hedgers.get(variant.name))
+
+    def compared_roles(self) -> List[str]:
+        if self.roles is not None:
+            return self.roles
+        return sorted({role for role, _ in self.ratings.ratings if len(self.ratings.for_role(role)) >= 2})
+
+    def leaders(self, confidence: Optional[float] = None) -> Dict[str, Optional[str]]:
+        """The separated leader (or None) of each compared role"""
+        confidence = self.look_confidence if confidence is None else confidence
+        return {role: self.ratings.leader(role, confidence) for role in self.compared_roles()}
+
+    def play_one(self, seed: int) -> bool:
+        """Play and rate the game dealt from seed; False if it failed"""
+        player_roles, _ = deal_roles(self.game_config, random.Random(seed))
+        seated = self.seat_variants(player_roles, seed)
+        game_config = {
+            **self.game_config,
+            "number_human_players": 0,
+            "seat_agent_types": [variant.agent_type for variant in seated],
+        }
+        try:
+            game_context, outcome = play_game(
+                game_config,
+                seed=seed,
+                verbose=self.verbose,
+                router=self.router,
+                hedger=self.hedger,
+                on_setup=partial(self._configure, seated)
+            )
+        except Exception as e:
+            self.failed_games.append((seed, str(e)))
+            if self.verbose:
+                print(f"❌ Game with seed {seed} failed: {str(e)}")
+            return False
+
+        winners = set(outcome.winners)
+        self.ratings.record_game([
+            (agent.initial_role.lower(), seated[player_id].name, player_id in winners)
+            for player_id, agent in game_context.players.items()
+        ])
+        return True
+
+    def run(self) -> TournamentResult:
+        """Play until every compared role has a separated leader, or max_games are played"""
+        played = 0
+        stopped_early = False
+        try:
+            for seed in range(self.base_seed, self.base_seed + self.max_games):
+                if not self.play_one(seed):
+                    continue
+                played += 1
+                if played >= self.min_games and (played - self.min_games) % self.check_every == 0:
+                    leaders = self.leaders()
+                    if leaders and all(leaders.values()):
+                        stopped_early = played < self.max_games
+                        break
+        finally:
+            for hedger in [self.hedger, *self._variant_hedgers.values()]:
+                if hedger is not None:
+                    hedger.shutdown()
+
+        return TournamentResult(
+            games_played=played,
+            stopped_early=stopped_early,
+            confidence=self.confidence,
+            leaders=self.leaders(),
+            ratings=self.ratings.rows(self.look_confidence),
+            failed_games=self.failed_games
+        )
@@ -0,0 +1,19 @@
+import json
+import os
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Model-backed agents build an OpenAI client on first use; tests replace or never reach it
+os.environ.setdefault("OPENAI_API_KEY", "test-only")
+
+
+@pytest.fixture
+def game_config() -> dict:
+    """The repo's game config with every seat scripted, so games run without a model"""
+    with open(os.path.join(ROOT, "game_config.json")) as f:
+        config = json.load(f)
+    config["number_human_players"] = 0
+    config["default_agent_type"] = "scripted"
+    config["seat_agent_types"] = []
+    return config
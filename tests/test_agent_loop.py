@@ -0,0 +1,174 @@
+import random
+import threading
+import time
+from types import SimpleNamespace
+import openai
+from game_context.messages import ConversationHistory
+from setup import setup_game_context
+
+
+class SlowClient:
+    """Fake OpenAI client whose calls take until their request timeout and then time out"""
+    def __init__(self):
+        self.timeouts = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._complete, parse=self._complete))
+
+    def _complete(self, **params):
+        self.timeouts.append(params.get("timeout"))
+        time.sleep(min(params.get("timeout") or 5.0, 5.0))
+        raise openai.APITimeoutError(request=None)
+
+
+def _day_game(game_config: dict, client) -> tuple:
+    config = {**game_config, "default_agent_type": "llm", "hedging": {"enabled": False}}
+    game_context = setup_game_context(config, rng=random.Random(0), client_factory=lambda: client)
+    game_context.set_nighttime(False)
+    agent = game_context.players[0]
+    agent.stream_responses = False
+    return game_context, agent
+
+
+def test_turn_deadline_bounds_the_model_call_in_flight(game_config):
+    client = SlowClient()
+    game_context, agent = _day_game(game_config, client)
+    agent.max_turn_seconds = 0.2
+
+    start = time.monotonic()
+    response = agent.act("Your turn to speak.", game_state=game_context)
+
+    assert time.monotonic() - start < 1.0
+    assert client.timeouts and client.timeouts[0] <= 0.2
+    assert response.public_response == "(stays quiet)"
+
+
+def test_turn_deadline_gives_up_inquiries_still_running(game_config):
+    game_context, agent = _day_game(game_config, SlowClient())
+    names = [player.player_name for player in game_context.players.values() if player is not agent][:2]
+    tool_calls = [
+        SimpleNamespace(id=f"call_{index}", function=SimpleNamespace(name="inquire_about_another_player", arguments=f'{{"player_name": "{name}", "question": "What are you?"}}'))
+        for index, name in enumerate(names)
+    ]
+    agent._call_tool_with_repair = lambda name, args, raw_arguments, game_context, message_id=None: time.sleep(2.0) or (name, args, "late")
+
+    start = time.monotonic()
+    results = agent._execute_tool_calls(tool_calls, game_context, deadline=time.monotonic() + 0.2)
+
+    assert time.monotonic() - start < 1.0
+    assert [name for name, _, _ in results] == ["inquire_about_another_player"] * 2
+    assert all(result.kind == "timed_out" for _, _, result in results)
+
+
+def test_concurrent_writes_keep_the_transcript_whole_and_ordered():
+    history = ConversationHistory()
+    barrier = threading.Barrier(8)
+
+    def speak(player_id):
+        barrier.wait()
+        for _ in range(50):
+            history.add_agent_response(player_id=player_id, player_name=f"AI {player_id}", public_response="hello")
+
+    threads = [threading.Thread(target=speak, args=(player_id,)) for player_id in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [message.message_id for message in history.snapshot()] == list(range(1, 401))
+
+
+def test_answers_to_concurrent_questions_land_in_the_order_asked(game_config):
+    game_context = setup_game_context(game_config, rng=random.Random(0))
+    game_context.set_nighttime(False)
+    asker, slow, fast = list(game_context.players.values())[:3]
+    answer = slow.act
+    slow.act = lambda *args, **kwargs: time.sleep(0.2) or answer(*args, **kwargs)
+    tool_calls = [
+        SimpleNamespace(id=f"call_{index}", function=SimpleNamespace(name="inquire_about_another_player", arguments=f'{{"player_name": "{player.player_name}", "question": "What are you?"}}'))
+        for index, player in enumerate((slow, fast))
+    ]
+
+    results = asker._execute_tool_calls(tool_calls, game_context)
+    asker.act("Your turn to speak.", game_state=game_context)
+
+    assert all(isinstance(result, str) and "responds" in result for _, _, result in results)
+    speakers = [message.player_id for message in game_context.conversation.snapshot()]
+    assert speakers == [slow.player_id, fast.player_id, asker.player_id]
+
+
+def test_unused_reservations_do_not_hold_up_the_transcript(game_config):
+    game_context = setup_game_context(game_config, rng=random.Random(0))
+    game_context.set_nighttime(False)
+    asker = game_context.players[0]
+    tool_calls = [SimpleNamespace(id="call_0", function=SimpleNamespace(name="inquire_about_another_player", arguments='{"player_name": "Nobody", "question": "Who are you?"}'))]
+
+    asker._execute_tool_calls(tool_calls, game_context)
+    asker.act("Your turn to speak.", game_state=game_context)
+
+    assert [message.player_id for message in game_context.conversation.snapshot()] == [asker.player_id]
+
+
+def _reply(history, message_id):
+    return history.add_agent_response(player_id=message_id, player_name=f"AI {message_id}", public_response="late answer", message_id=message_id)
+
+
+def test_message_added_after_its_id_was_released_is_dropped():
+    history = ConversationHistory()
+    earlier, late = history.reserve_message_id(), history.reserve_message_id()
+
+    # The turn gave up on the inquiry while an earlier message was still pending; its worker answers anyway
+    history.release_message_id(late)
+    _reply(history, late)
+    _reply(history, earlier)
+
+    assert [message.message_id for message in history.snapshot()] == [earlier]
+    assert not history.order.released
+
+
+def test_release_leaves_a_message_that_was_already_added():
+    history = ConversationHistory()
+    earlier, added = history.reserve_message_id(), history.reserve_message_id()
+
+    _reply(history, added)
+    history.release_message_id(added)
+    _reply(history, earlier)
+
+    assert [message.message_id for message in history.snapshot()] == [earlier, added]
+
+
+class LockWithPause:
+    """Transcript lock that, the first time the given thread lets go of it, lets another thread run first"""
+    def __init__(self, lock, thread, meanwhile):
+        self.lock = lock
+        self.thread = thread
+        self.meanwhile = meanwhile
+        self.paused = False
+
+    def __enter__(self):
+        self.lock.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.lock.release()
+        if not self.paused and threading.current_thread() is self.thread:
+            self.paused = True
+            other = threading.Thread(target=self.meanwhile)
+            other.start()
+            other.join(timeout=0.5)
+        return False
+
+
+def test_add_racing_a_release_is_either_kept_or_dropped_whole():
+    history = ConversationHistory()
+    earlier, raced = history.reserve_message_id(), history.reserve_message_id()
+    finished = []
+    history.order.lock = LockWithPause(history.order.lock, threading.current_thread(), lambda: finished.append(_reply(history, raced)))
+
+    history.release_message_id(raced)
+    added_before_release_returned = bool(finished)
+    deadline = time.monotonic() + 2.0
+    while not finished and time.monotonic() < deadline:
+        time.sleep(0.01)
+    _reply(history, earlier)
+
+    expected = [earlier, raced] if added_before_release_returned else [earlier]
+    assert [message.message_id for message in history.snapshot()] == expected
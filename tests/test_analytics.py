@@ -0,0 +1,28 @@
+import numpy as np
+from simulation.analytics import GameArrays
+from simulation.game_runner import play_game
+from simulation.results_store import GameRecord, ResultsStore, ResultsStoreWriter
+
+
+def test_from_role_summaries_matches_the_results_store(game_config, tmp_path):
+    initial_summaries, final_summaries, outcomes = [], [], []
+    with ResultsStoreWriter(str(tmp_path / "store")) as writer:
+        for seed in range(30):
+            game_context, outcome = play_game(
+                game_config,
+                seed=seed,
+                on_setup=lambda dealt: initial_summaries.append(dealt.get_role_assignments_summary())
+            )
+            final_summaries.append(game_context.get_role_assignments_summary())
+            outcomes.append(outcome)
+            writer.append(GameRecord.from_game(game_context, outcome, seed=seed))
+
+    from_summaries = GameArrays.from_role_summaries(final_summaries, outcomes, initial_summaries)
+    from_store = GameArrays.from_store(ResultsStore(str(tmp_path / "store")))
+    for name in ("initial_roles", "final_roles", "final_center", "votes", "eliminated", "winners"):
+        assert np.array_equal(getattr(from_summaries, name), getattr(from_store, name)), name
+
+
+def test_from_role_summaries_handles_no_games():
+    arrays = GameArrays.from_role_summaries([], [])
+    assert len(arrays) == 0
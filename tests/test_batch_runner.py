@@ -0,0 +1,21 @@
+import numpy as np
+from simulation.batch_runner import BatchRunner
+from simulation.results_store import COLUMNS, ResultsStore
+
+
+def test_batches_do_not_pool_by_default(game_config, tmp_path):
+    assert BatchRunner(game_config, str(tmp_path / "store")).agent_pool is None
+
+
+def test_pooled_and_unpooled_batches_store_identical_games(game_config, tmp_path):
+    game_config["max_rounds"] = 2
+    stores = {}
+    for pooled in (False, True):
+        path = str(tmp_path / f"pooled-{pooled}")
+        runner = BatchRunner(game_config, path, pool_objects=pooled)
+        assert runner.run(12) == 12
+        assert not runner.failed_games
+        stores[pooled] = ResultsStore(path)
+
+    for name in COLUMNS:
+        assert np.array_equal(stores[False][name], stores[True][name]), name
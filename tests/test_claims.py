@@ -0,0 +1,46 @@
+import pytest
+from game_context.claims import ClaimExtractor
+from game_context.roles import Role
+
+PLAYERS = {0: "AI 1", 1: "AI 2", 2: "AI 3", 3: "Human 1"}
+PHRASINGS = [
+    "I'm the {role}.",
+    "I am the {role}.",
+    "I was the {role}.",
+    "I was dealt the {role}.",
+    "My card is the {role}.",
+    "My role was {role}.",
+    "I started as the {role}.",
+    "Honestly, I am really the {role}!",
+]
+
+
+def _claims(text: str, player_id: int = 0):
+    return ClaimExtractor(PLAYERS).extract(1, player_id, text)
+
+
+@pytest.mark.parametrize("phrasing", PHRASINGS)
+@pytest.mark.parametrize("role", [role.value for role in Role])
+def test_every_role_claim_phrasing_is_read(role, phrasing):
+    claims = _claims(phrasing.format(role=role.title()))
+    assert [(claim.kind, claim.role) for claim in claims] == [("role", role)]
+
+
+@pytest.mark.parametrize("role", [role.value for role in Role])
+def test_denials_are_read_as_not_role(role):
+    claims = _claims(f"I'm not the {role.title()}.")
+    assert [(claim.kind, claim.role) for claim in claims] == [("not_role", role)]
+
+
+def test_robbing_a_named_player_is_a_robbery():
+    claims = _claims("I took AI 2's card, it was the Werewolf.")
+    assert [(claim.kind, claim.targets, claim.role) for claim in claims if claim.kind == "robbed"] == [("robbed", (1,), "werewolf")]
+
+
+def test_taking_a_center_card_is_not_a_robbery():
+    claims = _claims("I took center card 1.")
+    assert [(claim.kind, claim.targets) for claim in claims] == [("took_center", (1,))]
+
+
+def test_third_person_roles_are_not_claims():
+    assert _claims("AI 3 is the Seer.") == []
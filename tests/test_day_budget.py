@@ -0,0 +1,123 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from game_agents.hedging import DeadlineExceeded
+from game_agents.model_router import ModelRoute
+from game_agents.speculation import SpeculativeTurn
+from game_context.day_budget import DayBudget
+from play import DayPhaseManager
+from setup import setup_game_context
+from tests.test_agent_loop import SlowClient
+
+
+class UnhurriedChannel:
+    """A human player who takes every request's full timeout and then doesn't answer"""
+    def __init__(self):
+        self.timeouts = []
+        self.hung_up = threading.Event()
+
+    def request(self, prompt, timeout=None):
+        self.timeouts.append(timeout)
+        self.hung_up.wait(min(timeout, 5.0))
+        return None
+
+    def notify(self, message):
+        pass
+
+
+def _llm_day(game_config, client=None):
+    config = {**game_config, "default_agent_type": "llm", "hedging": {"enabled": False}}
+    game_context = setup_game_context(config, rng=random.Random(0), client_factory=(lambda: client) if client else None)
+    game_context.set_nighttime(False)
+    return game_context
+
+
+def test_vote_is_reserved_at_the_vote_route_timeout(game_config):
+    game_context = _llm_day(game_config)
+    router = game_context.model_router
+    vote_route = router.resolve(game_context.players[0].initial_role, "day", "vote")
+    for _ in range(10):
+        router.record(vote_route, 0.5)
+
+    budget = DayBudget(wall_time=90, min_samples=5)
+
+    assert vote_route.timeout is not None
+    assert budget.vote_reserve(game_context) == pytest.approx(vote_route.timeout * len(game_context.players))
+    # The default config still leaves most of the day for discussion
+    assert budget.vote_reserve(game_context) < budget.wall_time / 2
+
+
+def _human_day(game_config):
+    game_context = setup_game_context({**game_config, "number_human_players": 1}, rng=random.Random(0))
+    human = next(player for player in game_context.players.values() if not player.is_ai)
+    human.channel = UnhurriedChannel()
+    game_context.set_nighttime(False)
+    return game_context, human
+
+
+def test_human_vote_timeout_is_reserved(game_config):
+    game_context, human = _human_day(game_config)
+
+    assert DayBudget().vote_reserve(game_context) == human.vote_timeout
+    game_context.close()
+
+
+def test_human_seat_stays_within_the_day(game_config):
+    game_context, human = _human_day(game_config)
+    human.turn_timeout = 120.0
+    human.vote_timeout = 0.2
+    day_manager = DayPhaseManager(game_context, max_rounds=3, verbose=False, day_budget=DayBudget(wall_time=0.6))
+
+    start = time.monotonic()
+    day_manager.execute_day_phase()
+
+    assert time.monotonic() - start < 1.5
+    assert human.channel.timeouts and max(human.channel.timeouts) <= 0.6
+    assert human.turn_timeout == 120.0
+    game_context.close()
+
+
+def test_unanswered_human_vote_ends_with_the_day(game_config):
+    game_context, human = _human_day(game_config)
+    budget = DayBudget(wall_time=0.3)
+    budget.start()
+    day_manager = DayPhaseManager(game_context, max_rounds=1, verbose=False, day_budget=budget)
+
+    start = time.monotonic()
+    votes = day_manager.run_vote()
+    day_manager.shutdown()
+
+    assert time.monotonic() - start < 1.5
+    assert human.player_id not in votes
+    human.channel.hung_up.set()
+    game_context.close()
+
+
+def test_turn_calls_get_no_more_than_the_allowance(game_config):
+    client = SlowClient()
+    game_context = _llm_day(game_config, client)
+    for player in game_context.players.values():
+        player.stream_responses = False
+    budget = DayBudget(wall_time=0.5, default_turn_seconds=0.01, default_question_seconds=0.01, default_vote_seconds=0.01)
+    budget.call_deadline_seconds = lambda player, call_type, game_context: 0.01
+    day_manager = DayPhaseManager(game_context, max_rounds=1, verbose=False, day_budget=budget)
+
+    start = time.monotonic()
+    step = next(day_manager.discussion_steps())
+    step()
+
+    assert time.monotonic() - start < 1.0
+    assert client.timeouts and client.timeouts[0] <= 0.5
+    day_manager.shutdown()
+
+
+def test_speculation_is_not_waited_on_past_the_turn(game_config):
+    game_context = _llm_day(game_config)
+    turn = SpeculativeTurn(0, "Your turn.", ModelRoute(name="turns"), [], {}, game_context)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        turn.run(executor, lambda: time.sleep(0.5))
+
+        with pytest.raises(DeadlineExceeded):
+            turn.result(timeout=0.05)
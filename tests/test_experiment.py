@@ -0,0 +1,27 @@
+import random
+from setup import deal_roles
+from simulation.experiment import PairedExperiment
+from simulation.tournament import AgentVariant
+
+
+def _variant(name: str) -> AgentVariant:
+    return AgentVariant(name=name, agent_type="scripted", model_routing={"routes": [{"name": f"{name}-route", "model": f"{name}-model"}]})
+
+
+def test_only_tested_seats_use_the_variants_routing(game_config):
+    experiment = PairedExperiment(game_config, _variant("control"), _variant("treatment"), roles=["werewolf"])
+    games = {}
+    configure = experiment._configure
+    experiment._configure = lambda arm, tested_seats, game_context: games.setdefault(arm, game_context) and configure(arm, tested_seats, game_context)
+    player_roles, _ = deal_roles(experiment.game_config, random.Random(0))
+    tested_seats = experiment.tested_seats(player_roles)
+    assert tested_seats and len(tested_seats) < len(player_roles)
+
+    for arm in ("control", "treatment"):
+        experiment.play_arm(arm, 0, player_roles, tested_seats)
+        for seat, agent in games[arm].players.items():
+            expected = experiment.variant_routers[arm] if seat in tested_seats else experiment.routers[arm]
+            assert agent.router is expected
+    assert experiment.variant_routers["control"] is not experiment.variant_routers["treatment"]
+    assert experiment.routers["control"].routes == experiment.routers["treatment"].routes
+    assert not {route.name for route in experiment.routers["control"].routes} & {"control-route", "treatment-route"}
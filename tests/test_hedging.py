@@ -0,0 +1,80 @@
+import json
+import os
+import threading
+import time
+from game_agents.hedging import DeadlineExceeded, HedgedCaller
+from game_agents.model_router import ModelRoute, ModelRouter
+from simulation.game_runner import play_game
+from tests.conftest import ROOT
+
+
+def _hedge_threads():
+    return [thread for thread in threading.enumerate() if thread.name.startswith("hedged-call")]
+
+
+def _wait_for_no_hedge_threads(timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while _hedge_threads() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return not _hedge_threads()
+
+
+def test_default_route_has_a_deadline():
+    with open(os.path.join(ROOT, "game_config.json")) as f:
+        routing = json.load(f)["model_routing"]
+    router = ModelRouter.from_config(routing)
+    assert router.default.timeout is not None
+    assert all(route.timeout is not None for route in router.routes if not route.is_scripted)
+
+
+def test_threads_start_on_first_call_and_stop_on_shutdown():
+    assert _wait_for_no_hedge_threads()
+    caller = HedgedCaller(ModelRouter())
+    assert not _hedge_threads()
+
+    result, hedged = caller.call(ModelRoute(timeout=1.0), lambda timeout: "answer")
+    assert (result, hedged) == ("answer", False)
+    assert _hedge_threads()
+
+    caller.shutdown()
+    assert _wait_for_no_hedge_threads()
+
+
+def test_losing_attempt_gets_the_time_left_as_its_request_timeout():
+    router = ModelRouter()
+    route = ModelRoute(name="slow", timeout=0.3)
+    for _ in range(20):
+        router.record(route, 0.01)
+    caller = HedgedCaller(router, min_samples=20)
+    timeouts = []
+
+    def attempt(timeout):
+        timeouts.append(timeout)
+        time.sleep(timeout)
+        raise TimeoutError("request timed out")
+
+    try:
+        caller.call(route, attempt)
+    except (DeadlineExceeded, TimeoutError):
+        pass
+    finally:
+        caller.shutdown()
+    assert len(timeouts) == 2
+    assert all(0 < timeout <= route.timeout for timeout in timeouts)
+
+
+def test_game_without_a_router_shuts_its_hedger_down(game_config, monkeypatch):
+    assert game_config["hedging"]["enabled"]
+    shut_down = []
+    monkeypatch.setattr(HedgedCaller, "shutdown", lambda self: shut_down.append(self))
+    game_context, _ = play_game(game_config, seed=0)
+    assert shut_down == [next(iter(game_context.players.values())).hedger]
+
+
+def test_game_given_a_router_leaves_the_hedger_to_its_owner(game_config, monkeypatch):
+    router = ModelRouter.from_config(game_config["model_routing"])
+    hedger = HedgedCaller.from_config(router, game_config["hedging"])
+    shut_down = []
+    monkeypatch.setattr(HedgedCaller, "shutdown", lambda self: shut_down.append(self))
+    play_game(game_config, seed=0, router=router, hedger=hedger)
+    assert shut_down == []
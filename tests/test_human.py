@@ -0,0 +1,125 @@
+import random
+import socket
+import threading
+import time
+from types import SimpleNamespace
+from play import DayPhaseManager
+from setup import setup_game_context
+from simulation.game_runner import play_game
+
+
+class SilentChannel:
+    """A human player who never answers"""
+    def __init__(self):
+        self.requests = []
+
+    def request(self, prompt, timeout=None):
+        self.requests.append(prompt)
+        return None
+
+    def notify(self, message):
+        pass
+
+
+def _human_game(game_config: dict):
+    game_context = setup_game_context({**game_config, "number_human_players": 1}, rng=random.Random(0))
+    human = next(player for player in game_context.players.values() if not player.is_ai)
+    human.channel = SilentChannel()
+    game_context.set_nighttime(False)
+    return game_context, human
+
+
+def _threads(prefix: str):
+    return [thread for thread in threading.enumerate() if thread.name.startswith(prefix)]
+
+
+def _day_prep_threads():
+    return _threads("day-prep")
+
+
+def _free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def test_unanswered_turn_says_the_human_timed_out(game_config):
+    game_context, human = _human_game(game_config)
+
+    response = human.act("Your turn to speak.", game_state=game_context)
+    game_context.close()
+
+    assert response.public_response == "(stays quiet)"
+    message = game_context.conversation.snapshot()[-1]
+    assert message.player_id == human.player_id
+    assert "timed out waiting for input" in message.private_thoughts
+    assert "model" not in message.private_thoughts
+
+
+def test_day_phase_stops_its_background_threads(game_config):
+    game_context, human = _human_game(game_config)
+    day_manager = DayPhaseManager(game_context, max_rounds=1, verbose=False)
+
+    day_manager.execute_day_phase()
+    game_context.close()
+
+    assert human.channel.requests
+    deadline = time.monotonic() + 2.0
+    while _day_prep_threads() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not _day_prep_threads()
+
+
+def test_setting_up_a_terminal_seat_leaves_stdin_alone(game_config):
+    io_threads = len(_threads("human-io"))
+    game_context, _ = _human_game(game_config)
+
+    assert not _threads("human-stdin")
+    game_context.close()
+    assert len(_threads("human-io")) == io_threads
+
+
+def test_websocket_games_free_their_port_and_io_thread(game_config):
+    port = _free_port()
+    human_io = {"mode": "websocket", "port": port, "night_timeout": 0.05, "turn_timeout": 0.05, "vote_timeout": 0.05}
+    config = {**game_config, "number_human_players": 1, "human_io": human_io, "max_rounds": 1}
+    io_threads = len(_threads("human-io"))
+
+    for seed in range(2):
+        play_game(config, seed=seed)
+
+        assert len(_threads("human-io")) == io_threads
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", port))
+
+
+class RecordingClient:
+    """Fake OpenAI client that answers every plain completion with one token"""
+    def __init__(self):
+        self.calls = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, **params):
+        self.calls.append(params)
+        usage = SimpleNamespace(prompt_tokens=900, completion_tokens=1, prompt_tokens_details=None)
+        message = SimpleNamespace(content=".", tool_calls=None)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+
+
+def test_warm_up_goes_through_the_completion_path(game_config):
+    client = RecordingClient()
+    config = {**game_config, "default_agent_type": "llm", "hedging": {"enabled": False}}
+    game_context = setup_game_context(config, rng=random.Random(0), client_factory=lambda: client)
+    game_context.set_nighttime(False)
+    agent = game_context.players[0]
+    turn_route = agent._resolve_route("turn", game_context)
+
+    agent.prepare_turn(game_context)
+
+    assert len(client.calls) == 1
+    assert client.calls[0]["max_tokens"] == 1 and client.calls[0]["model"] == turn_route.model
+    assert "response_format" not in client.calls[0]
+    assert agent.token_usage["prompt_tokens"] == 900
+    stats = agent.router.stats
+    assert stats[f"{turn_route.name}-warm-up"].calls == 1 and stats[f"{turn_route.name}-warm-up"].prompt_tokens == 900
+    assert turn_route.name not in stats or stats[turn_route.name].calls == 0
@@ -0,0 +1,32 @@
+import random
+from game_agents.knowledge import Fact, KnowledgeStore
+from setup import setup_game_context
+
+
+def test_answer_claiming_a_role_adds_a_claimed_fact():
+    store = KnowledgeStore()
+    store.append("AI 2 responds: I am the Seer. I looked at AI 3's card.")
+
+    assert [fact.kind for fact in store.about("AI 2")] == ["answer", "claimed"]
+    assert store.about("AI 2")[1] == Fact(kind="claimed", subject="AI 2", role="seer", source="AI 2 responds: I am the Seer. I looked at AI 3's card.")
+    assert "AI 2 claimed to be the Seer" in store.render()
+    # Iteration still yields each text once, as it did for the plain list
+    assert list(store) == ["AI 2 responds: I am the Seer. I looked at AI 3's card."]
+
+
+def test_denials_and_third_person_roles_are_not_claims():
+    store = KnowledgeStore()
+    store.append("AI 4 responds: I'm not the Werewolf. AI 1 is the Robber.")
+
+    assert [fact.kind for fact in store.facts()] == ["answer"]
+
+
+def test_questioning_a_player_records_their_claim(game_config):
+    game_context = setup_game_context(game_config, rng=random.Random(0))
+    game_context.set_nighttime(False)
+    asker, answerer = game_context.players[0], game_context.players[1]
+
+    asker.call_tool("inquire_about_another_player", {"player_name": answerer.player_name, "question": "What's your role?"}, game_context)
+
+    claims = [fact for fact in asker.personal_knowledge.about(answerer.player_name) if fact.kind == "claimed"]
+    assert [fact.role for fact in claims] == [answerer.initial_role.lower()]
@@ -0,0 +1,73 @@
+import random
+import numpy as np
+from simulation.batch_runner import BatchRunner
+from simulation.night_cache import NightCache, NightRecording
+from simulation.results_store import COLUMNS, ResultsStore
+from simulation.sweep import CompositionSweep
+
+VILLAGE_DECK = ["robber", "seer", "villager", "villager", "villager", "werewolf", "werewolf"]
+TANNER_DECK = ["robber", "seer", "tanner", "villager", "villager", "werewolf", "werewolf"]
+
+
+def test_decks_differing_in_a_role_without_a_night_action_share_nights(game_config, tmp_path):
+    game_config["max_rounds"] = 1
+    sweep = CompositionSweep(game_config, [VILLAGE_DECK, TANNER_DECK], str(tmp_path), games_per_config=10)
+
+    cube = sweep.run()
+
+    assert cube.night_hits > 0
+    assert cube.night_hits + cube.night_misses == 20
+    assert len(sweep.night_cache) == cube.night_misses
+
+
+def test_night_roles_in_other_seats_do_not_share_a_night(game_config):
+    cache = NightCache()
+    village = {**game_config, "available_roles": VILLAGE_DECK}
+    seers_and_robbers_swapped = {**game_config, "available_roles": ["seer", "robber", *VILLAGE_DECK[2:]]}
+
+    assert cache.key(village, 0) != cache.key(seers_and_robbers_swapped, 0)
+    assert cache.key(village, 0) != cache.key(village, 1)
+    assert cache.key(village, 0) != cache.key({**village, "seat_agent_types": ["llm"]}, 0)
+    assert cache.key(village, 0) == cache.key({**village, "max_rounds": 9}, 0)
+
+
+def test_recording_keeps_the_rng_state_exactly():
+    rng = random.Random(7)
+    rng.random()
+    recording = NightRecording({}, rng.getstate())
+
+    assert recording.rng_state == rng.getstate()
+
+
+def _store(game_config, path, night_cache=None):
+    runner = BatchRunner(game_config, path, night_cache=night_cache)
+    assert runner.run(12) == 12
+    assert not runner.failed_games
+    return ResultsStore(path)
+
+
+def test_replayed_nights_store_the_same_games(game_config, tmp_path):
+    game_config["max_rounds"] = 2
+    cache = NightCache()
+    _store(game_config, str(tmp_path / "recorded"), cache)
+    assert cache.hits == 0
+
+    replayed = _store(game_config, str(tmp_path / "replayed"), cache)
+    played = _store(game_config, str(tmp_path / "played"))
+
+    assert cache.hits == 12
+    for name in COLUMNS:
+        assert np.array_equal(replayed[name], played[name]), name
+
+
+def test_nights_replayed_across_decks_store_the_same_games(game_config, tmp_path):
+    game_config["max_rounds"] = 2
+    cache = NightCache()
+    _store({**game_config, "available_roles": VILLAGE_DECK}, str(tmp_path / "village"), cache)
+
+    replayed = _store({**game_config, "available_roles": TANNER_DECK}, str(tmp_path / "replayed"), cache)
+    played = _store({**game_config, "available_roles": TANNER_DECK}, str(tmp_path / "played"))
+
+    assert cache.hits > 0
+    for name in COLUMNS:
+        assert np.array_equal(replayed[name], played[name]), name
@@ -0,0 +1,31 @@
+import random
+from game_context.game_context import NIGHT_PHASE_ORDER
+from play import NightPhaseManager
+from setup import setup_game_context
+
+
+def _robber_and_insomniac_game(game_config: dict):
+    config = {**game_config, "available_roles": ["werewolf", "werewolf", "robber", "insomniac", "seer", "villager", "drunk"]}
+    for seed in range(50):
+        game_context = setup_game_context(config, rng=random.Random(seed))
+        roles = {player.initial_role.lower(): player for player in game_context.players.values()}
+        if "robber" in roles and "insomniac" in roles:
+            return game_context, roles["robber"], roles["insomniac"]
+    raise AssertionError("No seed dealt both the robber and the insomniac to players")
+
+
+def test_robbing_a_later_role_does_not_change_who_acts(game_config):
+    game_context, robber, insomniac = _robber_and_insomniac_game(game_config)
+    robber.night_policy = lambda agent, _: ("robber_swap", {"target_player_name": insomniac.player_name})
+    acted = []
+    for player in game_context.players.values():
+        act = player.execute_night_action
+        player.execute_night_action = lambda context, player=player, act=act: acted.append(player.player_id) or act(context)
+
+    NightPhaseManager(game_context).execute_night_phase()
+
+    assert robber.current_role.lower() == "insomniac" and insomniac.current_role.lower() == "robber"
+    night_seats = [player.player_id for player in game_context.players.values() if player.initial_role.lower() in NIGHT_PHASE_ORDER]
+    assert sorted(acted) == sorted(night_seats)
+    order = [NIGHT_PHASE_ORDER.index(game_context.players[player_id].initial_role.lower()) for player_id in acted]
+    assert order == sorted(order)
@@ -0,0 +1,55 @@
+import json
+import random
+from types import SimpleNamespace
+from game_agents.tool_registry import ToolError
+from setup import setup_game_context
+
+
+class SelfRobbingClient:
+    """Fake OpenAI client whose every night tool call has the robber rob themselves"""
+    def __init__(self):
+        self.player_name = None
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._complete, parse=self._complete))
+
+    def _complete(self, **params):
+        arguments = json.dumps({"target_player_name": self.player_name})
+        tool_call = SimpleNamespace(id="call_0", type="function", function=SimpleNamespace(name="robber_swap", arguments=arguments))
+        message = SimpleNamespace(content=None, parsed=None, tool_calls=[tool_call])
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+def _robber(game_context):
+    return next(agent for agent in game_context.players.values() if agent.initial_role.lower() == "robber")
+
+
+def _robber_game(game_config: dict, agent_type: str, client=None):
+    config = {**game_config, "default_agent_type": agent_type, "hedging": {"enabled": False}}
+    for seed in range(50):
+        game_context = setup_game_context(config, rng=random.Random(seed), client_factory=(lambda: client) if client else None)
+        if any(agent.initial_role.lower() == "robber" for agent in game_context.players.values()):
+            return game_context
+    raise AssertionError("No seed dealt the robber to a player")
+
+
+def test_robbing_yourself_is_an_invalid_action(game_config):
+    game_context = _robber_game(game_config, "scripted")
+    robber = _robber(game_context)
+
+    result = robber.call_tool("robber_swap", {"target_player_name": robber.player_name}, game_context)
+
+    assert isinstance(result, ToolError) and result.kind == "invalid_action"
+    assert game_context.night_action_log == []
+    assert not robber.personal_knowledge
+
+
+def test_invalid_night_action_falls_back_to_the_default_action(game_config):
+    client = SelfRobbingClient()
+    game_context = _robber_game(game_config, "llm", client)
+    robber = _robber(game_context)
+    client.player_name = robber.player_name
+    robber.max_tool_repairs = 1
+
+    response = robber.act("It is night.", game_state=game_context)
+
+    assert [entry["action"] for entry in game_context.night_action_log] == ["robber"]
+    assert response.tool_calls[-1]["name"] == "robber_swap" and "error" not in response.tool_calls[-1]
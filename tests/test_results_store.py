@@ -0,0 +1,62 @@
+import json
+import os
+import numpy as np
+import pytest
+from simulation.analytics import GameArrays, claim_truthfulness
+from simulation.batch_runner import BatchRunner
+from simulation.results_store import META_FILE, STORE_VERSION, ResultsStore
+from simulation.sweep import store_metrics
+
+# Columns added in store version 2
+NEWER_COLUMNS = ("claimed_roles", "contradictions", "discussion_rounds")
+
+
+def _downgrade_to_version_1(path: str) -> None:
+    """Rewrite a store as version 1 wrote it, without the columns added since"""
+    with open(os.path.join(path, META_FILE)) as f:
+        meta = json.load(f)
+    meta["version"] = 1
+    for name in NEWER_COLUMNS:
+        del meta["columns"][name]
+        os.remove(os.path.join(path, f"{name}.col"))
+    with open(os.path.join(path, META_FILE), "w") as f:
+        json.dump(meta, f)
+
+
+@pytest.fixture
+def old_store(game_config, tmp_path) -> str:
+    path = str(tmp_path / "store")
+    game_config["max_rounds"] = 1
+    BatchRunner(game_config, path).run(5)
+    _downgrade_to_version_1(path)
+    return path
+
+
+def test_new_stores_record_the_current_version(game_config, tmp_path):
+    path = str(tmp_path / "store")
+    game_config["max_rounds"] = 1
+    BatchRunner(game_config, path).run(2)
+    store = ResultsStore(path)
+    assert store.meta["version"] == STORE_VERSION == 2
+    assert all(store.has_column(name) for name in NEWER_COLUMNS)
+
+
+def test_old_store_reads_missing_columns_as_empty(old_store):
+    store = ResultsStore(old_store)
+
+    assert len(store) == 5 and not store.has_column("claimed_roles")
+    assert np.all(store["claimed_roles"] == -1) and store["claimed_roles"].shape == (5, 10)
+    assert np.all(store["contradictions"] == 0)
+    assert store["seed"].tolist() == list(range(5))
+
+
+def test_old_store_analytics_treat_claims_as_absent(old_store):
+    store = ResultsStore(old_store)
+
+    arrays = GameArrays.from_store(store)
+    assert arrays.claimed_roles is None
+    assert claim_truthfulness(arrays) == {}
+
+    metrics = store_metrics(store)
+    assert metrics["games"] == 5.0
+    assert np.isnan(metrics["contradictions_per_player"]) and np.isnan(metrics["discussion_rounds"])
@@ -0,0 +1,138 @@
+import asyncio
+import json
+from types import SimpleNamespace
+from game_context.events import GameEvent
+from game_server.spectators import HISTORY_BATCHES, MAX_WATCHER_BACKLOG, SpectatorFeed, coalesce
+
+
+class FakeWatcher:
+    """Spectator connection that keeps the messages written to it and reports a settable backlog"""
+    def __init__(self):
+        self.messages = []
+        self.backlog = 0
+        self.writer = SimpleNamespace(transport=SimpleNamespace(get_write_buffer_size=lambda: self.backlog))
+
+    def write_encoded(self, frame: bytes) -> int:
+        # Server frames are unmasked; short ones have a one-byte length, longer ones 2 or 8 more bytes
+        length = frame[1] & 0x7F
+        offset = 2 + {126: 2, 127: 8}.get(length, 0)
+        self.messages.append(json.loads(frame[offset:]))
+        return self.backlog
+
+    async def close(self):
+        pass
+
+
+def _message(seq: int, player_id: int = 0) -> GameEvent:
+    return GameEvent(seq=seq, type="message", player_id=player_id, data={"message_id": seq, "public_response": f"message {seq}"})
+
+
+def _feed_with_batches(batches: int) -> SpectatorFeed:
+    feed = SpectatorFeed(players={0: "AI 1"})
+    for seq in range(1, batches + 1):
+        feed.publish(_message(seq))
+        feed.flush()
+    return feed
+
+
+def test_message_supersedes_the_text_streamed_before_it():
+    deltas = [
+        {"say": [1, "Hel"]},
+        {"say": [2, "Hi"]},
+        {"say": [1, "lo"]},
+        {"msg": [5, 1, "Hello!"]},
+        {"say": [2, " there"]},
+    ]
+
+    assert coalesce(deltas) == [{"say": [2, "Hi there"]}, {"msg": [5, 1, "Hello!"]}]
+
+
+def test_retraction_drops_the_streamed_text():
+    assert coalesce([{"say": [1, "I think"]}, {"unsay": 1}]) == [{"unsay": 1}]
+
+
+def test_only_each_voters_last_vote_is_kept():
+    deltas = [{"vote": [1, 2]}, {"vote": [3, 1]}, {"vote": [1, 3]}]
+
+    assert coalesce(deltas) == [{"vote": [3, 1]}, {"vote": [1, 3]}]
+
+
+def test_reconnecting_watcher_is_replayed_the_batches_it_missed():
+    async def scenario():
+        feed = _feed_with_batches(5)
+        watcher = FakeWatcher()
+
+        feed.attach(watcher, since=2)
+
+        assert [(message["from"], message["to"]) for message in watcher.messages] == [(3, 3), (4, 4), (5, 5)]
+        assert [message["d"][0]["msg"][0] for message in watcher.messages] == [3, 4, 5]
+
+    asyncio.run(scenario())
+
+
+def test_watcher_that_is_up_to_date_gets_nothing_to_replay():
+    async def scenario():
+        feed = _feed_with_batches(3)
+        watcher = FakeWatcher()
+
+        feed.attach(watcher, since=3)
+
+        assert watcher.messages == []
+
+    asyncio.run(scenario())
+
+
+def test_watcher_behind_the_history_gets_a_snapshot():
+    async def scenario():
+        feed = _feed_with_batches(HISTORY_BATCHES + 2)
+        watcher = FakeWatcher()
+
+        feed.attach(watcher, since=1)
+
+        assert len(watcher.messages) == 1
+        snapshot = watcher.messages[0]
+        assert snapshot["seq"] == HISTORY_BATCHES + 2
+        assert len(snapshot["snapshot"]["messages"]) == HISTORY_BATCHES + 2
+
+    asyncio.run(scenario())
+
+
+def test_resync_sends_a_snapshot():
+    async def scenario():
+        feed = _feed_with_batches(2)
+        watcher = FakeWatcher()
+        feed.attach(watcher)
+        feed.publish(_message(3))
+
+        feed.resync(watcher)
+
+        # The pending delta is flushed first, so the snapshot already includes it
+        assert watcher.messages[-2]["from"] == 3
+        assert watcher.messages[-1]["seq"] == 3
+
+    asyncio.run(scenario())
+
+
+def test_watcher_with_a_backlog_is_resynced_once_it_drains():
+    async def scenario():
+        feed = _feed_with_batches(1)
+        watcher = FakeWatcher()
+        feed.attach(watcher)
+        watcher.backlog = MAX_WATCHER_BACKLOG + 1
+        feed.publish(_message(2))
+        feed.flush()
+        assert feed.watchers[watcher] is False
+        sent = len(watcher.messages)
+
+        feed.publish(_message(3))
+        feed.flush()
+        assert len(watcher.messages) == sent
+
+        watcher.backlog = 0
+        feed.publish(_message(4))
+        feed.flush()
+
+        assert feed.watchers[watcher] is True
+        assert watcher.messages[-1]["seq"] == 4 and len(watcher.messages[-1]["snapshot"]["messages"]) == 4
+
+    asyncio.run(scenario())
@@ -0,0 +1,30 @@
+import random
+from game_context.straw_poll import StrawPoll
+from setup import setup_game_context
+
+
+def _day(game_config):
+    game_context = setup_game_context(game_config, rng=random.Random(0))
+    game_context.set_nighttime(False)
+    return game_context
+
+
+def test_rounds_with_no_predicted_votes_never_settle(game_config):
+    game_context = _day(game_config)
+    poll = StrawPoll(stable_rounds=2, min_rounds=2)
+
+    assert [poll.record_round(game_context) for _ in range(4)] == [False] * 4
+    assert poll.predictions == [None] * 4
+
+
+def test_unchanged_prediction_settles_the_table(game_config):
+    game_context = _day(game_config)
+    players = list(game_context.players.values())
+    accused = players[-1]
+    for player in players[:-1]:
+        game_context.conversation.add_agent_response(player.player_id, player.player_name, f"{accused.player_name} is a werewolf, vote them out.")
+    poll = StrawPoll(stable_rounds=2, min_rounds=2)
+
+    assert poll.record_round(game_context) is False
+    assert poll.record_round(game_context) is True
+    assert poll.predictions[-1] == [accused.player_id]
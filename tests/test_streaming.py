@@ -0,0 +1,58 @@
+import random
+import time
+from types import SimpleNamespace
+import pytest
+from game_agents.hedging import DeadlineExceeded
+from game_agents.model_router import ModelRoute
+from setup import setup_game_context
+
+
+class SlowStream:
+    """Fake completion stream that keeps sending content deltas, one every interval seconds"""
+    def __init__(self, interval: float, chunks: int):
+        self.interval = interval
+        self.chunks = chunks
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.closed = True
+        return False
+
+    def __iter__(self):
+        for _ in range(self.chunks):
+            time.sleep(self.interval)
+            yield SimpleNamespace(type="content.delta", delta="word ")
+
+    def get_final_completion(self):
+        raise AssertionError("The stream should have been cut off before it finished")
+
+
+class SlowStreamClient:
+    def __init__(self):
+        self.streams = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(stream=self._stream))
+
+    def _stream(self, stream_options=None, **params):
+        self.streams.append(SlowStream(interval=0.05, chunks=100))
+        return self.streams[-1]
+
+
+def test_stream_is_closed_at_the_call_deadline(game_config):
+    client = SlowStreamClient()
+    config = {**game_config, "default_agent_type": "llm", "hedging": {"enabled": False}}
+    game_context = setup_game_context(config, rng=random.Random(0), client_factory=lambda: client)
+    agent = game_context.players[0]
+    route = ModelRoute(name="slow-stream", timeout=0.3)
+    deltas = []
+
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        agent._create_completion(route, structured=True, on_content_delta=deltas.append, messages=[{"role": "user", "content": "Speak."}])
+
+    assert time.monotonic() - start < 1.0
+    assert client.streams[0].closed
+    assert 0 < len(deltas) < 100
+    assert agent.router.stats["slow-stream"].timeouts == 1
@@ -0,0 +1,103 @@
+import random
+import pytest
+from setup import deal_roles
+from simulation.tournament import AgentVariant, RatingTable, Tournament, wilson_interval
+
+VARIANTS = [AgentVariant(name="strong", agent_type="scripted"), AgentVariant(name="weak", agent_type="scripted")]
+
+
+def rigged(tournament: Tournament, winner: str) -> None:
+    """Make every seat played by the winner variant win, and every other seat lose"""
+    record_game = tournament.ratings.record_game
+    tournament.ratings.record_game = lambda seats: record_game(
+        [(role, variant, variant == winner) for role, variant, _ in seats]
+    )
+
+
+def watch_looks(tournament: Tournament) -> list:
+    """Record what leaders() returned at every look the run took"""
+    looks = []
+    leaders = tournament.leaders
+
+    def watched(confidence=None):
+        result = leaders(confidence)
+        looks.append(result)
+        return result
+
+    tournament.leaders = watched
+    return looks
+
+
+def test_wilson_interval_holds_the_win_rate_and_narrows_with_games():
+    assert wilson_interval(0, 0, 0.95) == (0.0, 1.0)
+
+    low, high = wilson_interval(8, 10, 0.95)
+    assert round(low, 3) == 0.490 and round(high, 3) == 0.943
+
+    wider = wilson_interval(8, 10, 0.99)
+    narrower = wilson_interval(80, 100, 0.95)
+    assert wider[0] < low and wider[1] > high
+    assert low < narrower[0] < 0.8 < narrower[1] < high
+
+
+def test_leader_needs_a_variant_whose_interval_clears_every_other():
+    ratings = RatingTable()
+    ratings.record_game([("seer", "strong", True)])
+    assert ratings.leader("seer", 0.95) is None
+
+    ratings.record_game([("seer", "weak", False)])
+    assert ratings.leader("seer", 0.95) is None
+
+    for _ in range(30):
+        ratings.record_game([("seer", "strong", True), ("seer", "weak", False)])
+    assert ratings.leader("seer", 0.95) == "strong"
+    assert ratings.leader("werewolf", 0.95) is None
+
+
+def test_look_confidence_splits_the_error_across_every_look(game_config):
+    tournament = Tournament(game_config, VARIANTS, confidence=0.9, min_games=10, max_games=60, check_every=10)
+    assert tournament.look_confidence == pytest.approx(1 - 0.1 / 6)
+
+    single_look = Tournament(game_config, VARIANTS, confidence=0.9, min_games=60, max_games=60)
+    assert single_look.look_confidence == pytest.approx(0.9)
+
+
+def test_replaying_a_tournament_seats_and_rates_the_same_variants(game_config):
+    game_config["max_rounds"] = 1
+    first = Tournament(game_config, VARIANTS, base_seed=3, min_games=6, max_games=6)
+    second = Tournament(game_config, VARIANTS, base_seed=3, min_games=6, max_games=6)
+
+    for seed in range(3, 9):
+        player_roles, _ = deal_roles(game_config, random.Random(seed))
+        assert first.seat_variants(player_roles, seed) == second.seat_variants(player_roles, seed)
+
+    assert first.run().ratings == second.run().ratings
+
+
+def test_a_tournament_stops_at_the_first_look_where_every_role_separates(game_config):
+    game_config["max_rounds"] = 1
+    tournament = Tournament(game_config, VARIANTS, min_games=10, max_games=200, check_every=10)
+    rigged(tournament, "strong")
+    looks = watch_looks(tournament)
+
+    result = tournament.run()
+
+    assert result.stopped_early
+    assert result.games_played < 200
+    # One leaders() call per look, plus the one the result reports
+    assert len(looks) == (result.games_played - 10) // 10 + 2
+    assert all(None in look.values() for look in looks[:-2])
+    assert looks[-2] and set(looks[-2].values()) == {"strong"}
+    assert set(result.leaders) == set(tournament.compared_roles())
+
+
+def test_a_tournament_without_separated_roles_plays_every_game(game_config):
+    game_config["max_rounds"] = 1
+    tournament = Tournament(game_config, VARIANTS, min_games=10, max_games=30, check_every=10)
+    looks = watch_looks(tournament)
+
+    result = tournament.run()
+
+    assert not result.stopped_early
+    assert result.games_played == 30
+    assert all(None in look.values() for look in looks)